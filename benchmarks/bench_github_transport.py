@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-call latency of GitHubClient raw HTTP calls against a local stub.
+
+Compares:
+1. per-call: a fresh httpx.Client per request (previous behaviour)
+2. pooled:   GitHubClient's shared keep-alive client
+
+The stub server speaks HTTP/1.1 with keep-alive on localhost, so the numbers
+only include TCP setup. Against api.github.com the pooled path also skips the
+TLS handshake, so the real-world gap is larger.
+
+Usage:
+    uv run python benchmarks/bench_github_transport.py [iterations]
+"""
+
+import json
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+from mcp_server.api_clients.github_client import GitHubClient
+
+GRAPHQL_RESPONSE = json.dumps(
+    {"data": {"repository": {"issue": {"id": "I_kwDOStub"}}}}
+).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal GitHub GraphQL stub with keep-alive enabled."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(GRAPHQL_RESPONSE)))
+        self.end_headers()
+        self.wfile.write(GRAPHQL_RESPONSE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _per_call_request(base_url: str) -> None:
+    """Previous behaviour: new client (and connection) for every call."""
+    with httpx.Client() as client:
+        response = client.post(
+            f"{base_url}/graphql",
+            headers={"Authorization": "Bearer stub"},
+            json={"query": "query { viewer { login } }", "variables": {}},
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        response.json()
+
+
+def _measure(fn, iterations: int) -> list:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def _report(label: str, timings: list) -> None:
+    print(
+        f"{label:<10} mean={statistics.mean(timings):7.3f}ms "
+        f"p50={statistics.median(timings):7.3f}ms "
+        f"p95={sorted(timings)[int(len(timings) * 0.95) - 1]:7.3f}ms"
+    )
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    client = GitHubClient(token="stub", installation_id=1, base_url=base_url)
+
+    # Warm up both paths
+    _per_call_request(base_url)
+    client.get_issue_node_id(1, owner="stub", repo="stub")
+
+    per_call = _measure(lambda: _per_call_request(base_url), iterations)
+    pooled = _measure(
+        lambda: client.get_issue_node_id(1, owner="stub", repo="stub"), iterations
+    )
+
+    print(f"GraphQL calls against local stub ({iterations} iterations)")
+    _report("per-call", per_call)
+    _report("pooled", pooled)
+    print(f"speedup   {statistics.mean(per_call) / statistics.mean(pooled):.2f}x")
+
+    client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Benchmark request counts of GitHubClient.list_prs backends against a local stub.
+
+Compares:
+1. rest:    PyGithub PaginatedList; detail_level='full' lazily completes
+            every PR with its own GET /pulls/{number}
+2. graphql: one pullRequests query per 100 PRs with only the model fields
+
+Wall times for the rest backend include PyGithub's default 0.25s spacing
+between requests, which is also what callers see against api.github.com.
+
+Usage:
+    uv run python benchmarks/bench_list_prs.py [num_prs]
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from mcp_server.api_clients.github_client import GitHubClient
+
+OWNER = "stub-org"
+REPO = "stub-repo"
+TOTAL_PRS = 250
+
+REQUESTS = Counter()
+
+
+def _rest_pr(base_url: str, number: int, full: bool) -> dict:
+    pr = {
+        "url": f"{base_url}/repos/{OWNER}/{REPO}/pulls/{number}",
+        "html_url": f"https://github.com/{OWNER}/{REPO}/pull/{number}",
+        "number": number,
+        "state": "open",
+        "title": f"PR {number}",
+        "body": "Body",
+        "user": {"login": "alice"},
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-02T00:00:00Z",
+        "merged_at": None,
+        "draft": False,
+        "head": {"ref": f"feature-{number}"},
+        "base": {"ref": "main"},
+        "labels": [{"name": "bug"}],
+        "requested_reviewers": [{"login": "bob"}],
+    }
+    if full:
+        pr.update({"additions": 10, "deletions": 2, "changed_files": 3, "commits": 4})
+        pr["mergeable"] = True
+    return pr
+
+
+def _graphql_pr(number: int) -> dict:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "state": "OPEN",
+        "author": {"login": "alice"},
+        "createdAt": "2024-01-01T00:00:00Z",
+        "mergedAt": None,
+        "url": f"https://github.com/{OWNER}/{REPO}/pull/{number}",
+        "body": "Body",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "headRefName": f"feature-{number}",
+        "baseRefName": "main",
+        "additions": 10,
+        "deletions": 2,
+        "changedFiles": 3,
+        "commits": {"totalCount": 4},
+        "isDraft": False,
+        "mergeable": "MERGEABLE",
+        "labels": {"nodes": [{"name": "bug"}]},
+        "reviewRequests": {"nodes": [{"requestedReviewer": {"login": "bob"}}]},
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal GitHub REST + GraphQL stub that counts requests by kind."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _send_json(self, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        base_url = f"http://{self.headers['Host']}"
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        path = url.path
+
+        if path == f"/repos/{OWNER}/{REPO}":
+            REQUESTS["GET /repos/{owner}/{repo}"] += 1
+            return self._send_json(
+                {
+                    "url": f"{base_url}/repos/{OWNER}/{REPO}",
+                    "name": REPO,
+                    "full_name": f"{OWNER}/{REPO}",
+                    "owner": {"login": OWNER},
+                }
+            )
+
+        if path == f"/repos/{OWNER}/{REPO}/pulls":
+            REQUESTS["GET /pulls (list page)"] += 1
+            page = int(params.get("page", ["1"])[0])
+            per_page = int(params.get("per_page", ["30"])[0])
+            start = (page - 1) * per_page + 1
+            end = min(start + per_page, TOTAL_PRS + 1)
+            headers = {}
+            if end <= TOTAL_PRS:
+                next_url = (
+                    f"{base_url}{path}?state=open&sort=updated&direction=desc"
+                    f"&per_page={per_page}&page={page + 1}"
+                )
+                headers["Link"] = f'<{next_url}>; rel="next"'
+            prs = [_rest_pr(base_url, n, full=False) for n in range(start, end)]
+            return self._send_json(prs, headers)
+
+        number = int(path.rsplit("/", 1)[-1])
+        REQUESTS["GET /pulls/{number} (lazy completion)"] += 1
+        return self._send_json(_rest_pr(base_url, number, full=True))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        variables = json.loads(self.rfile.read(length))["variables"]
+        REQUESTS["POST /graphql"] += 1
+
+        start = int(variables["after"] or 0) + 1
+        end = min(start + variables["first"], TOTAL_PRS + 1)
+        self._send_json(
+            {
+                "data": {
+                    "repository": {
+                        "pullRequests": {
+                            "pageInfo": {
+                                "hasNextPage": end <= TOTAL_PRS,
+                                "endCursor": str(end - 1),
+                            },
+                            "nodes": [_graphql_pr(n) for n in range(start, end)],
+                        }
+                    }
+                }
+            }
+        )
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _run(base_url: str, backend: str, detail_level: str, limit: int) -> tuple:
+    client = GitHubClient(
+        token="stub",
+        default_owner=OWNER,
+        default_repo=REPO,
+        installation_id=1,
+        base_url=base_url,
+    )
+    REQUESTS.clear()
+    start = time.perf_counter()
+    prs = client.list_prs(limit=limit, detail_level=detail_level, backend=backend)
+    elapsed = (time.perf_counter() - start) * 1000
+    client.close()
+    assert len(prs) == limit
+    return sum(REQUESTS.values()), dict(REQUESTS), elapsed
+
+
+def main():
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"list_prs(limit={limit}) against local stub")
+    for detail_level in ("summary", "full"):
+        for backend in ("rest", "graphql"):
+            total, breakdown, elapsed = _run(base_url, backend, detail_level, limit)
+            print(
+                f"{detail_level:<8} {backend:<8} requests={total:<4} "
+                f"time={elapsed:8.1f}ms"
+            )
+            for kind, count in sorted(breakdown.items()):
+                print(f"    {count:>4}  {kind}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
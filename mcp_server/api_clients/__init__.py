@@ -1,6 +1,8 @@
 """API clients for external services."""
 
+from mcp_server.api_clients.async_github_client import AsyncGitHubClient
 from mcp_server.api_clients.github_client import GitHubClient
+from mcp_server.api_clients.http_cache import HTTPCache
 from mcp_server.api_clients.slack_client import SlackClient
 
-__all__ = ["GitHubClient", "SlackClient"]
+__all__ = ["AsyncGitHubClient", "GitHubClient", "HTTPCache", "SlackClient"]
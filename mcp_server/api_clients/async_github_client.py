@@ -0,0 +1,664 @@
+"""
+Async GitHub API client for MCP server.
+
+Mirrors GitHubClient on httpx.AsyncClient so tools can await GitHub I/O
+instead of blocking the event loop. Read paths (PR/branch/issue listings,
+search, batched PR fetches, GraphQL) are native async; everything else is
+delegated to a wrapped GitHubClient on a worker thread. Query building,
+response parsing, search window splitting and batch bookkeeping are
+GitHubClient's own helpers, so only the I/O differs between the two.
+"""
+
+import asyncio
+import functools
+import logging
+import weakref
+from datetime import date
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from github import GithubException
+
+from mcp_server.api_clients.github_client import (
+    DEFAULT_POOL_LIMITS,
+    GITHUB_API_URL,
+    PR_BATCH_SIZE,
+    GitHubClient,
+    PullRequest,
+    PullRequestSummary,
+    Repository,
+    _http2_available,
+    _PRBatch,
+    _weak_hook,
+)
+from mcp_server.api_clients.http_cache import AsyncCachingTransport, HTTPCache
+from mcp_server.api_clients.rate_limit import AsyncRateLimitTransport, RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+def _aclose_soon(
+    http: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Finalizer for AsyncGitHubClient: schedule closing its pool."""
+    if loop is None or loop.is_closed():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(http.aclose(), loop)
+    except RuntimeError as e:
+        logger.debug(f"Could not close async GitHub client: {e}")
+
+
+class AsyncGitHubClient:
+    """
+    Async GitHub API client.
+
+    Has the same methods as GitHubClient, as coroutines. Shares the token,
+    defaults and rate limiter with a wrapped GitHubClient, which serves the
+    operations that still go through PyGithub.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        default_owner: Optional[str] = None,
+        default_repo: Optional[str] = None,
+        installation_id: Optional[int] = None,
+        base_url: str = GITHUB_API_URL,
+        pool_limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        on_unauthorized: Optional[Callable[[], None]] = None,
+        http_cache: Optional[HTTPCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        sync_client: Optional[GitHubClient] = None,
+    ):
+        """
+        Initialize async GitHub API client.
+
+        Args:
+            token: GitHub access token (installation token or PAT)
+            default_owner: Default repository owner (optional)
+            default_repo: Default repository name (optional)
+            installation_id: GitHub App installation ID (None for PAT mode)
+            base_url: GitHub API base URL (override for GHE or local testing)
+            pool_limits: Connection pool limits for the async HTTP transport
+            http2: Enable HTTP/2. Defaults to True when the h2 package is installed.
+            transport: Custom async httpx transport (optional, mainly for testing)
+            on_unauthorized: Callback invoked when GitHub rejects the token (401)
+            http_cache: On-disk response cache for REST GETs
+            rate_limiter: Scheduler for core/search/GraphQL budgets
+            sync_client: GitHubClient for delegated operations. Created from the
+                         other arguments if not given.
+        """
+        self._sync = sync_client or GitHubClient(
+            token=token,
+            default_owner=default_owner,
+            default_repo=default_repo,
+            installation_id=installation_id,
+            base_url=base_url,
+            pool_limits=pool_limits,
+            http2=http2,
+            on_unauthorized=on_unauthorized,
+            http_cache=http_cache,
+            rate_limiter=rate_limiter,
+        )
+        self.rate_limiter = rate_limiter or self._sync.rate_limiter
+
+        limits = pool_limits or DEFAULT_POOL_LIMITS
+        if http2 is None:
+            http2 = _http2_available()
+
+        # Same layering as GitHubClient: cache -> rate limiter -> network
+        transport = AsyncRateLimitTransport(
+            transport or httpx.AsyncHTTPTransport(limits=limits, http2=http2),
+            self.rate_limiter,
+        )
+        if http_cache is not None:
+            transport = AsyncCachingTransport(
+                transport, http_cache, identity=self._sync.cache_identity
+            )
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            timeout=30.0,
+            transport=transport,
+            event_hooks={"response": [_weak_hook(self, "_check_unauthorized")]},
+        )
+        # Close the pool once the client is garbage-collected, on the loop it
+        # was created on (a replaced client may still be serving calls)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        self._finalizer = weakref.finalize(self, _aclose_soon, self._http, loop)
+
+    @classmethod
+    def from_client(
+        cls,
+        client: GitHubClient,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> "AsyncGitHubClient":
+        """Create an async client sharing a GitHubClient's token and budgets."""
+        return cls(
+            token=client.token,
+            default_owner=client.default_owner,
+            default_repo=client.default_repo,
+            installation_id=client.installation_id,
+            base_url=client.base_url,
+            transport=transport,
+            on_unauthorized=client._on_unauthorized,
+            http_cache=client.http_cache,
+            rate_limiter=client.rate_limiter,
+            sync_client=client,
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate operations without a native async version to a thread."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self._sync, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call_in_thread(*args, **kwargs):
+            return await asyncio.to_thread(attr, *args, **kwargs)
+
+        return call_in_thread
+
+    async def _check_unauthorized(self, response: httpx.Response) -> None:
+        """Response hook: notify the owner when the token is rejected."""
+        self._sync._check_unauthorized(response)
+
+    @property
+    def sync_client(self) -> GitHubClient:
+        """The wrapped blocking client."""
+        return self._sync
+
+    @property
+    def is_pat_mode(self) -> bool:
+        """Check if client is using PAT authentication."""
+        return self._sync.is_pat_mode
+
+    async def get_rate_limits(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get remaining GitHub API budget per resource.
+
+        Returns:
+            Dict of resource ('core', 'search', 'graphql', ...) to
+            limit/remaining/used/reset_at
+        """
+        try:
+            response = await self._http.get("/rate_limit")
+            response.raise_for_status()
+            self.rate_limiter.update_from_status(response.json().get("resources", {}))
+        except Exception as e:
+            logger.warning(f"Failed to fetch rate limits, using last known: {e}")
+        return self.rate_limiter.snapshot()
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client (the wrapped client stays open)."""
+        self._finalizer.detach()
+        await self._http.aclose()
+
+    async def _paginate(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield items from a paginated REST list endpoint (async)."""
+        url = path
+        params = {**(params or {}), "per_page": 100}
+        while url:
+            try:
+                response = await self._http.get(url, params=params)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                logger.error(f"GET {path} failed: HTTP {e.response.status_code}")
+                raise GithubException(e.response.status_code, e.response.json())
+
+            for item in response.json():
+                yield item
+
+            next_link = response.links.get("next")
+            url = next_link["url"] if next_link else None
+            # The next link already carries the query string
+            params = None
+
+    # ========================================================================
+    # Repository Operations
+    # ========================================================================
+
+    async def list_repos(self, limit: int = 20) -> List[Repository]:
+        """
+        List repositories accessible to the authenticated user/installation.
+
+        Args:
+            limit: Maximum repositories to return
+
+        Returns:
+            List of repositories
+        """
+        if self.is_pat_mode:
+            # PAT mode lists through PyGithub's user.get_repos()
+            return await asyncio.to_thread(self._sync.list_repos, limit)
+
+        try:
+            response = await self._http.get(
+                "/installation/repositories", params={"per_page": limit}
+            )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"Failed to list installation repos: HTTP {e.response.status_code}"
+            )
+            raise GithubException(e.response.status_code, e.response.json())
+
+        return [
+            Repository(
+                name=repo_data["name"],
+                owner=repo_data["owner"]["login"],
+                full_name=repo_data["full_name"],
+                html_url=repo_data["html_url"],
+                description=repo_data.get("description") or "",
+                default_branch=repo_data.get("default_branch", "main"),
+                private=repo_data.get("private", False),
+            )
+            for repo_data in response.json().get("repositories", [])[:limit]
+        ]
+
+    # ========================================================================
+    # Pull Request Operations
+    # ========================================================================
+
+    async def list_prs(
+        self,
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        state: str = "open",
+        limit: int = 20,
+        detail_level: str = "summary",
+        backend: str = "auto",
+    ) -> List[PullRequest] | List[PullRequestSummary]:
+        """
+        List pull requests.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            state: PR state: 'open', 'closed', or 'all'
+            limit: Maximum PRs to return
+            detail_level: 'summary' for minimal fields, 'full' for all fields
+            backend: 'auto', 'graphql', 'rest_list' or 'rest' (see
+                     GitHubClient.list_prs)
+
+        Returns:
+            List of pull requests (summary or full based on detail_level)
+        """
+        if backend == "auto":
+            backend = "graphql" if detail_level == "full" else "rest_list"
+        if backend == "rest_list":
+            return await self._list_prs_rest_summary(owner, repo, state, limit)
+        if backend == "graphql":
+            return await self._list_prs_graphql(owner, repo, state, limit, detail_level)
+        return await asyncio.to_thread(
+            self._sync.list_prs, owner, repo, state, limit, detail_level, backend
+        )
+
+    async def _list_prs_rest_summary(
+        self,
+        owner: Optional[str],
+        repo: Optional[str],
+        state: str,
+        limit: int,
+    ) -> List[PullRequestSummary]:
+        """List PR summaries from the REST list endpoint (100 PRs per request)."""
+        prs = []
+        params = {"state": state, "sort": "updated", "direction": "desc"}
+        path = f"{self._sync._repo_path(owner, repo)}/pulls"
+        async for item in self._paginate(path, params):
+            if len(prs) >= limit:
+                break
+            prs.append(self._sync._convert_rest_pr_summary(item))
+        return prs
+
+    async def _list_prs_graphql(
+        self,
+        owner: Optional[str],
+        repo: Optional[str],
+        state: str,
+        limit: int,
+        detail_level: str,
+    ) -> List[PullRequest] | List[PullRequestSummary]:
+        """List pull requests with a paged GraphQL query (100 PRs per request)."""
+        owner, repo = self._sync._resolve_repo(owner, repo)
+        query = self._sync._pr_list_query(state, detail_level)
+
+        prs = []
+        cursor = None
+        while len(prs) < limit:
+            data = await self._graphql_request(
+                query,
+                self._sync._pr_list_variables(
+                    owner, repo, state, limit - len(prs), cursor
+                ),
+            )
+            page, cursor = self._sync._parse_pr_list_page(
+                data, owner, repo, detail_level
+            )
+            prs.extend(page)
+            if not cursor:
+                break
+
+        return prs[:limit]
+
+    # ========================================================================
+    # Branch Operations
+    # ========================================================================
+
+    async def list_branches(
+        self,
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        limit: int = 30,
+    ) -> List[Dict[str, Any]]:
+        """
+        List repository branches.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            limit: Maximum branches to return
+
+        Returns:
+            List of branch info dicts
+        """
+        branches = []
+        path = f"{self._sync._repo_path(owner, repo)}/branches"
+        async for branch in self._paginate(path):
+            if len(branches) >= limit:
+                break
+            branches.append(
+                {
+                    "name": branch["name"],
+                    "sha": branch["commit"]["sha"],
+                    "protected": branch.get("protected", False),
+                }
+            )
+        return branches
+
+    # ========================================================================
+    # Issue Operations
+    # ========================================================================
+
+    async def list_issues(
+        self,
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        state: str = "open",
+        labels: Optional[List[str]] = None,
+        assignee: Optional[str] = None,
+        creator: Optional[str] = None,
+        milestone: Optional[str] = None,
+        sort: str = "updated",
+        limit: int = 30,
+    ) -> List[Dict[str, Any]]:
+        """
+        List issues in a repository.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            state: Issue state: 'open', 'closed', or 'all'
+            labels: Filter by labels
+            assignee: Filter by assignee username
+            creator: Filter by issue creator username
+            milestone: Filter by milestone (number, title, or '*' for any, 'none' for no milestone)
+            sort: Sort by 'created', 'updated', or 'comments'
+            limit: Maximum issues to return
+
+        Returns:
+            List of issue summaries
+        """
+        repo_path = self._sync._repo_path(owner, repo)
+        params = self._sync._issue_list_params(state, labels, assignee, creator, sort)
+        if milestone:
+            if milestone == "*" or milestone == "none" or milestone.isdigit():
+                params["milestone"] = milestone
+            else:
+                async for ms in self._paginate(
+                    f"{repo_path}/milestones", {"state": "all"}
+                ):
+                    if ms["title"].lower() == milestone.lower():
+                        params["milestone"] = str(ms["number"])
+                        break
+
+        issues = []
+        async for issue in self._paginate(f"{repo_path}/issues", params):
+            # Skip pull requests (GitHub API returns PRs in issues endpoint)
+            if issue.get("pull_request") is not None:
+                continue
+            issues.append(self._sync._convert_rest_issue_summary(issue))
+            if len(issues) >= limit:
+                break
+        return issues
+
+    # ========================================================================
+    # Search Operations
+    # ========================================================================
+
+    async def search_merged_prs(
+        self,
+        author: Optional[str] = None,
+        since_date: Optional[str] = None,
+        org: Optional[str] = None,
+        repo: Optional[str] = None,
+        limit: Optional[int] = 100,
+        detail_level: str = "summary",
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for merged pull requests using GitHub Search API.
+
+        Args:
+            author: GitHub username to filter by
+            since_date: ISO date string (YYYY-MM-DD) - only PRs merged after this date
+            org: GitHub org to search within
+            repo: Specific repo in "owner/repo" format (overrides org if specified)
+            limit: Maximum PRs to return (None for all matches)
+            detail_level: 'summary' for minimal fields, 'full' for all fields
+
+        Returns:
+            List of merged PR dicts (see GitHubClient.search_merged_prs)
+        """
+        prs = []
+        async for pr in self.iter_merged_prs(
+            author=author,
+            since_date=since_date,
+            org=org,
+            repo=repo,
+            detail_level=detail_level,
+        ):
+            if limit is not None and len(prs) >= limit:
+                break
+            prs.append(pr)
+        return prs
+
+    async def iter_merged_prs(
+        self,
+        author: Optional[str] = None,
+        since_date: Optional[str] = None,
+        until_date: Optional[str] = None,
+        org: Optional[str] = None,
+        repo: Optional[str] = None,
+        detail_level: str = "summary",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream merged pull requests from the Search API, page by page.
+
+        Yields:
+            Merged PR dicts in the same format as search_merged_prs
+        """
+        base_query, start, end = self._sync._merged_pr_search(
+            author, since_date, until_date, org, repo
+        )
+
+        seen = set()
+        async for item in self._iter_search_window(base_query, start, end):
+            # Results can shift between pages while paginating
+            if item["html_url"] in seen:
+                continue
+            seen.add(item["html_url"])
+            yield self._sync._convert_search_pr(item, detail_level)
+
+    async def _iter_search_window(
+        self, base_query: str, start: date, end: date
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield raw search items merged in [start, end], splitting past the cap."""
+        data, next_url = await self._search_issues_page(
+            "/search/issues",
+            params=self._sync._search_window_params(base_query, start, end),
+        )
+
+        windows = self._sync._split_search_window(data, start, end)
+        if windows:
+            for window in windows:
+                async for item in self._iter_search_window(base_query, *window):
+                    yield item
+            return
+
+        for item in data.get("items", []):
+            yield item
+        while next_url:
+            data, next_url = await self._search_issues_page(next_url)
+            for item in data.get("items", []):
+                yield item
+
+    async def _search_issues_page(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Fetch one Search API page; returns (response JSON, next page URL)."""
+        try:
+            response = await self._http.get(url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Failed to search PRs: HTTP {e.response.status_code}")
+            raise GithubException(e.response.status_code, e.response.json())
+
+        next_link = response.links.get("next")
+        return response.json(), next_link["url"] if next_link else None
+
+    # ========================================================================
+    # Batched PR Fetching
+    # ========================================================================
+
+    async def fetch_prs_parallel(
+        self,
+        pr_refs: List[Dict[str, Any]],
+        max_workers: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Fetch full PR details for multiple PRs, dropping the error list."""
+        prs, _ = await self.fetch_prs_batch(pr_refs, max_workers=max_workers)
+        return prs
+
+    async def fetch_prs_batch(
+        self,
+        pr_refs: List[Dict[str, Any]],
+        batch_size: int = PR_BATCH_SIZE,
+        max_workers: int = 10,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fetch full PR details for multiple PRs with aliased GraphQL queries.
+
+        Same contract as GitHubClient.fetch_prs_batch; batches run
+        concurrently on the event loop.
+
+        Args:
+            pr_refs: List of dicts with 'owner', 'repo', 'number' keys
+            batch_size: PR lookups per GraphQL query (default: 50)
+            max_workers: Max concurrent requests (default: 10)
+
+        Returns:
+            Tuple of (prs, errors) in the order of pr_refs
+        """
+        batch = _PRBatch(pr_refs, batch_size)
+        slots = asyncio.Semaphore(max_workers)
+
+        async def fetch_batch(indexes: List[int]) -> None:
+            try:
+                async with slots:
+                    found, failed = await self._graphql_pr_batch(batch.refs(indexes))
+            except Exception as e:
+                batch.batch_failed(indexes, e)
+                return
+            batch.batch_done(indexes, found, failed)
+
+        async def fetch_single_pr(index: int) -> None:
+            pr_ref = pr_refs[index]
+            try:
+                async with slots:
+                    pr = await asyncio.to_thread(
+                        self._sync.get_pr,
+                        pr_ref["number"],
+                        owner=pr_ref["owner"],
+                        repo=pr_ref["repo"],
+                    )
+            except Exception as e:
+                batch.single_failed(index, e)
+                return
+            batch.single_done(index, pr)
+
+        await asyncio.gather(*(fetch_batch(indexes) for indexes in batch.batches))
+        if batch.retry:
+            logger.info(f"Falling back to REST for {len(batch.retry)} PRs")
+            await asyncio.gather(*(fetch_single_pr(i) for i in sorted(batch.retry)))
+
+        return batch.outcome()
+
+    async def _graphql_pr_batch(
+        self, pr_refs: List[Dict[str, Any]]
+    ) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, str]]:
+        """Look up a batch of PRs in a single aliased GraphQL query."""
+        query, variables = self._sync._pr_batch_query(pr_refs)
+        data, graphql_errors = await self._graphql_request_partial(query, variables)
+        return self._sync._parse_pr_batch(pr_refs, data, graphql_errors)
+
+    # ========================================================================
+    # GraphQL
+    # ========================================================================
+
+    async def _graphql_request(
+        self, query: str, variables: Optional[Dict] = None
+    ) -> Dict:
+        """Execute a GraphQL request, raising GithubException on any error."""
+        data, errors = await self._graphql_request_partial(query, variables)
+        if errors:
+            error_messages = [e.get("message", str(e)) for e in errors]
+            raise GithubException(
+                400, {"message": "; ".join(error_messages)}, "GraphQL Error"
+            )
+        return data
+
+    async def _graphql_request_partial(
+        self, query: str, variables: Optional[Dict] = None
+    ) -> Tuple[Dict, List[Dict]]:
+        """Execute a GraphQL request, returning partial data alongside errors."""
+        try:
+            response = await self._http.post(
+                "/graphql",
+                json={"query": query, "variables": variables or {}},
+            )
+            response.raise_for_status()
+            data = response.json()
+            return data.get("data") or {}, data.get("errors") or []
+        except httpx.HTTPStatusError as e:
+            logger.error(f"GraphQL request failed: HTTP {e.response.status_code}")
+            raise GithubException(e.response.status_code, e.response.json())
+        except GithubException:
+            # e.g. rate limit exhausted
+            raise
+        except Exception as e:
+            logger.error(f"GraphQL request failed: {e}")
+            raise GithubException(500, {"message": str(e)})
@@ -5,17 +5,48 @@ Provides GitHub API operations using PyGithub library.
 Focuses on PRs and commits for minimal implementation.
 """
 
+import asyncio
+import hashlib
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Dict, Any, Tuple
+from datetime import date, datetime, timedelta, timezone
 
-from github import Github, GithubException, Auth
+from github import Github, GithubException
 from pydantic import BaseModel
 import httpx
 
+from mcp_server.api_clients.http_cache import CachingTransport, HTTPCache
+from mcp_server.api_clients.rate_limit import (
+    RateLimitedTokenAuth,
+    RateLimiter,
+    RateLimitTransport,
+)
+
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Shared connection pool for raw REST/GraphQL calls. Keep-alive connections are
+# reused across calls so chained GraphQL operations skip the TCP+TLS handshake.
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=60.0,
+)
+
+
+def _http2_available() -> bool:
+    """Check if the optional h2 package is installed (required for HTTP/2)."""
+    try:
+        import h2  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
 
 # ============================================================================
 # Pydantic models for GitHub data
@@ -90,11 +121,188 @@ class Repository(BaseModel):
     private: bool = False
 
 
+# ============================================================================
+# GraphQL selections for pull requests
+# ============================================================================
+
+# Fields needed for PullRequestSummary
+PR_SUMMARY_GRAPHQL_FIELDS = """
+    number
+    title
+    state
+    author { login }
+    createdAt
+    mergedAt
+    url
+"""
+
+# Fields needed for PullRequest (superset of the summary fields)
+PR_FULL_GRAPHQL_FIELDS = (
+    PR_SUMMARY_GRAPHQL_FIELDS
+    + """
+    body
+    updatedAt
+    headRefName
+    baseRefName
+    additions
+    deletions
+    changedFiles
+    commits { totalCount }
+    isDraft
+    mergeable
+    labels(first: 50) { nodes { name } }
+    reviewRequests(first: 50) {
+        nodes { requestedReviewer { ... on User { login } } }
+    }
+"""
+)
+
+# GraphQL pullRequests connection accepts at most 100 nodes per page
+GRAPHQL_PAGE_SIZE = 100
+
+# PR lookups packed into one aliased GraphQL query by fetch_prs_batch
+PR_BATCH_SIZE = 50
+
+# The Search API returns at most 1000 results per query, 100 per page
+SEARCH_RESULT_CAP = 1000
+SEARCH_PAGE_SIZE = 100
+
+# Lower bound for merged: ranges when no since_date is given
+SEARCH_EPOCH = date(2008, 1, 1)
+
+# REST-style state filter -> GraphQL PullRequestState list (None = all states)
+_PR_STATES_GRAPHQL = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "all": None,
+}
+
+# GraphQL MergeableState -> REST-style mergeable flag
+_MERGEABLE_GRAPHQL = {"MERGEABLE": True, "CONFLICTING": False}
+
+# Seconds project IDs and field definitions (incl. option IDs) are reused
+PROJECT_METADATA_TTL = 300.0
+
+# Aliased operations per GraphQL document in bulk project updates; keeps each
+# request well under GitHub's query complexity limits
+PROJECT_BATCH_SIZE = 50
+
+
 # ============================================================================
 # GitHub Client
 # ============================================================================
 
 
+def _weak_hook(owner: Any, name: str) -> Callable:
+    """
+    httpx event hook calling owner.<name> without keeping owner alive.
+
+    A bound-method hook would tie the client to its own HTTP pool, so the
+    pool's finalizer could never run.
+    """
+    ref = weakref.ref(owner)
+    method = getattr(type(owner), name)
+    if asyncio.iscoroutinefunction(method):
+
+        async def async_hook(response: httpx.Response) -> None:
+            target = ref()
+            if target is not None:
+                await method(target, response)
+
+        return async_hook
+
+    def hook(response: httpx.Response) -> None:
+        target = ref()
+        if target is not None:
+            method(target, response)
+
+    return hook
+
+
+def _close_pools(http: httpx.Client, gh: Github) -> None:
+    """Finalizer for GitHubClient: close both connection pools."""
+    http.close()
+    gh.close()
+
+
+class _PRBatch:
+    """
+    Bookkeeping for fetch_prs_batch, shared by the sync and async clients.
+
+    The clients only run the requests: one aliased GraphQL query per batch,
+    then a REST lookup per PR in `retry`. Results are keyed by position in
+    pr_refs so they come back in input order.
+    """
+
+    def __init__(self, pr_refs: List[Dict[str, Any]], batch_size: int):
+        self.pr_refs = pr_refs
+        self.batches = [
+            list(range(i, min(i + batch_size, len(pr_refs))))
+            for i in range(0, len(pr_refs), batch_size)
+        ]
+        self.retry: List[int] = []
+        self._results: Dict[int, Dict[str, Any]] = {}
+        self._errors: Dict[int, Dict[str, Any]] = {}
+
+    def refs(self, indexes: List[int]) -> List[Dict[str, Any]]:
+        return [self.pr_refs[i] for i in indexes]
+
+    def batch_done(
+        self,
+        indexes: List[int],
+        found: Dict[int, Dict[str, Any]],
+        failed: Dict[int, str],
+    ) -> None:
+        """Record a GraphQL batch; lookups failing other than NOT_FOUND retry."""
+        for position, index in enumerate(indexes):
+            if position in found:
+                self._results[index] = found[position]
+            elif failed.get(position) == "NOT_FOUND":
+                self._errors[index] = self._error(index, "PR not found")
+            else:
+                self.retry.append(index)
+
+    def batch_failed(self, indexes: List[int], error: Exception) -> None:
+        logger.warning(
+            f"GraphQL batch of {len(indexes)} PRs failed, using REST: {error}"
+        )
+        self.retry.extend(indexes)
+
+    def single_done(self, index: int, pr: Optional["PullRequest"]) -> None:
+        """Record a REST lookup (None if the PR doesn't exist)."""
+        if pr is None:
+            self._errors[index] = self._error(index, "PR not found")
+            return
+        pr_dict = pr.model_dump()
+        # Add owner/repo for context
+        pr_dict["owner"] = self.pr_refs[index]["owner"]
+        pr_dict["repo"] = self.pr_refs[index]["repo"]
+        self._results[index] = pr_dict
+
+    def single_failed(self, index: int, error: Exception) -> None:
+        logger.warning(f"Failed to fetch PR {self.pr_refs[index]}: {error}")
+        self._errors[index] = self._error(index, str(error))
+
+    def outcome(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """(prs, errors), both in the order of pr_refs."""
+        if self._errors:
+            logger.warning(f"Failed to fetch {len(self._errors)} PRs")
+        return (
+            [self._results[i] for i in sorted(self._results)],
+            [self._errors[i] for i in sorted(self._errors)],
+        )
+
+    def _error(self, index: int, error: str) -> Dict[str, Any]:
+        """Build a per-PR error entry for batch fetch results."""
+        pr_ref = self.pr_refs[index]
+        return {
+            "owner": pr_ref.get("owner"),
+            "repo": pr_ref.get("repo"),
+            "number": pr_ref.get("number"),
+            "error": error,
+        }
+
+
 class GitHubClient:
     """
     GitHub API client using PyGithub.
@@ -113,6 +321,14 @@ class GitHubClient:
         default_owner: Optional[str] = None,
         default_repo: Optional[str] = None,
         installation_id: Optional[int] = None,
+        base_url: str = GITHUB_API_URL,
+        pool_limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        on_unauthorized: Optional[Callable[[], None]] = None,
+        http_cache: Optional[HTTPCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        project_metadata_ttl: float = PROJECT_METADATA_TTL,
     ):
         """
         Initialize GitHub API client.
@@ -122,27 +338,103 @@ class GitHubClient:
             default_owner: Default repository owner (optional)
             default_repo: Default repository name (optional)
             installation_id: GitHub App installation ID (None for PAT mode)
+            base_url: GitHub API base URL (override for GHE or local testing)
+            pool_limits: Connection pool limits for the shared HTTP transport
+            http2: Enable HTTP/2. Defaults to True when the h2 package is installed.
+            transport: Custom httpx transport (optional, mainly for testing)
+            on_unauthorized: Callback invoked when GitHub rejects the token (401),
+                             e.g. to invalidate cached credentials
+            http_cache: On-disk response cache. REST GETs are revalidated with
+                        ETag/Last-Modified; 304s don't count against rate limits.
+            rate_limiter: Scheduler for core/search/GraphQL budgets. Share one
+                          between clients using the same token.
+            project_metadata_ttl: Seconds to reuse resolved project IDs and
+                                  field definitions (0 disables)
         """
         self.token = token
         self.default_owner = default_owner
         self.default_repo = default_repo
         self.installation_id = installation_id
+        self.base_url = base_url
+        self.http_cache = http_cache
+        self._on_unauthorized = on_unauthorized
 
         # Detect if this is a PAT (no installation_id means PAT mode)
         self._is_pat_mode = installation_id is None
 
-        # Initialize PyGithub client
-        auth = Auth.Token(token)
-        self.gh = Github(auth=auth)
+        limits = pool_limits or DEFAULT_POOL_LIMITS
+        if http2 is None:
+            http2 = _http2_available()
+
+        # Initialize PyGithub client; its requests draw from the same budget
+        self.rate_limiter = rate_limiter or RateLimiter()
+        auth = RateLimitedTokenAuth(token, self.rate_limiter)
+        self.gh = Github(auth=auth, base_url=base_url, pool_size=limits.max_connections)
+
+        # Long-lived pooled HTTP client for raw REST/GraphQL calls
+        # Requests go cache -> rate limiter -> network, so cache hits never
+        # wait on a budget
+        transport = RateLimitTransport(
+            transport or httpx.HTTPTransport(limits=limits, http2=http2),
+            self.rate_limiter,
+        )
+        if http_cache is not None:
+            transport = CachingTransport(
+                transport, http_cache, identity=self.cache_identity
+            )
+        self._http = httpx.Client(
+            base_url=base_url,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            timeout=30.0,
+            transport=transport,
+            event_hooks={"response": [_weak_hook(self, "_check_unauthorized")]},
+        )
+        # Release the pools once the client is garbage-collected, so a client
+        # replaced while calls are still using it is closed after the last one
+        self._finalizer = weakref.finalize(self, _close_pools, self._http, self.gh)
 
         # Cache for repo objects
         self._repo_cache: Dict[str, Any] = {}
 
+        # Projects V2 item index: project node ID -> {issue node ID: item ID}.
+        # Filled from issue.projectItems lookups and kept current on add/remove.
+        self._project_items: Dict[str, Dict[str, str]] = {}
+        # (owner, repo, number) -> issue node ID; node IDs don't change
+        self._issue_node_ids: Dict[Tuple[str, str, int], str] = {}
+        # Project IDs and field definitions: key -> (monotonic expiry, value)
+        self.project_metadata_ttl = project_metadata_ttl
+        self._project_metadata: Dict[Tuple, Tuple[float, Any]] = {}
+
+    def _check_unauthorized(self, response: httpx.Response) -> None:
+        """Response hook: notify the owner when the token is rejected."""
+        if response.status_code == 401 and self._on_unauthorized:
+            logger.warning("GitHub rejected token (401), invalidating credentials")
+            try:
+                self._on_unauthorized()
+            except Exception as e:
+                logger.debug(f"on_unauthorized callback failed: {e}")
+
     @property
     def is_pat_mode(self) -> bool:
         """Check if client is using PAT authentication."""
         return self._is_pat_mode
 
+    @property
+    def cache_identity(self) -> str:
+        """
+        Stable name for the account behind the token, for cache keys.
+
+        GitHub App installation tokens rotate at least hourly, so they are
+        named by installation; a PAT by a digest of the token.
+        """
+        if self.installation_id is not None:
+            return f"installation:{self.installation_id}"
+        return "token:" + hashlib.sha256(self.token.encode()).hexdigest()[:16]
+
     def _get_repo(self, owner: Optional[str] = None, repo: Optional[str] = None):
         """Get PyGithub repo object, using defaults if not specified."""
         owner = owner or self.default_owner
@@ -169,17 +461,10 @@ class GitHubClient:
                 return True
             else:
                 # For installation tokens, use /installation/repositories endpoint
-                with httpx.Client() as client:
-                    response = client.get(
-                        "https://api.github.com/installation/repositories",
-                        headers={
-                            "Authorization": f"Bearer {self.token}",
-                            "Accept": "application/vnd.github+json",
-                            "X-GitHub-Api-Version": "2022-11-28",
-                        },
-                        params={"per_page": 1},
-                    )
-                    return response.status_code == 200
+                response = self._http.get(
+                    "/installation/repositories", params={"per_page": 1}
+                )
+                return response.status_code == 200
         except Exception:
             return False
 
@@ -207,9 +492,73 @@ class GitHubClient:
                 pass
             return self.default_owner or "GitHub App"
 
+    def get_rate_limits(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get remaining GitHub API budget per resource.
+
+        Calls GET /rate_limit (which doesn't count against any limit) and
+        syncs the scheduler with it.
+
+        Returns:
+            Dict of resource ('core', 'search', 'graphql', ...) to
+            limit/remaining/used/reset_at
+        """
+        try:
+            response = self._http.get("/rate_limit")
+            response.raise_for_status()
+            self.rate_limiter.update_from_status(response.json().get("resources", {}))
+        except Exception as e:
+            logger.warning(f"Failed to fetch rate limits, using last known: {e}")
+        return self.rate_limiter.snapshot()
+
     def close(self):
-        """Close GitHub API client."""
-        self.gh.close()
+        """Close GitHub API client and release pooled connections."""
+        self._finalizer()
+
+    def _resolve_repo(
+        self, owner: Optional[str] = None, repo: Optional[str] = None
+    ) -> Tuple[str, str]:
+        """Fill in default owner/repo, raising if either is still missing."""
+        owner = owner or self.default_owner
+        repo = repo or self.default_repo
+
+        if not owner or not repo:
+            raise ValueError(
+                "Repository owner and name must be specified or set as defaults"
+            )
+
+        return owner, repo
+
+    def _repo_path(self, owner: Optional[str] = None, repo: Optional[str] = None):
+        """REST path for a repo, using defaults if not specified."""
+        owner, repo = self._resolve_repo(owner, repo)
+        return f"/repos/{owner}/{repo}"
+
+    def _paginate(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield items from a paginated REST list endpoint.
+
+        Follows Link headers, 100 items per page. Goes through the pooled
+        client, so pages are revalidated against the HTTP cache if enabled.
+        """
+        url = path
+        params = {**(params or {}), "per_page": 100}
+        while url:
+            try:
+                response = self._http.get(url, params=params)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                logger.error(f"GET {path} failed: HTTP {e.response.status_code}")
+                raise GithubException(e.response.status_code, e.response.json())
+
+            yield from response.json()
+
+            next_link = response.links.get("next")
+            url = next_link["url"] if next_link else None
+            # The next link already carries the query string
+            params = None
 
     # ========================================================================
     # Repository Operations
@@ -260,31 +609,24 @@ class GitHubClient:
                 # Installation tokens can't use PyGithub's user.get_repos() endpoint
                 # Must use /installation/repositories endpoint directly (same as backend)
                 # https://docs.github.com/en/rest/apps/installations#list-repositories-accessible-to-the-app-installation
-                with httpx.Client() as client:
-                    response = client.get(
-                        "https://api.github.com/installation/repositories",
-                        headers={
-                            "Authorization": f"Bearer {self.token}",
-                            "Accept": "application/vnd.github+json",
-                            "X-GitHub-Api-Version": "2022-11-28",
-                        },
-                        params={"per_page": limit},
-                    )
-                    response.raise_for_status()
-                    data = response.json()
-
-                    for repo_data in data.get("repositories", [])[:limit]:
-                        repos.append(
-                            Repository(
-                                name=repo_data["name"],
-                                owner=repo_data["owner"]["login"],
-                                full_name=repo_data["full_name"],
-                                html_url=repo_data["html_url"],
-                                description=repo_data.get("description") or "",
-                                default_branch=repo_data.get("default_branch", "main"),
-                                private=repo_data.get("private", False),
-                            )
+                response = self._http.get(
+                    "/installation/repositories", params={"per_page": limit}
+                )
+                response.raise_for_status()
+                data = response.json()
+
+                for repo_data in data.get("repositories", [])[:limit]:
+                    repos.append(
+                        Repository(
+                            name=repo_data["name"],
+                            owner=repo_data["owner"]["login"],
+                            full_name=repo_data["full_name"],
+                            html_url=repo_data["html_url"],
+                            description=repo_data.get("description") or "",
+                            default_branch=repo_data.get("default_branch", "main"),
+                            private=repo_data.get("private", False),
                         )
+                    )
             except httpx.HTTPStatusError as e:
                 logger.error(
                     f"Failed to list installation repos: HTTP {e.response.status_code}"
@@ -322,6 +664,7 @@ class GitHubClient:
         state: str = "open",
         limit: int = 20,
         detail_level: str = "summary",
+        backend: str = "auto",
     ) -> List[PullRequest] | List[PullRequestSummary]:
         """
         List pull requests.
@@ -333,10 +676,26 @@ class GitHubClient:
             limit: Maximum PRs to return
             detail_level: 'summary' for minimal fields (~200 bytes/PR),
                          'full' for all fields (~2KB/PR)
+            backend: 'graphql' fetches exactly the needed fields in one request
+                     per 100 PRs. 'rest' uses PyGithub, which makes an extra
+                     request per PR for detail_level='full'. 'auto' (default)
+                     uses GraphQL for full details and the REST list endpoint
+                     for summaries, which the HTTP cache can revalidate.
 
         Returns:
             List of pull requests (summary or full based on detail_level)
         """
+        if backend == "auto":
+            backend = "graphql" if detail_level == "full" else "rest_list"
+        if backend == "rest_list":
+            return self._list_prs_rest_summary(owner, repo, state, limit)
+        if backend == "graphql":
+            return self._list_prs_graphql(owner, repo, state, limit, detail_level)
+        if backend != "rest":
+            raise ValueError(
+                f"Unknown backend '{backend}'. Use 'auto', 'graphql' or 'rest'."
+            )
+
         gh_repo = self._get_repo(owner, repo)
         prs = []
 
@@ -355,6 +714,128 @@ class GitHubClient:
 
         return prs
 
+    def _list_prs_rest_summary(
+        self,
+        owner: Optional[str],
+        repo: Optional[str],
+        state: str,
+        limit: int,
+    ) -> List[PullRequestSummary]:
+        """List PR summaries from the REST list endpoint (100 PRs per request)."""
+        prs = []
+        params = {"state": state, "sort": "updated", "direction": "desc"}
+        for item in self._paginate(f"{self._repo_path(owner, repo)}/pulls", params):
+            if len(prs) >= limit:
+                break
+            prs.append(self._convert_rest_pr_summary(item))
+        return prs
+
+    def _convert_rest_pr_summary(self, item: Dict[str, Any]) -> PullRequestSummary:
+        """Convert a REST pull request JSON object to summary model."""
+        return PullRequestSummary(
+            number=item["number"],
+            title=item["title"],
+            state=item["state"],
+            author=(item.get("user") or {}).get("login", "unknown"),
+            created_at=item["created_at"],
+            merged_at=item.get("merged_at"),
+            html_url=item["html_url"],
+        )
+
+    def _list_prs_graphql(
+        self,
+        owner: Optional[str],
+        repo: Optional[str],
+        state: str,
+        limit: int,
+        detail_level: str,
+    ) -> List[PullRequest] | List[PullRequestSummary]:
+        """List pull requests with a paged GraphQL query (100 PRs per request)."""
+        owner, repo = self._resolve_repo(owner, repo)
+        query = self._pr_list_query(state, detail_level)
+
+        prs = []
+        cursor = None
+        while len(prs) < limit:
+            data = self._graphql_request(
+                query,
+                self._pr_list_variables(owner, repo, state, limit - len(prs), cursor),
+            )
+            page, cursor = self._parse_pr_list_page(data, owner, repo, detail_level)
+            prs.extend(page)
+            if not cursor:
+                break
+
+        return prs[:limit]
+
+    @staticmethod
+    def _pr_list_query(state: str, detail_level: str) -> str:
+        """GraphQL query paging through a repo's pull requests."""
+        if state not in _PR_STATES_GRAPHQL:
+            raise ValueError(
+                f"Invalid state '{state}'. Use 'open', 'closed', or 'all'."
+            )
+
+        fields = (
+            PR_FULL_GRAPHQL_FIELDS
+            if detail_level == "full"
+            else PR_SUMMARY_GRAPHQL_FIELDS
+        )
+        return f"""
+        query($owner: String!, $repo: String!, $states: [PullRequestState!],
+              $first: Int!, $after: String) {{
+            repository(owner: $owner, name: $repo) {{
+                pullRequests(
+                    states: $states,
+                    first: $first,
+                    after: $after,
+                    orderBy: {{field: UPDATED_AT, direction: DESC}}
+                ) {{
+                    pageInfo {{ hasNextPage endCursor }}
+                    nodes {{ {fields} }}
+                }}
+            }}
+        }}
+        """
+
+    @staticmethod
+    def _pr_list_variables(
+        owner: str, repo: str, state: str, remaining: int, cursor: Optional[str]
+    ) -> Dict[str, Any]:
+        """Variables for the next _pr_list_query page."""
+        return {
+            "owner": owner,
+            "repo": repo,
+            "states": _PR_STATES_GRAPHQL[state],
+            "first": min(remaining, GRAPHQL_PAGE_SIZE),
+            "after": cursor,
+        }
+
+    def _parse_pr_list_page(
+        self, data: Dict[str, Any], owner: str, repo: str, detail_level: str
+    ) -> Tuple[List[PullRequest] | List[PullRequestSummary], Optional[str]]:
+        """
+        Convert one _pr_list_query page.
+
+        Returns:
+            (pull requests, cursor of the next page or None on the last)
+        """
+        repository = data.get("repository")
+        if not repository:
+            raise GithubException(
+                404, {"message": f"Repository {owner}/{repo} not found"}
+            )
+
+        connection = repository["pullRequests"]
+        prs = [
+            self._convert_graphql_pr(node, detail_level)
+            for node in connection.get("nodes") or []
+            if node
+        ]
+        page_info = connection.get("pageInfo", {})
+        cursor = page_info.get("endCursor") if page_info.get("hasNextPage") else None
+        return prs, cursor
+
     def get_pr(
         self,
         pr_number: int,
@@ -417,6 +898,55 @@ class GitHubClient:
             html_url=pr.html_url,
         )
 
+    def _convert_graphql_pr(
+        self, node: Dict[str, Any], detail_level: str = "full"
+    ) -> PullRequest | PullRequestSummary:
+        """Convert a GraphQL PullRequest node to Pydantic model."""
+        author = (node.get("author") or {}).get("login") or "unknown"
+        # REST reports merged PRs as 'closed'
+        state = "open" if node["state"] == "OPEN" else "closed"
+
+        if detail_level != "full":
+            return PullRequestSummary(
+                number=node["number"],
+                title=node["title"],
+                state=state,
+                author=author,
+                created_at=node["createdAt"],
+                merged_at=node.get("mergedAt"),
+                html_url=node["url"],
+            )
+
+        reviewers = []
+        for request in (node.get("reviewRequests") or {}).get("nodes") or []:
+            login = (request.get("requestedReviewer") or {}).get("login")
+            if login:
+                reviewers.append(login)
+
+        return PullRequest(
+            number=node["number"],
+            title=node["title"],
+            body=node.get("body") or None,
+            state=state,
+            author=author,
+            created_at=node["createdAt"],
+            updated_at=node.get("updatedAt"),
+            merged_at=node.get("mergedAt"),
+            html_url=node["url"],
+            head_branch=node["headRefName"],
+            base_branch=node["baseRefName"],
+            additions=node.get("additions") or 0,
+            deletions=node.get("deletions") or 0,
+            changed_files=node.get("changedFiles") or 0,
+            commits=(node.get("commits") or {}).get("totalCount") or 0,
+            draft=node.get("isDraft", False),
+            mergeable=_MERGEABLE_GRAPHQL.get(node.get("mergeable")),
+            labels=[
+                label["name"] for label in (node.get("labels") or {}).get("nodes") or []
+            ],
+            reviewers=reviewers,
+        )
+
     def create_pr(
         self,
         title: str,
@@ -1120,15 +1650,16 @@ class GitHubClient:
         Returns:
             List of branch info dicts
         """
-        gh_repo = self._get_repo(owner, repo)
         branches = []
 
-        for branch in gh_repo.get_branches()[:limit]:
+        for branch in self._paginate(f"{self._repo_path(owner, repo)}/branches"):
+            if len(branches) >= limit:
+                break
             branches.append(
                 {
-                    "name": branch.name,
-                    "sha": branch.commit.sha,
-                    "protected": branch.protected,
+                    "name": branch["name"],
+                    "sha": branch["commit"]["sha"],
+                    "protected": branch.get("protected", False),
                 }
             )
 
@@ -1188,41 +1719,59 @@ class GitHubClient:
         Returns:
             List of issue summaries
         """
-        gh_repo = self._get_repo(owner, repo)
-
-        kwargs = {"state": state, "sort": sort, "direction": "desc"}
-        if labels:
-            kwargs["labels"] = labels
-        if assignee:
-            kwargs["assignee"] = assignee
-        if creator:
-            kwargs["creator"] = creator
+        repo_path = self._repo_path(owner, repo)
+        params = self._issue_list_params(state, labels, assignee, creator, sort)
         if milestone:
             # Handle milestone - can be number, '*', 'none', or title
-            if milestone == "*" or milestone == "none":
-                kwargs["milestone"] = milestone
-            elif milestone.isdigit():
-                kwargs["milestone"] = gh_repo.get_milestone(int(milestone))
+            if milestone == "*" or milestone == "none" or milestone.isdigit():
+                params["milestone"] = milestone
             else:
                 # Search by title
-                for ms in gh_repo.get_milestones(state="all"):
-                    if ms.title.lower() == milestone.lower():
-                        kwargs["milestone"] = ms
+                for ms in self._paginate(f"{repo_path}/milestones", {"state": "all"}):
+                    if ms["title"].lower() == milestone.lower():
+                        params["milestone"] = str(ms["number"])
                         break
 
         issues = []
-        count = 0
-        for issue in gh_repo.get_issues(**kwargs):
+        for issue in self._paginate(f"{repo_path}/issues", params):
             # Skip pull requests (GitHub API returns PRs in issues endpoint)
-            if issue.pull_request is not None:
+            if issue.get("pull_request") is not None:
                 continue
-            issues.append(self._issue_to_dict(issue, summary=True))
-            count += 1
-            if count >= limit:
+            issues.append(self._convert_rest_issue_summary(issue))
+            if len(issues) >= limit:
                 break
 
         return issues
 
+    @staticmethod
+    def _issue_list_params(
+        state: str,
+        labels: Optional[List[str]],
+        assignee: Optional[str],
+        creator: Optional[str],
+        sort: str,
+    ) -> Dict[str, Any]:
+        """Query parameters for the REST issue list endpoint (minus milestone)."""
+        params = {"state": state, "sort": sort, "direction": "desc"}
+        if labels:
+            params["labels"] = ",".join(labels)
+        if assignee:
+            params["assignee"] = assignee
+        if creator:
+            params["creator"] = creator
+        return params
+
+    @staticmethod
+    def _convert_rest_issue_summary(issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a REST issue JSON object to a summary dict."""
+        return {
+            "number": issue["number"],
+            "title": issue["title"],
+            "state": issue["state"],
+            "labels": [label["name"] for label in issue.get("labels", [])],
+            "html_url": issue["html_url"],
+        }
+
     def create_issue(
         self,
         title: str,
@@ -1529,18 +2078,11 @@ class GitHubClient:
             raise ValueError("Repository owner and name must be specified")
 
         try:
-            with httpx.Client() as client:
-                response = client.get(
-                    f"https://api.github.com/repos/{owner}/{repo}/issues/{parent_issue_number}/sub_issues",
-                    headers={
-                        "Authorization": f"Bearer {self.token}",
-                        "Accept": "application/vnd.github+json",
-                        "X-GitHub-Api-Version": "2022-11-28",
-                    },
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = self._http.get(
+                f"/repos/{owner}/{repo}/issues/{parent_issue_number}/sub_issues"
+            )
+            response.raise_for_status()
+            data = response.json()
 
             return [
                 {
@@ -1593,18 +2135,11 @@ class GitHubClient:
         child_id = child_issue.id
 
         try:
-            with httpx.Client() as client:
-                response = client.post(
-                    f"https://api.github.com/repos/{owner}/{repo}/issues/{parent_issue_number}/sub_issues",
-                    headers={
-                        "Authorization": f"Bearer {self.token}",
-                        "Accept": "application/vnd.github+json",
-                        "X-GitHub-Api-Version": "2022-11-28",
-                    },
-                    json={"sub_issue_id": child_id},
-                    timeout=30.0,
-                )
-                response.raise_for_status()
+            response = self._http.post(
+                f"/repos/{owner}/{repo}/issues/{parent_issue_number}/sub_issues",
+                json={"sub_issue_id": child_id},
+            )
+            response.raise_for_status()
 
             return {
                 "success": True,
@@ -1652,17 +2187,10 @@ class GitHubClient:
         child_id = child_issue.id
 
         try:
-            with httpx.Client() as client:
-                response = client.delete(
-                    f"https://api.github.com/repos/{owner}/{repo}/issues/{parent_issue_number}/sub_issues/{child_id}",
-                    headers={
-                        "Authorization": f"Bearer {self.token}",
-                        "Accept": "application/vnd.github+json",
-                        "X-GitHub-Api-Version": "2022-11-28",
-                    },
-                    timeout=30.0,
-                )
-                response.raise_for_status()
+            response = self._http.delete(
+                f"/repos/{owner}/{repo}/issues/{parent_issue_number}/sub_issues/{child_id}"
+            )
+            response.raise_for_status()
 
             return {
                 "success": True,
@@ -1689,104 +2217,177 @@ class GitHubClient:
         since_date: Optional[str] = None,
         org: Optional[str] = None,
         repo: Optional[str] = None,
-        limit: int = 100,
+        limit: Optional[int] = 100,
         detail_level: str = "summary",
     ) -> List[Dict[str, Any]]:
         """
         Search for merged pull requests using GitHub Search API.
 
         Ideal for gathering contribution data for appraisals/reviews.
+        Collects results from iter_merged_prs, so it is not capped at one page.
 
         Args:
             author: GitHub username to filter by
             since_date: ISO date string (YYYY-MM-DD) - only PRs merged after this date
             org: GitHub org to search within
             repo: Specific repo in "owner/repo" format (overrides org if specified)
-            limit: Maximum PRs to return (max 100 per page)
+            limit: Maximum PRs to return (None for all matches)
             detail_level: 'summary' for minimal fields, 'full' for all fields
 
         Returns:
             List of merged PR dicts. Summary includes: number, title, merged_at,
             repo, owner, html_url, author. Full adds: body, labels.
         """
-        # Build search query
+        prs = []
+        for pr in self.iter_merged_prs(
+            author=author,
+            since_date=since_date,
+            org=org,
+            repo=repo,
+            detail_level=detail_level,
+        ):
+            if limit is not None and len(prs) >= limit:
+                break
+            prs.append(pr)
+        return prs
+
+    def iter_merged_prs(
+        self,
+        author: Optional[str] = None,
+        since_date: Optional[str] = None,
+        until_date: Optional[str] = None,
+        org: Optional[str] = None,
+        repo: Optional[str] = None,
+        detail_level: str = "summary",
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream merged pull requests from the Search API, page by page.
+
+        Follows Link headers for pagination. The Search API stops at 1000
+        results per query, so when a merged: date range matches more than
+        that it is split into smaller windows, newest first.
+
+        Args:
+            author: GitHub username to filter by
+            since_date: ISO date string (YYYY-MM-DD) - first merge date to include
+            until_date: ISO date string (YYYY-MM-DD) - last merge date to include
+                        (default: today)
+            org: GitHub org to search within
+            repo: Specific repo in "owner/repo" format (overrides org if specified)
+            detail_level: 'summary' for minimal fields, 'full' for all fields
+
+        Yields:
+            Merged PR dicts in the same format as search_merged_prs
+        """
+        base_query, start, end = self._merged_pr_search(
+            author, since_date, until_date, org, repo
+        )
+
+        seen = set()
+        for item in self._iter_search_window(base_query, start, end):
+            # Results can shift between pages while paginating
+            if item["html_url"] in seen:
+                continue
+            seen.add(item["html_url"])
+            yield self._convert_search_pr(item, detail_level)
+
+    @staticmethod
+    def _merged_pr_search(
+        author: Optional[str],
+        since_date: Optional[str],
+        until_date: Optional[str],
+        org: Optional[str],
+        repo: Optional[str],
+    ) -> Tuple[str, date, date]:
+        """Build the merged-PR search query and its merge date range."""
         query_parts = ["is:pr", "is:merged"]
 
         if author:
             query_parts.append(f"author:{author}")
 
-        if since_date:
-            query_parts.append(f"merged:>={since_date}")
-
         # repo takes precedence over org
         if repo:
             query_parts.append(f"repo:{repo}")
         elif org:
             query_parts.append(f"org:{org}")
 
-        query = " ".join(query_parts)
+        start = date.fromisoformat(since_date) if since_date else SEARCH_EPOCH
+        end = (
+            date.fromisoformat(until_date)
+            if until_date
+            else datetime.now(timezone.utc).date()
+        )
+        return " ".join(query_parts), start, end
+
+    def _iter_search_window(
+        self, base_query: str, start: date, end: date
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield raw search items merged in [start, end], splitting past the cap."""
+        data, next_url = self._search_issues_page(
+            "/search/issues", params=self._search_window_params(base_query, start, end)
+        )
 
-        try:
-            with httpx.Client() as client:
-                response = client.get(
-                    "https://api.github.com/search/issues",
-                    headers={
-                        "Authorization": f"Bearer {self.token}",
-                        "Accept": "application/vnd.github+json",
-                        "X-GitHub-Api-Version": "2022-11-28",
-                    },
-                    params={
-                        "q": query,
-                        "sort": "updated",
-                        "order": "desc",
-                        "per_page": min(limit, 100),
-                    },
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+        windows = self._split_search_window(data, start, end)
+        if windows:
+            for window in windows:
+                yield from self._iter_search_window(base_query, *window)
+            return
 
-            # Convert to simplified format
-            prs = []
-            for item in data.get("items", [])[:limit]:
-                # Extract repo info from repository_url
-                # Format: https://api.github.com/repos/owner/repo
-                repo_url_parts = item.get("repository_url", "").split("/")
-                repo_owner = repo_url_parts[-2] if len(repo_url_parts) >= 2 else ""
-                repo_name = repo_url_parts[-1] if len(repo_url_parts) >= 1 else ""
+        yield from data.get("items", [])
+        while next_url:
+            data, next_url = self._search_issues_page(next_url)
+            yield from data.get("items", [])
 
-                if detail_level == "full":
-                    prs.append(
-                        {
-                            "number": item["number"],
-                            "title": item["title"],
-                            "body": item.get("body") or "",
-                            "merged_at": item.get("pull_request", {}).get("merged_at"),
-                            "html_url": item["html_url"],
-                            "labels": [
-                                label["name"] for label in item.get("labels", [])
-                            ],
-                            "repo": repo_name,
-                            "owner": repo_owner,
-                            "author": item.get("user", {}).get("login", "unknown"),
-                        }
-                    )
-                else:
-                    # Summary: skip body and labels
-                    prs.append(
-                        {
-                            "number": item["number"],
-                            "title": item["title"],
-                            "merged_at": item.get("pull_request", {}).get("merged_at"),
-                            "html_url": item["html_url"],
-                            "repo": repo_name,
-                            "owner": repo_owner,
-                            "author": item.get("user", {}).get("login", "unknown"),
-                        }
-                    )
+    @staticmethod
+    def _search_window_params(
+        base_query: str, start: date, end: date
+    ) -> Dict[str, Any]:
+        """Search API parameters for PRs merged in [start, end]."""
+        return {
+            "q": f"{base_query} merged:{start.isoformat()}..{end.isoformat()}",
+            "sort": "updated",
+            "order": "desc",
+            "per_page": SEARCH_PAGE_SIZE,
+        }
+
+    @staticmethod
+    def _split_search_window(
+        data: Dict[str, Any], start: date, end: date
+    ) -> List[Tuple[date, date]]:
+        """
+        Windows to search instead of [start, end], newest first.
+
+        Empty when the first page's total_count fits under SEARCH_RESULT_CAP
+        (or the window is a single day, which can't be split further).
+        """
+        total = data.get("total_count", 0)
+        if total <= SEARCH_RESULT_CAP:
+            return []
+        if start >= end:
+            logger.warning(
+                f"More than {SEARCH_RESULT_CAP} PRs merged on {start}; "
+                "results for that day are truncated"
+            )
+            return []
+
+        middle = start + (end - start) // 2
+        logger.info(
+            f"Search window {start}..{end} has {total} results, splitting at {middle}"
+        )
+        return [(middle + timedelta(1), end), (start, middle)]
 
-            return prs
+    def _search_issues_page(
+        self, url: str, params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Fetch one Search API page.
 
+        Returns:
+            Tuple of (response JSON, URL of the next page or None)
+        """
+        try:
+            response = self._http.get(url, params=params)
+            response.raise_for_status()
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to search PRs: HTTP {e.response.status_code}")
             raise GithubException(e.response.status_code, e.response.json())
@@ -1794,13 +2395,52 @@ class GitHubClient:
             logger.error(f"Failed to search PRs: {e}")
             raise
 
+        next_link = response.links.get("next")
+        return response.json(), next_link["url"] if next_link else None
+
+    def _convert_search_pr(
+        self, item: Dict[str, Any], detail_level: str
+    ) -> Dict[str, Any]:
+        """Convert a Search API issue item to a merged PR dict."""
+        # Extract repo info from repository_url
+        # Format: https://api.github.com/repos/owner/repo
+        repo_url_parts = item.get("repository_url", "").split("/")
+        repo_owner = repo_url_parts[-2] if len(repo_url_parts) >= 2 else ""
+        repo_name = repo_url_parts[-1] if len(repo_url_parts) >= 1 else ""
+
+        if detail_level == "full":
+            return {
+                "number": item["number"],
+                "title": item["title"],
+                "body": item.get("body") or "",
+                "merged_at": item.get("pull_request", {}).get("merged_at"),
+                "html_url": item["html_url"],
+                "labels": [label["name"] for label in item.get("labels", [])],
+                "repo": repo_name,
+                "owner": repo_owner,
+                "author": item.get("user", {}).get("login", "unknown"),
+            }
+
+        # Summary: skip body and labels
+        return {
+            "number": item["number"],
+            "title": item["title"],
+            "merged_at": item.get("pull_request", {}).get("merged_at"),
+            "html_url": item["html_url"],
+            "repo": repo_name,
+            "owner": repo_owner,
+            "author": item.get("user", {}).get("login", "unknown"),
+        }
+
     def fetch_prs_parallel(
         self,
         pr_refs: List[Dict[str, Any]],
         max_workers: int = 10,
     ) -> List[Dict[str, Any]]:
         """
-        Fetch full PR details for multiple PRs in parallel.
+        Fetch full PR details for multiple PRs.
+
+        Thin wrapper over fetch_prs_batch that drops the error list.
 
         Args:
             pr_refs: List of dicts with 'owner', 'repo', 'number' keys
@@ -1809,47 +2449,128 @@ class GitHubClient:
         Returns:
             List of full PR details with stats (additions, deletions, files)
         """
-        results = []
-        errors = []
+        prs, _ = self.fetch_prs_batch(pr_refs, max_workers=max_workers)
+        return prs
 
-        def fetch_single_pr(pr_ref: Dict[str, Any]) -> Dict[str, Any] | None:
-            try:
-                owner = pr_ref["owner"]
-                repo = pr_ref["repo"]
-                number = pr_ref["number"]
-                pr = self.get_pr(number, owner=owner, repo=repo)
-                if pr:
-                    pr_dict = pr.model_dump()
-                    # Add owner/repo for context
-                    pr_dict["owner"] = owner
-                    pr_dict["repo"] = repo
-                    return pr_dict
-                return None
-            except Exception as e:
-                logger.warning(f"Failed to fetch PR {pr_ref}: {e}")
-                return None
+    def fetch_prs_batch(
+        self,
+        pr_refs: List[Dict[str, Any]],
+        batch_size: int = PR_BATCH_SIZE,
+        max_workers: int = 10,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fetch full PR details for multiple PRs with aliased GraphQL queries.
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(fetch_single_pr, pr_ref): pr_ref for pr_ref in pr_refs
-            }
+        Up to batch_size PRs (across any repos) are packed into one query, so
+        100 PRs take 2 requests instead of one REST call per PR plus one per
+        repo. PRs whose lookup fails for a reason other than "not found" are
+        retried individually over REST.
 
-            for future in as_completed(futures):
-                pr_ref = futures[future]
-                try:
-                    result = future.result()
-                    if result:
-                        results.append(result)
-                    else:
-                        errors.append(pr_ref)
-                except Exception as e:
-                    logger.error(f"Error fetching {pr_ref}: {e}")
-                    errors.append(pr_ref)
+        Args:
+            pr_refs: List of dicts with 'owner', 'repo', 'number' keys
+            batch_size: PR lookups per GraphQL query (default: 50)
+            max_workers: Max concurrent requests (default: 10)
 
-        if errors:
-            logger.warning(f"Failed to fetch {len(errors)} PRs: {errors[:5]}...")
+        Returns:
+            Tuple of (prs, errors). prs are full PR dicts with owner/repo added,
+            in the order of pr_refs. errors has one dict per failed PR with
+            'owner', 'repo', 'number' and 'error' keys.
+        """
+        batch = _PRBatch(pr_refs, batch_size)
+
+        def fetch_batch(indexes: List[int]) -> None:
+            try:
+                found, failed = self._graphql_pr_batch(batch.refs(indexes))
+            except Exception as e:
+                batch.batch_failed(indexes, e)
+                return
+            batch.batch_done(indexes, found, failed)
+
+        def fetch_single_pr(index: int) -> None:
+            pr_ref = pr_refs[index]
+            try:
+                pr = self.get_pr(
+                    pr_ref["number"], owner=pr_ref["owner"], repo=pr_ref["repo"]
+                )
+            except Exception as e:
+                batch.single_failed(index, e)
+                return
+            batch.single_done(index, pr)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(fetch_batch, batch.batches))
+            if batch.retry:
+                logger.info(f"Falling back to REST for {len(batch.retry)} PRs")
+                list(executor.map(fetch_single_pr, sorted(batch.retry)))
+
+        return batch.outcome()
+
+    def _graphql_pr_batch(
+        self, pr_refs: List[Dict[str, Any]]
+    ) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, str]]:
+        """
+        Look up a batch of PRs in a single aliased GraphQL query.
+
+        Args:
+            pr_refs: List of dicts with 'owner', 'repo', 'number' keys
+
+        Returns:
+            Tuple of (found, failed). found maps batch position to PR dict,
+            failed maps batch position to the GraphQL error type.
+        """
+        query, variables = self._pr_batch_query(pr_refs)
+        data, graphql_errors = self._graphql_request_partial(query, variables)
+        return self._parse_pr_batch(pr_refs, data, graphql_errors)
+
+    @staticmethod
+    def _pr_batch_query(pr_refs: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+        """Build an aliased query (pr0, pr1, ...) looking up each PR ref."""
+        declarations = []
+        selections = []
+        variables: Dict[str, Any] = {}
+        for i, pr_ref in enumerate(pr_refs):
+            declarations.append(f"$o{i}: String!, $r{i}: String!, $n{i}: Int!")
+            selections.append(
+                f"pr{i}: repository(owner: $o{i}, name: $r{i}) {{ "
+                f"pullRequest(number: $n{i}) {{ {PR_FULL_GRAPHQL_FIELDS} }} }}"
+            )
+            variables[f"o{i}"] = pr_ref["owner"]
+            variables[f"r{i}"] = pr_ref["repo"]
+            variables[f"n{i}"] = int(pr_ref["number"])
+
+        query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+        return query, variables
 
-        return results
+    def _parse_pr_batch(
+        self,
+        pr_refs: List[Dict[str, Any]],
+        data: Dict[str, Any],
+        graphql_errors: List[Dict[str, Any]],
+    ) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, str]]:
+        """Split an aliased PR batch response into found PRs and failures."""
+        failed: Dict[int, str] = {}
+        for error in graphql_errors:
+            path = error.get("path") or []
+            if path and str(path[0]).startswith("pr"):
+                failed[int(path[0][2:])] = error.get("type", "ERROR")
+        if graphql_errors and not failed:
+            # Errors not tied to an alias (e.g. query too complex) - fail batch
+            raise GithubException(
+                400, {"message": graphql_errors[0].get("message")}, "GraphQL Error"
+            )
+
+        found: Dict[int, Dict[str, Any]] = {}
+        for i, pr_ref in enumerate(pr_refs):
+            node = (data.get(f"pr{i}") or {}).get("pullRequest")
+            if not node:
+                failed.setdefault(i, "NOT_FOUND")
+                continue
+            pr_dict = self._convert_graphql_pr(node).model_dump()
+            pr_dict["owner"] = pr_ref["owner"]
+            pr_dict["repo"] = pr_ref["repo"]
+            found[i] = pr_dict
+
+        return found, failed
 
     # ========================================================================
     # Project Operations (GitHub Projects V2 via GraphQL)
@@ -1869,31 +2590,46 @@ class GitHubClient:
         Raises:
             GithubException: If the request fails
         """
-        try:
-            with httpx.Client() as client:
-                response = client.post(
-                    "https://api.github.com/graphql",
-                    headers={
-                        "Authorization": f"Bearer {self.token}",
-                        "Accept": "application/vnd.github+json",
-                    },
-                    json={"query": query, "variables": variables or {}},
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+        data, errors = self._graphql_request_partial(query, variables)
+        if errors:
+            error_messages = [e.get("message", str(e)) for e in errors]
+            raise GithubException(
+                400, {"message": "; ".join(error_messages)}, "GraphQL Error"
+            )
+        return data
 
-                if "errors" in data:
-                    error_messages = [e.get("message", str(e)) for e in data["errors"]]
-                    raise GithubException(
-                        400, {"message": "; ".join(error_messages)}, "GraphQL Error"
-                    )
+    def _graphql_request_partial(
+        self, query: str, variables: Optional[Dict] = None
+    ) -> Tuple[Dict, List[Dict]]:
+        """
+        Execute a GraphQL request, returning partial data alongside errors.
+
+        Aliased batch queries can fail for some aliases (e.g. a missing PR)
+        while the rest resolve; GitHub then returns both 'data' and 'errors'.
 
-                return data.get("data", {})
+        Args:
+            query: GraphQL query or mutation string
+            variables: Optional variables for the query
+
+        Returns:
+            Tuple of (data dict, list of GraphQL error dicts)
+
+        Raises:
+            GithubException: If the HTTP request itself fails
+        """
+        try:
+            response = self._http.post(
+                "/graphql",
+                json={"query": query, "variables": variables or {}},
+            )
+            response.raise_for_status()
+            data = response.json()
+            return data.get("data") or {}, data.get("errors") or []
         except httpx.HTTPStatusError as e:
             logger.error(f"GraphQL request failed: HTTP {e.response.status_code}")
             raise GithubException(e.response.status_code, e.response.json())
         except GithubException:
+            # e.g. rate limit exhausted
             raise
         except Exception as e:
             logger.error(f"GraphQL request failed: {e}")
@@ -1976,6 +2712,33 @@ class GitHubClient:
             if node  # Filter out None nodes
         ]
 
+    def _cached_metadata(self, key: Tuple) -> Optional[Any]:
+        """Return a memoized project metadata value if it hasn't expired."""
+        entry = self._project_metadata.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def _store_metadata(self, key: Tuple, value: Any) -> None:
+        if self.project_metadata_ttl > 0 and value is not None:
+            self._project_metadata[key] = (
+                time.monotonic() + self.project_metadata_ttl,
+                value,
+            )
+
+    def invalidate_project_metadata(self, project_id: Optional[str] = None) -> None:
+        """
+        Forget memoized project IDs and field definitions.
+
+        Args:
+            project_id: Only drop this project's field definitions. Clears
+                        everything when not given.
+        """
+        if project_id:
+            self._project_metadata.pop(("fields", project_id), None)
+        else:
+            self._project_metadata.clear()
+
     def get_project_id(
         self,
         project: str,
@@ -1985,6 +2748,8 @@ class GitHubClient:
         """
         Get the node ID of a project by number or title.
 
+        Resolved IDs are reused for project_metadata_ttl seconds.
+
         Args:
             project: Project number (as string) or title
             owner: Organization or user name
@@ -1997,6 +2762,17 @@ class GitHubClient:
         if not owner:
             raise ValueError("Owner must be specified")
 
+        key = ("id", owner.lower(), project.lower(), is_org)
+        project_id = self._cached_metadata(key)
+        if project_id is None:
+            project_id = self._lookup_project_id(project, owner, is_org)
+            self._store_metadata(key, project_id)
+        return project_id
+
+    def _lookup_project_id(
+        self, project: str, owner: str, is_org: bool
+    ) -> Optional[str]:
+        """Resolve a project number or title to its node ID over GraphQL."""
         # If project is a number, query directly
         if project.isdigit():
             project_number = int(project)
@@ -2084,6 +2860,10 @@ class GitHubClient:
         if not owner or not repo:
             raise ValueError("Repository owner and name must be specified")
 
+        cached = self._issue_node_ids.get((owner, repo, issue_number))
+        if cached:
+            return cached
+
         query = """
         query($owner: String!, $repo: String!, $number: Int!) {
             repository(owner: $owner, name: $repo) {
@@ -2104,6 +2884,7 @@ class GitHubClient:
         issue = repository.get("issue")
         if not issue:
             raise GithubException(404, {"message": f"Issue #{issue_number} not found"})
+        self._issue_node_ids[(owner, repo, issue_number)] = issue["id"]
         return issue["id"]
 
     def add_issue_to_project(
@@ -2159,6 +2940,8 @@ class GitHubClient:
         )
 
         item = data.get("addProjectV2ItemById", {}).get("item")
+        if item:
+            self._project_items.setdefault(project_id, {})[issue_node_id] = item["id"]
         return {
             "success": True,
             "issue_number": issue_number,
@@ -2201,57 +2984,9 @@ class GitHubClient:
                 404, {"message": f"Project '{project}' not found for {project_owner}"}
             )
 
-        # Get issue node ID
-        issue_node_id = self.get_issue_node_id(issue_number, owner=owner, repo=repo)
-
-        # First, find the project item ID for this issue
-        query = """
-        query($projectId: ID!, $cursor: String) {
-            node(id: $projectId) {
-                ... on ProjectV2 {
-                    items(first: 100, after: $cursor) {
-                        nodes {
-                            id
-                            content {
-                                ... on Issue {
-                                    id
-                                    number
-                                }
-                            }
-                        }
-                        pageInfo {
-                            hasNextPage
-                            endCursor
-                        }
-                    }
-                }
-            }
-        }
-        """
-
-        # Paginate to find the item
-        cursor = None
-        item_id = None
-        while True:
-            data = self._graphql_request(
-                query, {"projectId": project_id, "cursor": cursor}
-            )
-            node = data.get("node", {})
-            items = node.get("items", {})
-
-            for item in items.get("nodes", []):
-                content = item.get("content")
-                if content and content.get("id") == issue_node_id:
-                    item_id = item["id"]
-                    break
-
-            if item_id:
-                break
-
-            page_info = items.get("pageInfo", {})
-            if not page_info.get("hasNextPage"):
-                break
-            cursor = page_info.get("endCursor")
+        issue_node_id, item_id = self._find_project_item(
+            project_id, owner, repo, issue_number
+        )
 
         if not item_id:
             raise GithubException(
@@ -2272,6 +3007,7 @@ class GitHubClient:
         )
 
         deleted_id = data.get("deleteProjectV2Item", {}).get("deletedItemId")
+        self._project_items.get(project_id, {}).pop(issue_node_id, None)
         return {
             "success": True,
             "issue_number": issue_number,
@@ -2307,6 +3043,10 @@ class GitHubClient:
                 404, {"message": f"Project '{project}' not found for {owner}"}
             )
 
+        cached = self._cached_metadata(("fields", project_id))
+        if cached is not None:
+            return cached
+
         # Query fields with options
         query = """
         query($projectId: ID!) {
@@ -2357,6 +3097,7 @@ class GitHubClient:
 
             fields.append(field_data)
 
+        self._store_metadata(("fields", project_id), fields)
         return fields
 
     def list_projects_with_fields(
@@ -2535,22 +3276,38 @@ class GitHubClient:
                 404, {"message": f"Project '{project}' not found for {project_owner}"}
             )
 
-        # Get issue node ID
-        issue_node_id = self.get_issue_node_id(issue_number, owner=owner, repo=repo)
+        _, item_id = self._find_project_item(project_id, owner, repo, issue_number)
+        return item_id
+
+    def _find_project_item(
+        self, project_id: str, owner: str, repo: str, issue_number: int
+    ) -> Tuple[str, Optional[str]]:
+        """
+        Find an issue's item in a project.
+
+        Answers from the item index when possible. Otherwise asks the issue
+        which projects it is in (issue.projectItems), which costs one request
+        however large the project is, and indexes every item it returns.
+
+        Returns:
+            Tuple of (issue node ID, project item ID or None if not in project)
+        """
+        issue_node_id = self._issue_node_ids.get((owner, repo, issue_number))
+        if issue_node_id:
+            item_id = self._project_items.get(project_id, {}).get(issue_node_id)
+            if item_id:
+                return issue_node_id, item_id
 
-        # Search for the item in the project
         query = """
-        query($projectId: ID!, $cursor: String) {
-            node(id: $projectId) {
-                ... on ProjectV2 {
-                    items(first: 100, after: $cursor) {
+        query($owner: String!, $repo: String!, $number: Int!, $cursor: String) {
+            repository(owner: $owner, name: $repo) {
+                issue(number: $number) {
+                    id
+                    projectItems(first: 100, after: $cursor) {
                         nodes {
                             id
-                            content {
-                                ... on Issue {
-                                    id
-                                    number
-                                }
+                            project {
+                                id
                             }
                         }
                         pageInfo {
@@ -2563,93 +3320,70 @@ class GitHubClient:
         }
         """
 
+        item_id = None
         cursor = None
         while True:
             data = self._graphql_request(
-                query, {"projectId": project_id, "cursor": cursor}
+                query,
+                {
+                    "owner": owner,
+                    "repo": repo,
+                    "number": issue_number,
+                    "cursor": cursor,
+                },
             )
-            node = data.get("node", {})
-            items = node.get("items", {})
+            issue = (data.get("repository") or {}).get("issue")
+            if not issue:
+                raise GithubException(
+                    404, {"message": f"Issue #{issue_number} not found"}
+                )
+            issue_node_id = issue["id"]
+            self._issue_node_ids[(owner, repo, issue_number)] = issue_node_id
 
-            for item in items.get("nodes", []):
-                content = item.get("content")
-                if content and content.get("id") == issue_node_id:
-                    return item["id"]
+            items = issue.get("projectItems") or {}
+            for item in items.get("nodes") or []:
+                item_project = (item.get("project") or {}).get("id")
+                if not item_project:
+                    continue
+                self._project_items.setdefault(item_project, {})[issue_node_id] = item[
+                    "id"
+                ]
+                if item_project == project_id:
+                    item_id = item["id"]
 
             page_info = items.get("pageInfo", {})
-            if not page_info.get("hasNextPage"):
+            if item_id or not page_info.get("hasNextPage"):
                 break
             cursor = page_info.get("endCursor")
 
-        return None
+        if not item_id:
+            # Removed elsewhere since we indexed it
+            self._project_items.get(project_id, {}).pop(issue_node_id, None)
+        return issue_node_id, item_id
 
-    def update_project_item_field(
-        self,
-        issue_number: int,
-        project: str,
-        field_name: str,
-        value: str,
-        owner: Optional[str] = None,
-        repo: Optional[str] = None,
-        project_owner: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    def invalidate_project_items(self, project_id: Optional[str] = None) -> None:
         """
-        Update a field value for an issue in a GitHub Project V2.
+        Drop indexed project items, for one project or all of them.
 
-        Supports different field types:
-        - SINGLE_SELECT: value is the option name (e.g., "In Progress")
-        - TEXT: value is the text content
-        - NUMBER: value is the number as string
-        - DATE: value is ISO date format (YYYY-MM-DD)
-
-        Args:
-            issue_number: Issue number
-            project: Project number (as string) or title
-            field_name: Field name (e.g., "Status", "Priority")
-            value: Field value (option name for SingleSelect, text for others)
-            owner: Repository owner (for the issue)
-            repo: Repository name
-            project_owner: Owner of the project (org or user). Defaults to repo owner.
+        Call after changing a project outside this client (e.g. in the web UI);
+        the next lookup re-reads the issue's project items.
+        """
+        if project_id:
+            self._project_items.pop(project_id, None)
+        else:
+            self._project_items.clear()
 
-        Returns:
-            Dict with success status and updated info
+    @staticmethod
+    def _project_field_value(
+        fields: List[Dict[str, Any]], field_name: str, value: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Resolve a field name and value to a field ID and ProjectV2FieldValue.
 
         Raises:
-            GithubException: If project, field, or option not found
+            GithubException: If the field or option doesn't exist, or the
+                             field type can't be updated
         """
-        owner = owner or self.default_owner
-        repo = repo or self.default_repo
-        project_owner = project_owner or owner
-
-        if not owner or not repo:
-            raise ValueError("Repository owner and name must be specified")
-
-        # Get project ID
-        project_id = self.get_project_id(project, owner=project_owner, is_org=True)
-        if not project_id:
-            raise GithubException(
-                404, {"message": f"Project '{project}' not found for {project_owner}"}
-            )
-
-        # Get project item ID (issue must be in project)
-        item_id = self.get_project_item_id(
-            issue_number=issue_number,
-            project=project,
-            owner=owner,
-            repo=repo,
-            project_owner=project_owner,
-        )
-        if not item_id:
-            raise GithubException(
-                404,
-                {
-                    "message": f"Issue #{issue_number} not found in project '{project}'. Add it first with add_to_project."
-                },
-            )
-
-        # Get fields to find the field ID and type
-        fields = self.get_project_fields(project, owner=project_owner, is_org=True)
-
         # Find the field by name (case-insensitive)
         field = None
         for f in fields:
@@ -2715,6 +3449,86 @@ class GitHubClient:
                 },
             )
 
+        return field_id, field_value
+
+    def update_project_item_field(
+        self,
+        issue_number: int,
+        project: str,
+        field_name: str,
+        value: str,
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        project_owner: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Update a field value for an issue in a GitHub Project V2.
+
+        Supports different field types:
+        - SINGLE_SELECT: value is the option name (e.g., "In Progress")
+        - TEXT: value is the text content
+        - NUMBER: value is the number as string
+        - DATE: value is ISO date format (YYYY-MM-DD)
+
+        Args:
+            issue_number: Issue number
+            project: Project number (as string) or title
+            field_name: Field name (e.g., "Status", "Priority")
+            value: Field value (option name for SingleSelect, text for others)
+            owner: Repository owner (for the issue)
+            repo: Repository name
+            project_owner: Owner of the project (org or user). Defaults to repo owner.
+
+        Returns:
+            Dict with success status and updated info
+
+        Raises:
+            GithubException: If project, field, or option not found
+        """
+        owner = owner or self.default_owner
+        repo = repo or self.default_repo
+        project_owner = project_owner or owner
+
+        if not owner or not repo:
+            raise ValueError("Repository owner and name must be specified")
+
+        # Get project ID
+        project_id = self.get_project_id(project, owner=project_owner, is_org=True)
+        if not project_id:
+            raise GithubException(
+                404, {"message": f"Project '{project}' not found for {project_owner}"}
+            )
+
+        # Get project item ID (issue must be in project)
+        item_id = self.get_project_item_id(
+            issue_number=issue_number,
+            project=project,
+            owner=owner,
+            repo=repo,
+            project_owner=project_owner,
+        )
+        if not item_id:
+            raise GithubException(
+                404,
+                {
+                    "message": f"Issue #{issue_number} not found in project '{project}'. Add it first with add_to_project."
+                },
+            )
+
+        # Get fields to find the field ID and type
+        fields_cached = self._cached_metadata(("fields", project_id)) is not None
+        fields = self.get_project_fields(project, owner=project_owner, is_org=True)
+        try:
+            field_id, field_value = self._project_field_value(fields, field_name, value)
+        except GithubException:
+            if not fields_cached:
+                raise
+            # The field or option may have been added since we cached the
+            # definitions - refetch once before giving up
+            self.invalidate_project_metadata(project_id)
+            fields = self.get_project_fields(project, owner=project_owner, is_org=True)
+            field_id, field_value = self._project_field_value(fields, field_name, value)
+
         # Execute the mutation
         mutation = """
         mutation($projectId: ID!, $itemId: ID!, $fieldId: ID!, $value: ProjectV2FieldValue!) {
@@ -2731,15 +3545,22 @@ class GitHubClient:
         }
         """
 
-        data = self._graphql_request(
-            mutation,
-            {
-                "projectId": project_id,
-                "itemId": item_id,
-                "fieldId": field_id,
-                "value": field_value,
-            },
-        )
+        try:
+            data = self._graphql_request(
+                mutation,
+                {
+                    "projectId": project_id,
+                    "itemId": item_id,
+                    "fieldId": field_id,
+                    "value": field_value,
+                },
+            )
+        except GithubException:
+            # The indexed item or cached field may have been deleted outside
+            # this client
+            self.invalidate_project_items(project_id)
+            self.invalidate_project_metadata(project_id)
+            raise
 
         updated_item = data.get("updateProjectV2ItemFieldValue", {}).get(
             "projectV2Item"
@@ -2753,3 +3574,239 @@ class GitHubClient:
             "value": value,
             "item_id": updated_item["id"] if updated_item else item_id,
         }
+
+    def update_project_item_fields(
+        self,
+        issue_numbers: List[int],
+        project: str,
+        fields: Dict[str, str],
+        owner: Optional[str] = None,
+        repo: Optional[str] = None,
+        project_owner: Optional[str] = None,
+        batch_size: int = PROJECT_BATCH_SIZE,
+    ) -> List[Dict[str, Any]]:
+        """
+        Set several fields on several issues in a GitHub Project V2.
+
+        Item lookups and field updates are packed into aliased GraphQL
+        documents of up to batch_size operations, so moving 50 cards takes
+        one or two requests instead of one per issue per field.
+
+        Args:
+            issue_numbers: Issue numbers (must already be in the project)
+            project: Project number (as string) or title
+            fields: Field names to values (see update_project_item_field)
+            owner: Repository owner (for the issues)
+            repo: Repository name
+            project_owner: Owner of the project (org or user). Defaults to repo owner.
+            batch_size: Operations per GraphQL request (default: 50)
+
+        Returns:
+            One dict per issue, in input order, with 'number', 'fields_updated'
+            ([{field, value}]), 'errors' ([{field, error}]) and 'status'
+            ('success' or 'partial').
+        """
+        owner = owner or self.default_owner
+        repo = repo or self.default_repo
+        project_owner = project_owner or owner
+
+        if not owner or not repo:
+            raise ValueError("Repository owner and name must be specified")
+
+        project_id = self.get_project_id(project, owner=project_owner, is_org=True)
+        if not project_id:
+            raise GithubException(
+                404, {"message": f"Project '{project}' not found for {project_owner}"}
+            )
+
+        issue_numbers = list(dict.fromkeys(issue_numbers))
+        results = {
+            number: {"number": number, "fields_updated": [], "errors": []}
+            for number in issue_numbers
+        }
+
+        def fail(number: int, field_name: str, error: str) -> None:
+            results[number]["errors"].append({"field": field_name, "error": error})
+
+        # Resolve every field once, refetching stale definitions on a miss
+        resolved: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        fields_cached = self._cached_metadata(("fields", project_id)) is not None
+        definitions = self.get_project_fields(project, owner=project_owner)
+        for attempt in range(2):
+            field_errors: Dict[str, str] = {}
+            for field_name, value in fields.items():
+                try:
+                    resolved[field_name] = self._project_field_value(
+                        definitions, field_name, value
+                    )
+                except GithubException as e:
+                    field_errors[field_name] = str(e)
+            if not field_errors or not fields_cached or attempt:
+                break
+            self.invalidate_project_metadata(project_id)
+            definitions = self.get_project_fields(project, owner=project_owner)
+        for field_name, error in field_errors.items():
+            for number in issue_numbers:
+                fail(number, field_name, error)
+
+        items = self._find_project_items(
+            project_id, owner, repo, issue_numbers, batch_size
+        )
+        updates = []
+        for number in issue_numbers:
+            item_id = items.get(number)
+            if isinstance(item_id, Exception) or not item_id:
+                error = (
+                    str(item_id)
+                    if item_id
+                    else f"Issue #{number} not found in project '{project}'. "
+                    "Add it first with add_to_project."
+                )
+                for field_name in resolved:
+                    fail(number, field_name, error)
+                continue
+            for field_name, (field_id, field_value) in resolved.items():
+                updates.append((number, item_id, field_name, field_id, field_value))
+
+        failed_any = False
+        for start in range(0, len(updates), batch_size):
+            chunk = updates[start : start + batch_size]
+            declarations = ["$projectId: ID!"]
+            selections = []
+            variables: Dict[str, Any] = {"projectId": project_id}
+            for i, (_, item_id, _, field_id, field_value) in enumerate(chunk):
+                declarations.append(
+                    f"$i{i}: ID!, $f{i}: ID!, $v{i}: ProjectV2FieldValue!"
+                )
+                selections.append(
+                    f"u{i}: updateProjectV2ItemFieldValue(input: {{"
+                    f"projectId: $projectId, itemId: $i{i}, fieldId: $f{i}, "
+                    f"value: $v{i}}}) {{ projectV2Item {{ id }} }}"
+                )
+                variables[f"i{i}"] = item_id
+                variables[f"f{i}"] = field_id
+                variables[f"v{i}"] = field_value
+            mutation = (
+                f"mutation({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+            )
+
+            try:
+                data, graphql_errors = self._graphql_request_partial(
+                    mutation, variables
+                )
+            except GithubException as e:
+                data, graphql_errors = {}, [{"message": str(e)}]
+
+            alias_errors: Dict[int, str] = {}
+            for error in graphql_errors:
+                path = error.get("path") or []
+                if path and str(path[0]).startswith("u"):
+                    alias_errors[int(path[0][1:])] = error.get("message", str(error))
+            # Errors not tied to an alias fail the whole document
+            chunk_error = None
+            if graphql_errors and not alias_errors:
+                chunk_error = graphql_errors[0].get("message", "GraphQL Error")
+
+            for i, (number, _, field_name, _, _) in enumerate(chunk):
+                error = alias_errors.get(i) or chunk_error
+                if not error and not data.get(f"u{i}"):
+                    error = "Update returned no item"
+                if error:
+                    failed_any = True
+                    fail(number, field_name, error)
+                else:
+                    results[number]["fields_updated"].append(
+                        {"field": field_name, "value": fields[field_name]}
+                    )
+
+        if failed_any:
+            # Items or fields may have been deleted outside this client
+            self.invalidate_project_items(project_id)
+            self.invalidate_project_metadata(project_id)
+
+        ordered = []
+        for number in issue_numbers:
+            result = results[number]
+            result["status"] = "success" if not result["errors"] else "partial"
+            ordered.append(result)
+        return ordered
+
+    def _find_project_items(
+        self,
+        project_id: str,
+        owner: str,
+        repo: str,
+        issue_numbers: List[int],
+        batch_size: int = PROJECT_BATCH_SIZE,
+    ) -> Dict[int, Any]:
+        """
+        Find the project items of several issues in one repo.
+
+        Indexed items are answered locally; the rest are looked up with
+        aliased issue.projectItems queries, batch_size issues per request.
+
+        Returns:
+            Dict of issue number to item ID, None if the issue isn't in the
+            project, or the exception raised looking it up
+        """
+        found: Dict[int, Any] = {}
+        missing = []
+        for number in dict.fromkeys(issue_numbers):
+            issue_node_id = self._issue_node_ids.get((owner, repo, number))
+            item_id = self._project_items.get(project_id, {}).get(issue_node_id)
+            if issue_node_id and item_id:
+                found[number] = item_id
+            else:
+                missing.append(number)
+
+        for start in range(0, len(missing), batch_size):
+            chunk = missing[start : start + batch_size]
+            declarations = ["$owner: String!", "$repo: String!"]
+            selections = []
+            variables: Dict[str, Any] = {"owner": owner, "repo": repo}
+            for i, number in enumerate(chunk):
+                declarations.append(f"$n{i}: Int!")
+                selections.append(
+                    f"i{i}: repository(owner: $owner, name: $repo) {{ "
+                    f"issue(number: $n{i}) {{ id projectItems(first: 100) {{ "
+                    "nodes { id project { id } } pageInfo { hasNextPage } } } }"
+                )
+                variables[f"n{i}"] = number
+            query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+
+            try:
+                data, _ = self._graphql_request_partial(query, variables)
+            except GithubException as e:
+                for number in chunk:
+                    found[number] = e
+                continue
+
+            for i, number in enumerate(chunk):
+                issue = (data.get(f"i{i}") or {}).get("issue")
+                if not issue:
+                    found[number] = GithubException(
+                        404, {"message": f"Issue #{number} not found"}
+                    )
+                    continue
+                issue_node_id = issue["id"]
+                self._issue_node_ids[(owner, repo, number)] = issue_node_id
+                items = issue.get("projectItems") or {}
+                found[number] = None
+                for item in items.get("nodes") or []:
+                    item_project = (item.get("project") or {}).get("id")
+                    if not item_project:
+                        continue
+                    self._project_items.setdefault(item_project, {})[issue_node_id] = (
+                        item["id"]
+                    )
+                    if item_project == project_id:
+                        found[number] = item["id"]
+                if found[number] is None and items.get("pageInfo", {}).get(
+                    "hasNextPage"
+                ):
+                    # In over 100 projects - page through this one issue
+                    _, found[number] = self._find_project_item(
+                        project_id, owner, repo, number
+                    )
+
+        return found
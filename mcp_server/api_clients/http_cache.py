@@ -0,0 +1,437 @@
+"""
+Persistent HTTP response cache for API clients.
+
+Stores GET responses in SQLite (~/.quickcall/http_cache.db) and revalidates
+them with ETag / Last-Modified on the next request. GitHub does not count
+304 Not Modified responses against the rate limit, so repeated listings are
+near-free. APIs without validators (Slack) can opt specific endpoints into a
+plain TTL instead.
+
+Entries are keyed by URL and the identity behind the credential (by default
+a hash of the Authorization header), so two accounts never share cached
+responses. Clients whose tokens rotate (GitHub App installation tokens) pass
+a stable identity instead, so a new token keeps the cache and its ETags. The
+database is trimmed by age and total size.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".quickcall" / "http_cache.db"
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024  # 50 MB
+DEFAULT_MAX_AGE = 7 * 24 * 3600.0  # 7 days
+
+# Run eviction every N stores instead of on every write
+EVICT_EVERY = 50
+
+# Headers that describe the wire encoding rather than the decoded body we store
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+)
+"""
+
+
+@dataclass
+class CachedResponse:
+    """A stored response and its validators."""
+
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def to_response(
+        self, request: httpx.Request, extra_headers: Optional[httpx.Headers] = None
+    ) -> httpx.Response:
+        """Rebuild an httpx.Response, optionally refreshing headers from a 304."""
+        headers = dict(self.headers)
+        if extra_headers:
+            for name, value in extra_headers.items():
+                if name.lower() not in _DROP_HEADERS:
+                    headers[name] = value
+        return httpx.Response(
+            self.status,
+            headers=headers,
+            content=self.body,
+            request=request,
+            extensions={"from_cache": True},
+        )
+
+
+class HTTPCache:
+    """
+    SQLite-backed store for HTTP responses.
+
+    Safe to share between clients and threads.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: SQLite file location
+            max_bytes: Total body size to keep before evicting least recently used
+            max_age: Seconds after which entries are dropped regardless of use
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._stores = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, timeout=5.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        # Responses can contain private repo / workspace data
+        os.chmod(self.path, 0o600)
+
+    @staticmethod
+    def key_for(request: httpx.Request, identity: Optional[str] = None) -> str:
+        """
+        Cache key: request URL scoped to the account that made it.
+
+        Args:
+            request: The request
+            identity: Stable name for the account behind the credential;
+                      defaults to the Authorization header itself
+        """
+        if identity is None:
+            identity = request.headers.get("Authorization", "")
+        scope = hashlib.sha256(identity.encode()).hexdigest()[:16]
+        return hashlib.sha256(
+            f"{scope}\n{request.method}\n{request.url}".encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Look up an entry, ignoring ones past max_age."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if not row:
+            return None
+        status, headers, body, etag, last_modified, stored_at = row
+        if time.time() - stored_at > self.max_age:
+            return None
+        return CachedResponse(
+            status, json.loads(headers), body, etag, last_modified, stored_at
+        )
+
+    def store(self, key: str, url: str, response: httpx.Response) -> None:
+        """Store a response whose body has already been read."""
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in _DROP_HEADERS
+        }
+        body = response.content
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    response.status_code,
+                    json.dumps(headers),
+                    body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now,
+                    len(body),
+                ),
+            )
+            self._conn.commit()
+            self._stores += 1
+            if self._stores % EVICT_EVERY == 0:
+                self._evict()
+
+    def touch(self, key: str, refreshed: bool = False) -> None:
+        """Mark an entry as used; refreshed=True also restarts its age."""
+        now = time.time()
+        with self._lock:
+            if refreshed:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ?, stored_at = ? WHERE key = ?",
+                    (now, now, key),
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+            self._conn.commit()
+
+    def evict(self) -> None:
+        """Drop expired entries and trim to max_bytes."""
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Eviction body; caller holds the lock."""
+        self._conn.execute(
+            "DELETE FROM responses WHERE stored_at < ?",
+            (time.time() - self.max_age,),
+        )
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total > self.max_bytes:
+            # Delete least recently used entries until under budget
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at"
+            ).fetchall()
+            doomed = []
+            for key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                doomed.append((key,))
+                total -= size
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class _CachePolicy:
+    """Shared request/response logic for the sync and async transports."""
+
+    def __init__(
+        self,
+        cache: HTTPCache,
+        ttl_rules: Optional[Dict[str, float]],
+        accept: Optional[Callable[[httpx.Response], bool]] = None,
+        identity: Optional[str] = None,
+    ):
+        self.cache = cache
+        self.ttl_rules = ttl_rules or {}
+        self.accept = accept
+        self.identity = identity
+
+    def ttl_for(self, request: httpx.Request) -> float:
+        """Seconds a response may be served without revalidation."""
+        for suffix, ttl in self.ttl_rules.items():
+            if request.url.path.endswith(suffix):
+                return ttl
+        return 0.0
+
+    def lookup(self, request: httpx.Request):
+        """
+        Find a cached entry for the request.
+
+        Returns:
+            Tuple of (key, entry, fresh). When the entry is stale but has
+            validators, conditional headers are added to the request.
+        """
+        if request.method != "GET":
+            return None, None, False
+        key = self.cache.key_for(request, self.identity)
+        entry = self.cache.get(key)
+        if not entry:
+            return key, None, False
+
+        # "Cache-Control: no-cache" on the request forces a round trip
+        no_cache = "no-cache" in request.headers.get("Cache-Control", "")
+        ttl = self.ttl_for(request)
+        if ttl and not no_cache and time.time() - entry.stored_at < ttl:
+            return key, entry, True
+
+        if entry.etag:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request.headers["If-Modified-Since"] = entry.last_modified
+        return key, entry, False
+
+    def cacheable(self, request: httpx.Request, response: httpx.Response) -> bool:
+        """Only keep successful responses we can revalidate or have a TTL for."""
+        if response.status_code != 200:
+            return False
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return False
+        has_validator = (
+            "ETag" in response.headers or "Last-Modified" in response.headers
+        )
+        return has_validator or self.ttl_for(request) > 0
+
+    def store(self, key: str, request: httpx.Request, response: httpx.Response):
+        """Store a read response unless the owner's body check rejects it."""
+        if self.accept is not None and not self.accept(response):
+            return
+        self.cache.store(key, str(request.url), response)
+
+
+class CachingTransport(httpx.BaseTransport):
+    """httpx transport that serves GET requests from an HTTPCache."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        cache: HTTPCache,
+        ttl_rules: Optional[Dict[str, float]] = None,
+        accept: Optional[Callable[[httpx.Response], bool]] = None,
+        identity: Optional[str] = None,
+    ):
+        """
+        Args:
+            transport: Transport that performs the real requests
+            cache: Response store
+            ttl_rules: URL path suffix -> seconds to serve without revalidating,
+                       for APIs that don't send ETag/Last-Modified
+            accept: Called with a cacheable response once its body is read;
+                    return False to not store it (e.g. errors sent as 200)
+            identity: Stable account name scoping the entries (see
+                      HTTPCache.key_for); defaults to the Authorization header
+        """
+        self._transport = transport
+        self._policy = _CachePolicy(cache, ttl_rules, accept, identity)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key, entry, fresh = self._policy.lookup(request)
+        if fresh:
+            self._policy.cache.touch(key)
+            return entry.to_response(request)
+
+        response = self._transport.handle_request(request)
+
+        if entry and response.status_code == 304:
+            response.close()
+            self._policy.cache.touch(key, refreshed=True)
+            return entry.to_response(request, response.headers)
+
+        if key and self._policy.cacheable(request, response):
+            response.read()
+            self._policy.store(key, request, response)
+            return httpx.Response(
+                response.status_code,
+                headers=[
+                    (name, value)
+                    for name, value in response.headers.items()
+                    if name.lower() not in _DROP_HEADERS
+                ],
+                content=response.content,
+                request=request,
+            )
+
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCachingTransport(httpx.AsyncBaseTransport):
+    """Async variant of CachingTransport."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        cache: HTTPCache,
+        ttl_rules: Optional[Dict[str, float]] = None,
+        accept: Optional[Callable[[httpx.Response], bool]] = None,
+        identity: Optional[str] = None,
+    ):
+        self._transport = transport
+        self._policy = _CachePolicy(cache, ttl_rules, accept, identity)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key, entry, fresh = self._policy.lookup(request)
+        if fresh:
+            self._policy.cache.touch(key)
+            return entry.to_response(request)
+
+        response = await self._transport.handle_async_request(request)
+
+        if entry and response.status_code == 304:
+            await response.aclose()
+            self._policy.cache.touch(key, refreshed=True)
+            return entry.to_response(request, response.headers)
+
+        if key and self._policy.cacheable(request, response):
+            await response.aread()
+            self._policy.store(key, request, response)
+            return httpx.Response(
+                response.status_code,
+                headers=[
+                    (name, value)
+                    for name, value in response.headers.items()
+                    if name.lower() not in _DROP_HEADERS
+                ],
+                content=response.content,
+                request=request,
+            )
+
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# Process-wide cache shared by all clients
+_default_cache: Optional[HTTPCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> Optional[HTTPCache]:
+    """
+    Get the shared on-disk HTTP cache.
+
+    Set QUICKCALL_HTTP_CACHE=off to disable it. Returns None when disabled
+    or when the database can't be opened.
+    """
+    global _default_cache
+    if os.getenv("QUICKCALL_HTTP_CACHE", "on").lower() in ("0", "off", "false"):
+        return None
+    with _default_cache_lock:
+        if _default_cache is None:
+            try:
+                _default_cache = HTTPCache()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"HTTP cache disabled, could not open database: {e}")
+                return None
+        return _default_cache
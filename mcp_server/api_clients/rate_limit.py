@@ -0,0 +1,372 @@
+"""
+Rate-limit aware request scheduling for the GitHub API.
+
+GitHub tracks separate budgets per resource: 'core' REST calls, 'search'
+(30 requests/minute) and 'graphql' (points/hour). RateLimiter keeps the
+latest budget for each from X-RateLimit-* response headers, holds callers
+back when a budget is spent until it resets, caps concurrent requests (to
+stay clear of secondary rate limits), and decides how long to wait before
+retrying a 403/429. The concurrency cap is shared by sync and async
+callers.
+
+GraphQL budgets are counted in points, but a query's cost is only known
+from its response, so reserve() takes one point per query up front and the
+real remaining balance replaces it when the X-RateLimit-* headers arrive.
+Queries in flight at once can therefore overdraw the budget by their cost
+beyond one point each; GitHub's own 403 is then retried like any other.
+
+RateLimitTransport plugs the limiter into an httpx client, and
+RateLimitedTokenAuth into PyGithub.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from github import Auth, GithubException
+
+logger = logging.getLogger(__name__)
+
+# Budgets assumed until the first response reports the real numbers
+DEFAULT_BUDGETS = {
+    "core": (5000, 3600.0),
+    "search": (30, 60.0),
+    "graphql": (5000, 3600.0),
+}
+
+DEFAULT_MAX_CONCURRENT = 10
+# Longest we'll block a caller waiting for a budget to reset
+DEFAULT_MAX_WAIT = 60.0
+DEFAULT_MAX_RETRIES = 3
+# Fallback backoff when a secondary limit hits without Retry-After
+BASE_BACKOFF = 2.0
+
+
+@dataclass
+class RateLimitBudget:
+    """Remaining requests (or GraphQL points) for one resource."""
+
+    resource: str
+    limit: int
+    remaining: int
+    reset_at: float  # epoch seconds
+    used: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "used": self.used,
+            "reset_at": datetime.fromtimestamp(self.reset_at, timezone.utc).isoformat(),
+        }
+
+
+class RateLimiter:
+    """
+    Tracks GitHub rate-limit budgets and schedules requests against them.
+
+    Thread-safe. One limiter should be shared by every client using the
+    same token, since GitHub budgets are per identity.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
+        """
+        Args:
+            max_concurrent: Requests allowed in flight at once
+            max_wait: Max seconds to wait for a budget reset before failing
+            max_retries: Retries for rate-limited (403/429) responses
+        """
+        self.max_concurrent = max_concurrent
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+        # Requests in flight, and event-loop waiters for a free slot
+        self._in_flight = 0
+        self._slot_lock = threading.Lock()
+        self._slot_free = threading.Condition(self._slot_lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+        now = time.time()
+        self._budgets: Dict[str, RateLimitBudget] = {
+            resource: RateLimitBudget(resource, limit, limit, now + window)
+            for resource, (limit, window) in DEFAULT_BUDGETS.items()
+        }
+
+    @staticmethod
+    def resource_for(request: httpx.Request) -> Optional[str]:
+        """Which budget a request draws from (None for /rate_limit, which is free)."""
+        path = request.url.path
+        if path.endswith("/rate_limit"):
+            return None
+        if path.endswith("/graphql"):
+            return "graphql"
+        if "/search/" in path:
+            return "search"
+        return "core"
+
+    def reserve(self, resource: str) -> float:
+        """
+        Claim one request from a budget.
+
+        A GraphQL query claims one point whatever its cost; update()
+        corrects the balance from the response.
+
+        Returns:
+            0 if the request may go now, otherwise seconds to wait before
+            calling reserve() again.
+
+        Raises:
+            GithubException: If the budget won't reset within max_wait
+        """
+        with self._lock:
+            budget = self._budgets.setdefault(
+                resource, RateLimitBudget(resource, 5000, 5000, time.time() + 3600)
+            )
+            now = time.time()
+            if budget.reset_at <= now:
+                # Window rolled over since we last heard from GitHub
+                window = DEFAULT_BUDGETS.get(resource, (0, 3600.0))[1]
+                budget.remaining = budget.limit
+                budget.used = 0
+                budget.reset_at = now + window
+            if budget.remaining > 0:
+                budget.remaining -= 1
+                budget.used += 1
+                return 0.0
+
+            wait = budget.reset_at - now
+            if wait > self.max_wait:
+                reset = datetime.fromtimestamp(budget.reset_at, timezone.utc)
+                raise GithubException(
+                    403,
+                    {
+                        "message": f"GitHub {resource} rate limit exhausted, "
+                        f"resets at {reset.isoformat()}"
+                    },
+                )
+            return wait
+
+    def update(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Refresh a budget from X-RateLimit-* response headers."""
+        headers = response.headers
+        if "X-RateLimit-Remaining" not in headers:
+            return
+        resource = headers.get("X-RateLimit-Resource") or self.resource_for(request)
+        if not resource:
+            return
+        try:
+            limit = int(headers.get("X-RateLimit-Limit", 0))
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_at = float(headers.get("X-RateLimit-Reset", time.time() + 60))
+            used = int(headers.get("X-RateLimit-Used", limit - remaining))
+        except ValueError:
+            return
+
+        with self._lock:
+            budget = self._budgets.get(resource)
+            if budget and budget.reset_at == reset_at:
+                # Concurrent responses arrive out of order: keep the lowest
+                remaining = min(remaining, budget.remaining)
+            self._budgets[resource] = RateLimitBudget(
+                resource, limit, remaining, reset_at, used
+            )
+
+        if remaining < limit * 0.1:
+            logger.warning(
+                f"GitHub {resource} rate limit low: {remaining}/{limit} remaining"
+            )
+
+    def update_from_status(self, resources: Dict[str, Dict[str, Any]]) -> None:
+        """Replace budgets with the 'resources' section of GET /rate_limit."""
+        with self._lock:
+            for resource, data in resources.items():
+                self._budgets[resource] = RateLimitBudget(
+                    resource,
+                    data["limit"],
+                    data["remaining"],
+                    float(data["reset"]),
+                    data.get("used", data["limit"] - data["remaining"]),
+                )
+
+    def retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying a rate-limited response.
+
+        Returns:
+            None if the response isn't a rate limit or retries are used up.
+        """
+        if response.status_code not in (403, 429) or attempt >= self.max_retries:
+            return None
+
+        headers = response.headers
+        if "Retry-After" in headers:
+            try:
+                return max(float(headers["Retry-After"]), 0.0)
+            except ValueError:
+                pass
+        if headers.get("X-RateLimit-Remaining") == "0":
+            reset_at = float(headers.get("X-RateLimit-Reset", time.time()))
+            return max(reset_at - time.time(), 0.0) + 1.0
+        if response.status_code == 429 or b"rate limit" in response.content.lower():
+            # Secondary rate limit without guidance: exponential backoff
+            return BASE_BACKOFF * (2**attempt)
+        # Plain 403 (permissions) - not ours to retry
+        return None
+
+    def acquire_slot(self) -> None:
+        """Block until a concurrency slot is free."""
+        with self._slot_lock:
+            while self._in_flight >= self.max_concurrent:
+                self._slot_free.wait()
+            self._in_flight += 1
+
+    async def acquire_slot_async(self) -> None:
+        """Wait without blocking the event loop until a slot is free."""
+        while True:
+            with self._slot_lock:
+                if self._in_flight < self.max_concurrent:
+                    self._in_flight += 1
+                    return
+                waiter = (asyncio.get_running_loop(), asyncio.Event())
+                self._async_waiters.append(waiter)
+            try:
+                await waiter[1].wait()
+            finally:
+                with self._slot_lock:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def release_slot(self) -> None:
+        with self._slot_lock:
+            self._in_flight -= 1
+            self._slot_free.notify()
+            # Waiters race for the slot; losers wait again
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Current budget per resource, for status reporting."""
+        with self._lock:
+            return {
+                resource: budget.to_dict()
+                for resource, budget in sorted(self._budgets.items())
+            }
+
+
+class RateLimitedTokenAuth(Auth.Token):
+    """
+    PyGithub token auth that claims every request from a RateLimiter.
+
+    PyGithub calls authentication() once per HTTP request it sends, so
+    operations served by PyGithub draw from the same core budget as the
+    httpx transports, and wait for a reset the same way.
+    """
+
+    def __init__(self, token: str, limiter: RateLimiter):
+        super().__init__(token)
+        self._limiter = limiter
+
+    def authentication(self, headers: dict) -> None:
+        wait = self._limiter.reserve("core")
+        while wait > 0:
+            logger.info(f"GitHub core budget spent, waiting {wait:.1f}s")
+            time.sleep(wait)
+            wait = self._limiter.reserve("core")
+        super().authentication(headers)
+
+
+class RateLimitTransport(httpx.BaseTransport):
+    """httpx transport that sends requests through a RateLimiter."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter):
+        self._transport = transport
+        self._limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        resource = self._limiter.resource_for(request)
+        attempt = 0
+        while True:
+            wait = self._limiter.reserve(resource) if resource else 0.0
+            while wait > 0:
+                logger.info(f"GitHub {resource} budget spent, waiting {wait:.1f}s")
+                time.sleep(wait)
+                wait = self._limiter.reserve(resource)
+
+            self._limiter.acquire_slot()
+            try:
+                response = self._transport.handle_request(request)
+            finally:
+                self._limiter.release_slot()
+
+            self._limiter.update(request, response)
+            if response.status_code in (403, 429):
+                response.read()
+            delay = self._limiter.retry_delay(response, attempt)
+            if delay is None or delay > self._limiter.max_wait:
+                return response
+
+            response.close()
+            attempt += 1
+            logger.warning(
+                f"GitHub rate limited ({response.status_code}) on "
+                f"{request.url.path}, retry {attempt} in {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncRateLimitTransport(httpx.AsyncBaseTransport):
+    """Async variant of RateLimitTransport; waits without blocking the loop."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter):
+        self._transport = transport
+        self._limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        resource = self._limiter.resource_for(request)
+        attempt = 0
+        while True:
+            wait = self._limiter.reserve(resource) if resource else 0.0
+            while wait > 0:
+                logger.info(f"GitHub {resource} budget spent, waiting {wait:.1f}s")
+                await asyncio.sleep(wait)
+                wait = self._limiter.reserve(resource)
+
+            await self._limiter.acquire_slot_async()
+            try:
+                response = await self._transport.handle_async_request(request)
+            finally:
+                self._limiter.release_slot()
+
+            self._limiter.update(request, response)
+            if response.status_code in (403, 429):
+                await response.aread()
+            delay = self._limiter.retry_delay(response, attempt)
+            if delay is None or delay > self._limiter.max_wait:
+                return response
+
+            await response.aclose()
+            attempt += 1
+            logger.warning(
+                f"GitHub rate limited ({response.status_code}) on "
+                f"{request.url.path}, retry {attempt} in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,92 @@
+"""
+Channel name resolution index for SlackClient.
+
+Resolving a user-typed channel name used to rebuild a name -> channel dict
+and run rapidfuzz over every channel name on each call. ChannelIndex is
+built once per channel list and answers, in order of preference:
+
+1. Exact name (case-insensitive, '#' optional)
+2. Unique prefix ('launch' -> 'launch-2025' when nothing else starts so)
+3. Fuzzy match (token_sort_ratio >= FUZZY_CUTOFF), memoized per query
+
+SlackClient drops the index whenever its channel cache is replaced.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+from rapidfuzz import fuzz, process
+
+# Minimum rapidfuzz score for a fuzzy channel match
+FUZZY_CUTOFF = 70
+
+
+class _TrieNode:
+    __slots__ = ("children", "count", "name")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.count = 0  # Names passing through this node
+        self.name: Optional[str] = None  # Any one of them
+
+
+class ChannelIndex:
+    """Lookup structures over one snapshot of the channel list."""
+
+    def __init__(self, channels: Sequence):
+        """
+        Args:
+            channels: SlackChannel objects (anything with .id and .name)
+        """
+        self.source = channels
+        self._by_name = {ch.name.lower(): ch for ch in channels}
+        self._names: List[str] = list(self._by_name)
+        self._fuzzy: Dict[str, Optional[tuple]] = {}
+
+        self._trie = _TrieNode()
+        for name in self._names:
+            node = self._trie
+            for char in name:
+                node = node.children.setdefault(char, _TrieNode())
+                node.count += 1
+                node.name = node.name or name
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def exact(self, name: str):
+        """Channel named exactly `name` (lowercase, no '#'), or None."""
+        return self._by_name.get(name)
+
+    def prefix(self, name: str):
+        """The only channel whose name starts with `name`, or None."""
+        node = self._trie
+        for char in name:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        if node.count != 1:
+            return None
+        return self._by_name[node.name]
+
+    def fuzzy(self, name: str):
+        """
+        Best fuzzy match for `name`.
+
+        Returns:
+            (channel, score), or None below FUZZY_CUTOFF
+        """
+        if name not in self._fuzzy:
+            # token_sort_ratio handles word reordering
+            # (e.g., "dev no sleep" = "no sleep dev")
+            match = process.extractOne(
+                name,
+                self._names,
+                scorer=fuzz.token_sort_ratio,
+                score_cutoff=FUZZY_CUTOFF,
+            )
+            self._fuzzy[name] = (match[0], match[1]) if match else None
+
+        hit = self._fuzzy[name]
+        if hit is None:
+            return None
+        return self._by_name[hit[0]], hit[1]
@@ -5,15 +5,87 @@ Provides Slack API operations using httpx.
 Focuses on messaging and channel operations.
 """
 
+import asyncio
+import json as jsonlib
 import logging
-from typing import List, Optional, Dict, Any
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from itertools import islice
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import httpx
 from pydantic import BaseModel
-from rapidfuzz import fuzz, process
+
+from mcp_server.api_clients.http_cache import (
+    AsyncCachingTransport,
+    CachingTransport,
+    HTTPCache,
+)
+from mcp_server.api_clients.slack_channel_index import ChannelIndex
+from mcp_server.api_clients.slack_message_store import (
+    STORE_REFRESH_OVERLAP,
+    SlackMessageStore,
+)
+from mcp_server.api_clients.slack_rate_limit import (
+    AsyncSlackRateLimitTransport,
+    SlackRateLimiter,
+    SlackRateLimitTransport,
+)
 
 logger = logging.getLogger(__name__)
 
+# Items requested per page from cursor-paginated methods (Slack's recommended max)
+PAGE_SIZE = 200
+
+# Seconds the channel list is reused before a full refetch, and user names
+# before they're looked up again. Users are only ever looked up one by one
+# (users.info) after the first directory page, so names can live longer.
+CHANNEL_CACHE_TTL = 900.0
+USER_CACHE_TTL = 24 * 3600.0
+# Users fetched with users.list on a cold start (Tier 2, 200 per page)
+USER_DIRECTORY_LIMIT = 500
+# Minimum seconds between channel list refetches triggered by an unknown name
+CHANNEL_MISS_REFRESH = 60.0
+
+# Threads fetched at once by fetch_thread_replies
+THREAD_FETCH_CONCURRENCY = 8
+# Threads whose replies are kept, keyed by (channel ID, thread ts)
+REPLY_CACHE_SIZE = 500
+
+# Channels fetched at once by fetch_channel_histories (conversations.history
+# is Tier 3, 50/min)
+CHANNEL_FETCH_CONCURRENCY = 4
+
+# Connections kept open to slack.com and reused across calls
+DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_connections=10,
+    max_keepalive_connections=5,
+    keepalive_expiry=60.0,
+)
+
+
+def _is_ok_response(response: httpx.Response) -> bool:
+    """Slack reports errors as 200 {"ok": false}; only cache real results."""
+    try:
+        return response.json().get("ok") is True
+    except ValueError:
+        return False
+
 
 # ============================================================================
 # Pydantic models for Slack data
@@ -62,6 +134,7 @@ class SlackChannelMessage(BaseModel):
     thread_ts: Optional[str] = None
     reply_count: int = 0
     has_thread: bool = False
+    latest_reply: Optional[str] = None  # ts of the newest reply, for threads
 
 
 # ============================================================================
@@ -74,38 +147,159 @@ class SlackClient:
     Slack API client using httpx.
 
     Provides simplified interface for Slack operations.
-    Uses bot token authentication.
+    Uses bot token authentication over a pooled connection; list and history
+    calls follow Slack's cursor pagination, and every call is scheduled
+    against Slack's per-method rate-limit tiers (see slack_rate_limit).
 
     Note on Caching:
-        This client caches channel list and user mappings to reduce API calls.
-        Cache is per-instance and does NOT expire automatically.
-        New channels/users won't appear until:
-        - MCP server restarts (new session)
-        - New SlackClient instance is created
-
-        TODO: Add TTL-based cache invalidation if this becomes an issue.
-        See internal-docs/issues/007-slack-api-caching.md
+        This client caches the channel list and user ID -> name mappings.
+        - The channel list expires after channel_cache_ttl seconds.
+        - A channel name that isn't cached refetches the list (at most once
+          per CHANNEL_MISS_REFRESH seconds) before fuzzy matching.
+        - The user directory starts from the first USER_DIRECTORY_LIMIT
+          users; IDs it doesn't know, or names older than user_cache_ttl,
+          are looked up one by one with users.info, never with a full
+          users.list scan.
+        - With directory_path set, both are saved to disk so a new process
+          starts warm.
+        - With a message_store, thread reads fetch only replies newer than
+          the last read, and each thread whole every STORE_MAX_AGE seconds
+          (see slack_message_store). Channel history is always fetched.
     """
 
     BASE_URL = "https://slack.com/api"
 
-    def __init__(self, bot_token: str, default_channel: Optional[str] = None):
+    # Non-message events (joins, leaves, etc.) left out of history
+    SKIP_SUBTYPES = {"channel_join", "channel_leave", "bot_add"}
+
+    # Slack errors meaning the bot token is no longer valid
+    AUTH_ERRORS = {"invalid_auth", "not_authed", "token_revoked", "account_inactive"}
+
+    # users.info errors meaning the ID won't resolve on a retry either
+    UNKNOWN_USER_ERRORS = {"user_not_found", "user_not_visible"}
+
+    # Slack sends no ETag/Last-Modified, so directory endpoints are served
+    # from the HTTP cache for a fixed time instead of being revalidated
+    CACHE_TTLS = {
+        "/conversations.list": 300.0,
+        "/users.list": 300.0,
+        "/users.info": 300.0,
+    }
+
+    def __init__(
+        self,
+        bot_token: str,
+        default_channel: Optional[str] = None,
+        on_unauthorized: Optional[Callable[[], None]] = None,
+        http_cache: Optional[HTTPCache] = None,
+        rate_limiter: Optional[SlackRateLimiter] = None,
+        pool_limits: Optional[httpx.Limits] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        directory_path: Optional[Path] = None,
+        channel_cache_ttl: float = CHANNEL_CACHE_TTL,
+        user_cache_ttl: float = USER_CACHE_TTL,
+        message_store: Optional[SlackMessageStore] = None,
+    ):
         """
         Initialize Slack API client.
 
         Args:
             bot_token: Slack bot OAuth token (xoxb-...)
             default_channel: Default channel name or ID for sending messages
+            on_unauthorized: Callback invoked when Slack rejects the token,
+                             e.g. to invalidate cached credentials
+            http_cache: On-disk response cache for channel/user listings
+                        (see CACHE_TTLS)
+            rate_limiter: Per-method tier scheduler. Share one between
+                          clients using the same bot token.
+            pool_limits: Connection pool limits for the shared HTTP transport
+            transport: Custom httpx transport (optional, mainly for testing)
+            async_transport: Custom async httpx transport (optional, mainly
+                             for testing)
+            directory_path: JSON file persisting the channel list and user
+                            directory across restarts (optional)
+            channel_cache_ttl: Seconds to reuse the channel list
+            user_cache_ttl: Seconds to reuse the user directory
+            message_store: Local store making repeat thread reads fetch only
+                           new replies (optional)
         """
         self.bot_token = bot_token
         self.default_channel = default_channel
+        self._on_unauthorized = on_unauthorized
+        self._http_cache = http_cache
         self._headers = {
             "Authorization": f"Bearer {bot_token}",
             "Content-Type": "application/json",
         }
-        # Caches (per-instance, cleared on new client)
+        self._pool_limits = pool_limits or DEFAULT_POOL_LIMITS
+        self._async_transport = async_transport
+        self.rate_limiter = rate_limiter or SlackRateLimiter()
+
+        # Long-lived pooled HTTP client. Requests go cache -> rate limiter ->
+        # network, so cache hits never wait on a tier limit.
+        sync_transport = SlackRateLimitTransport(
+            transport or httpx.HTTPTransport(limits=self._pool_limits),
+            self.rate_limiter,
+        )
+        if http_cache is not None:
+            sync_transport = CachingTransport(
+                sync_transport, http_cache, self.CACHE_TTLS, _is_ok_response
+            )
+        self._http = httpx.Client(
+            base_url=self.BASE_URL,
+            headers=self._headers,
+            timeout=30.0,
+            transport=sync_transport,
+        )
+        # Async pool, created on first use in an event loop: (loop, client)
+        self._async_http: Optional[
+            Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]
+        ] = None
+
+        # Channel list and user ID -> name directory, with epoch fetch times
+        self.channel_cache_ttl = channel_cache_ttl
+        self.user_cache_ttl = user_cache_ttl
+        self._directory_path = directory_path
         self._channel_cache: Optional[List["SlackChannel"]] = None
+        self._channel_cache_at = 0.0
+        # Name resolution index, rebuilt when _channel_cache is replaced
+        self._channel_index: Optional[ChannelIndex] = None
         self._user_cache: Optional[Dict[str, str]] = None
+        self._user_cache_at = 0.0
+        # User ID -> epoch of its last users.info lookup
+        self._user_checked_at: Dict[str, float] = {}
+        self._load_directory()
+        self.message_store = message_store
+        # (channel ID, thread ts) -> (latest_reply, limit, replies), LRU
+        self._reply_cache: OrderedDict[
+            Tuple[str, str], Tuple[str, int, List[SlackChannelMessage]]
+        ] = OrderedDict()
+
+    def _get_async_http(self) -> httpx.AsyncClient:
+        """Get the pooled async client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_http and self._async_http[0] is loop:
+            return self._async_http[1]
+
+        # Connections can't be shared across event loops, so a new loop
+        # (e.g. a fresh asyncio.run) gets its own pool
+        transport = AsyncSlackRateLimitTransport(
+            self._async_transport or httpx.AsyncHTTPTransport(limits=self._pool_limits),
+            self.rate_limiter,
+        )
+        if self._http_cache is not None:
+            transport = AsyncCachingTransport(
+                transport, self._http_cache, self.CACHE_TTLS, _is_ok_response
+            )
+        client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers=self._headers,
+            timeout=30.0,
+            transport=transport,
+        )
+        self._async_http = (loop, client)
+        return client
 
     async def _request(
         self,
@@ -115,21 +309,38 @@ class SlackClient:
         json: Optional[Dict] = None,
     ) -> Dict[str, Any]:
         """Make an async request to Slack API."""
-        url = f"{self.BASE_URL}/{endpoint}"
-
-        async with httpx.AsyncClient() as client:
-            if method == "GET":
-                response = await client.get(url, headers=self._headers, params=params)
-            else:
-                response = await client.post(url, headers=self._headers, json=json)
+        client = self._get_async_http()
+        if method == "GET":
+            response = await client.get(f"/{endpoint}", params=params)
+        else:
+            response = await client.post(f"/{endpoint}", json=json)
+
+        return self._handle_response(response)
+
+    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Parse a Slack API response, raising SlackAPIError on failure."""
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After", "?")
+            raise SlackAPIError(
+                f"Slack API error: ratelimited (retry after {retry_after}s)",
+                "ratelimited",
+            )
 
-            data = response.json()
+        data = response.json()
 
-            if not data.get("ok"):
-                error = data.get("error", "unknown_error")
-                raise SlackAPIError(f"Slack API error: {error}")
+        if not data.get("ok"):
+            error = data.get("error", "unknown_error")
+            if error in self.AUTH_ERRORS and self._on_unauthorized:
+                logger.warning(
+                    f"Slack rejected token ({error}), invalidating credentials"
+                )
+                try:
+                    self._on_unauthorized()
+                except Exception as e:
+                    logger.debug(f"on_unauthorized callback failed: {e}")
+            raise SlackAPIError(f"Slack API error: {error}", error)
 
-            return data
+        return data
 
     def _request_sync(
         self,
@@ -137,23 +348,158 @@ class SlackClient:
         endpoint: str,
         params: Optional[Dict] = None,
         json: Optional[Dict] = None,
+        fresh: bool = False,
     ) -> Dict[str, Any]:
-        """Make a sync request to Slack API."""
-        url = f"{self.BASE_URL}/{endpoint}"
+        """Make a sync request to Slack API (fresh=True skips the HTTP cache)."""
+        if method == "GET":
+            headers = {"Cache-Control": "no-cache"} if fresh else None
+            response = self._http.get(f"/{endpoint}", params=params, headers=headers)
+        else:
+            response = self._http.post(f"/{endpoint}", json=json)
 
-        with httpx.Client() as client:
-            if method == "GET":
-                response = client.get(url, headers=self._headers, params=params)
-            else:
-                response = client.post(url, headers=self._headers, json=json)
+        return self._handle_response(response)
 
-            data = response.json()
+    def _paginate(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        fresh: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate the items of a cursor-paginated GET method.
 
-            if not data.get("ok"):
-                error = data.get("error", "unknown_error")
-                raise SlackAPIError(f"Slack API error: {error}")
+        Follows response_metadata.next_cursor until it is empty or `limit`
+        items have been yielded. Pages are only requested as the caller
+        consumes items, so stopping early saves the remaining calls.
+
+        Args:
+            endpoint: Slack method, e.g. "conversations.list"
+            key: Response field holding the items ("channels", "members", ...)
+            params: Query parameters for every page
+            limit: Maximum items to yield (None for all)
+            fresh: Bypass the HTTP cache
+        """
+        params = dict(params or {})
+        yielded = 0
+        cursor = None
+        while True:
+            page_size = PAGE_SIZE
+            if limit is not None:
+                page_size = min(PAGE_SIZE, limit - yielded)
+            page_params = {**params, "limit": page_size}
+            if cursor:
+                page_params["cursor"] = cursor
+
+            data = self._request_sync("GET", endpoint, params=page_params, fresh=fresh)
+            for item in data.get(key, []):
+                yield item
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+            cursor = (data.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                return
+
+    async def _paginate_async(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async variant of _paginate over the pooled async client."""
+        params = dict(params or {})
+        yielded = 0
+        cursor = None
+        while True:
+            page_size = PAGE_SIZE
+            if limit is not None:
+                page_size = min(PAGE_SIZE, limit - yielded)
+            page_params = {**params, "limit": page_size}
+            if cursor:
+                page_params["cursor"] = cursor
+
+            data = await self._request("GET", endpoint, params=page_params)
+            for item in data.get(key, []):
+                yield item
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+            cursor = (data.get("response_metadata") or {}).get("next_cursor")
+            if not cursor:
+                return
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP connections.
 
-            return data
+        The async pool is closed on its own event loop when that loop is
+        still open.
+        """
+        self._http.close()
+        if self._async_http:
+            loop, client = self._async_http
+            self._async_http = None
+            if not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def aclose(self) -> None:
+        """Close the pooled async HTTP connections for the current loop."""
+        if self._async_http:
+            await self._async_http[1].aclose()
+            self._async_http = None
+
+    # ========================================================================
+    # Directory Persistence
+    # ========================================================================
+
+    def _load_directory(self) -> None:
+        """Warm the channel/user caches from directory_path, if saved."""
+        if not self._directory_path or not self._directory_path.exists():
+            return
+        try:
+            data = jsonlib.loads(self._directory_path.read_text())
+            channels = data.get("channels")
+            if channels:
+                self._channel_cache = [SlackChannel(**ch) for ch in channels["items"]]
+                self._channel_cache_at = channels["fetched_at"]
+            users = data.get("users")
+            if users:
+                self._user_cache = dict(users["items"])
+                self._user_cache_at = users["fetched_at"]
+                self._user_checked_at = dict(users.get("checked_at", {}))
+            logger.debug(f"Loaded Slack directory from {self._directory_path}")
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable Slack directory cache: {e}")
+
+    def _save_directory(self) -> None:
+        """Persist the channel/user caches to directory_path."""
+        if not self._directory_path:
+            return
+        data: Dict[str, Any] = {}
+        if self._channel_cache is not None:
+            data["channels"] = {
+                "fetched_at": self._channel_cache_at,
+                "items": [ch.model_dump() for ch in self._channel_cache],
+            }
+        if self._user_cache is not None:
+            data["users"] = {
+                "fetched_at": self._user_cache_at,
+                "items": self._user_cache,
+                "checked_at": self._user_checked_at,
+            }
+        try:
+            self._directory_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._directory_path.with_suffix(".tmp")
+            tmp.write_text(jsonlib.dumps(data))
+            tmp.chmod(0o600)  # Restrict permissions
+            os.replace(tmp, self._directory_path)
+        except OSError as e:
+            logger.warning(f"Failed to save Slack directory cache: {e}")
 
     # ========================================================================
     # Connection / Auth
@@ -187,42 +533,44 @@ class SlackClient:
     # ========================================================================
 
     def list_channels(
-        self, include_private: bool = True, limit: int = 200, use_cache: bool = True
+        self,
+        include_private: bool = True,
+        limit: Optional[int] = 200,
+        use_cache: bool = True,
     ) -> List[SlackChannel]:
         """
         List Slack channels the bot has access to.
 
         Args:
             include_private: Whether to include private channels
-            limit: Maximum channels to return
-            use_cache: Use cached results if available (default: True)
+            limit: Maximum channels to return (None for all)
+            use_cache: Use cached results if younger than channel_cache_ttl
+                       (default: True). False refetches from Slack.
 
         Returns:
             List of channels
         """
-        # Return cached if available
-        if use_cache and self._channel_cache is not None:
-            return (
-                self._channel_cache[:limit]
-                if limit < len(self._channel_cache)
-                else self._channel_cache
-            )
+        # Return cached if still fresh
+        age = time.time() - self._channel_cache_at
+        if (
+            use_cache
+            and self._channel_cache is not None
+            and age < self.channel_cache_ttl
+        ):
+            return self._channel_cache[:limit]
 
         types = (
             "public_channel,private_channel" if include_private else "public_channel"
         )
 
-        # Always fetch 200 to ensure we get all channels for caching
-        fetch_limit = 200
-
-        data = self._request_sync(
-            "GET",
-            "conversations.list",
-            params={"types": types, "limit": fetch_limit, "exclude_archived": True},
-        )
-
+        # Always fetch every page so the cache can resolve any channel
         channels = []
-        for ch in data.get("channels", []):
+        for ch in self._paginate(
+            "conversations.list",
+            "channels",
+            params={"types": types, "exclude_archived": True},
+            fresh=not use_cache,
+        ):
             channels.append(
                 SlackChannel(
                     id=ch["id"],
@@ -236,11 +584,34 @@ class SlackClient:
 
         # Cache the full result
         self._channel_cache = channels
-        return channels[:limit] if limit < len(channels) else channels
+        self._channel_cache_at = time.time()
+        self._save_directory()
+        return channels[:limit]
+
+    def _get_channel_index(self, refresh: bool = False) -> ChannelIndex:
+        """
+        Get the resolution index for the cached channel list.
 
-    def _resolve_channel(self, channel: Optional[str] = None) -> str:
+        Refetches the list when missing, expired or refresh is set; the
+        index itself is only rebuilt when the cached list changes.
         """
-        Resolve channel name to channel ID with fuzzy matching.
+        expired = time.time() - self._channel_cache_at >= self.channel_cache_ttl
+        if refresh or self._channel_cache is None or expired:
+            self.list_channels(limit=0, use_cache=not refresh)
+
+        if (
+            self._channel_index is None
+            or self._channel_index.source is not self._channel_cache
+        ):
+            self._channel_index = ChannelIndex(self._channel_cache)
+        return self._channel_index
+
+    def resolve_channel(self, channel: Optional[str] = None) -> str:
+        """
+        Resolve channel name to channel ID.
+
+        Tries an exact name, then a unique prefix, then a fuzzy match
+        against the precomputed ChannelIndex.
 
         Args:
             channel: Channel name (with or without #) or channel ID
@@ -260,32 +631,54 @@ class SlackClient:
         # Strip # prefix if present
         channel_name = channel.lstrip("#").lower()
 
-        # Look up channel by name
-        channels = self.list_channels()
-        channel_names = {ch.name.lower(): ch for ch in channels}
-
         # First try exact match
-        if channel_name in channel_names:
-            return channel_names[channel_name].id
-
-        # Use rapidfuzz for fuzzy matching
-        # token_sort_ratio handles word reordering (e.g., "dev no sleep" = "no sleep dev")
-        match = process.extractOne(
-            channel_name,
-            list(channel_names.keys()),
-            scorer=fuzz.token_sort_ratio,
-            score_cutoff=70,  # Minimum 70% match
-        )
+        index = self._get_channel_index()
+        match = index.exact(channel_name)
+
+        # Unknown name: the channel may be newer than the cache
+        if not match and time.time() - self._channel_cache_at >= CHANNEL_MISS_REFRESH:
+            logger.info(f"Channel '{channel}' not cached, refreshing channel list")
+            index = self._get_channel_index(refresh=True)
+            match = index.exact(channel_name)
 
         if match:
-            matched_name, score, _ = match
-            logger.info(
-                f"Fuzzy matched '{channel}' to '{matched_name}' (score: {score})"
-            )
-            return channel_names[matched_name].id
+            return match.id
+
+        # Then a name only one channel starts with
+        match = index.prefix(channel_name)
+        if match:
+            logger.info(f"Prefix matched '{channel}' to '{match.name}'")
+            return match.id
+
+        # Use rapidfuzz for fuzzy matching (memoized per index)
+        fuzzy = index.fuzzy(channel_name)
+        if fuzzy:
+            match, score = fuzzy
+            logger.info(f"Fuzzy matched '{channel}' to '{match.name}' (score: {score})")
+            return match.id
 
         raise ValueError(f"Channel '{channel}' not found or bot is not a member")
 
+    def resolve_channels(
+        self, channels: Sequence[str]
+    ) -> Dict[str, Union[str, ValueError]]:
+        """
+        Resolve many channel names to IDs against one channel index.
+
+        Args:
+            channels: Channel names (with or without #) or channel IDs
+
+        Returns:
+            channel -> channel ID, or the ValueError it failed to resolve with
+        """
+        results: Dict[str, Union[str, ValueError]] = {}
+        for channel in channels:
+            try:
+                results[channel] = self.resolve_channel(channel)
+            except ValueError as e:
+                results[channel] = e
+        return results
+
     # ========================================================================
     # Messaging
     # ========================================================================
@@ -307,7 +700,7 @@ class SlackClient:
         Returns:
             SlackMessage with sent message details
         """
-        channel_id = self._resolve_channel(channel)
+        channel_id = self.resolve_channel(channel)
 
         payload = {
             "channel": channel_id,
@@ -343,7 +736,7 @@ class SlackClient:
         Returns:
             SlackMessage with sent message details
         """
-        channel_id = self._resolve_channel(channel)
+        channel_id = self.resolve_channel(channel)
 
         payload = {
             "channel": channel_id,
@@ -385,44 +778,74 @@ class SlackClient:
         Returns:
             List of messages (newest first)
         """
-        channel_id = self._resolve_channel(channel)
+        channel_id = self.resolve_channel(channel)
 
-        params = {
-            "channel": channel_id,
-            "limit": limit,
-        }
+        params = {"channel": channel_id}
 
         if oldest:
             params["oldest"] = oldest
         if latest:
             params["latest"] = latest
 
-        data = self._request_sync("GET", "conversations.history", params=params)
+        # Not served from the message store: a parent's reply_count and
+        # latest_reply change without its ts moving past a high-water mark
+        raw_messages = list(
+            self._paginate("conversations.history", "messages", params, limit)
+        )
 
         # Get user info for resolving names
-        user_map = self._get_user_map()
+        user_map = self._get_user_map({msg.get("user") for msg in raw_messages})
 
         messages = []
-        for msg in data.get("messages", []):
+        for msg in raw_messages:
             # Skip non-message types (joins, leaves, etc.)
-            if msg.get("subtype") in ["channel_join", "channel_leave", "bot_add"]:
+            if msg.get("subtype") in self.SKIP_SUBTYPES:
                 continue
 
-            user_id = msg.get("user")
-            messages.append(
-                SlackChannelMessage(
-                    ts=msg.get("ts", ""),
-                    user=user_id,
-                    user_name=user_map.get(user_id, user_id),
-                    text=msg.get("text", ""),
-                    thread_ts=msg.get("thread_ts"),
-                    reply_count=msg.get("reply_count", 0),
-                    has_thread=msg.get("reply_count", 0) > 0,
-                )
-            )
+            messages.append(self._to_message(msg, user_map))
 
         return messages
 
+    def iter_channel_history(
+        self,
+        channel: str,
+        oldest: Optional[str] = None,
+        latest: Optional[str] = None,
+    ) -> Iterator[SlackChannelMessage]:
+        """
+        Stream every message of a channel between two timestamps.
+
+        Follows conversations.history cursors for the whole range, one page
+        at a time, so arbitrarily long ranges never sit in memory at once.
+        User names are resolved per page.
+
+        Args:
+            channel: Channel name or ID
+            oldest: Unix timestamp - only messages after this time
+            latest: Unix timestamp - only messages before this time
+
+        Yields:
+            Messages, newest first
+        """
+        channel_id = self.resolve_channel(channel)
+
+        params = {"channel": channel_id}
+        if oldest:
+            params["oldest"] = oldest
+        if latest:
+            params["latest"] = latest
+
+        raw_messages = self._paginate("conversations.history", "messages", params)
+        while True:
+            page = list(islice(raw_messages, PAGE_SIZE))
+            if not page:
+                return
+
+            user_map = self._get_user_map({msg.get("user") for msg in page})
+            for msg in page:
+                if msg.get("subtype") not in self.SKIP_SUBTYPES:
+                    yield self._to_message(msg, user_map)
+
     def get_thread_replies(
         self,
         channel: str,
@@ -440,71 +863,401 @@ class SlackClient:
         Returns:
             List of replies (includes parent message first)
         """
-        channel_id = self._resolve_channel(channel)
+        channel_id = self.resolve_channel(channel)
+
+        raw_messages = None
+        if self.message_store is not None:
+            try:
+                raw_messages = self._stored_replies(channel_id, thread_ts, limit)
+            except sqlite3.Error as e:
+                logger.warning(f"Slack message store unavailable: {e}")
+        if raw_messages is None:
+            params = {"channel": channel_id, "ts": thread_ts}
+            raw_messages = list(
+                self._paginate("conversations.replies", "messages", params, limit)
+            )
 
-        params = {
-            "channel": channel_id,
-            "ts": thread_ts,
-            "limit": limit,
-        }
+        user_map = self._get_user_map({msg.get("user") for msg in raw_messages})
 
-        data = self._request_sync("GET", "conversations.replies", params=params)
+        return [self._to_message(msg, user_map, in_thread=True) for msg in raw_messages]
 
-        user_map = self._get_user_map()
+    def _stored_replies(
+        self, channel_id: str, thread_ts: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        conversations.replies through the message store.
 
-        messages = []
-        for msg in data.get("messages", []):
-            user_id = msg.get("user")
-            messages.append(
-                SlackChannelMessage(
-                    ts=msg.get("ts", ""),
-                    user=user_id,
-                    user_name=user_map.get(user_id, user_id),
-                    text=msg.get("text", ""),
-                    thread_ts=msg.get("thread_ts"),
-                    reply_count=msg.get("reply_count", 0),
-                    has_thread=False,
+        Only threads that fit in `limit` are stored, so a stored thread is
+        always complete from its parent onwards.
+        """
+        scope = f"{channel_id}/{thread_ts}"
+        params = {"channel": channel_id, "ts": thread_ts}
+
+        since = self._store_since(scope, thread_ts)
+        if since is not None:
+            new = list(
+                self._paginate(
+                    "conversations.replies",
+                    "messages",
+                    {**params, "oldest": str(since)},
+                    limit,
                 )
             )
+            stored = self._store_merge(scope, new, since, limit)
+            if stored is not None:
+                return stored
 
-        return messages
+        raw_messages = list(
+            self._paginate("conversations.replies", "messages", params, limit)
+        )
+        self._store_merge(scope, raw_messages, 0.0, limit)
+        return raw_messages
+
+    async def _stored_replies_async(
+        self, channel_id: str, thread_ts: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        """_stored_replies over the async client; store calls run in a thread."""
+        scope = f"{channel_id}/{thread_ts}"
+        params = {"channel": channel_id, "ts": thread_ts}
+
+        since = await asyncio.to_thread(self._store_since, scope, thread_ts)
+        if since is not None:
+            new = [
+                msg
+                async for msg in self._paginate_async(
+                    "conversations.replies",
+                    "messages",
+                    {**params, "oldest": str(since)},
+                    limit,
+                )
+            ]
+            stored = await asyncio.to_thread(
+                self._store_merge, scope, new, since, limit
+            )
+            if stored is not None:
+                return stored
 
-    def _get_user_map(self) -> Dict[str, str]:
-        """Get a mapping of user IDs to display names (cached)."""
-        # Return cached if available
-        if self._user_cache is not None:
-            return self._user_cache
+        raw_messages = [
+            msg
+            async for msg in self._paginate_async(
+                "conversations.replies", "messages", params, limit
+            )
+        ]
+        await asyncio.to_thread(self._store_merge, scope, raw_messages, 0.0, limit)
+        return raw_messages
+
+    def _store_since(self, scope: str, thread_ts: str) -> Optional[float]:
+        """`oldest` for an incremental read of a stored thread, or None."""
+        mark = self.message_store.mark(scope)
+        if not mark:
+            return None
+        return max(mark[1] - STORE_REFRESH_OVERLAP, float(thread_ts))
+
+    def _store_merge(
+        self, scope: str, fetched: List[Dict[str, Any]], since: float, limit: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Save replies fetched from `since` (0 for the whole thread).
 
-        try:
-            users = self.list_users(limit=500, include_bots=True)
-            self._user_cache = {
-                u.id: u.display_name or u.real_name or u.name for u in users
-            }
-            return self._user_cache
-        except Exception:
-            return {}
+        Returns:
+            The stored thread, or None if it no longer fits in `limit` (it
+            is then dropped and must be fetched whole)
+        """
+        store = self.message_store
+        if len(fetched) < limit:
+            store.save(scope, fetched, since, complete=True)
+            stored = store.messages(scope, limit=limit, newest_first=False)
+            if len(stored) < limit:
+                return stored
+        store.drop(scope)
+        return None
+
+    async def fetch_thread_replies(
+        self,
+        channel_id: str,
+        threads: Sequence[Tuple[str, Optional[str]]],
+        limit: int = 100,
+    ) -> Dict[str, Union[List[SlackChannelMessage], Exception]]:
+        """
+        Fetch replies for many threads of one channel concurrently.
+
+        Up to THREAD_FETCH_CONCURRENCY threads are fetched at once over the
+        pooled async client. Replies are cached per thread and reused while
+        the thread's latest_reply is unchanged, so re-reading a channel only
+        fetches threads with new replies; with a message_store, those are
+        read incrementally like get_thread_replies.
+
+        Args:
+            channel_id: Resolved channel ID (see resolve_channel)
+            threads: (thread_ts, latest_reply) pairs; latest_reply comes from
+                     the parent message and may be None (never cached)
+            limit: Maximum replies per thread (parent message included)
+
+        Returns:
+            thread_ts -> replies (parent first), or the exception that thread
+            failed with
+        """
+        results: Dict[str, Union[List[SlackChannelMessage], Exception]] = {}
+        pending = []
+        for thread_ts, latest_reply in threads:
+            cached = self._reply_cache.get((channel_id, thread_ts))
+            if (
+                cached
+                and latest_reply
+                and cached[0] == latest_reply
+                and cached[1] >= limit
+            ):
+                self._reply_cache.move_to_end((channel_id, thread_ts))
+                results[thread_ts] = cached[2][:limit]
+            else:
+                pending.append((thread_ts, latest_reply))
+
+        if not pending:
+            return results
+
+        slots = asyncio.Semaphore(THREAD_FETCH_CONCURRENCY)
+
+        async def fetch(thread_ts: str) -> List[Dict[str, Any]]:
+            async with slots:
+                if self.message_store is not None:
+                    try:
+                        return await self._stored_replies_async(
+                            channel_id, thread_ts, limit
+                        )
+                    except sqlite3.Error as e:
+                        logger.warning(f"Slack message store unavailable: {e}")
+                params = {"channel": channel_id, "ts": thread_ts}
+                return [
+                    msg
+                    async for msg in self._paginate_async(
+                        "conversations.replies", "messages", params, limit
+                    )
+                ]
+
+        raw = await asyncio.gather(
+            *(fetch(thread_ts) for thread_ts, _ in pending), return_exceptions=True
+        )
+
+        # Resolve names once for every fetched thread (may call users.info)
+        user_ids = {
+            msg.get("user")
+            for replies in raw
+            if not isinstance(replies, BaseException)
+            for msg in replies
+        }
+        user_map = await asyncio.to_thread(self._get_user_map, user_ids)
+
+        for (thread_ts, latest_reply), replies in zip(pending, raw):
+            if isinstance(replies, BaseException):
+                results[thread_ts] = replies
+                continue
+            messages = [
+                self._to_message(msg, user_map, in_thread=True) for msg in replies
+            ]
+            results[thread_ts] = messages
+            if latest_reply:
+                self._reply_cache[(channel_id, thread_ts)] = (
+                    latest_reply,
+                    limit,
+                    messages,
+                )
+                self._reply_cache.move_to_end((channel_id, thread_ts))
+                while len(self._reply_cache) > REPLY_CACHE_SIZE:
+                    self._reply_cache.popitem(last=False)
+
+        return results
+
+    async def fetch_channel_histories(
+        self,
+        channel_ids: Sequence[str],
+        oldest: Optional[str] = None,
+        limit: int = 100,
+    ) -> Dict[str, Union[List[SlackChannelMessage], Exception]]:
+        """
+        Fetch recent messages from many channels concurrently.
+
+        Up to CHANNEL_FETCH_CONCURRENCY channels are fetched at once over the
+        pooled async client, then user names are resolved in one pass for
+        all of them.
+
+        Args:
+            channel_ids: Resolved channel IDs (see resolve_channel)
+            oldest: Unix timestamp - only messages after this time
+            limit: Maximum messages per channel
+
+        Returns:
+            channel_id -> messages (newest first), or the exception that
+            channel failed with
+        """
+        slots = asyncio.Semaphore(CHANNEL_FETCH_CONCURRENCY)
+
+        async def fetch(channel_id: str) -> List[Dict[str, Any]]:
+            async with slots:
+                params = {"channel": channel_id}
+                if oldest:
+                    params["oldest"] = oldest
+                return [
+                    msg
+                    async for msg in self._paginate_async(
+                        "conversations.history", "messages", params, limit
+                    )
+                ]
+
+        raw = await asyncio.gather(
+            *(fetch(channel_id) for channel_id in channel_ids),
+            return_exceptions=True,
+        )
+
+        user_ids = {
+            msg.get("user")
+            for messages in raw
+            if not isinstance(messages, BaseException)
+            for msg in messages
+        }
+        user_map = await asyncio.to_thread(self._get_user_map, user_ids)
+
+        results: Dict[str, Union[List[SlackChannelMessage], Exception]] = {}
+        for channel_id, messages in zip(channel_ids, raw):
+            if isinstance(messages, BaseException):
+                results[channel_id] = messages
+                continue
+            results[channel_id] = [
+                self._to_message(msg, user_map)
+                for msg in messages
+                if msg.get("subtype") not in self.SKIP_SUBTYPES
+            ]
+        return results
+
+    @staticmethod
+    def _to_message(
+        msg: Dict[str, Any], user_map: Dict[str, str], in_thread: bool = False
+    ) -> SlackChannelMessage:
+        """Convert a raw history/replies message, resolving the user's name."""
+        user_id = msg.get("user")
+        return SlackChannelMessage(
+            ts=msg.get("ts", ""),
+            user=user_id,
+            user_name=user_map.get(user_id, user_id),
+            text=msg.get("text", ""),
+            thread_ts=msg.get("thread_ts"),
+            reply_count=msg.get("reply_count", 0),
+            has_thread=not in_thread and msg.get("reply_count", 0) > 0,
+            latest_reply=msg.get("latest_reply"),
+        )
+
+    def _get_user_map(self, user_ids: Optional[Set[str]] = None) -> Dict[str, str]:
+        """
+        Get a mapping of user IDs to display names (cached).
+
+        A cold start fetches the first USER_DIRECTORY_LIMIT users. After
+        that the directory is served as is, even past user_cache_ttl: IDs
+        in user_ids that it doesn't know (users who joined since), or whose
+        name is older than user_cache_ttl, are looked up with users.info.
+
+        Args:
+            user_ids: IDs the caller is about to resolve
+        """
+        now = time.time()
+        if self._user_cache is None:
+            try:
+                users = self.list_users(limit=USER_DIRECTORY_LIMIT, include_bots=True)
+            except Exception as e:
+                logger.warning(f"Failed to fetch Slack user directory: {e}")
+                return {}
+            self._user_cache = {u.id: self._display_name(u) for u in users}
+            self._user_cache_at = now
+            self._user_checked_at = {}
+            self._save_directory()
+
+        expired = now - self._user_cache_at >= self.user_cache_ttl
+        lookup = {
+            uid
+            for uid in user_ids or ()
+            if uid
+            and (
+                uid not in self._user_cache
+                or (
+                    expired
+                    and now - self._user_checked_at.get(uid, 0.0) >= self.user_cache_ttl
+                )
+            )
+        }
+        found = False
+        for user_id in sorted(lookup):
+            try:
+                user = self.get_user(user_id)
+            except Exception as e:
+                # Transient or permission errors: keep any old name, resolve
+                # again next call
+                logger.debug(f"Could not look up Slack user {user_id}: {e}")
+                continue
+            # Remember unknown IDs too, so they aren't retried every call
+            self._user_cache[user_id] = self._display_name(user) if user else user_id
+            self._user_checked_at[user_id] = now
+            found = True
+        if found:
+            self._save_directory()
+
+        return self._user_cache
+
+    @staticmethod
+    def _display_name(user: "SlackUser") -> str:
+        return user.display_name or user.real_name or user.name
 
     # ========================================================================
     # User Operations
     # ========================================================================
 
+    def get_user(self, user_id: str) -> Optional[SlackUser]:
+        """
+        Look up a single user with users.info.
+
+        Args:
+            user_id: Slack user ID (U...)
+
+        Returns:
+            The user, or None if Slack doesn't know the ID
+
+        Raises:
+            SlackAPIError: Any other failure (rate limits, missing scope, ...)
+        """
+        try:
+            data = self._request_sync("GET", "users.info", params={"user": user_id})
+        except SlackAPIError as e:
+            if e.error not in self.UNKNOWN_USER_ERRORS:
+                raise
+            logger.debug(f"users.info failed for {user_id}: {e}")
+            return None
+        return self._to_user(data.get("user") or {"id": user_id})
+
+    @staticmethod
+    def _to_user(member: Dict[str, Any]) -> SlackUser:
+        profile = member.get("profile", {})
+        return SlackUser(
+            id=member["id"],
+            name=member.get("name", ""),
+            real_name=member.get("real_name", ""),
+            display_name=profile.get("display_name", ""),
+            email=profile.get("email"),
+            is_admin=member.get("is_admin", False),
+            is_bot=member.get("is_bot", False),
+        )
+
     def list_users(
-        self, limit: int = 200, include_bots: bool = False
+        self, limit: Optional[int] = 200, include_bots: bool = False
     ) -> List[SlackUser]:
         """
         List users in the Slack workspace.
 
         Args:
-            limit: Maximum users to return
+            limit: Maximum users to return (None for all)
             include_bots: Whether to include bot users
 
         Returns:
             List of users
         """
-        data = self._request_sync("GET", "users.list", params={"limit": limit})
-
         users = []
-        for member in data.get("members", []):
+        for member in self._paginate("users.list", "members"):
             # Skip deleted users
             if member.get("deleted"):
                 continue
@@ -517,18 +1270,10 @@ class SlackClient:
             if member.get("id") == "USLACKBOT":
                 continue
 
-            profile = member.get("profile", {})
-            users.append(
-                SlackUser(
-                    id=member["id"],
-                    name=member.get("name", ""),
-                    real_name=member.get("real_name", ""),
-                    display_name=profile.get("display_name", ""),
-                    email=profile.get("email"),
-                    is_admin=member.get("is_admin", False),
-                    is_bot=member.get("is_bot", False),
-                )
-            )
+            users.append(self._to_user(member))
+            # Filtered members don't count, so stop on users, not items
+            if limit is not None and len(users) >= limit:
+                break
 
         return users
 
@@ -536,4 +1281,7 @@ class SlackClient:
 class SlackAPIError(Exception):
     """Exception raised for Slack API errors."""
 
-    pass
+    def __init__(self, message: str, error: Optional[str] = None):
+        super().__init__(message)
+        # Slack's error code, e.g. "channel_not_found"
+        self.error = error
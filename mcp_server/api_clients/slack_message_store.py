@@ -0,0 +1,289 @@
+"""
+Local store of fetched Slack thread replies for incremental reads.
+
+Each scope (one thread, "channel_id/thread_ts") keeps the raw messages
+fetched so far plus a coverage mark:
+
+- covered_from: every message with ts > covered_from up to high_water is
+  stored
+- high_water: ts of the newest stored message
+- refreshed_at: when the whole covered range was last fetched
+
+SlackClient then asks Slack only for replies newer than high_water (minus
+STORE_REFRESH_OVERLAP, so recent edits and deletions are picked up) and
+serves older ones from here. Once a mark is STORE_MAX_AGE old the scope is
+fetched whole again, so older edits and deletions are seen too.
+
+Channel history isn't stored: a parent message's reply_count and
+latest_reply change when someone replies, without its ts moving past the
+high-water mark, so stored parents would serve stale thread metadata.
+
+Scopes are evicted whole, least recently read first, once the database
+exceeds max_bytes.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024  # 20 MB
+
+# Seconds before the high-water mark that are refetched on every read
+STORE_REFRESH_OVERLAP = 3600.0
+
+# Seconds a scope is read incrementally before it is refetched whole
+STORE_MAX_AGE = 6 * 3600.0
+
+# Run eviction every N saves instead of on every write
+EVICT_EVERY = 20
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    scope TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    ts_num REAL NOT NULL,
+    data TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (scope, ts)
+);
+CREATE INDEX IF NOT EXISTS messages_by_time ON messages (scope, ts_num);
+CREATE TABLE IF NOT EXISTS marks (
+    scope TEXT PRIMARY KEY,
+    covered_from REAL NOT NULL,
+    high_water REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+
+class SlackMessageStore:
+    """
+    SQLite-backed message store for one Slack workspace (bot token).
+
+    Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_age: float = STORE_MAX_AGE,
+    ):
+        """
+        Open (or create) the store database.
+
+        Args:
+            path: SQLite file location
+            max_bytes: Total message size to keep before evicting scopes
+            max_age: Seconds a scope's mark is trusted before a full refetch
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._saves = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, timeout=5.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(marks)")}
+        if "refreshed_at" not in columns:
+            # Database from before marks expired: start over
+            self._conn.executescript("DROP TABLE marks; DROP TABLE messages;")
+            self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        # Messages can contain private workspace data
+        os.chmod(self.path, 0o600)
+
+    def mark(self, scope: str) -> Optional[Tuple[float, float]]:
+        """
+        (covered_from, high_water) for a scope.
+
+        Returns:
+            None if nothing is stored, or the covered range was last fetched
+            more than max_age seconds ago
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT covered_from, high_water, refreshed_at FROM marks "
+                "WHERE scope = ?",
+                (scope,),
+            ).fetchone()
+        if not row or time.time() - row[2] > self.max_age:
+            return None
+        return row[0], row[1]
+
+    def messages(
+        self,
+        scope: str,
+        after: float = 0.0,
+        limit: Optional[int] = None,
+        newest_first: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Stored raw messages of a scope with ts > after.
+
+        Args:
+            scope: Channel ID, or "channel_id/thread_ts" for a thread
+            after: Only messages newer than this Unix timestamp
+            limit: Maximum messages (None for all)
+            newest_first: Order like conversations.history (True) or
+                          conversations.replies (False)
+        """
+        order = "DESC" if newest_first else "ASC"
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM messages WHERE scope = ? AND ts_num > ? "
+                f"ORDER BY ts_num {order} LIMIT ?",
+                (scope, after, -1 if limit is None else limit),
+            ).fetchall()
+            self._conn.execute(
+                "UPDATE marks SET accessed_at = ? WHERE scope = ?",
+                (time.time(), scope),
+            )
+            self._conn.commit()
+        return [json.loads(data) for (data,) in rows]
+
+    def save(
+        self,
+        scope: str,
+        messages: Sequence[Dict[str, Any]],
+        fetched_from: float,
+        complete: bool,
+    ) -> None:
+        """
+        Merge a fetch result into a scope.
+
+        Args:
+            scope: Channel ID, or "channel_id/thread_ts" for a thread
+            messages: Raw messages returned by Slack
+            fetched_from: The `oldest` the fetch was made with (0 for none)
+            complete: True if every message after fetched_from was returned
+                      (the fetch wasn't cut off by its limit)
+        """
+        times = [float(msg["ts"]) for msg in messages]
+        # A truncated fetch only proves coverage down to its oldest message
+        new_from = fetched_from if complete or not times else min(times)
+        newest = max(times, default=fetched_from)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT covered_from, high_water, refreshed_at FROM marks "
+                "WHERE scope = ?",
+                (scope,),
+            ).fetchone()
+            if row and new_from <= row[1]:
+                covered_from = min(row[0], new_from)
+                high_water = max(row[1], newest)
+                # Only a fetch spanning everything stored refreshes the mark
+                refreshed_at = now if new_from <= row[0] else row[2]
+            else:
+                # No overlap with what's stored: start over
+                self._conn.execute("DELETE FROM messages WHERE scope = ?", (scope,))
+                covered_from, high_water, refreshed_at = new_from, newest, now
+
+            if complete:
+                # Messages in the fetched range that Slack no longer returns
+                # were deleted
+                fetched = {msg["ts"] for msg in messages}
+                stale = [
+                    (scope, ts)
+                    for (ts,) in self._conn.execute(
+                        "SELECT ts FROM messages WHERE scope = ? AND ts_num > ?",
+                        (scope, fetched_from),
+                    )
+                    if ts not in fetched
+                ]
+                self._conn.executemany(
+                    "DELETE FROM messages WHERE scope = ? AND ts = ?", stale
+                )
+
+            rows = []
+            for msg, ts_num in zip(messages, times):
+                data = json.dumps(msg)
+                rows.append((scope, msg["ts"], ts_num, data, len(data)))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO messages VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO marks VALUES (?, ?, ?, ?, ?)",
+                (scope, covered_from, high_water, now, refreshed_at),
+            )
+            self._conn.commit()
+
+            self._saves += 1
+            if self._saves % EVICT_EVERY == 0:
+                self._evict()
+
+    def drop(self, scope: str) -> None:
+        """Forget everything stored for a scope."""
+        with self._lock:
+            self._conn.execute("DELETE FROM messages WHERE scope = ?", (scope,))
+            self._conn.execute("DELETE FROM marks WHERE scope = ?", (scope,))
+            self._conn.commit()
+
+    def evict(self) -> None:
+        """Trim to max_bytes, dropping least recently read scopes."""
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Eviction body; caller holds the lock."""
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM messages"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT marks.scope, COALESCE(SUM(messages.size), 0) FROM marks "
+            "LEFT JOIN messages ON messages.scope = marks.scope "
+            "GROUP BY marks.scope ORDER BY marks.accessed_at"
+        ).fetchall()
+        doomed = []
+        for scope, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((scope,))
+            total -= size
+        self._conn.executemany("DELETE FROM messages WHERE scope = ?", doomed)
+        self._conn.executemany("DELETE FROM marks WHERE scope = ?", doomed)
+        self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all stored messages."""
+        with self._lock:
+            self._conn.execute("DELETE FROM messages")
+            self._conn.execute("DELETE FROM marks")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def open_message_store(path: Path) -> Optional[SlackMessageStore]:
+    """
+    Open a message store, or None when disabled or unavailable.
+
+    Set QUICKCALL_SLACK_STORE=off to disable it.
+    """
+    if os.getenv("QUICKCALL_SLACK_STORE", "on").lower() in ("0", "off", "false"):
+        return None
+    try:
+        return SlackMessageStore(path)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Slack message store disabled, could not open database: {e}")
+        return None
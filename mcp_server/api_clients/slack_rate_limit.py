@@ -0,0 +1,220 @@
+"""
+Rate-limit aware request scheduling for the Slack Web API.
+
+Slack limits each API method per workspace by tier (Tier 1: ~1/min, Tier 2:
+~20/min, Tier 3: ~50/min, Tier 4: ~100/min), with chat.postMessage allowed
+about one message per second. SlackRateLimiter keeps a one-minute sliding
+window per method so callers are held back before Slack starts rejecting
+them, and when Slack does answer 429 it honors Retry-After for every
+caller of that method.
+
+SlackRateLimitTransport plugs the limiter into an httpx client.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Requests per minute allowed by each Slack rate-limit tier
+TIER_LIMITS = {1: 1, 2: 20, 3: 50, 4: 100}
+
+# Tier of the methods this server calls; unknown methods assume Tier 3
+METHOD_TIERS = {
+    "auth.test": 4,
+    "conversations.list": 2,
+    "conversations.history": 3,
+    "conversations.replies": 3,
+    "conversations.info": 3,
+    "users.list": 2,
+    "users.info": 4,
+}
+
+# Methods with their own per-minute limits instead of a tier
+SPECIAL_LIMITS = {"chat.postMessage": 60}
+
+WINDOW = 60.0
+DEFAULT_TIER = 3
+# Longest we'll block a caller (Retry-After or tier budget) before giving up
+DEFAULT_MAX_WAIT = 60.0
+DEFAULT_MAX_RETRIES = 3
+# Slack almost always sends Retry-After; this covers when it doesn't
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class SlackRateLimiter:
+    """
+    Schedules Slack API calls against per-method tier limits.
+
+    Thread-safe. Slack limits are per workspace and app, so one limiter
+    should be shared by every client using the same bot token.
+    """
+
+    def __init__(
+        self,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        limits: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Args:
+            max_wait: Max seconds to hold one call back (Retry-After or tier
+                      budget) before failing it as ratelimited
+            max_retries: Retries for 429 responses
+            limits: Per-method requests/minute overriding the tier table
+        """
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self._limits = dict(limits or {})
+        self._lock = threading.Lock()
+        self._sent: Dict[str, Deque[float]] = {}
+        self._blocked_until: Dict[str, float] = {}
+
+    @staticmethod
+    def method_for(request: httpx.Request) -> str:
+        """Slack API method of a request, e.g. 'conversations.list'."""
+        return request.url.path.rsplit("/", 1)[-1]
+
+    def limit_for(self, method: str) -> int:
+        """Requests per minute allowed for a method."""
+        if method in self._limits:
+            return self._limits[method]
+        if method in SPECIAL_LIMITS:
+            return SPECIAL_LIMITS[method]
+        return TIER_LIMITS[METHOD_TIERS.get(method, DEFAULT_TIER)]
+
+    def reserve(self, method: str) -> float:
+        """
+        Claim one call to a method.
+
+        Returns:
+            0 if the call may go now, otherwise seconds to wait before
+            calling reserve() again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            blocked = self._blocked_until.get(method, 0.0) - now
+            if blocked > 0:
+                return blocked
+
+            sent = self._sent.setdefault(method, deque())
+            while sent and sent[0] <= now - WINDOW:
+                sent.popleft()
+            if len(sent) < self.limit_for(method):
+                sent.append(now)
+                return 0.0
+            return sent[0] + WINDOW - now
+
+    @staticmethod
+    def throttled(request: httpx.Request, wait: float) -> httpx.Response:
+        """Local 429 for a call that would wait longer than max_wait."""
+        return httpx.Response(
+            429,
+            headers={"Retry-After": f"{wait:.0f}"},
+            json={"ok": False, "error": "ratelimited"},
+            request=request,
+        )
+
+    def block(self, method: str, seconds: float) -> None:
+        """Hold back every caller of a method, e.g. after a 429."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            self._blocked_until[method] = max(
+                until, self._blocked_until.get(method, 0.0)
+            )
+
+    def retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying a rate-limited response.
+
+        Returns:
+            None if the response isn't a 429 or retries are used up.
+        """
+        if response.status_code != 429 or attempt >= self.max_retries:
+            return None
+        try:
+            return max(float(response.headers["Retry-After"]), 0.0)
+        except (KeyError, ValueError):
+            return DEFAULT_RETRY_AFTER
+
+
+class SlackRateLimitTransport(httpx.BaseTransport):
+    """httpx transport that sends requests through a SlackRateLimiter."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: SlackRateLimiter):
+        self._transport = transport
+        self._limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        method = self._limiter.method_for(request)
+        attempt = 0
+        while True:
+            wait = self._limiter.reserve(method)
+            waited = 0.0
+            while wait > 0:
+                if waited + wait > self._limiter.max_wait:
+                    logger.warning(f"Slack {method} limit reached, not waiting")
+                    return self._limiter.throttled(request, wait)
+                logger.info(f"Slack {method} limit reached, waiting {wait:.1f}s")
+                time.sleep(wait)
+                waited += wait
+                wait = self._limiter.reserve(method)
+
+            response = self._transport.handle_request(request)
+            delay = self._limiter.retry_delay(response, attempt)
+            if delay is None or delay > self._limiter.max_wait:
+                return response
+
+            response.close()
+            self._limiter.block(method, delay)
+            attempt += 1
+            logger.warning(
+                f"Slack rate limited {method}, retry {attempt} in {delay:.1f}s"
+            )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncSlackRateLimitTransport(httpx.AsyncBaseTransport):
+    """Async variant of SlackRateLimitTransport; waits without blocking the loop."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: SlackRateLimiter):
+        self._transport = transport
+        self._limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        method = self._limiter.method_for(request)
+        attempt = 0
+        while True:
+            wait = self._limiter.reserve(method)
+            waited = 0.0
+            while wait > 0:
+                if waited + wait > self._limiter.max_wait:
+                    logger.warning(f"Slack {method} limit reached, not waiting")
+                    return self._limiter.throttled(request, wait)
+                logger.info(f"Slack {method} limit reached, waiting {wait:.1f}s")
+                await asyncio.sleep(wait)
+                waited += wait
+                wait = self._limiter.reserve(method)
+
+            response = await self._transport.handle_async_request(request)
+            delay = self._limiter.retry_delay(response, attempt)
+            if delay is None or delay > self._limiter.max_wait:
+                return response
+
+            await response.aclose()
+            self._limiter.block(method, delay)
+            attempt += 1
+            logger.warning(
+                f"Slack rate limited {method}, retry {attempt} in {delay:.1f}s"
+            )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
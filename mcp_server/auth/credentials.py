@@ -12,10 +12,12 @@ Also supports GitHub PAT fallback for users without GitHub App access:
 import os
 import json
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass, asdict
-from datetime import datetime
+from datetime import datetime, timezone
 
 import httpx
 
@@ -32,6 +34,16 @@ PAT_CONFIG_FILENAMES = [".quickcall.env", "quickcall.env"]
 # Set QUICKCALL_API_URL=http://localhost:8000 for local development
 QUICKCALL_API_URL = os.getenv("QUICKCALL_API_URL", "https://api.quickcall.dev")
 
+# API credential cache - short TTL so connect/disconnect changes propagate quickly.
+# Set QUICKCALL_CREDENTIALS_TTL=0 to disable caching.
+API_CREDENTIALS_TTL = float(os.getenv("QUICKCALL_CREDENTIALS_TTL", "60"))
+# Fraction of the TTL after which a background refresh is started
+API_CREDENTIALS_REFRESH_FRACTION = 0.75
+# GitHub installation tokens are valid for 1 hour
+GITHUB_TOKEN_VALIDITY = 3600.0
+# Refresh installation tokens this many seconds before they expire
+GITHUB_TOKEN_REFRESH_MARGIN = 300.0
+
 
 @dataclass
 class StoredCredentials:
@@ -137,6 +149,12 @@ class CredentialStore:
         self._stored: Optional[StoredCredentials] = None
         self._github_pat: Optional[GitHubPATCredentials] = None
         self._api_creds: Optional[APICredentials] = None
+        self._api_creds_ttl = API_CREDENTIALS_TTL
+        # Monotonic timestamps for the cached API credentials
+        self._api_creds_fetched_at: float = 0.0
+        self._github_token_expires_at: Optional[float] = None
+        self._api_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
         self._load()
 
     def _load(self):
@@ -195,7 +213,7 @@ class CredentialStore:
     def save(self, credentials: StoredCredentials):
         """Save QuickCall credentials to disk."""
         self._stored = credentials
-        self._api_creds = None  # Clear cached API creds
+        self.invalidate_api_credentials()
         self._save_to_file()
         logger.info(f"Saved QuickCall credentials for user {credentials.user_id}")
 
@@ -211,12 +229,12 @@ class CredentialStore:
 
         self._stored = None
         self._github_pat = None
-        self._api_creds = None
+        self.invalidate_api_credentials()
 
     def clear_quickcall(self):
         """Clear only QuickCall credentials, keep PAT if configured."""
         self._stored = None
-        self._api_creds = None
+        self.invalidate_api_credentials()
         if self._github_pat:
             self._save_to_file()
         elif CREDENTIALS_FILE.exists():
@@ -272,14 +290,19 @@ class CredentialStore:
         self, force_refresh: bool = False
     ) -> Optional[APICredentials]:
         """
-        Fetch fresh API credentials from QuickCall.
+        Get API credentials from QuickCall, using a short-lived cache.
 
-        This calls the /api/cli/credentials endpoint to get:
-        - GitHub installation token (fresh, 1 hour validity)
+        The /api/cli/credentials endpoint returns:
+        - GitHub installation token (1 hour validity)
         - Slack bot token (decrypted)
 
+        Cached credentials are reused for QUICKCALL_CREDENTIALS_TTL seconds
+        (and never past the GitHub token expiry). Late in that window the cache
+        is refreshed in the background so callers don't wait on the network.
+        Call invalidate_api_credentials() when a token is rejected (401).
+
         Args:
-            force_refresh: Force fetch even if cached
+            force_refresh: Bypass the cache and fetch fresh credentials
 
         Returns:
             APICredentials with fresh tokens, or None if not authenticated
@@ -287,15 +310,82 @@ class CredentialStore:
         if not self._stored:
             return None
 
-        # Always fetch fresh credentials - don't cache
-        # Integration status can change at any time (user connects/disconnects via web)
-        # Caching causes stale data issues where connected integrations show as disconnected
+        cached = self._api_creds
+        if not force_refresh and cached is not None:
+            now = time.monotonic()
+            soft_deadline, hard_deadline = self._api_creds_deadlines()
+            if now < soft_deadline:
+                return cached
+            if now < hard_deadline:
+                self._start_background_refresh()
+                return cached
+
+        with self._api_lock:
+            return self._fetch_api_credentials()
+
+    def invalidate_api_credentials(self):
+        """
+        Drop cached API credentials.
+
+        Call this when GitHub or Slack reject a token (401) so the next
+        call fetches fresh credentials.
+        """
+        self._api_creds = None
+        self._api_creds_fetched_at = 0.0
+        self._github_token_expires_at = None
+
+    def _api_creds_deadlines(self) -> Tuple[float, float]:
+        """Return (background refresh, hard expiry) monotonic deadlines."""
+        soft = self._api_creds_fetched_at + (
+            self._api_creds_ttl * API_CREDENTIALS_REFRESH_FRACTION
+        )
+        hard = self._api_creds_fetched_at + self._api_creds_ttl
+
+        if self._github_token_expires_at is not None:
+            token_deadline = self._github_token_expires_at - GITHUB_TOKEN_REFRESH_MARGIN
+            soft = min(soft, token_deadline)
+            hard = min(hard, self._github_token_expires_at - 60.0)
+
+        return soft, hard
+
+    def _start_background_refresh(self):
+        """Refresh cached credentials in a background thread (at most one)."""
+        if self._refresh_thread and self._refresh_thread.is_alive():
+            return
+
+        def refresh():
+            # Skip if a foreground call is already fetching
+            if not self._api_lock.acquire(blocking=False):
+                return
+            try:
+                self._fetch_api_credentials(keep_on_error=True)
+            finally:
+                self._api_lock.release()
+
+        self._refresh_thread = threading.Thread(
+            target=refresh, name="quickcall-credentials-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def _fetch_api_credentials(
+        self, keep_on_error: bool = False
+    ) -> Optional[APICredentials]:
+        """
+        Fetch fresh API credentials from QuickCall and update the cache.
+
+        Args:
+            keep_on_error: Keep existing cached credentials if the fetch fails
+                           (used by background refresh)
+        """
+        stored = self._stored
+        if not stored:
+            return None
 
         try:
             with httpx.Client(timeout=30.0) as client:
                 response = client.get(
                     f"{self.api_url}/api/cli/credentials",
-                    headers={"Authorization": f"Bearer {self._stored.device_token}"},
+                    headers={"Authorization": f"Bearer {stored.device_token}"},
                 )
 
                 if response.status_code == 401:
@@ -306,7 +396,7 @@ class CredentialStore:
                 response.raise_for_status()
                 data = response.json()
 
-                self._api_creds = APICredentials(
+                api_creds = APICredentials(
                     user_id=data["user"]["user_id"],
                     email=data["user"].get("email"),
                     username=data["user"].get("username"),
@@ -321,18 +411,29 @@ class CredentialStore:
                     slack_user_id=data["slack"].get("user_id"),
                 )
 
+                fetched_at = time.monotonic()
+                self._api_creds = api_creds
+                self._api_creds_fetched_at = fetched_at
+                self._github_token_expires_at = (
+                    _parse_token_expiry(data["github"].get("expires_at"), fetched_at)
+                    if api_creds.github_token
+                    else None
+                )
+
                 logger.debug(
-                    f"Fetched API credentials: GitHub={self._api_creds.github_connected}, "
-                    f"Slack={self._api_creds.slack_connected}"
+                    f"Fetched API credentials: GitHub={api_creds.github_connected}, "
+                    f"Slack={api_creds.slack_connected}"
                 )
-                return self._api_creds
+                return api_creds
 
         except httpx.HTTPStatusError as e:
             logger.error(f"API error fetching credentials: {e.response.status_code}")
-            return None
         except Exception as e:
             logger.error(f"Failed to fetch API credentials: {e}")
-            return None
+
+        if keep_on_error:
+            return self._api_creds
+        return None
 
     def get_status(self) -> Dict[str, Any]:
         """Get authentication status for diagnostics."""
@@ -388,6 +489,23 @@ class CredentialStore:
         return result
 
 
+def _parse_token_expiry(expires_at: Optional[str], fetched_at: float) -> float:
+    """
+    Convert a token expiry timestamp to a monotonic deadline.
+
+    Falls back to the standard 1 hour installation token validity when
+    the API doesn't report an expiry.
+    """
+    if expires_at:
+        try:
+            expiry = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+            remaining = (expiry - datetime.now(timezone.utc)).total_seconds()
+            return fetched_at + remaining
+        except (ValueError, TypeError):
+            logger.debug(f"Could not parse token expiry: {expires_at}")
+    return fetched_at + GITHUB_TOKEN_VALIDITY
+
+
 # Global credential store instance
 _credential_store: Optional[CredentialStore] = None
 
@@ -406,7 +524,7 @@ def is_authenticated() -> bool:
 
 
 def get_credentials() -> Optional[APICredentials]:
-    """Get fresh API credentials (GitHub token, Slack token, etc)."""
+    """Get API credentials (GitHub token, Slack token, etc), briefly cached."""
     return get_credential_store().get_api_credentials()
 
 
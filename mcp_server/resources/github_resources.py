@@ -4,7 +4,10 @@ GitHub MCP Resources - Exposes GitHub data for Claude's context.
 Resources are automatically available in Claude's context when connected.
 """
 
+import asyncio
 import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastmcp import FastMCP
 
@@ -12,6 +15,158 @@ from mcp_server.auth import get_credential_store, get_github_pat
 
 logger = logging.getLogger(__name__)
 
+# Seconds a github://projects listing is served without refetching
+PROJECTS_CACHE_TTL = 300.0
+# Past the TTL, a listing up to this old is still served while it refreshes
+PROJECTS_CACHE_MAX_STALE = 3600.0
+# Owners whose projects are fetched at once
+PROJECT_DISCOVERY_CONCURRENCY = 8
+
+# (auth mode, username, token digest) -> (monotonic fetch time, projects).
+# Keyed by token so a reconnect or another account never sees old listings.
+_projects_cache: Dict[Tuple[str, str, str], Tuple[float, List[Dict[str, Any]]]] = {}
+# Background refreshes in flight, one per identity
+_projects_refresh: Dict[Tuple[str, str, str], "asyncio.Task[List[Dict[str, Any]]]"] = {}
+# Username resolved for the current client: (client, username)
+_identity_cache: Optional[Tuple[Any, str]] = None
+
+
+# ============================================================================
+# Project Discovery
+# ============================================================================
+
+
+async def _get_username(client) -> str:
+    """Get the authenticated username, resolved once per client."""
+    global _identity_cache
+
+    if _identity_cache and _identity_cache[0] is client.sync_client:
+        return _identity_cache[1]
+
+    username = await client.get_authenticated_user()
+    _identity_cache = (client.sync_client, username)
+    return username
+
+
+async def _discover_projects(client, username: str) -> List[Dict[str, Any]]:
+    """
+    Fetch projects for the user and every org they have repos in.
+
+    User projects and the repo listing are fetched together, then all orgs
+    are queried concurrently (PROJECT_DISCOVERY_CONCURRENCY at a time).
+    Owners that fail (no access, SSO not authorized, ...) are skipped.
+
+    Returns:
+        User projects first, then org projects by repo count (most first)
+    """
+    slots = asyncio.Semaphore(PROJECT_DISCOVERY_CONCURRENCY)
+
+    async def fetch(owner: str, is_org: bool) -> List[Dict[str, Any]]:
+        async with slots:
+            try:
+                return await client.list_projects_with_fields(
+                    owner=owner, is_org=is_org, limit=100
+                )
+            except Exception as e:
+                logger.debug(f"Skipping projects for {owner}: {e}")
+                return []
+
+    user_projects, repos = await asyncio.gather(
+        fetch(username, False),
+        client.list_repos(limit=100),
+        return_exceptions=True,
+    )
+    if isinstance(user_projects, BaseException):
+        user_projects = []
+    if isinstance(repos, BaseException):
+        logger.debug(f"Skipping org projects, repo listing failed: {repos}")
+        repos = []
+
+    org_counts: Dict[str, int] = {}
+    for repo in repos:
+        if repo.owner != username:
+            org_counts[repo.owner] = org_counts.get(repo.owner, 0) + 1
+
+    # Sort orgs by repo count (most repos first)
+    sorted_orgs = sorted(org_counts, key=lambda x: org_counts[x], reverse=True)
+    org_projects = await asyncio.gather(*(fetch(org, True) for org in sorted_orgs))
+
+    all_projects = list(user_projects)
+    for projects in org_projects:
+        all_projects.extend(projects)
+    return all_projects
+
+
+def _installation(client) -> str:
+    """
+    The GitHub App installation behind the client, or "" for a PAT.
+
+    Installation tokens rotate at least hourly, so listings are keyed by
+    installation rather than token; credential changes go through
+    invalidate_projects_cache().
+    """
+    installation_id = client.sync_client.installation_id
+    return "" if installation_id is None else str(installation_id)
+
+
+def _refresh_projects(client, key: Tuple[str, str, str]) -> "asyncio.Task":
+    """Start (or join) the discovery for an identity and cache its result."""
+    task = _projects_refresh.get(key)
+    if task and not task.done():
+        return task
+
+    async def run() -> List[Dict[str, Any]]:
+        try:
+            projects = await _discover_projects(client, key[1])
+            _projects_cache[key] = (time.monotonic(), projects)
+            return projects
+        finally:
+            _projects_refresh.pop(key, None)
+
+    task = asyncio.create_task(run())
+    _projects_refresh[key] = task
+    return task
+
+
+async def _get_projects(
+    client, auth_mode: str
+) -> Tuple[List[Dict[str, Any]], Optional[float]]:
+    """
+    Get projects for the current identity, stale-while-revalidate.
+
+    Fresh listings (younger than PROJECTS_CACHE_TTL) are returned as is.
+    Stale ones up to PROJECTS_CACHE_MAX_STALE old are returned immediately
+    while a background refresh replaces them; anything older is refetched.
+
+    Returns:
+        (projects, age in seconds if served stale else None)
+    """
+    username = await _get_username(client)
+    key = (auth_mode, username, _installation(client))
+
+    cached = _projects_cache.get(key)
+    if cached:
+        age = time.monotonic() - cached[0]
+        if age < PROJECTS_CACHE_TTL:
+            return cached[1], None
+        if age < PROJECTS_CACHE_MAX_STALE:
+            _refresh_projects(client, key)
+            return cached[1], age
+
+    return await _refresh_projects(client, key), None
+
+
+def invalidate_projects_cache() -> None:
+    """
+    Forget cached github://projects listings and the resolved username.
+
+    Called by the connect/disconnect tools when GitHub credentials change.
+    """
+    global _identity_cache
+
+    _projects_cache.clear()
+    _identity_cache = None
+
 
 def create_github_resources(mcp: FastMCP) -> None:
     """Add GitHub resources to the MCP server."""
@@ -116,7 +271,7 @@ def create_github_resources(mcp: FastMCP) -> None:
         return "\n".join(lines)
 
     @mcp.resource("github://projects")
-    def get_github_projects() -> str:
+    async def get_github_projects() -> str:
         """
         List of GitHub Projects V2 with their fields and options.
 
@@ -134,7 +289,7 @@ def create_github_resources(mcp: FastMCP) -> None:
         # Check QuickCall GitHub App connection
         has_app = False
         if store.is_authenticated():
-            creds = store.get_api_credentials()
+            creds = await asyncio.to_thread(store.get_api_credentials)
             if creds and creds.github_connected and creds.github_token:
                 has_app = True
 
@@ -143,52 +298,15 @@ def create_github_resources(mcp: FastMCP) -> None:
 
         try:
             # Import here to avoid circular imports
-            from mcp_server.tools.github_tools import _get_client
+            from mcp_server.tools.github_tools import _get_async_client
 
-            client = _get_client()
+            client = await _get_async_client()
 
             # Determine auth mode for display
             auth_mode = "PAT" if has_pat else "GitHub App"
 
-            # Get the authenticated user
-            username = client.get_authenticated_user()
-
-            # Collect all projects from user and their orgs
-            all_projects = []
-
-            # 1. Try user projects first
-            try:
-                user_projects = client.list_projects_with_fields(
-                    owner=username, is_org=False, limit=100
-                )
-                all_projects.extend(user_projects)
-            except Exception:
-                pass
-
-            # 2. Get unique orgs from repos the user has access to
-            try:
-                repos = client.list_repos(limit=100)
-                org_counts: dict = {}
-                for repo in repos:
-                    if repo.owner != username:
-                        org_counts[repo.owner] = org_counts.get(repo.owner, 0) + 1
-
-                # Sort orgs by repo count (most repos first)
-                sorted_orgs = sorted(
-                    org_counts.keys(), key=lambda x: org_counts[x], reverse=True
-                )
-
-                # Fetch projects from all orgs
-                for org in sorted_orgs:
-                    try:
-                        org_projects = client.list_projects_with_fields(
-                            owner=org, is_org=True, limit=100
-                        )
-                        all_projects.extend(org_projects)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            all_projects, stale_age = await _get_projects(client, auth_mode)
+            username = await _get_username(client)
 
             if not all_projects:
                 return (
@@ -201,6 +319,8 @@ def create_github_resources(mcp: FastMCP) -> None:
             projects = all_projects
 
             lines = [f"GitHub Projects (via {auth_mode}):", ""]
+            if stale_age is not None:
+                lines.insert(1, f"(Cached {int(stale_age // 60)} min ago, refreshing)")
 
             for proj in projects:
                 status = "closed" if proj["closed"] else "open"
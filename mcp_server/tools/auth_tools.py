@@ -22,6 +22,7 @@ from mcp_server.auth import (
     DeviceFlowAuth,
     get_github_pat,
 )
+from mcp_server.resources.github_resources import invalidate_projects_cache
 
 logger = logging.getLogger(__name__)
 
@@ -204,6 +205,7 @@ def create_auth_tools(mcp: FastMCP):
 
             # Clear credentials
             store.clear()
+            invalidate_projects_cache()
 
             return {
                 "status": "disconnected",
@@ -315,6 +317,9 @@ def create_auth_tools(mcp: FastMCP):
 
             install_url = data.get("install_url")
 
+            # Integration status will change once the user finishes in the browser
+            store.invalidate_api_credentials()
+
             if open_browser and install_url:
                 try:
                     webbrowser.open(install_url)
@@ -405,6 +410,9 @@ def create_auth_tools(mcp: FastMCP):
 
             install_url = data.get("install_url")
 
+            # Integration status will change once the user finishes in the browser
+            store.invalidate_api_credentials()
+
             if open_browser and install_url:
                 try:
                     webbrowser.open(install_url)
@@ -491,6 +499,9 @@ def create_auth_tools(mcp: FastMCP):
 
             install_url = data.get("install_url")
 
+            # Integration status will change once the user finishes in the browser
+            store.invalidate_api_credentials()
+
             if open_browser and install_url:
                 try:
                     webbrowser.open(install_url)
@@ -623,6 +634,7 @@ def create_auth_tools(mcp: FastMCP):
         # Store the PAT
         try:
             store.save_github_pat(token=token, username=username)
+            invalidate_projects_cache()
         except Exception as e:
             logger.error(f"Failed to save GitHub PAT: {e}")
             return {
@@ -665,6 +677,7 @@ def create_auth_tools(mcp: FastMCP):
             username = pat_creds.username if pat_creds else "unknown"
 
             store.clear_github_pat()
+            invalidate_projects_cache()
 
             return {
                 "status": "disconnected",
@@ -0,0 +1,327 @@
+"""
+Size-budgeted summaries of unified diffs for the git tools.
+
+Slicing a patch at N characters spends the whole budget on the first few
+files (alphabetically) and cuts hunks in half. compact_diff instead:
+
+1. Parses the diff stream into files and hunks
+2. Ranks files by churn (lines added + deleted)
+3. Gives every shown file its headers, then shares the budget across files
+   max-min fairly: small files get all they need, the biggest files split
+   what's left, each filled with its highest-churn hunks
+4. Reports what it left out: files that didn't fit, and per file how many
+   hunks / lines were elided
+
+Memory stays around twice the budget (plus MIN_FILE_BYTES per file) however
+large the diff is: once that much is held, the files holding the most are
+cut back to a fair share while parsing, keeping each one's top hunk.
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+# Bytes reserved per shown file for a taste of its top hunk
+MIN_FILE_BYTES = 400
+# Room left for a "... (N more ...)" line
+MARKER_BYTES = 64
+# Lines longer than this (minified/generated code) are cut
+MAX_LINE_BYTES = 300
+# Elided files listed by name in the report
+ELIDED_FILES_LISTED = 30
+
+
+def _clip(line: str) -> str:
+    if len(line) <= MAX_LINE_BYTES:
+        return line
+    return line[:MAX_LINE_BYTES] + " ..."
+
+
+@dataclass
+class _Hunk:
+    index: int
+    lines: List[str]  # "@@ ... @@" header first
+    additions: int = 0
+    deletions: int = 0
+    size: int = 0
+
+    @property
+    def churn(self) -> int:
+        return self.additions + self.deletions
+
+
+@dataclass
+class _FileDiff:
+    path: str
+    order: int
+    header: List[str]
+    hunks: List[_Hunk] = field(default_factory=list)
+    hunk_count: int = 0
+    additions: int = 0
+    deletions: int = 0
+    # Hunks dropped while parsing to bound memory
+    dropped_hunks: int = 0
+    dropped_lines: int = 0
+
+    @property
+    def churn(self) -> int:
+        return self.additions + self.deletions
+
+    @property
+    def retained(self) -> int:
+        return sum(hunk.size for hunk in self.hunks)
+
+    @property
+    def header_size(self) -> int:
+        return sum(len(line) + 1 for line in self.header)
+
+    def shrink(self, keep_bytes: int) -> None:
+        """
+        Drop lowest-churn hunks until at most keep_bytes are held.
+
+        The top hunk is always kept; if it alone is too big its tail is cut
+        (rendering reports the missing lines).
+        """
+        total = self.retained
+        if total <= keep_bytes or not self.hunks:
+            return
+        top = max(self.hunks, key=lambda h: (h.churn, -h.index))
+        by_churn = sorted(self.hunks, key=lambda h: (h.churn, -h.index))
+        dropped = set()
+        for hunk in by_churn:
+            if total <= keep_bytes or hunk is top:
+                break
+            dropped.add(hunk.index)
+            total -= hunk.size
+            self.dropped_hunks += 1
+            self.dropped_lines += hunk.churn
+        self.hunks = [hunk for hunk in self.hunks if hunk.index not in dropped]
+
+        while total > keep_bytes and len(top.lines) > 1:
+            line = top.lines.pop()
+            total -= len(line) + 1
+            top.size -= len(line) + 1
+
+
+def _path_from_diff_line(line: str) -> str:
+    """Path from 'diff --git a/<path> b/<path>' (the b/ side for renames)."""
+    _, _, rest = line.partition(" b/")
+    return rest or line[len("diff --git ") :]
+
+
+class _Parser:
+    """Incremental unified diff parser with a memory cap."""
+
+    def __init__(self, hold_bytes: int):
+        self.hold_bytes = hold_bytes
+        self.files: List[_FileDiff] = []
+        self.scanned_bytes = 0
+        self._file: Optional[_FileDiff] = None
+        self._hunk: Optional[_Hunk] = None
+        self._held = 0
+        self._holding = 0  # Files holding hunks
+        # (-retained, order) max-heap of files holding hunks; entries whose
+        # retained size has since changed are stale and skipped
+        self._holders: List[tuple] = []
+
+    def feed(self, line: str) -> None:
+        self.scanned_bytes += len(line) + 1
+        if line.startswith("diff --git "):
+            self._finish_file()
+            self._file = _FileDiff(
+                path=_path_from_diff_line(line),
+                order=len(self.files),
+                header=[_clip(line)],
+            )
+        elif self._file is None:
+            return
+        elif line.startswith("@@"):
+            self._finish_hunk()
+            self._hunk = _Hunk(index=self._file.hunk_count, lines=[_clip(line)])
+            self._hunk.size = len(self._hunk.lines[0]) + 1
+            self._file.hunk_count += 1
+        elif self._hunk is None:
+            # File header: keep mode/rename/binary/---/+++ lines, skip index
+            if not line.startswith("index "):
+                self._file.header.append(_clip(line))
+        else:
+            if line.startswith("+"):
+                self._hunk.additions += 1
+            elif line.startswith("-"):
+                self._hunk.deletions += 1
+            kept = _clip(line)
+            if self._hunk.size + len(kept) + 1 <= self.hold_bytes:
+                self._hunk.lines.append(kept)
+                self._hunk.size += len(kept) + 1
+
+    def close(self) -> List[_FileDiff]:
+        self._finish_file()
+        return self.files
+
+    def _finish_hunk(self) -> None:
+        if self._hunk is None:
+            return
+        file, hunk = self._file, self._hunk
+        self._hunk = None
+        file.additions += hunk.additions
+        file.deletions += hunk.deletions
+        file.hunks.append(hunk)
+        self._held += hunk.size
+        # One file never holds more than the whole cap
+        before = file.retained
+        file.shrink(self.hold_bytes)
+        self._held -= before - file.retained
+
+    def _finish_file(self) -> None:
+        self._finish_hunk()
+        if self._file is None:
+            return
+        file = self._file
+        self._file = None
+        self.files.append(file)
+        if not file.hunks:
+            return
+        self._holding += 1
+        heapq.heappush(self._holders, (-file.retained, file.order))
+
+        # Over the cap: cut the biggest holders back to a fair share
+        share = max(MIN_FILE_BYTES, self.hold_bytes // self._holding)
+        while self._held > self.hold_bytes and self._holders:
+            size, order = self._holders[0]
+            victim = self.files[order]
+            if -size != victim.retained:
+                heapq.heappop(self._holders)
+                continue
+            if victim.retained <= share:
+                break
+            heapq.heappop(self._holders)
+            before = victim.retained
+            victim.shrink(share)
+            self._held -= before - victim.retained
+            heapq.heappush(self._holders, (-victim.retained, victim.order))
+
+
+def _render_hunk(hunk: _Hunk, allowance: Optional[int] = None) -> List[str]:
+    """Hunk lines, cut at a line boundary to fit allowance bytes."""
+    lines, used = [], 0
+    for line in hunk.lines:
+        if lines and allowance is not None and used + len(line) + 1 > allowance:
+            break
+        lines.append(line)
+        used += len(line) + 1
+    # Also counts lines not held because the hunk outgrew the parser's cap
+    missing = hunk.churn - sum(1 for line in lines[1:] if line[:1] in "+-")
+    if missing > 0:
+        lines.append(f"... ({missing} more changed lines in this hunk)")
+    return lines
+
+
+def compact_diff(lines: Iterable[str], budget: int) -> Dict[str, Any]:
+    """
+    Summarize a unified diff (e.g. `git diff` output) in about `budget` bytes.
+
+    Args:
+        lines: Diff lines without trailing newlines, in order
+        budget: Target size of the returned patch text
+
+    Returns:
+        {"patch", "files_changed", "files_shown", "scanned_bytes",
+         "elided": {"files", "hunks", "lines", "file_list"}}
+    """
+    parser = _Parser(hold_bytes=2 * budget)
+    for line in lines:
+        parser.feed(line)
+    files = parser.close()
+
+    ranked = sorted(files, key=lambda f: (-f.churn, f.order))
+
+    # Headers plus a minimum for hunks, in churn order, while they fit
+    shown: List[_FileDiff] = []
+    elided_files: List[_FileDiff] = []
+    minimums: Dict[int, int] = {}
+    remaining = budget
+    for file in ranked:
+        minimum = MIN_FILE_BYTES if file.hunk_count else 0
+        if file.header_size + minimum > remaining:
+            elided_files.append(file)
+            continue
+        shown.append(file)
+        minimums[file.order] = minimum
+        remaining -= file.header_size + minimum
+
+    # Share what's left max-min fairly: files needing less than an equal
+    # share get all of it, so one huge file can't starve the rest
+    extra: Dict[int, int] = {}
+    needs = {
+        file.order: max(0, file.retained + MARKER_BYTES - minimums[file.order])
+        for file in shown
+    }
+    by_need = sorted(shown, key=lambda f: (needs[f.order], -f.churn, f.order))
+    for left, file in enumerate(by_need):
+        extra[file.order] = min(needs[file.order], remaining // (len(by_need) - left))
+        remaining -= extra[file.order]
+
+    selected: Dict[int, Dict[int, Optional[int]]] = {}
+    leftover = remaining
+    for file in shown:
+        allowance = minimums[file.order] + extra[file.order]
+        picks: Dict[int, Optional[int]] = {}
+        # Keep room for the elided-hunks line
+        used = MARKER_BYTES if file.hunk_count else 0
+        for hunk in sorted(file.hunks, key=lambda h: (-h.churn, h.index)):
+            if used + hunk.size <= allowance:
+                picks[hunk.index] = None
+                used += hunk.size
+        if not picks and file.hunks:
+            # Nothing fits whole: show the top hunk cut to the allowance,
+            # leaving room for its own "more changed lines" line
+            top = max(file.hunks, key=lambda h: (h.churn, -h.index))
+            picks[top.index] = allowance - 2 * MARKER_BYTES
+            used = allowance
+        selected[file.order] = picks
+        leftover += allowance - used
+    for file in shown:
+        picks = selected[file.order]
+        for hunk in sorted(file.hunks, key=lambda h: (-h.churn, h.index)):
+            if leftover <= 0:
+                break
+            if hunk.index not in picks and hunk.size <= leftover:
+                picks[hunk.index] = None
+                leftover -= hunk.size
+
+    out: List[str] = []
+    elided_hunks = sum(file.hunk_count for file in elided_files)
+    elided_lines = sum(file.churn for file in elided_files)
+    for file in shown:
+        out.extend(file.header)
+        picks = selected[file.order]
+        for hunk in file.hunks:
+            if hunk.index in picks:
+                out.extend(_render_hunk(hunk, picks[hunk.index]))
+        skipped = [hunk for hunk in file.hunks if hunk.index not in picks]
+        hunks = len(skipped) + file.dropped_hunks
+        if hunks:
+            changed = sum(hunk.churn for hunk in skipped) + file.dropped_lines
+            out.append(f"... ({hunks} more hunks elided, {changed} changed lines)")
+            elided_hunks += hunks
+            elided_lines += changed
+
+    return {
+        "patch": "\n".join(out),
+        "files_changed": len(files),
+        "files_shown": len(shown),
+        "scanned_bytes": parser.scanned_bytes,
+        "elided": {
+            "files": len(elided_files),
+            "hunks": elided_hunks,
+            "lines": elided_lines,
+            "file_list": [
+                {
+                    "file": file.path,
+                    "additions": file.additions,
+                    "deletions": file.deletions,
+                }
+                for file in elided_files[:ELIDED_FILES_LISTED]
+            ],
+        },
+    }
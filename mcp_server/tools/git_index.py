@@ -0,0 +1,267 @@
+"""
+Persistent per-repository index of git history.
+
+Stores the commits git_tools has already parsed from `git log -z
+--numstat` (metadata, parents, numstat and PR number) in SQLite under
+~/.quickcall/git/, one database per repository root. The index records:
+
+- tip: the HEAD it was last brought up to date with
+- covered_since: commit time from which every commit reachable from tip
+  is stored
+
+git_tools only asks git for commits after the tip (`git log HEAD ^tip`),
+or older than covered_since when a query reaches further back. Queries
+walk parents from HEAD inside the index, so commits from other branches
+that were indexed earlier are never returned.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from mcp_server.auth.credentials import QUICKCALL_DIR
+
+logger = logging.getLogger(__name__)
+
+GIT_INDEX_DIR = QUICKCALL_DIR / "git"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS commits (
+    sha TEXT PRIMARY KEY,
+    parents TEXT NOT NULL,
+    committed_at INTEGER NOT NULL,
+    author TEXT NOT NULL,
+    email TEXT NOT NULL,
+    date TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    additions INTEGER NOT NULL,
+    deletions INTEGER NOT NULL,
+    files TEXT NOT NULL,
+    pr_number INTEGER
+);
+CREATE TABLE IF NOT EXISTS state (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    tip TEXT NOT NULL,
+    covered_since INTEGER NOT NULL
+);
+"""
+
+_COLUMNS = (
+    "sha, parents, committed_at, author, email, date, subject, body, "
+    "additions, deletions, files, pr_number"
+)
+
+
+def extract_pr_number(subject: str) -> Optional[int]:
+    """PR number from a merge or squash-merge commit subject, if any."""
+    merge_match = re.search(r"Merge pull request #(\d+)", subject)
+    if merge_match:
+        return int(merge_match.group(1))
+    # Also check for GitHub's squash merge format
+    squash_match = re.search(r"\(#(\d+)\)$", subject)
+    if squash_match:
+        return int(squash_match.group(1))
+    return None
+
+
+def _author_matcher(author: Optional[str]):
+    """Approximates `git log --author`: a regex over 'Name <email>'."""
+    if not author:
+        return lambda entry: True
+    try:
+        pattern = re.compile(author)
+    except re.error:
+        pattern = re.compile(re.escape(author))
+    return lambda entry: bool(pattern.search(f"{entry['author']} <{entry['email']}>"))
+
+
+class GitHistoryIndex:
+    """
+    SQLite-backed commit index for one repository.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the index database.
+
+        Args:
+            path: SQLite file location
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, timeout=5.0
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        # Commit messages can come from private repositories
+        os.chmod(self.path, 0o600)
+
+    def state(self) -> Optional[Tuple[str, int]]:
+        """(tip, covered_since), or None for an empty index."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tip, covered_since FROM state WHERE id = 0"
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def add(
+        self, entries: Iterable[Dict[str, Any]], tip: str, covered_since: int
+    ) -> int:
+        """
+        Store parsed commits and move the index to a new tip.
+
+        Args:
+            entries: Commits as yielded by git_tools._iter_log_z
+            tip: HEAD the index now covers
+            covered_since: Commit time from which history reachable from
+                           tip is now complete
+
+        Returns:
+            Number of commits written
+        """
+        rows = [
+            (
+                entry["sha"],
+                " ".join(entry["parents"]),
+                entry["timestamp"],
+                entry["author"],
+                entry["email"],
+                entry["date"],
+                entry["subject"],
+                entry["body"],
+                entry["additions"],
+                entry["deletions"],
+                json.dumps(entry["files"]),
+                entry["pr_number"],
+            )
+            for entry in entries
+        ]
+        with self._lock:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO commits ({_COLUMNS}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state VALUES (0, ?, ?)", (tip, covered_since)
+            )
+            self._conn.commit()
+        return len(rows)
+
+    def commits(
+        self, head: str, since: int, author: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Commits reachable from head with commit time >= since, newest first.
+
+        Like `git log --since`, the walk doesn't continue past commits
+        older than since.
+
+        Args:
+            head: Commit to walk from (must be the index tip or older)
+            since: Unix time lower bound
+            author: Regex matched against "Name <email>", like --author
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM commits WHERE committed_at >= ?",
+                (since,),
+            ).fetchall()
+
+        by_sha = {}
+        for row in rows:
+            (
+                sha,
+                parents,
+                committed_at,
+                name,
+                email,
+                date,
+                subject,
+                body,
+                additions,
+                deletions,
+                files,
+                pr_number,
+            ) = row
+            by_sha[sha] = {
+                "sha": sha,
+                "parents": parents.split(),
+                "timestamp": committed_at,
+                "author": name,
+                "email": email,
+                "date": date,
+                "subject": subject,
+                "body": body,
+                "additions": additions,
+                "deletions": deletions,
+                "files": files,
+                "pr_number": pr_number,
+            }
+
+        matches = _author_matcher(author)
+        found = []
+        seen = set()
+        stack = [head]
+        while stack:
+            sha = stack.pop()
+            if sha in seen or sha not in by_sha:
+                continue
+            seen.add(sha)
+            entry = by_sha[sha]
+            stack.extend(entry["parents"])
+            if matches(entry):
+                entry["files"] = json.loads(entry["files"])
+                found.append(entry)
+
+        found.sort(key=lambda entry: entry["timestamp"], reverse=True)
+        return found
+
+    def clear(self) -> None:
+        """Remove all indexed commits."""
+        with self._lock:
+            self._conn.execute("DELETE FROM commits")
+            self._conn.execute("DELETE FROM state")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_indexes: Dict[str, GitHistoryIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_git_index(repo_root: str) -> Optional[GitHistoryIndex]:
+    """
+    Get the shared index for a repository root.
+
+    Set QUICKCALL_GIT_INDEX=off to disable it. Returns None when disabled
+    or when the database can't be opened.
+    """
+    if os.getenv("QUICKCALL_GIT_INDEX", "on").lower() in ("0", "off", "false"):
+        return None
+    with _indexes_lock:
+        if repo_root not in _indexes:
+            digest = hashlib.sha256(repo_root.encode()).hexdigest()[:16]
+            try:
+                _indexes[repo_root] = GitHistoryIndex(GIT_INDEX_DIR / f"{digest}.db")
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Git index disabled, could not open database: {e}")
+                return None
+        return _indexes[repo_root]
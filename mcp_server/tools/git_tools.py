@@ -2,33 +2,312 @@
 Git Tools - Simple tools for viewing repository changes.
 """
 
-from typing import Optional, List
+from typing import Dict, Iterator, List, Optional, Tuple
+from pathlib import Path
+import asyncio
+import logging
+import os
+import sqlite3
 import subprocess
-import re
+import tempfile
+import threading
+import time
 
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
-
-def _run_git(args: List[str], cwd: Optional[str] = None) -> str:
-    """Run a git command and return output."""
+from mcp_server.tools.diff_compactor import compact_diff
+from mcp_server.tools.git_index import (
+    GitHistoryIndex,
+    extract_pr_number,
+    get_git_index,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds a git command may run before it is killed
+GIT_TIMEOUT = 30.0
+
+# Bytes read from git per chunk
+_CHUNK_SIZE = 65536
+
+# Patch output get_updates returns for the committed / uncommitted diff
+DIFF_MAX_BYTES = 50000
+UNCOMMITTED_DIFF_MAX_BYTES = 20000
+
+# Raw diff read to build a compacted patch; files past this are not seen
+DIFF_SCAN_MAX_BYTES = 64 * 1024 * 1024
+
+# get_multi_repo_updates: repositories collected at once, most repositories
+# per call, directory levels searched under a parent directory, patch bytes
+# shared by the active repositories and commits listed per repository
+REPO_CONCURRENCY = 8
+MAX_REPOS = 30
+REPO_SEARCH_DEPTH = 2
+MULTI_REPO_PATCH_BUDGET = 60000
+MULTI_REPO_COMMIT_LIMIT = 30
+
+# Directories never searched for repositories
+_SKIP_DIRS = {"node_modules", "venv", "__pycache__"}
+
+
+def _stream_git(
+    args: List[str],
+    cwd: Optional[str] = None,
+    max_bytes: Optional[int] = None,
+    timeout: float = GIT_TIMEOUT,
+) -> Iterator[bytes]:
+    """
+    Run a git command and yield its stdout in chunks as it is produced.
+
+    Nothing is buffered beyond one chunk. git is killed once `max_bytes`
+    have been yielded, when the caller stops iterating early, or after
+    `timeout` seconds.
+
+    Args:
+        args: git arguments
+        cwd: Repository path
+        max_bytes: Stop after this much output (None for all). Stopping
+                   at the budget is not an error.
+        timeout: Seconds before git is killed and ToolError raised
+    """
+    # stderr goes to a file so a chatty git can't block on a full pipe
+    stderr = tempfile.TemporaryFile()
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["git"] + args,
             cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=30,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
         )
-        if result.returncode != 0:
-            raise ToolError(f"Git error: {result.stderr.strip()}")
-        return result.stdout.strip()
-    except subprocess.TimeoutExpired:
-        raise ToolError("Git command timed out")
     except FileNotFoundError:
+        stderr.close()
         raise ToolError("Git not found")
 
+    timer = threading.Timer(timeout, proc.kill)
+    timer.daemon = True
+    timer.start()
+    remaining = max_bytes
+    try:
+        while remaining is None or remaining > 0:
+            chunk = proc.stdout.read1(_CHUNK_SIZE)
+            if not chunk:
+                break
+            if remaining is not None:
+                chunk = chunk[:remaining]
+                remaining -= len(chunk)
+            yield chunk
+
+        if remaining == 0:
+            return  # Budget reached; git is killed below
+        proc.wait()
+        if not timer.is_alive():
+            raise ToolError("Git command timed out")
+        if proc.returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode(errors="replace").strip()
+            raise ToolError(f"Git error: {message}")
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        stderr.close()
+
+
+def _read_git(
+    args: List[str], cwd: Optional[str] = None, max_bytes: Optional[int] = None
+) -> Tuple[str, bool]:
+    """
+    Run a git command and return at most `max_bytes` of its output.
+
+    When the output is longer, git is killed rather than left to produce
+    the rest, and the text is cut back to the last full line.
+
+    Returns:
+        (output, truncated)
+    """
+    limit = None if max_bytes is None else max_bytes + 1
+    output = b"".join(_stream_git(args, cwd, limit))
+    truncated = max_bytes is not None and len(output) > max_bytes
+    if truncated:
+        output = output[:max_bytes]
+        last_line = output.rfind(b"\n")
+        if last_line > 0:
+            output = output[:last_line]
+    return output.decode(errors="replace"), truncated
+
+
+def _iter_git_lines(
+    args: List[str], cwd: Optional[str] = None, max_bytes: Optional[int] = None
+) -> Iterator[str]:
+    """Run a git command and yield its output lines as they are produced."""
+    pending = b""
+    for chunk in _stream_git(args, cwd, max_bytes):
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line.decode(errors="replace")
+    if pending:
+        yield pending.decode(errors="replace")
+
+
+def _run_git(args: List[str], cwd: Optional[str] = None) -> str:
+    """Run a git command and return output."""
+    return _read_git(args, cwd)[0].strip()
+
+
+def _compact_git_diff(args: List[str], cwd: str, budget: int) -> Tuple[str, dict]:
+    """
+    Run a git diff command and summarize its patch in about `budget` bytes.
+
+    See diff_compactor.compact_diff: files are ranked by churn and hunks
+    are kept whole where they fit, so the result scales with the budget
+    rather than with the size of the diff.
+
+    Returns:
+        (patch, elided) where elided counts the files, hunks and changed
+        lines left out and lists the elided files
+    """
+    summary = compact_diff(_iter_git_lines(args, cwd, DIFF_SCAN_MAX_BYTES), budget)
+    elided = summary["elided"]
+    if summary["scanned_bytes"] >= DIFF_SCAN_MAX_BYTES:
+        # git was stopped before the end of the diff
+        elided["incomplete"] = True
+    return summary["patch"], elided
+
+
+# One commit per record: fields NUL-terminated, records start with RS (0x1e)
+_LOG_Z_FORMAT = "--format=%x1e%H%x00%P%x00%ct%x00%an%x00%ae%x00%ad%x00%s%x00%b%x00"
+
+
+def _iter_log_z(
+    args: List[str], cwd: Optional[str] = None
+) -> Iterator[Dict[str, object]]:
+    """
+    Stream commits from `git log -z --numstat`, one pass over the history.
+
+    Fields are NUL-delimited, so '|' or newlines in names and messages are
+    safe, and each commit's numstat entries are attached to it.
+
+    Args:
+        args: Extra `git log` arguments (range, --since, --author, ...)
+        cwd: Repository path
+
+    Yields:
+        {"sha", "parents", "timestamp", "author", "email", "date" (ISO),
+         "subject", "body", "additions", "deletions", "files", "pr_number"}
+    """
+    pending = b""
+    for chunk in _stream_git(
+        ["log", "-z", "--numstat", "--date=iso", _LOG_Z_FORMAT] + args, cwd
+    ):
+        records = (pending + chunk).split(b"\x1e")
+        pending = records.pop()
+        for record in records:
+            if record:
+                yield _parse_log_z_record(record)
+    if pending:
+        yield _parse_log_z_record(pending)
+
+
+def _parse_log_z_record(record: bytes) -> Dict[str, object]:
+    """Parse one RS-delimited record of _iter_log_z output."""
+    fields = record.decode(errors="replace").split("\0")
+    sha, parents, timestamp, author, email, date, subject, body = fields[:8]
+
+    additions = deletions = 0
+    files = []
+    # After the header: "adds\tdels\tpath" entries, or "adds\tdels\t"
+    # followed by old and new path for renames
+    stats = iter(fields[8:])
+    for entry in stats:
+        entry = entry.lstrip("\n")
+        if not entry:
+            continue
+        parts = entry.split("\t", 2)
+        if len(parts) < 3:
+            continue
+        adds, dels, file_path = parts
+        if not file_path:
+            next(stats, None)  # Old path
+            file_path = next(stats, "")
+        additions += int(adds) if adds != "-" else 0
+        deletions += int(dels) if dels != "-" else 0
+        files.append(file_path)
+
+    return {
+        "sha": sha,
+        "parents": parents.split(),
+        "timestamp": int(timestamp),
+        "author": author,
+        "email": email,
+        "date": date,
+        "subject": subject,
+        "body": body,
+        "additions": additions,
+        "deletions": deletions,
+        "files": files,
+        "pr_number": extract_pr_number(subject),
+    }
+
+
+def _indexed_log(
+    index: GitHistoryIndex, cwd: str, since: int, author: Optional[str]
+) -> List[Dict[str, object]]:
+    """
+    Answer a log query from the history index, scanning only what's new.
+
+    - Same HEAD and window already covered: no git log at all
+    - HEAD moved: `git log HEAD ^<last tip>` adds the new commits
+    - Window reaches past what's indexed: the window is rescanned
+    """
+    head = _run_git(["rev-parse", "HEAD"], cwd)
+    state = index.state()
+
+    if state is None or state[1] > since:
+        entries = _iter_log_z([f"--since=@{since}", head], cwd)
+        index.add(entries, head, since)
+    elif state[0] != head:
+        tip, covered_since = state
+        try:
+            entries = list(
+                _iter_log_z([f"--since=@{covered_since}", head, f"^{tip}"], cwd)
+            )
+        except ToolError:
+            # Old tip no longer exists (e.g. rewritten and garbage collected)
+            entries = list(_iter_log_z([f"--since=@{covered_since}", head], cwd))
+        index.add(entries, head, covered_since)
+
+    return index.commits(head, since, author)
+
+
+def _log_entries(
+    cwd: str, repo_root: str, days: int, author: Optional[str] = None
+) -> List[Dict[str, object]]:
+    """
+    Commits from the last `days` days, newest first, as parsed by _iter_log_z.
+
+    Served from the repository's history index when available.
+    """
+    since = int(time.time() - days * 86400)
+
+    index = get_git_index(repo_root)
+    if index is not None:
+        try:
+            return _indexed_log(index, cwd, since, author)
+        except sqlite3.Error as e:
+            logger.warning(f"Git index unavailable, reading git log: {e}")
+
+    log_args = [f"--since=@{since}"]
+    if author:
+        log_args.extend(["--author", author])
+    return list(_iter_log_z(log_args, cwd))
+
 
 def _get_repo_info(cwd: Optional[str] = None) -> dict:
     """Get repository info."""
@@ -62,6 +341,179 @@ def _get_repo_info(cwd: Optional[str] = None) -> dict:
     return {"root": repo_root, "owner": owner, "repo": repo, "branch": branch}
 
 
+def _collect_updates(
+    path: str,
+    days: int,
+    author: Optional[str] = None,
+    diff_max_bytes: Optional[int] = DIFF_MAX_BYTES,
+    uncommitted_max_bytes: Optional[int] = UNCOMMITTED_DIFF_MAX_BYTES,
+) -> dict:
+    """
+    Commits, diff stats and uncommitted changes for one repository.
+
+    Backs get_updates and get_multi_repo_updates. Raises ToolError.
+
+    With diff_max_bytes None, patches are left empty for _add_patches to
+    fill in once the budget is known.
+    """
+    repo_info = _get_repo_info(path)
+    repo_name = (
+        f"{repo_info['owner']}/{repo_info['repo']}"
+        if repo_info["owner"]
+        else repo_info["root"]
+    )
+
+    result = {
+        "repository": repo_name,
+        "branch": repo_info["branch"],
+        "period": f"Last {days} days",
+    }
+
+    # Get commits
+    commits = [
+        {
+            "sha": entry["sha"][:7],
+            "author": entry["author"],
+            "date": entry["date"][:10],
+            "message": entry["subject"],
+        }
+        for entry in _log_entries(path, repo_info["root"], days, author)
+    ]
+
+    result["commits"] = commits
+    result["commit_count"] = len(commits)
+
+    if not commits:
+        result["diff"] = {
+            "files_changed": 0,
+            "additions": 0,
+            "deletions": 0,
+            "patch": "",
+        }
+        return result
+
+    # Get total diff between oldest and newest commit
+    oldest_sha = commits[-1]["sha"]
+    newest_sha = commits[0]["sha"]
+
+    try:
+        # Get stats
+        files = []
+        total_add = 0
+        total_del = 0
+
+        for line in _iter_git_lines(
+            ["diff", "--numstat", f"{oldest_sha}^", newest_sha], path
+        ):
+            if not line:
+                continue
+            parts = line.split("\t")
+            if len(parts) >= 3:
+                adds = int(parts[0]) if parts[0] != "-" else 0
+                dels = int(parts[1]) if parts[1] != "-" else 0
+                files.append(
+                    {
+                        "file": parts[2],
+                        "additions": adds,
+                        "deletions": dels,
+                    }
+                )
+                total_add += adds
+                total_del += dels
+
+        result["diff"] = {
+            "files_changed": len(files),
+            "additions": total_add,
+            "deletions": total_del,
+            "files": files[:30],
+            "patch": "",
+        }
+    except ToolError:
+        result["diff"] = {
+            "files_changed": 0,
+            "additions": 0,
+            "deletions": 0,
+            "patch": "",
+        }
+
+    # Uncommitted changes
+    staged = _run_git(["diff", "--cached", "--name-only"], path)
+    unstaged = _run_git(["diff", "--name-only"], path)
+
+    staged_list = [f for f in staged.split("\n") if f]
+    unstaged_list = [f for f in unstaged.split("\n") if f]
+
+    if staged_list or unstaged_list:
+        result["uncommitted"] = {
+            "staged": staged_list,
+            "unstaged": unstaged_list,
+            "patch": "",
+        }
+
+    if diff_max_bytes is not None:
+        _add_patches(path, result, diff_max_bytes, uncommitted_max_bytes)
+    return result
+
+
+def _add_patches(
+    path: str, updates: dict, diff_max_bytes: int, uncommitted_max_bytes: int
+) -> None:
+    """Fill in the compacted patches of a _collect_updates result."""
+    commits = updates["commits"]
+    if commits and "files" in updates["diff"]:
+        try:
+            patch, elided = _compact_git_diff(
+                ["diff", f"{commits[-1]['sha']}^", commits[0]["sha"]],
+                path,
+                diff_max_bytes,
+            )
+            updates["diff"].update(patch=patch, elided=elided)
+        except ToolError:
+            pass
+
+    if "uncommitted" in updates:
+        patch, elided = _compact_git_diff(["diff", "HEAD"], path, uncommitted_max_bytes)
+        updates["uncommitted"].update(patch=patch, elided=elided)
+
+
+def _repo_root(path: str) -> str:
+    """Top level of the checkout containing path, or path if it isn't one."""
+    try:
+        return _run_git(["rev-parse", "--show-toplevel"], path)
+    except (ToolError, OSError):
+        return os.path.realpath(path)
+
+
+def _discover_repos(root: str, max_depth: int = REPO_SEARCH_DEPTH) -> List[str]:
+    """
+    Git checkouts under a directory, searched breadth-first.
+
+    The search doesn't descend into repositories (submodules and vendored
+    checkouts are left out), hidden directories or _SKIP_DIRS.
+    """
+    repos = []
+    level = [Path(root).expanduser()]
+    for _ in range(max_depth + 1):
+        next_level = []
+        for directory in level:
+            if (directory / ".git").exists():
+                repos.append(str(directory))
+                continue
+            try:
+                children = sorted(directory.iterdir())
+            except OSError:
+                continue
+            next_level.extend(
+                child
+                for child in children
+                if child.is_dir()
+                and not child.name.startswith(".")
+                and child.name not in _SKIP_DIRS
+            )
+        level = next_level
+    return repos
+
+
 def create_git_tools(mcp: FastMCP) -> None:
     """Add git tools to the MCP server."""
 
@@ -83,6 +535,10 @@ def create_git_tools(mcp: FastMCP) -> None:
         """
         Get updates from a git repository. Returns commits, diff stats, and uncommitted changes.
 
+        Patches are compacted to a size budget: the most-changed files and
+        hunks are kept whole, and `elided` counts (and lists) what was left
+        out. Use diff stats for the full picture.
+
         FORMAT OUTPUT AS A STANDUP SUMMARY:
 
         **Summary:** One sentence of what was accomplished.
@@ -100,137 +556,139 @@ def create_git_tools(mcp: FastMCP) -> None:
         Never display raw JSON to the user.
         """
         try:
-            repo_info = _get_repo_info(path)
-            repo_name = (
-                f"{repo_info['owner']}/{repo_info['repo']}"
-                if repo_info["owner"]
-                else repo_info["root"]
-            )
-
-            result = {
-                "repository": repo_name,
-                "branch": repo_info["branch"],
-                "period": f"Last {days} days",
-            }
-
-            # Get commits
-            since_date = f"{days} days ago"
-            log_format = "--pretty=format:%H|%an|%ad|%s"
-            log_args = ["log", log_format, "--date=short", f"--since={since_date}"]
-            if author:
-                log_args.extend(["--author", author])
-
-            log_output = _run_git(log_args, path)
-
-            commits = []
-            for line in log_output.split("\n"):
-                if not line:
-                    continue
-                parts = line.split("|", 3)
-                if len(parts) >= 4:
-                    commits.append(
-                        {
-                            "sha": parts[0][:7],
-                            "author": parts[1],
-                            "date": parts[2],
-                            "message": parts[3],
-                        }
-                    )
-
-            result["commits"] = commits
-            result["commit_count"] = len(commits)
-
-            if not commits:
-                result["diff"] = {
-                    "files_changed": 0,
-                    "additions": 0,
-                    "deletions": 0,
-                    "patch": "",
-                }
-                return result
-
-            # Get total diff between oldest and newest commit
-            oldest_sha = commits[-1]["sha"]
-            newest_sha = commits[0]["sha"]
+            return _collect_updates(path, days, author)
+        except ToolError:
+            raise
+        except Exception as e:
+            raise ToolError(f"Failed to get updates: {str(e)}")
 
-            try:
-                # Get stats
-                numstat = _run_git(
-                    ["diff", "--numstat", f"{oldest_sha}^", newest_sha], path
-                )
+    @mcp.tool(tags={"git", "updates"})
+    async def get_multi_repo_updates(
+        paths: Optional[List[str]] = Field(
+            default=None,
+            description="Paths to git repositories",
+        ),
+        parent_dir: Optional[str] = Field(
+            default=None,
+            description="Directory containing checkouts; repositories up to "
+            f"{REPO_SEARCH_DEPTH} levels below it are included",
+        ),
+        days: int = Field(
+            default=7,
+            description="Number of days to look back (default: 7)",
+        ),
+        author: Optional[str] = Field(
+            default=None,
+            description="Filter by author name/email",
+        ),
+    ) -> dict:
+        """
+        Get updates from several git repositories in one call.
 
-                files = []
-                total_add = 0
-                total_del = 0
-
-                for line in numstat.split("\n"):
-                    if not line:
-                        continue
-                    parts = line.split("\t")
-                    if len(parts) >= 3:
-                        adds = int(parts[0]) if parts[0] != "-" else 0
-                        dels = int(parts[1]) if parts[1] != "-" else 0
-                        files.append(
-                            {
-                                "file": parts[2],
-                                "additions": adds,
-                                "deletions": dels,
-                            }
-                        )
-                        total_add += adds
-                        total_del += dels
-
-                # Get actual diff patch
-                diff_patch = _run_git(["diff", f"{oldest_sha}^", newest_sha], path)
-
-                # Truncate if too large
-                if len(diff_patch) > 50000:
-                    diff_patch = (
-                        diff_patch[:50000] + "\n\n... (truncated, diff too large)"
-                    )
+        Use instead of calling get_updates per repository. Repositories are
+        collected concurrently. Output is size-bounded: patches share one
+        budget across active repositories and long commit lists are cut
+        ('commits_omitted'). Repositories without activity are only listed
+        by name; use get_updates on one repository for its full detail.
 
-                result["diff"] = {
-                    "files_changed": len(files),
-                    "additions": total_add,
-                    "deletions": total_del,
-                    "files": files[:30],
-                    "patch": diff_patch,
-                }
-            except ToolError:
-                result["diff"] = {
-                    "files_changed": 0,
-                    "additions": 0,
-                    "deletions": 0,
-                    "patch": "",
-                }
-
-            # Uncommitted changes
-            staged = _run_git(["diff", "--cached", "--name-only"], path)
-            unstaged = _run_git(["diff", "--name-only"], path)
+        FORMAT OUTPUT AS A STANDUP SUMMARY, grouped by repository, following
+        the get_updates format. Never display raw JSON to the user.
+        """
+        if not paths and not parent_dir:
+            raise ToolError("Provide paths or parent_dir")
 
-            staged_list = [f for f in staged.split("\n") if f]
-            unstaged_list = [f for f in unstaged.split("\n") if f]
+        try:
+            candidates = list(paths or [])
+            if parent_dir:
+                candidates.extend(await asyncio.to_thread(_discover_repos, parent_dir))
+        except Exception as e:
+            raise ToolError(f"Failed to find repositories: {str(e)}")
+
+        slots = asyncio.Semaphore(REPO_CONCURRENCY)
+
+        async def in_slot(func, *args):
+            async with slots:
+                return await asyncio.to_thread(func, *args)
+
+        # Same checkout given twice, by a subdirectory, or found under
+        # parent_dir too
+        roots = await asyncio.gather(*(in_slot(_repo_root, p) for p in candidates))
+        repo_paths = list(dict.fromkeys(roots))
+        if not repo_paths:
+            raise ToolError(f"No git repositories found in {parent_dir}")
+        skipped = repo_paths[MAX_REPOS:]
+        repo_paths = repo_paths[:MAX_REPOS]
+
+        # Patches come second, so only active repositories share the budget
+        results = await asyncio.gather(
+            *(
+                in_slot(_collect_updates, repo_path, days, author, None, None)
+                for repo_path in repo_paths
+            ),
+            return_exceptions=True,
+        )
 
-            if staged_list or unstaged_list:
-                # Get uncommitted diff patch too
-                uncommitted_patch = _run_git(["diff", "HEAD"], path)
-                if len(uncommitted_patch) > 20000:
-                    uncommitted_patch = (
-                        uncommitted_patch[:20000] + "\n\n... (truncated)"
+        active = []
+        inactive = []
+        errors = {}
+        totals = {"commits": 0, "additions": 0, "deletions": 0}
+        for repo_path, updates in zip(repo_paths, results):
+            if isinstance(updates, BaseException):
+                errors[repo_path] = str(updates)
+                continue
+            if not updates["commits"] and "uncommitted" not in updates:
+                inactive.append(updates["repository"])
+                continue
+
+            updates["path"] = repo_path
+            updates.pop("period")
+            omitted = len(updates["commits"]) - MULTI_REPO_COMMIT_LIMIT
+            if omitted > 0:
+                updates["commits"] = updates["commits"][:MULTI_REPO_COMMIT_LIMIT]
+                updates["commits_omitted"] = omitted
+            if "files" in updates["diff"]:
+                updates["diff"]["files"] = updates["diff"]["files"][:10]
+
+            totals["commits"] += updates["commit_count"]
+            totals["additions"] += updates["diff"]["additions"]
+            totals["deletions"] += updates["diff"]["deletions"]
+            active.append(updates)
+
+        if active:
+            patch_budget = MULTI_REPO_PATCH_BUDGET // len(active)
+            patched = await asyncio.gather(
+                *(
+                    in_slot(
+                        _add_patches,
+                        updates["path"],
+                        updates,
+                        patch_budget * 2 // 3,
+                        patch_budget // 3,
                     )
-
-                result["uncommitted"] = {
-                    "staged": staged_list,
-                    "unstaged": unstaged_list,
-                    "patch": uncommitted_patch,
-                }
-
-            return result
-
-        except ToolError:
-            raise
-        except Exception as e:
-            raise ToolError(f"Failed to get updates: {str(e)}")
+                    for updates in active
+                ),
+                return_exceptions=True,
+            )
+            for updates, error in zip(active, patched):
+                if isinstance(error, BaseException):
+                    errors[updates["path"]] = str(error)
+
+        active.sort(key=lambda updates: updates["commit_count"], reverse=True)
+        result = {
+            "period": f"Last {days} days",
+            "summary": {
+                "repositories": len(repo_paths),
+                "active_repositories": len(active),
+                **totals,
+            },
+            "repositories": active,
+            "inactive": inactive,
+        }
+        if errors:
+            result["errors"] = errors
+        if skipped:
+            result["skipped"] = skipped
+        return result
 
     @mcp.tool(tags={"git", "appraisal"})
     def get_local_contributions(
@@ -279,60 +737,29 @@ def create_git_tools(mcp: FastMCP) -> None:
                 except ToolError:
                     pass
 
-            since_date = f"{days} days ago"
-
-            # Get all commits by author
-            log_format = "--pretty=format:%H|%an|%ae|%ad|%s|%b---COMMIT_END---"
-            log_args = [
-                "log",
-                log_format,
-                "--date=iso",
-                f"--since={since_date}",
-            ]
-            if author:
-                log_args.extend(["--author", author])
-
-            log_output = _run_git(log_args, path)
-
             commits = []
             merge_commits = []
+            stats = {"total_additions": 0, "total_deletions": 0, "files_changed": set()}
 
-            # Parse commits
-            for commit_block in log_output.split("---COMMIT_END---"):
-                if not commit_block.strip():
-                    continue
-
-                lines = commit_block.strip().split("|", 5)
-                if len(lines) < 5:
-                    continue
-
-                sha = lines[0]
-                author_name = lines[1]
-                author_email = lines[2]
-                date = lines[3]
-                subject = lines[4]
-                body = lines[5] if len(lines) > 5 else ""
-
-                # Extract PR number from merge commit message
-                pr_number = None
-                merge_match = re.search(r"Merge pull request #(\d+)", subject)
-                if merge_match:
-                    pr_number = int(merge_match.group(1))
-                else:
-                    # Also check for GitHub's squash merge format
-                    squash_match = re.search(r"\(#(\d+)\)$", subject)
-                    if squash_match:
-                        pr_number = int(squash_match.group(1))
+            # Commits with their numstat and PR numbers, from the history
+            # index or a single git log pass
+            for entry in _log_entries(path, repo_info["root"], days, author):
+                subject = entry["subject"]
+                body = entry["body"]
+                pr_number = entry["pr_number"]
 
                 commit_data = {
-                    "sha": sha[:7],
-                    "full_sha": sha,
-                    "author": author_name,
-                    "email": author_email,
-                    "date": date,
+                    "sha": entry["sha"][:7],
+                    "full_sha": entry["sha"],
+                    "author": entry["author"],
+                    "email": entry["email"],
+                    "date": entry["date"],
                     "message": subject,
                     "body": body.strip()[:500] if body else "",
                     "pr_number": pr_number,
+                    "additions": entry["additions"],
+                    "deletions": entry["deletions"],
+                    "files_changed": len(entry["files"]),
                 }
 
                 commits.append(commit_data)
@@ -340,34 +767,9 @@ def create_git_tools(mcp: FastMCP) -> None:
                 if pr_number:
                     merge_commits.append(commit_data)
 
-            # Get stats for commits if we have any
-            stats = {"total_additions": 0, "total_deletions": 0, "files_changed": set()}
-
-            if commits:
-                # Get numstat for all commits by this author
-                numstat_args = [
-                    "log",
-                    "--numstat",
-                    "--pretty=format:",
-                    f"--since={since_date}",
-                ]
-                if author:
-                    numstat_args.extend(["--author", author])
-
-                try:
-                    numstat_output = _run_git(numstat_args, path)
-                    for line in numstat_output.split("\n"):
-                        if not line.strip():
-                            continue
-                        parts = line.split("\t")
-                        if len(parts) >= 3:
-                            adds = int(parts[0]) if parts[0] != "-" else 0
-                            dels = int(parts[1]) if parts[1] != "-" else 0
-                            stats["total_additions"] += adds
-                            stats["total_deletions"] += dels
-                            stats["files_changed"].add(parts[2])
-                except ToolError:
-                    pass
+                stats["total_additions"] += entry["additions"]
+                stats["total_deletions"] += entry["deletions"]
+                stats["files_changed"].update(entry["files"])
 
             # Calculate date range
             if commits:
@@ -13,18 +13,22 @@ PAT is preferred because:
 - No GitHub App installation required
 """
 
+import asyncio
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import yaml
-from github import GithubException
+from github import BadCredentialsException, GithubException
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
+from mcp_server.api_clients.async_github_client import AsyncGitHubClient
 from mcp_server.api_clients.github_client import GitHubClient
+from mcp_server.api_clients.http_cache import get_http_cache
 from mcp_server.auth import (
     get_credential_store,
     get_github_pat,
@@ -188,6 +192,35 @@ _pat_source: Optional[str] = None
 
 # Module-level client cache (keyed by token hash for security)
 _client_cache: Optional[Tuple[int, GitHubClient]] = None
+# Async wrapper around the cached client, rebuilt when that client changes
+_async_client_cache: Optional[Tuple[GitHubClient, AsyncGitHubClient]] = None
+# Guards replacing the cached clients; tools resolve them from worker threads
+_client_lock = threading.Lock()
+
+
+def _cached_client(token_hash: int, create: Callable[[], GitHubClient]) -> GitHubClient:
+    """
+    Cached client for a token, creating it once however many calls race.
+
+    A replaced client isn't closed here, since in-flight calls may still be
+    using it; its pools are released once it's garbage-collected.
+    """
+    global _client_cache
+
+    cached = _client_cache
+    if cached and cached[0] == token_hash:
+        return cached[1]
+    with _client_lock:
+        if _client_cache and _client_cache[0] == token_hash:
+            return _client_cache[1]
+        client = create()
+        _client_cache = (token_hash, client)
+        return client
+
+
+# Issues/PRs processed at once by bulk manage_issues/manage_prs actions.
+# Kept low: GitHub's secondary rate limits penalize bursts of writes.
+BULK_CONCURRENCY = 5
 
 
 def _get_client() -> GitHubClient:
@@ -210,50 +243,45 @@ def _get_client() -> GitHubClient:
     # Try PAT first (preferred - user has more control)
     pat_token, pat_source_str = get_github_pat()
     if pat_token:
-        token_hash = hash(pat_token)
-
-        # Return cached client if token matches
-        if _client_cache and _client_cache[0] == token_hash:
-            return _client_cache[1]
-
         _using_pat_mode = True
         _pat_source = pat_source_str
-        pat_username = get_github_pat_username()
-        logger.info(f"Using GitHub PAT from {pat_source_str}")
 
-        client = GitHubClient(
-            token=pat_token,
-            default_owner=pat_username,
-            installation_id=None,  # No installation ID for PAT
-        )
-        _client_cache = (token_hash, client)
-        return client
+        def create_pat_client() -> GitHubClient:
+            logger.info(f"Using GitHub PAT from {pat_source_str}")
+            return GitHubClient(
+                token=pat_token,
+                default_owner=get_github_pat_username(),
+                installation_id=None,  # No installation ID for PAT
+                http_cache=get_http_cache(),
+            )
+
+        # Return cached client if token matches
+        return _cached_client(hash(pat_token), create_pat_client)
 
     # Fall back to QuickCall GitHub App
     if store.is_authenticated():
         creds = store.get_api_credentials()
         if creds and creds.github_connected and creds.github_token:
-            token_hash = hash(creds.github_token)
-
-            # Return cached client if token matches
-            if _client_cache and _client_cache[0] == token_hash:
-                return _client_cache[1]
-
             _using_pat_mode = False
             _pat_source = None
 
-            client = GitHubClient(
-                token=creds.github_token,
-                default_owner=creds.github_username,
-                installation_id=creds.github_installation_id,
-            )
-            _client_cache = (token_hash, client)
-            return client
+            def create_app_client() -> GitHubClient:
+                return GitHubClient(
+                    token=creds.github_token,
+                    default_owner=creds.github_username,
+                    installation_id=creds.github_installation_id,
+                    on_unauthorized=store.invalidate_api_credentials,
+                    http_cache=get_http_cache(),
+                )
+
+            # Return cached client if token matches
+            return _cached_client(hash(creds.github_token), create_app_client)
 
     # No authentication available - provide helpful error message
     _using_pat_mode = False
     _pat_source = None
-    _client_cache = None
+    with _client_lock:
+        _client_cache = None
 
     if store.is_authenticated():
         # Connected to QuickCall but GitHub not connected
@@ -275,6 +303,100 @@ def _get_client() -> GitHubClient:
         )
 
 
+def _check_bad_credentials(error: BaseException) -> None:
+    """
+    Drop QuickCall credentials when PyGithub reports a rejected token.
+
+    GitHubClient's 401 hook only sees its httpx requests; PyGithub raises
+    BadCredentialsException instead, so tools pass the errors they map
+    through here. PATs aren't cached credentials and are left alone.
+    """
+    if isinstance(error, BadCredentialsException) and not _using_pat_mode:
+        logger.warning("GitHub rejected token (401), invalidating credentials")
+        get_credential_store().invalidate_api_credentials()
+
+
+async def _get_async_client() -> AsyncGitHubClient:
+    """
+    Get an async GitHub client for the current credentials.
+
+    Resolves credentials with _get_client on a worker thread (the credential
+    store may hit the network), then wraps that client so both share a rate
+    limiter and HTTP cache.
+
+    Raises:
+        ToolError: If no authentication method is available
+    """
+    global _async_client_cache
+
+    try:
+        client = await asyncio.to_thread(_get_client)
+    except ToolError:
+        with _client_lock:
+            _async_client_cache = None
+        raise
+
+    # No awaits below: the old wrapper isn't closed, since other coroutines
+    # may still be awaiting it; its pool closes once it's garbage-collected
+    with _client_lock:
+        if _async_client_cache and _async_client_cache[0] is client:
+            return _async_client_cache[1]
+        async_client = AsyncGitHubClient.from_client(client)
+        _async_client_cache = (client, async_client)
+        return async_client
+
+
+async def _run_bulk(
+    client: AsyncGitHubClient,
+    numbers: List[int],
+    handle: Callable[[int], Awaitable[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """
+    Run a per-issue/PR action for every number, BULK_CONCURRENCY at a time.
+
+    Every HTTP request a handler makes (httpx or PyGithub) is claimed from
+    the client's rate-limit budget as it is sent. A failure only fails its
+    own entry, so callers get partial results in the order of numbers.
+
+    Raises:
+        ToolError: Invalid arguments (same for every number). Entries not
+                   yet started are cancelled.
+        ValueError: Repository not specified
+    """
+    slots = asyncio.Semaphore(min(BULK_CONCURRENCY, client.rate_limiter.max_concurrent))
+    aborted = asyncio.Event()
+
+    async def run(number: int) -> Dict[str, Any]:
+        async with slots:
+            if aborted.is_set():
+                # The batch is failing; the result is never returned
+                return {"number": number, "status": "skipped"}
+            try:
+                return await handle(number)
+            except (ToolError, ValueError):
+                aborted.set()
+                raise
+            except GithubException as e:
+                _check_bad_credentials(e)
+                message = e.data.get("message", str(e)) if e.data else str(e)
+                error = f"GitHub API error ({e.status}): {message}"
+            except Exception as e:
+                error = f"{type(e).__name__}: {str(e) or repr(e)}"
+            logger.warning(f"Bulk action failed for #{number}: {error}")
+            return {"number": number, "status": "error", "error": error}
+
+    tasks = [asyncio.ensure_future(run(number)) for number in numbers]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # Bad arguments fail every entry: stop the rest instead of letting
+        # them carry on in the background
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
 def is_using_pat_mode() -> Tuple[bool, Optional[str]]:
     """
     Check if GitHub tools are using PAT mode.
@@ -289,7 +411,7 @@ def create_github_tools(mcp: FastMCP) -> None:
     """Add GitHub tools to the MCP server."""
 
     @mcp.tool(tags={"github", "repos"})
-    def list_repos(
+    async def list_repos(
         limit: int = Field(
             default=20,
             description="Maximum number of repositories to return (default: 20)",
@@ -302,8 +424,8 @@ def create_github_tools(mcp: FastMCP) -> None:
         Requires QuickCall authentication with GitHub connected.
         """
         try:
-            client = _get_client()
-            repos = client.list_repos(limit=limit)
+            client = await _get_async_client()
+            repos = await client.list_repos(limit=limit)
 
             return {
                 "count": len(repos),
@@ -312,10 +434,11 @@ def create_github_tools(mcp: FastMCP) -> None:
         except ToolError:
             raise
         except Exception as e:
+            _check_bad_credentials(e)
             raise ToolError(f"Failed to list repositories: {str(e)}")
 
     @mcp.tool(tags={"github", "prs"})
-    def list_prs(
+    async def list_prs(
         owner: Optional[str] = Field(
             default=None,
             description="Repository owner (username or org). Uses your GitHub username if not specified.",
@@ -346,8 +469,8 @@ def create_github_tools(mcp: FastMCP) -> None:
         Use get_prs() to fetch full details for specific PRs.
         """
         try:
-            client = _get_client()
-            prs = client.list_prs(
+            client = await _get_async_client()
+            prs = await client.list_prs(
                 owner=owner,
                 repo=repo,
                 state=state,
@@ -368,10 +491,11 @@ def create_github_tools(mcp: FastMCP) -> None:
                 f"Please provide both owner and repo parameters."
             )
         except Exception as e:
+            _check_bad_credentials(e)
             raise ToolError(f"Failed to list pull requests: {str(e)}")
 
     @mcp.tool(tags={"github", "prs"})
-    def get_prs(
+    async def get_prs(
         pr_refs: List[dict] = Field(
             ...,
             description="List of PR references. Each item should have 'owner', 'repo', and 'number' keys. "
@@ -381,14 +505,15 @@ def create_github_tools(mcp: FastMCP) -> None:
         """
         Get detailed information about one or more pull requests.
 
-        Works for single or multiple PRs - fetches in parallel when multiple.
+        Works for single or multiple PRs - fetches up to 50 PRs per request.
         Each PR ref needs owner, repo, and number.
+        PRs that could not be fetched are listed under 'errors'.
 
         Returns full PR details including additions, deletions, and files changed.
         Requires QuickCall authentication with GitHub connected.
         """
         try:
-            client = _get_client()
+            client = await _get_async_client()
 
             # Validate input
             validated_refs = []
@@ -413,21 +538,25 @@ def create_github_tools(mcp: FastMCP) -> None:
             if not validated_refs:
                 return {"count": 0, "prs": []}
 
-            # Fetch all PRs in parallel
-            prs = client.fetch_prs_parallel(validated_refs, max_workers=10)
+            # Fetch all PRs in batched GraphQL queries (REST fallback)
+            prs, errors = await client.fetch_prs_batch(validated_refs, max_workers=10)
 
-            return {
+            result = {
                 "count": len(prs),
                 "requested": len(validated_refs),
                 "prs": prs,
             }
+            if errors:
+                result["errors"] = errors
+            return result
         except ToolError:
             raise
         except Exception as e:
+            _check_bad_credentials(e)
             raise ToolError(f"Failed to fetch PRs: {str(e)}")
 
     @mcp.tool(tags={"github", "commits"})
-    def list_commits(
+    async def list_commits(
         owner: Optional[str] = Field(
             default=None,
             description="Repository owner. Uses your GitHub username if not specified.",
@@ -466,8 +595,8 @@ def create_github_tools(mcp: FastMCP) -> None:
         Use get_commit(sha) for full details on a specific commit.
         """
         try:
-            client = _get_client()
-            commits = client.list_commits(
+            client = await _get_async_client()
+            commits = await client.list_commits(
                 owner=owner,
                 repo=repo,
                 sha=branch,
@@ -490,10 +619,11 @@ def create_github_tools(mcp: FastMCP) -> None:
                 f"Please provide both owner and repo parameters."
             )
         except Exception as e:
+            _check_bad_credentials(e)
             raise ToolError(f"Failed to list commits: {str(e)}")
 
     @mcp.tool(tags={"github", "commits"})
-    def get_commit(
+    async def get_commit(
         sha: str = Field(..., description="Commit SHA (full or abbreviated)"),
         owner: Optional[str] = Field(
             default=None,
@@ -511,8 +641,8 @@ def create_github_tools(mcp: FastMCP) -> None:
         Requires QuickCall authentication with GitHub connected.
         """
         try:
-            client = _get_client()
-            commit = client.get_commit(sha, owner=owner, repo=repo)
+            client = await _get_async_client()
+            commit = await client.get_commit(sha, owner=owner, repo=repo)
 
             if not commit:
                 raise ToolError(f"Commit {sha} not found")
@@ -526,10 +656,11 @@ def create_github_tools(mcp: FastMCP) -> None:
                 f"Please provide both owner and repo parameters."
             )
         except Exception as e:
+            _check_bad_credentials(e)
             raise ToolError(f"Failed to get commit {sha}: {str(e)}")
 
     @mcp.tool(tags={"github", "branches"})
-    def list_branches(
+    async def list_branches(
         owner: Optional[str] = Field(
             default=None,
             description="Repository owner. Uses your GitHub username if not specified.",
@@ -550,8 +681,8 @@ def create_github_tools(mcp: FastMCP) -> None:
         Requires QuickCall authentication with GitHub connected.
         """
         try:
-            client = _get_client()
-            branches = client.list_branches(owner=owner, repo=repo, limit=limit)
+            client = await _get_async_client()
+            branches = await client.list_branches(owner=owner, repo=repo, limit=limit)
 
             return {
                 "count": len(branches),
@@ -565,10 +696,11 @@ def create_github_tools(mcp: FastMCP) -> None:
                 f"Please provide both owner and repo parameters."
             )
         except Exception as e:
+            _check_bad_credentials(e)
             raise ToolError(f"Failed to list branches: {str(e)}")
 
     @mcp.tool(tags={"github", "issues"})
-    def manage_issues(
+    async def manage_issues(
         action: str = Field(
             ...,
             description="Action: 'list', 'view', 'create', 'update', 'close', 'reopen', 'comment', "
@@ -649,6 +781,8 @@ def create_github_tools(mcp: FastMCP) -> None:
         Manage GitHub issues: list, view, create, update, close, reopen, comment, and sub-issues.
 
         Supports bulk operations for view/close/reopen/comment via issue_numbers list.
+        Bulk items run concurrently; a failed item is reported in its result
+        entry without stopping the rest.
 
         Examples:
         - list: manage_issues(action="list", state="open", milestone="v1.0")
@@ -669,11 +803,11 @@ def create_github_tools(mcp: FastMCP) -> None:
         For project operations (add to project, update fields), use manage_projects() instead.
         """
         try:
-            client = _get_client()
+            client = await _get_async_client()
 
             # === LIST ACTION ===
             if action == "list":
-                issues = client.list_issues(
+                issues = await client.list_issues(
                     owner=owner,
                     repo=repo,
                     state=state or "open",
@@ -708,7 +842,7 @@ def create_github_tools(mcp: FastMCP) -> None:
                 if title_prefix and not title.startswith(title_prefix):
                     title = f"{title_prefix}{title}"
 
-                issue = client.create_issue(
+                issue = await client.create_issue(
                     title=title,
                     body=final_body,
                     labels=final_labels,
@@ -722,7 +856,7 @@ def create_github_tools(mcp: FastMCP) -> None:
                 # If parent_issue specified, add as sub-issue
                 if parent_issue:
                     try:
-                        sub_result = client.add_sub_issue(
+                        sub_result = await client.add_sub_issue(
                             parent_issue_number=parent_issue,
                             child_issue_number=issue["number"],
                             owner=owner,
@@ -742,7 +876,7 @@ def create_github_tools(mcp: FastMCP) -> None:
                         "'parent_issue' is required for 'list_sub_issues' action"
                     )
 
-                sub_issues = client.list_sub_issues(
+                sub_issues = await client.list_sub_issues(
                     parent_issue_number=parent_issue,
                     owner=owner,
                     repo=repo,
@@ -758,21 +892,20 @@ def create_github_tools(mcp: FastMCP) -> None:
             if not issue_numbers:
                 raise ToolError(f"'issue_numbers' required for '{action}' action")
 
-            results = []
-            for issue_number in issue_numbers:
+            async def handle(issue_number: int) -> Dict[str, Any]:
                 # === VIEW ACTION ===
                 if action == "view":
-                    issue_data = client.get_issue(
+                    issue_data = await client.get_issue(
                         issue_number=issue_number,
                         owner=owner,
                         repo=repo,
                         include_sub_issues=True,
                     )
-                    results.append(issue_data)
+                    return issue_data
 
                 # === UPDATE ACTION ===
                 elif action == "update":
-                    client.update_issue(
+                    await client.update_issue(
                         issue_number=issue_number,
                         title=title,
                         body=body,
@@ -781,32 +914,30 @@ def create_github_tools(mcp: FastMCP) -> None:
                         owner=owner,
                         repo=repo,
                     )
-                    results.append({"number": issue_number, "status": "updated"})
+                    return {"number": issue_number, "status": "updated"}
 
                 # === CLOSE ACTION ===
                 elif action == "close":
-                    client.close_issue(issue_number, owner=owner, repo=repo)
-                    results.append({"number": issue_number, "status": "closed"})
+                    await client.close_issue(issue_number, owner=owner, repo=repo)
+                    return {"number": issue_number, "status": "closed"}
 
                 # === REOPEN ACTION ===
                 elif action == "reopen":
-                    client.reopen_issue(issue_number, owner=owner, repo=repo)
-                    results.append({"number": issue_number, "status": "reopened"})
+                    await client.reopen_issue(issue_number, owner=owner, repo=repo)
+                    return {"number": issue_number, "status": "reopened"}
 
                 # === COMMENT ACTION ===
                 elif action == "comment":
                     if not body:
                         raise ToolError("'body' is required for 'comment' action")
-                    comment = client.comment_on_issue(
+                    comment = await client.comment_on_issue(
                         issue_number, body=body, owner=owner, repo=repo
                     )
-                    results.append(
-                        {
-                            "number": issue_number,
-                            "status": "commented",
-                            "comment_url": comment["html_url"],
-                        }
-                    )
+                    return {
+                        "number": issue_number,
+                        "status": "commented",
+                        "comment_url": comment["html_url"],
+                    }
 
                 # === ADD SUB-ISSUE ACTION ===
                 elif action == "add_sub_issue":
@@ -814,19 +945,17 @@ def create_github_tools(mcp: FastMCP) -> None:
                         raise ToolError(
                             "'parent_issue' is required for 'add_sub_issue' action"
                         )
-                    sub_result = client.add_sub_issue(
+                    await client.add_sub_issue(
                         parent_issue_number=parent_issue,
                         child_issue_number=issue_number,
                         owner=owner,
                         repo=repo,
                     )
-                    results.append(
-                        {
-                            "number": issue_number,
-                            "status": "added_as_sub_issue",
-                            "parent_issue": parent_issue,
-                        }
-                    )
+                    return {
+                        "number": issue_number,
+                        "status": "added_as_sub_issue",
+                        "parent_issue": parent_issue,
+                    }
 
                 # === REMOVE SUB-ISSUE ACTION ===
                 elif action == "remove_sub_issue":
@@ -834,36 +963,32 @@ def create_github_tools(mcp: FastMCP) -> None:
                         raise ToolError(
                             "'parent_issue' is required for 'remove_sub_issue' action"
                         )
-                    client.remove_sub_issue(
+                    await client.remove_sub_issue(
                         parent_issue_number=parent_issue,
                         child_issue_number=issue_number,
                         owner=owner,
                         repo=repo,
                     )
-                    results.append(
-                        {
-                            "number": issue_number,
-                            "status": "removed_from_parent",
-                            "parent_issue": parent_issue,
-                        }
-                    )
+                    return {
+                        "number": issue_number,
+                        "status": "removed_from_parent",
+                        "parent_issue": parent_issue,
+                    }
 
                 # === LIST COMMENTS ACTION ===
                 elif action == "list_comments":
-                    comments = client.list_issue_comments(
+                    comments = await client.list_issue_comments(
                         issue_number=issue_number,
                         owner=owner,
                         repo=repo,
                         limit=comments_limit or 10,
                         order=comments_order or "asc",
                     )
-                    results.append(
-                        {
-                            "number": issue_number,
-                            "comments_count": len(comments),
-                            "comments": comments,
-                        }
-                    )
+                    return {
+                        "number": issue_number,
+                        "comments_count": len(comments),
+                        "comments": comments,
+                    }
 
                 # === UPDATE COMMENT ACTION ===
                 elif action == "update_comment":
@@ -875,19 +1000,17 @@ def create_github_tools(mcp: FastMCP) -> None:
                         raise ToolError(
                             "'body' is required for 'update_comment' action"
                         )
-                    updated = client.update_issue_comment(
+                    updated = await client.update_issue_comment(
                         comment_id=comment_id,
                         body=body,
                         owner=owner,
                         repo=repo,
                     )
-                    results.append(
-                        {
-                            "number": issue_number,
-                            "status": "comment_updated",
-                            "comment": updated,
-                        }
-                    )
+                    return {
+                        "number": issue_number,
+                        "status": "comment_updated",
+                        "comment": updated,
+                    }
 
                 # === DELETE COMMENT ACTION ===
                 elif action == "delete_comment":
@@ -895,22 +1018,22 @@ def create_github_tools(mcp: FastMCP) -> None:
                         raise ToolError(
                             "'comment_id' is required for 'delete_comment' action"
                         )
-                    client.delete_issue_comment(
+                    await client.delete_issue_comment(
                         comment_id=comment_id,
                         owner=owner,
                         repo=repo,
                     )
-                    results.append(
-                        {
-                            "number": issue_number,
-                            "status": "comment_deleted",
-                            "comment_id": comment_id,
-                        }
-                    )
+                    return {
+                        "number": issue_number,
+                        "status": "comment_deleted",
+                        "comment_id": comment_id,
+                    }
 
                 else:
                     raise ToolError(f"Invalid action: {action}")
 
+            results = await _run_bulk(client, issue_numbers, handle)
+
             # Return format depends on action
             if action == "view":
                 return {
@@ -933,10 +1056,11 @@ def create_github_tools(mcp: FastMCP) -> None:
         except ValueError as e:
             raise ToolError(f"Repository not specified: {str(e)}")
         except Exception as e:
+            _check_bad_credentials(e)
             raise ToolError(f"Failed to {action} issue(s): {str(e)}")
 
     @mcp.tool(tags={"github", "prs"})
-    def manage_prs(
+    async def manage_prs(
         action: str = Field(
             ...,
             description="Action: 'list', 'view', 'create', 'update', 'merge', 'close', 'reopen', "
@@ -1013,6 +1137,8 @@ def create_github_tools(mcp: FastMCP) -> None:
         Manage GitHub pull requests: list, view, create, update, merge, close, reopen, comment, and review.
 
         Supports bulk operations for view/close/reopen/comment via pr_numbers list.
+        Bulk items run concurrently; a failed item is reported in its result
+        entry without stopping the rest.
 
         Examples:
         - list: manage_prs(action="list", state="open")
@@ -1034,11 +1160,11 @@ def create_github_tools(mcp: FastMCP) -> None:
         - remove assignees: manage_prs(action="remove_assignees", pr_numbers=[42], assignees=["user1"])
         """
         try:
-            client = _get_client()
+            client = await _get_async_client()
 
             # === LIST ACTION ===
             if action == "list":
-                prs = client.list_prs(
+                prs = await client.list_prs(
                     owner=owner,
                     repo=repo,
                     state=state or "open",
@@ -1061,7 +1187,7 @@ def create_github_tools(mcp: FastMCP) -> None:
                         "'head' (source branch) is required for 'create' action"
                     )
 
-                pr = client.create_pr(
+                pr = await client.create_pr(
                     title=title,
                     head=head,
                     base=base or "main",
@@ -1080,13 +1206,13 @@ def create_github_tools(mcp: FastMCP) -> None:
                 pr_assignees = assignees
                 if pr_assignees is None:
                     # Default to current user
-                    current_user = client.get_authenticated_user()
+                    current_user = await client.get_authenticated_user()
                     if current_user:
                         pr_assignees = [current_user]
 
                 if pr_assignees:
                     try:
-                        assign_result = client.add_pr_assignees(
+                        assign_result = await client.add_pr_assignees(
                             pr.number, assignees=pr_assignees, owner=owner, repo=repo
                         )
                         result["assignees"] = assign_result["assignees"]
@@ -1099,23 +1225,22 @@ def create_github_tools(mcp: FastMCP) -> None:
             if not pr_numbers:
                 raise ToolError(f"'pr_numbers' required for '{action}' action")
 
-            results = []
-            for pr_number in pr_numbers:
+            async def handle(pr_number: int) -> Dict[str, Any]:
                 # === VIEW ACTION ===
                 if action == "view":
-                    pr_data = client.get_pr(
+                    pr_data = await client.get_pr(
                         pr_number=pr_number,
                         owner=owner,
                         repo=repo,
                     )
                     if pr_data:
-                        results.append(pr_data.model_dump())
+                        return pr_data.model_dump()
                     else:
-                        results.append({"number": pr_number, "error": "PR not found"})
+                        return {"number": pr_number, "error": "PR not found"}
 
                 # === UPDATE ACTION ===
                 elif action == "update":
-                    pr_data = client.update_pr(
+                    pr_data = await client.update_pr(
                         pr_number=pr_number,
                         title=title,
                         body=body,
@@ -1123,55 +1248,49 @@ def create_github_tools(mcp: FastMCP) -> None:
                         owner=owner,
                         repo=repo,
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "updated",
-                            "pr": pr_data.model_dump(),
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "updated",
+                        "pr": pr_data.model_dump(),
+                    }
 
                 # === MERGE ACTION ===
                 elif action == "merge":
-                    merge_result = client.merge_pr(
+                    merge_result = await client.merge_pr(
                         pr_number=pr_number,
                         merge_method=merge_method or "merge",
                         owner=owner,
                         repo=repo,
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "merged" if merge_result["merged"] else "failed",
-                            "message": merge_result["message"],
-                            "sha": merge_result["sha"],
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "merged" if merge_result["merged"] else "failed",
+                        "message": merge_result["message"],
+                        "sha": merge_result["sha"],
+                    }
 
                 # === CLOSE ACTION ===
                 elif action == "close":
-                    client.close_pr(pr_number, owner=owner, repo=repo)
-                    results.append({"number": pr_number, "status": "closed"})
+                    await client.close_pr(pr_number, owner=owner, repo=repo)
+                    return {"number": pr_number, "status": "closed"}
 
                 # === REOPEN ACTION ===
                 elif action == "reopen":
-                    client.reopen_pr(pr_number, owner=owner, repo=repo)
-                    results.append({"number": pr_number, "status": "reopened"})
+                    await client.reopen_pr(pr_number, owner=owner, repo=repo)
+                    return {"number": pr_number, "status": "reopened"}
 
                 # === COMMENT ACTION ===
                 elif action == "comment":
                     if not body:
                         raise ToolError("'body' is required for 'comment' action")
-                    comment = client.add_pr_comment(
+                    comment = await client.add_pr_comment(
                         pr_number, body=body, owner=owner, repo=repo
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "commented",
-                            "comment_url": comment["html_url"],
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "commented",
+                        "comment_url": comment["html_url"],
+                    }
 
                 # === REQUEST REVIEWERS ACTION ===
                 elif action == "request_reviewers":
@@ -1179,21 +1298,19 @@ def create_github_tools(mcp: FastMCP) -> None:
                         raise ToolError(
                             "'reviewers' or 'team_reviewers' required for 'request_reviewers' action"
                         )
-                    review_result = client.request_reviewers(
+                    review_result = await client.request_reviewers(
                         pr_number,
                         reviewers=reviewers,
                         team_reviewers=team_reviewers,
                         owner=owner,
                         repo=repo,
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "reviewers_requested",
-                            "requested_reviewers": review_result["requested_reviewers"],
-                            "requested_teams": review_result["requested_teams"],
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "reviewers_requested",
+                        "requested_reviewers": review_result["requested_reviewers"],
+                        "requested_teams": review_result["requested_teams"],
+                    }
 
                 # === REVIEW ACTION ===
                 elif action == "review":
@@ -1203,64 +1320,56 @@ def create_github_tools(mcp: FastMCP) -> None:
                         )
                     if review_event == "REQUEST_CHANGES" and not body:
                         raise ToolError("'body' is required when requesting changes")
-                    review_result = client.submit_pr_review(
+                    review_result = await client.submit_pr_review(
                         pr_number,
                         event=review_event,
                         body=body,
                         owner=owner,
                         repo=repo,
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "reviewed",
-                            "review_state": review_result["state"],
-                            "review_url": review_result["html_url"],
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "reviewed",
+                        "review_state": review_result["state"],
+                        "review_url": review_result["html_url"],
+                    }
 
                 # === TO DRAFT ACTION ===
                 elif action == "to_draft":
-                    draft_result = client.convert_pr_to_draft(
+                    draft_result = await client.convert_pr_to_draft(
                         pr_number, owner=owner, repo=repo
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "converted_to_draft",
-                            "is_draft": draft_result["is_draft"],
-                            "message": draft_result["message"],
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "converted_to_draft",
+                        "is_draft": draft_result["is_draft"],
+                        "message": draft_result["message"],
+                    }
 
                 # === READY FOR REVIEW ACTION ===
                 elif action == "ready_for_review":
-                    ready_result = client.mark_pr_ready_for_review(
+                    ready_result = await client.mark_pr_ready_for_review(
                         pr_number, owner=owner, repo=repo
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "marked_ready",
-                            "is_draft": ready_result["is_draft"],
-                            "message": ready_result["message"],
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "marked_ready",
+                        "is_draft": ready_result["is_draft"],
+                        "message": ready_result["message"],
+                    }
 
                 # === ADD LABELS ACTION ===
                 elif action == "add_labels":
                     if not labels:
                         raise ToolError("'labels' is required for 'add_labels' action")
-                    label_result = client.add_pr_labels(
+                    label_result = await client.add_pr_labels(
                         pr_number, labels=labels, owner=owner, repo=repo
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "labels_added",
-                            "labels": label_result["labels"],
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "labels_added",
+                        "labels": label_result["labels"],
+                    }
 
                 # === REMOVE LABELS ACTION ===
                 elif action == "remove_labels":
@@ -1268,16 +1377,14 @@ def create_github_tools(mcp: FastMCP) -> None:
                         raise ToolError(
                             "'labels' is required for 'remove_labels' action"
                         )
-                    label_result = client.remove_pr_labels(
+                    label_result = await client.remove_pr_labels(
                         pr_number, labels=labels, owner=owner, repo=repo
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "labels_removed",
-                            "labels": label_result["labels"],
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "labels_removed",
+                        "labels": label_result["labels"],
+                    }
 
                 # === ADD ASSIGNEES ACTION ===
                 elif action == "add_assignees":
@@ -1285,16 +1392,14 @@ def create_github_tools(mcp: FastMCP) -> None:
                         raise ToolError(
                             "'assignees' is required for 'add_assignees' action"
                         )
-                    assign_result = client.add_pr_assignees(
+                    assign_result = await client.add_pr_assignees(
                         pr_number, assignees=assignees, owner=owner, repo=repo
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "assignees_added",
-                            "assignees": assign_result["assignees"],
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "assignees_added",
+                        "assignees": assign_result["assignees"],
+                    }
 
                 # === REMOVE ASSIGNEES ACTION ===
                 elif action == "remove_assignees":
@@ -1302,20 +1407,20 @@ def create_github_tools(mcp: FastMCP) -> None:
                         raise ToolError(
                             "'assignees' is required for 'remove_assignees' action"
                         )
-                    assign_result = client.remove_pr_assignees(
+                    assign_result = await client.remove_pr_assignees(
                         pr_number, assignees=assignees, owner=owner, repo=repo
                     )
-                    results.append(
-                        {
-                            "number": pr_number,
-                            "status": "assignees_removed",
-                            "assignees": assign_result["assignees"],
-                        }
-                    )
+                    return {
+                        "number": pr_number,
+                        "status": "assignees_removed",
+                        "assignees": assign_result["assignees"],
+                    }
 
                 else:
                     raise ToolError(f"Invalid action: {action}")
 
+            results = await _run_bulk(client, pr_numbers, handle)
+
             # Return format depends on action
             if action == "view":
                 return {
@@ -1331,13 +1436,16 @@ def create_github_tools(mcp: FastMCP) -> None:
         except ValueError as e:
             raise ToolError(f"Repository not specified: {str(e)}")
         except GithubException as e:
+            _check_bad_credentials(e)
             error_msg = e.data.get("message", str(e)) if e.data else str(e)
             raise ToolError(f"GitHub API error ({e.status}): {error_msg}")
         except Exception as e:
-            raise ToolError(f"Failed to {action} PR(s): {type(e).__name__}: {str(e) or repr(e)}")
+            raise ToolError(
+                f"Failed to {action} PR(s): {type(e).__name__}: {str(e) or repr(e)}"
+            )
 
     @mcp.tool(tags={"github", "prs", "appraisal"})
-    def prepare_appraisal_data(
+    async def prepare_appraisal_data(
         author: Optional[str] = Field(
             default=None,
             description="GitHub username. Defaults to authenticated user.",
@@ -1373,7 +1481,7 @@ def create_github_tools(mcp: FastMCP) -> None:
         from datetime import datetime, timedelta, timezone
 
         try:
-            client = _get_client()
+            client = await _get_async_client()
 
             since_date = (datetime.now(timezone.utc) - timedelta(days=days)).strftime(
                 "%Y-%m-%d"
@@ -1381,17 +1489,19 @@ def create_github_tools(mcp: FastMCP) -> None:
 
             # Use authenticated user if author not specified
             if not author:
-                creds = get_credential_store().get_api_credentials()
+                creds = await asyncio.to_thread(
+                    get_credential_store().get_api_credentials
+                )
                 if creds and creds.github_username:
                     author = creds.github_username
 
-            # Step 1: Get list of merged PRs
-            pr_list = client.search_merged_prs(
+            # Step 1: Get all merged PRs (paginated past the 100/page limit)
+            pr_list = await client.search_merged_prs(
                 author=author,
                 since_date=since_date,
                 org=org,
                 repo=repo,
-                limit=100,
+                limit=None,
                 detail_level="full",  # Get body/labels from search
             )
 
@@ -1409,8 +1519,10 @@ def create_github_tools(mcp: FastMCP) -> None:
                 for pr in pr_list
             ]
 
-            # Step 3: Fetch full details in parallel
-            full_prs = client.fetch_prs_parallel(pr_refs, max_workers=10)
+            # Step 3: Fetch full details in batched GraphQL queries
+            full_prs, fetch_errors = await client.fetch_prs_batch(
+                pr_refs, max_workers=10
+            )
 
             # Step 4: Merge search data with full PR data
             # (search has body/labels, full PR has additions/deletions/files)
@@ -1449,7 +1561,7 @@ def create_github_tools(mcp: FastMCP) -> None:
                 for pr in full_prs
             ]
 
-            return {
+            result = {
                 "file_path": file_path,
                 "count": len(full_prs),
                 "author": author,
@@ -1458,14 +1570,18 @@ def create_github_tools(mcp: FastMCP) -> None:
                 "next_step": "Review titles above, then call "
                 "get_appraisal_pr_details(file_path, pr_numbers) for full details on selected PRs.",
             }
+            if fetch_errors:
+                result["errors"] = fetch_errors
+            return result
 
         except ToolError:
             raise
         except Exception as e:
+            _check_bad_credentials(e)
             raise ToolError(f"Failed to prepare appraisal data: {str(e)}")
 
     @mcp.tool(tags={"github", "prs", "appraisal"})
-    def get_appraisal_pr_details(
+    async def get_appraisal_pr_details(
         file_path: str = Field(
             ...,
             description="Path to the appraisal data file from prepare_appraisal_data",
@@ -1507,24 +1623,25 @@ def create_github_tools(mcp: FastMCP) -> None:
             raise ToolError(f"Failed to read appraisal data: {str(e)}")
 
     @mcp.tool(tags={"github", "status"})
-    def check_github_connection() -> dict:
+    async def check_github_connection() -> dict:
         """
         Check if GitHub is connected and working.
 
         Tests the GitHub connection by fetching your account info.
-        Shows whether using QuickCall GitHub App or PAT fallback.
+        Shows whether using QuickCall GitHub App or PAT fallback, and the
+        remaining API budget (core, search, graphql).
         Use this to verify your GitHub integration is working.
         """
         store = get_credential_store()
 
         # First, try to get a working client (this handles both QuickCall and PAT)
         try:
-            client = _get_client()
+            client = await _get_async_client()
             using_pat, pat_source = is_using_pat_mode()
 
             # Try to get username to verify connection works
             try:
-                username = client.get_authenticated_user()
+                username = await client.get_authenticated_user()
             except Exception:
                 username = None
 
@@ -1533,21 +1650,24 @@ def create_github_tools(mcp: FastMCP) -> None:
                     "connected": True,
                     "mode": "pat",
                     "pat_source": pat_source,
-                    "username": username or get_github_pat_username(),
+                    "username": username
+                    or await asyncio.to_thread(get_github_pat_username),
+                    "rate_limits": await client.get_rate_limits(),
                     "note": "Using Personal Access Token (PAT) mode. "
                     "Some features like list_repos may have limited access.",
                 }
             else:
-                creds = store.get_api_credentials()
+                creds = await asyncio.to_thread(store.get_api_credentials)
                 return {
                     "connected": True,
                     "mode": "github_app",
                     "username": username or (creds.github_username if creds else None),
                     "installation_id": creds.github_installation_id if creds else None,
+                    "rate_limits": await client.get_rate_limits(),
                 }
         except ToolError as e:
             # No authentication available
-            pat_token, _ = get_github_pat()
+            pat_token, _ = await asyncio.to_thread(get_github_pat)
             if pat_token:
                 # PAT exists but failed to work
                 return {
@@ -1557,8 +1677,8 @@ def create_github_tools(mcp: FastMCP) -> None:
                 }
 
             # Check QuickCall status for helpful error
-            if store.is_authenticated():
-                creds = store.get_api_credentials()
+            if await asyncio.to_thread(store.is_authenticated):
+                creds = await asyncio.to_thread(store.get_api_credentials)
                 if creds and not creds.github_connected:
                     return {
                         "connected": False,
@@ -1575,13 +1695,14 @@ def create_github_tools(mcp: FastMCP) -> None:
                 "error": str(e),
             }
         except Exception as e:
+            _check_bad_credentials(e)
             return {
                 "connected": False,
                 "error": str(e),
             }
 
     @mcp.tool(tags={"github", "projects"})
-    def manage_projects(
+    async def manage_projects(
         action: str = Field(
             ...,
             description="Action: 'list', 'add', 'remove', 'update_fields'",
@@ -1632,16 +1753,16 @@ def create_github_tools(mcp: FastMCP) -> None:
                          fields={"Status": "In Progress"}, repo="my-repo")
         """
         try:
-            client = _get_client()
+            client = await _get_async_client()
 
             # === LIST ACTION ===
             if action == "list":
                 proj_owner = project_owner or owner
                 if not proj_owner:
                     # Use authenticated user if no owner specified
-                    proj_owner = client.get_authenticated_user()
+                    proj_owner = await client.get_authenticated_user()
 
-                projects = client.list_projects(
+                projects = await client.list_projects(
                     owner=proj_owner,
                     is_org=True,  # Try org first, falls back to user
                     limit=limit or 20,
@@ -1667,7 +1788,7 @@ def create_github_tools(mcp: FastMCP) -> None:
                         "project": project,
                     }
                     try:
-                        result = client.add_issue_to_project(
+                        result = await client.add_issue_to_project(
                             issue_number=issue_number,
                             project=project,
                             owner=owner,
@@ -1676,35 +1797,35 @@ def create_github_tools(mcp: FastMCP) -> None:
                         )
                         issue_result["status"] = "added"
                         issue_result["project_item_id"] = result.get("project_item_id")
-
-                        # If fields provided, set them after adding
-                        if fields:
-                            issue_result["fields_updated"] = []
-                            issue_result["field_errors"] = []
-                            for field_name, value in fields.items():
-                                try:
-                                    client.update_project_item_field(
-                                        issue_number=issue_number,
-                                        project=project,
-                                        field_name=field_name,
-                                        value=value,
-                                        owner=owner,
-                                        repo=repo,
-                                        project_owner=project_owner,
-                                    )
-                                    issue_result["fields_updated"].append(
-                                        {"field": field_name, "value": value}
-                                    )
-                                except Exception as e:
-                                    issue_result["field_errors"].append(
-                                        {"field": field_name, "error": str(e)}
-                                    )
-
-                        results.append(issue_result)
                     except Exception as e:
                         issue_result["status"] = "error"
                         issue_result["error"] = str(e)
-                        results.append(issue_result)
+                    results.append(issue_result)
+
+                # If fields provided, set them on every added issue in bulk
+                added = [r for r in results if r["status"] == "added"]
+                if fields and added:
+                    try:
+                        updates = await client.update_project_item_fields(
+                            issue_numbers=[r["number"] for r in added],
+                            project=project,
+                            fields=fields,
+                            owner=owner,
+                            repo=repo,
+                            project_owner=project_owner,
+                        )
+                        by_number = {update["number"]: update for update in updates}
+                        for issue_result in added:
+                            update = by_number[issue_result["number"]]
+                            issue_result["fields_updated"] = update["fields_updated"]
+                            issue_result["field_errors"] = update["errors"]
+                    except Exception as e:
+                        for issue_result in added:
+                            issue_result["fields_updated"] = []
+                            issue_result["field_errors"] = [
+                                {"field": field_name, "error": str(e)}
+                                for field_name in fields
+                            ]
 
                 return {
                     "action": "add",
@@ -1723,7 +1844,7 @@ def create_github_tools(mcp: FastMCP) -> None:
                 results = []
                 for issue_number in issue_numbers:
                     try:
-                        client.remove_issue_from_project(
+                        await client.remove_issue_from_project(
                             issue_number=issue_number,
                             project=project,
                             owner=owner,
@@ -1764,37 +1885,14 @@ def create_github_tools(mcp: FastMCP) -> None:
                 if not fields:
                     raise ToolError("'fields' is required for 'update_fields' action")
 
-                results = []
-                for issue_number in issue_numbers:
-                    issue_result = {
-                        "number": issue_number,
-                        "fields_updated": [],
-                        "errors": [],
-                    }
-
-                    for field_name, value in fields.items():
-                        try:
-                            client.update_project_item_field(
-                                issue_number=issue_number,
-                                project=project,
-                                field_name=field_name,
-                                value=value,
-                                owner=owner,
-                                repo=repo,
-                                project_owner=project_owner,
-                            )
-                            issue_result["fields_updated"].append(
-                                {"field": field_name, "value": value}
-                            )
-                        except Exception as e:
-                            issue_result["errors"].append(
-                                {"field": field_name, "error": str(e)}
-                            )
-
-                    issue_result["status"] = (
-                        "success" if not issue_result["errors"] else "partial"
-                    )
-                    results.append(issue_result)
+                results = await client.update_project_item_fields(
+                    issue_numbers=issue_numbers,
+                    project=project,
+                    fields=fields,
+                    owner=owner,
+                    repo=repo,
+                    project_owner=project_owner,
+                )
 
                 return {
                     "action": "update_fields",
@@ -1812,4 +1910,5 @@ def create_github_tools(mcp: FastMCP) -> None:
         except ValueError as e:
             raise ToolError(f"Invalid parameters: {str(e)}")
         except Exception as e:
+            _check_bad_credentials(e)
             raise ToolError(f"Failed to {action} project: {str(e)}")
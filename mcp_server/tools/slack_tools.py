@@ -5,22 +5,52 @@ These tools require authentication via QuickCall.
 Connect using connect_quickcall tool first.
 """
 
-from typing import Optional
+from collections import Counter
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import tempfile
 
 from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 from pydantic import Field
 
 from mcp_server.auth import get_credential_store
+from mcp_server.auth.credentials import QUICKCALL_DIR
+from mcp_server.api_clients.http_cache import get_http_cache
 from mcp_server.api_clients.slack_client import SlackClient, SlackAPIError
+from mcp_server.api_clients.slack_message_store import open_message_store
 
 logger = logging.getLogger(__name__)
 
 # Module-level client cache (keyed by token hash for security)
 _client_cache: Optional[tuple[str, SlackClient]] = None
 
+# Saved channel lists / user directories and message stores, one file each
+# per bot token
+SLACK_DIRECTORY_DIR = QUICKCALL_DIR / "slack"
+
+
+def _token_digest(bot_token: str) -> str:
+    """Names per-token files by digest, never the token."""
+    return hashlib.sha256(bot_token.encode()).hexdigest()[:16]
+
+
+def _directory_path(bot_token: str) -> Path:
+    """Directory cache file for a bot token."""
+    return SLACK_DIRECTORY_DIR / f"directory-{_token_digest(bot_token)}.json"
+
+
+def _message_store_path(bot_token: str) -> Path:
+    """Message store database for a bot token."""
+    return SLACK_DIRECTORY_DIR / f"messages-{_token_digest(bot_token)}.db"
+
 
 def _get_client() -> SlackClient:
     """Get the Slack client, raising error if not configured. Uses cached client."""
@@ -34,7 +64,7 @@ def _get_client() -> SlackClient:
             "Run connect_quickcall to authenticate and enable Slack tools."
         )
 
-    # Fetch fresh credentials from API
+    # Fetch credentials from API (briefly cached by the credential store)
     creds = store.get_api_credentials()
 
     if not creds or not creds.slack_connected:
@@ -55,11 +85,163 @@ def _get_client() -> SlackClient:
         return _client_cache[1]
 
     # Create new client and cache it
-    client = SlackClient(bot_token=creds.slack_bot_token)
+    client = SlackClient(
+        bot_token=creds.slack_bot_token,
+        on_unauthorized=store.invalidate_api_credentials,
+        http_cache=get_http_cache(),
+        directory_path=_directory_path(creds.slack_bot_token),
+        message_store=open_message_store(_message_store_path(creds.slack_bot_token)),
+    )
+    previous = _client_cache[1] if _client_cache else None
     _client_cache = (token_hash, client)
+    if previous is not None:
+        _close_client(previous)
     return client
 
 
+def _close_client(client: SlackClient) -> None:
+    """Release a replaced client's connections and message store."""
+    try:
+        client.close()
+        if client.message_store is not None:
+            client.message_store.close()
+    except Exception as e:
+        logger.debug(f"Failed to close previous Slack client: {e}")
+
+
+# Most messages read_slack_export returns per call
+EXPORT_SLICE_MAX = 200
+# Entries kept in the export index's users/threads summaries
+EXPORT_INDEX_TOP = 20
+
+
+def _parse_date(value: str, name: str) -> datetime:
+    """Parse a YYYY-MM-DD tool argument as a UTC midnight."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    except ValueError:
+        raise ToolError(f"Invalid {name} '{value}', expected YYYY-MM-DD")
+
+
+def _export_history(
+    client: SlackClient, channel_id: str, oldest: str, latest: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Stream a channel's history into a JSONL temp file.
+
+    Messages are written as they are fetched (newest first, one JSON object
+    per line), so memory stays flat however long the range is.
+
+    Returns:
+        file_path, count and a compact index: per-day line offsets, the most
+        active users and the largest threads
+    """
+    days: Dict[str, Dict[str, int]] = {}
+    users: Counter = Counter()
+    threads = []
+    count = 0
+
+    fd, file_path = tempfile.mkstemp(suffix=".jsonl", prefix="slack_history_")
+    try:
+        with os.fdopen(fd, "w") as f:
+            for msg in client.iter_channel_history(channel_id, oldest, latest):
+                posted = datetime.fromtimestamp(float(msg.ts), timezone.utc)
+                record = {
+                    "ts": msg.ts,
+                    "time": posted.isoformat(timespec="seconds"),
+                    "user": msg.user_name or msg.user,
+                    "text": msg.text,
+                    "thread_ts": msg.thread_ts,
+                    "reply_count": msg.reply_count,
+                }
+                f.write(json.dumps(record) + "\n")
+
+                day = days.setdefault(
+                    posted.strftime("%Y-%m-%d"), {"offset": count, "count": 0}
+                )
+                day["count"] += 1
+                users[record["user"]] += 1
+                if msg.reply_count:
+                    threads.append(
+                        {"ts": msg.ts, "reply_count": msg.reply_count, "offset": count}
+                    )
+                count += 1
+    except BaseException:
+        os.unlink(file_path)
+        raise
+
+    threads.sort(key=lambda t: t["reply_count"], reverse=True)
+    return {
+        "file_path": file_path,
+        "count": count,
+        "index": {
+            "days": [{"date": date, **span} for date, span in days.items()],
+            "top_users": dict(users.most_common(EXPORT_INDEX_TOP)),
+            "top_threads": threads[:EXPORT_INDEX_TOP],
+        },
+    }
+
+
+# Total characters of message text a Slack digest returns, split evenly
+# across the channels that have messages
+DIGEST_MAX_CHARS = 40_000
+# Longer messages/replies are cut to this many characters in a digest
+DIGEST_TEXT_MAX = 500
+# Replies fetched per thread for a digest
+DIGEST_REPLY_LIMIT = 20
+
+
+def _clip(text: str) -> str:
+    if len(text) <= DIGEST_TEXT_MAX:
+        return text
+    return text[:DIGEST_TEXT_MAX] + "…"
+
+
+def _digest_channel(messages, threads: Dict[str, Any], budget: int) -> Dict[str, Any]:
+    """
+    Fit one channel's messages (newest first) and thread replies into a
+    character budget.
+
+    Returns:
+        Digest entry with messages, plus how many were left out
+    """
+    entries = []
+    used = 0
+    for msg in messages:
+        entry = {
+            "ts": msg.ts,
+            "user": msg.user_name or msg.user,
+            "text": _clip(msg.text),
+        }
+        cost = len(entry["text"])
+
+        replies = threads.get(msg.ts)
+        if isinstance(replies, Exception):
+            logger.warning(f"Failed to fetch thread {msg.ts}: {replies}")
+            replies = []
+        if replies is not None:
+            entry["replies"] = [
+                {"user": reply.user_name or reply.user, "text": _clip(reply.text)}
+                for reply in replies
+                if reply.ts != msg.ts  # Skip parent message
+            ]
+            cost += sum(len(reply["text"]) for reply in entry["replies"])
+        elif msg.reply_count:
+            entry["reply_count"] = msg.reply_count
+
+        # Always keep the newest message, even if it alone exceeds the budget
+        if entries and used + cost > budget:
+            break
+        entries.append(entry)
+        used += cost
+
+    return {
+        "count": len(entries),
+        "omitted": len(messages) - len(entries),
+        "messages": entries,
+    }
+
+
 def create_slack_tools(mcp: FastMCP) -> None:
     """Add Slack tools to the MCP server."""
 
@@ -216,7 +398,7 @@ def create_slack_tools(mcp: FastMCP) -> None:
             }
 
     @mcp.tool(tags={"slack", "messages", "history"})
-    def read_slack_messages(
+    async def read_slack_messages(
         channel: str = Field(
             ...,
             description="Channel name (with or without #) or channel ID",
@@ -238,22 +420,41 @@ def create_slack_tools(mcp: FastMCP) -> None:
         Read messages from a Slack channel.
 
         Returns messages from the specified channel within the date range.
+        Thread replies are fetched concurrently and reused while a thread
+        has no new replies.
         Bot must be a member of the channel.
         Requires QuickCall authentication with Slack connected.
         """
         try:
-            client = _get_client()
+            client = await asyncio.to_thread(_get_client)
+
+            # Resolve once; every later call gets the ID
+            channel_id = await asyncio.to_thread(client.resolve_channel, channel)
 
             # Calculate oldest timestamp
             oldest_dt = datetime.now(timezone.utc) - timedelta(days=days)
             oldest_ts = str(oldest_dt.timestamp())
 
-            messages = client.get_channel_messages(
-                channel=channel,
+            messages = await asyncio.to_thread(
+                client.get_channel_messages,
+                channel=channel_id,
                 oldest=oldest_ts,
                 limit=limit,
             )
 
+            # Fetch thread replies if include_threads is True
+            threads = {}
+            if include_threads:
+                threads = await client.fetch_thread_replies(
+                    channel_id,
+                    [
+                        (msg.ts, msg.latest_reply)
+                        for msg in messages
+                        if msg.has_thread and msg.reply_count > 0
+                    ],
+                    limit=50,
+                )
+
             result_messages = []
             for msg in messages:
                 msg_data = {
@@ -264,27 +465,23 @@ def create_slack_tools(mcp: FastMCP) -> None:
                     "reply_count": msg.reply_count,
                 }
 
-                # Fetch thread replies if message has a thread and include_threads is True
-                if include_threads and msg.has_thread and msg.reply_count > 0:
-                    try:
-                        thread_replies = client.get_thread_replies(
-                            channel=channel,
-                            thread_ts=msg.ts,
-                            limit=50,
+                if msg.ts in threads:
+                    thread_replies = threads[msg.ts]
+                    if isinstance(thread_replies, Exception):
+                        logger.warning(
+                            f"Failed to fetch thread {msg.ts}: {thread_replies}"
                         )
-                        # Skip first message (it's the parent) and add replies
-                        msg_data["replies"] = [
-                            {
-                                "ts": reply.ts,
-                                "user": reply.user_name or reply.user,
-                                "text": reply.text,
-                            }
-                            for reply in thread_replies
-                            if reply.ts != msg.ts  # Skip parent message
-                        ]
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch thread {msg.ts}: {e}")
-                        msg_data["replies"] = []
+                        thread_replies = []
+                    # Skip first message (it's the parent) and add replies
+                    msg_data["replies"] = [
+                        {
+                            "ts": reply.ts,
+                            "user": reply.user_name or reply.user,
+                            "text": reply.text,
+                        }
+                        for reply in thread_replies
+                        if reply.ts != msg.ts  # Skip parent message
+                    ]
 
                 result_messages.append(msg_data)
 
@@ -303,6 +500,134 @@ def create_slack_tools(mcp: FastMCP) -> None:
         except Exception as e:
             raise ToolError(f"Failed to read Slack messages: {str(e)}")
 
+    @mcp.tool(tags={"slack", "messages", "digest"})
+    async def read_slack_digest(
+        channels: Optional[List[str]] = Field(
+            default=None,
+            description="Channel names (with or without #) or IDs. "
+            "Default: every channel the bot is a member of.",
+        ),
+        days: int = Field(
+            default=1,
+            description="Number of days to look back (default: 1)",
+        ),
+        limit_per_channel: int = Field(
+            default=100,
+            description="Maximum messages per channel (default: 100)",
+        ),
+        include_threads: bool = Field(
+            default=True,
+            description="Fetch thread replies for messages with threads (default: true)",
+        ),
+    ) -> dict:
+        """
+        Read recent messages from several Slack channels in one call.
+
+        Channels are fetched concurrently and user names resolved once for
+        all of them. Use this instead of calling read_slack_messages per
+        channel for multi-channel summaries.
+
+        Output is size-bounded: long messages are clipped and each channel
+        with messages gets an equal share of the text budget, newest first.
+        'omitted' counts messages left out; use read_slack_messages on a
+        channel for more.
+        Requires QuickCall authentication with Slack connected.
+        """
+        try:
+            client = await asyncio.to_thread(_get_client)
+
+            if channels:
+                lookups = await asyncio.to_thread(client.resolve_channels, channels)
+                resolved: Dict[str, str] = {
+                    channel: channel_id
+                    for channel, channel_id in lookups.items()
+                    if isinstance(channel_id, str)
+                }
+                errors = {
+                    channel: str(e)
+                    for channel, e in lookups.items()
+                    if not isinstance(e, str)
+                }
+            else:
+                member_channels = await asyncio.to_thread(
+                    client.list_channels, limit=None
+                )
+                resolved = {
+                    f"#{ch.name}": ch.id for ch in member_channels if ch.is_member
+                }
+                errors = {}
+
+            oldest_dt = datetime.now(timezone.utc) - timedelta(days=days)
+            histories = await client.fetch_channel_histories(
+                list(resolved.values()),
+                oldest=str(oldest_dt.timestamp()),
+                limit=limit_per_channel,
+            )
+
+            fetched = {
+                channel_id: messages
+                for channel_id, messages in histories.items()
+                if not isinstance(messages, Exception)
+            }
+
+            threads: Dict[str, Dict[str, Any]] = {}
+            if include_threads:
+                replies = await asyncio.gather(
+                    *(
+                        client.fetch_thread_replies(
+                            channel_id,
+                            [
+                                (msg.ts, msg.latest_reply)
+                                for msg in messages
+                                if msg.has_thread and msg.reply_count > 0
+                            ],
+                            limit=DIGEST_REPLY_LIMIT,
+                        )
+                        for channel_id, messages in fetched.items()
+                    )
+                )
+                threads = dict(zip(fetched, replies))
+
+            for channel, channel_id in resolved.items():
+                if channel_id not in fetched:
+                    errors[channel] = str(histories[channel_id])
+
+            # Only channels with messages share the text budget
+            active = {
+                channel: channel_id
+                for channel, channel_id in resolved.items()
+                if fetched.get(channel_id)
+            }
+            budget = DIGEST_MAX_CHARS // max(len(active), 1)
+            digest = []
+            for channel, channel_id in active.items():
+                messages = fetched[channel_id]
+                digest.append(
+                    {
+                        "channel": channel,
+                        "channel_id": channel_id,
+                        **_digest_channel(
+                            messages, threads.get(channel_id, {}), budget
+                        ),
+                    }
+                )
+
+            result = {
+                "days": days,
+                "channels_read": len(fetched),
+                "total_messages": sum(entry["count"] for entry in digest),
+                "channels": digest,
+            }
+            if errors:
+                result["errors"] = errors
+            return result
+        except ToolError:
+            raise
+        except SlackAPIError as e:
+            raise ToolError(str(e))
+        except Exception as e:
+            raise ToolError(f"Failed to read Slack digest: {str(e)}")
+
     @mcp.tool(tags={"slack", "messages", "threads"})
     def read_slack_thread(
         channel: str = Field(
@@ -357,3 +682,122 @@ def create_slack_tools(mcp: FastMCP) -> None:
             raise ToolError(str(e))
         except Exception as e:
             raise ToolError(f"Failed to read Slack thread: {str(e)}")
+
+    @mcp.tool(tags={"slack", "messages", "history", "export"})
+    async def export_slack_history(
+        channel: str = Field(
+            ...,
+            description="Channel name (with or without #) or channel ID",
+        ),
+        days: int = Field(
+            default=7,
+            description="Number of days to look back (default: 7). "
+            "Ignored when start_date is set.",
+        ),
+        start_date: Optional[str] = Field(
+            default=None,
+            description="Start of the range, YYYY-MM-DD (UTC, inclusive)",
+        ),
+        end_date: Optional[str] = Field(
+            default=None,
+            description="End of the range, YYYY-MM-DD (UTC, inclusive). "
+            "Defaults to now.",
+        ),
+    ) -> dict:
+        """
+        Export a channel's full history for a date range to a file.
+
+        Use for weekly summaries or busy channels where read_slack_messages
+        would truncate. Every page is fetched and streamed to a JSONL file
+        (newest first); only a compact index comes back.
+
+        Returns:
+        - file_path: JSONL file, one message per line
+        - index: per-day {date, offset, count}, top_users, top_threads
+        - count: total messages
+
+        Workflow:
+        1. Call this tool → get file_path and index
+        2. Call read_slack_export(file_path, offset, count) for the slices
+           you need (e.g. one day from the index)
+        3. Call read_slack_thread for threads worth expanding
+        """
+        try:
+            if start_date:
+                oldest_dt = _parse_date(start_date, "start_date")
+            else:
+                oldest_dt = datetime.now(timezone.utc) - timedelta(days=days)
+            latest = None
+            if end_date:
+                end_dt = _parse_date(end_date, "end_date") + timedelta(days=1)
+                latest = str(end_dt.timestamp())
+
+            client = await asyncio.to_thread(_get_client)
+            channel_id = await asyncio.to_thread(client.resolve_channel, channel)
+
+            result = await asyncio.to_thread(
+                _export_history,
+                client,
+                channel_id,
+                str(oldest_dt.timestamp()),
+                latest,
+            )
+            return {
+                "channel": channel,
+                "channel_id": channel_id,
+                "period": {
+                    "start": oldest_dt.isoformat(timespec="seconds"),
+                    "end": end_date or "now",
+                },
+                **result,
+                "next_step": "Call read_slack_export(file_path, offset, count) "
+                "for the days or ranges you need.",
+            }
+        except ToolError:
+            raise
+        except SlackAPIError as e:
+            raise ToolError(str(e))
+        except ValueError as e:
+            raise ToolError(str(e))
+        except Exception as e:
+            raise ToolError(f"Failed to export Slack history: {str(e)}")
+
+    @mcp.tool(tags={"slack", "messages", "history", "export"})
+    def read_slack_export(
+        file_path: str = Field(
+            ...,
+            description="Path to the export file from export_slack_history",
+        ),
+        offset: int = Field(
+            default=0,
+            description="Line to start from (offsets come from the export index)",
+        ),
+        count: int = Field(
+            default=50,
+            description=f"Messages to return (default: 50, max: {EXPORT_SLICE_MAX})",
+        ),
+    ) -> dict:
+        """
+        Read a slice of messages from a Slack history export.
+
+        Call this after export_slack_history. Reads from the file - no API
+        calls made.
+        """
+        count = max(0, min(count, EXPORT_SLICE_MAX))
+        try:
+            with open(file_path) as f:
+                messages = [
+                    json.loads(line)
+                    for line in islice(f, max(offset, 0), max(offset, 0) + count)
+                ]
+            return {
+                "offset": offset,
+                "count": len(messages),
+                "messages": messages,
+            }
+        except FileNotFoundError:
+            raise ToolError(f"Slack export file not found: {file_path}")
+        except json.JSONDecodeError:
+            raise ToolError(f"Invalid JSON in Slack export file: {file_path}")
+        except Exception as e:
+            raise ToolError(f"Failed to read Slack export: {str(e)}")
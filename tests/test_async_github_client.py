@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Test AsyncGitHubClient and the async GitHub tools.
+
+Tests:
+1. list_prs/list_branches run natively on httpx.AsyncClient
+2. fetch_prs_batch keeps input order and reports missing PRs
+3. Concurrent calls overlap instead of running one after another
+4. PyGithub-only operations are delegated to a worker thread
+5. GitHub tools are coroutines and serve concurrent calls in parallel
+6. A rotated token closes the replaced clients once their callers finish
+7. Concurrent cold starts build one client and never close it under a caller
+
+Usage:
+    uv run python tests/test_async_github_client.py
+"""
+
+import asyncio
+import gc
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+
+
+def _make_clients(handler):
+    """Create a GitHubClient and an AsyncGitHubClient sharing a mock transport."""
+    from mcp_server.api_clients.async_github_client import AsyncGitHubClient
+    from mcp_server.api_clients.github_client import GitHubClient
+
+    transport = httpx.MockTransport(handler)
+    client = GitHubClient(
+        token="fake-token",
+        default_owner="test-org",
+        default_repo="test-repo",
+        installation_id=123,
+        transport=transport,
+    )
+    return client, AsyncGitHubClient.from_client(client, transport=transport)
+
+
+def _pr_node(number: int) -> dict:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "state": "OPEN",
+        "author": {"login": "alice"},
+        "createdAt": "2024-01-01T00:00:00Z",
+        "mergedAt": None,
+        "url": f"https://github.com/test-org/test-repo/pull/{number}",
+        "body": "",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "headRefName": f"feature-{number}",
+        "baseRefName": "main",
+        "additions": 10,
+        "deletions": 2,
+        "changedFiles": 3,
+        "commits": {"totalCount": 4},
+        "isDraft": False,
+        "mergeable": "UNKNOWN",
+        "labels": {"nodes": []},
+        "reviewRequests": {"nodes": []},
+    }
+
+
+def _branches_handler(delay: float = 0.0):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay)
+        return httpx.Response(
+            200, json=[{"name": "main", "commit": {"sha": "abc"}, "protected": True}]
+        )
+
+    return handler
+
+
+def test_native_async_listing():
+    """Test that listings go through the async HTTP client."""
+    print("\n=== Test 1: native async listing ===")
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/graphql":
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "repository": {
+                            "pullRequests": {
+                                "pageInfo": {"hasNextPage": False},
+                                "nodes": [_pr_node(1), _pr_node(2)],
+                            }
+                        }
+                    }
+                },
+            )
+        return httpx.Response(
+            200, json=[{"name": "main", "commit": {"sha": "abc"}, "protected": True}]
+        )
+
+    _, client = _make_clients(handler)
+
+    async def run():
+        prs = await client.list_prs(detail_level="full")
+        branches = await client.list_branches()
+        await client.aclose()
+        return prs, branches
+
+    prs, branches = asyncio.run(run())
+    assert [pr.number for pr in prs] == [1, 2]
+    assert prs[0].additions == 10
+    assert branches == [{"name": "main", "sha": "abc", "protected": True}]
+
+    print("✅ GraphQL and REST listings awaited")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_fetch_prs_batch():
+    """Test batched fetch ordering and per-PR errors."""
+    print("\n=== Test 2: fetch_prs_batch ===")
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        variables = body["variables"]
+        data, errors = {}, []
+        for key, number in variables.items():
+            if not key.startswith("n"):
+                continue
+            alias = f"pr{key[1:]}"
+            if number == 13:
+                data[alias] = {"pullRequest": None}
+                errors.append({"type": "NOT_FOUND", "path": [alias, "pullRequest"]})
+            else:
+                data[alias] = {"pullRequest": _pr_node(number)}
+        return httpx.Response(200, json={"data": data, "errors": errors})
+
+    _, client = _make_clients(handler)
+    refs = [
+        {"owner": "test-org", "repo": "test-repo", "number": n} for n in range(1, 21)
+    ]
+
+    prs, errors = asyncio.run(client.fetch_prs_batch(refs, batch_size=7))
+
+    assert [pr["number"] for pr in prs] == [n for n in range(1, 21) if n != 13]
+    assert errors == [
+        {
+            "owner": "test-org",
+            "repo": "test-repo",
+            "number": 13,
+            "error": "PR not found",
+        }
+    ]
+
+    print(f"✅ {len(prs)} PRs in order, 1 not found")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_concurrent_calls_overlap():
+    """Test that awaiting several calls together doesn't serialize them."""
+    print("\n=== Test 3: concurrent calls overlap ===")
+
+    _, client = _make_clients(_branches_handler(delay=0.2))
+
+    async def run():
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(client.list_branches(repo=f"repo-{i}") for i in range(5))
+        )
+        return results, time.perf_counter() - start
+
+    results, elapsed = asyncio.run(run())
+    assert len(results) == 5
+    assert elapsed < 0.6, f"5 x 0.2s calls took {elapsed:.2f}s, expected overlap"
+
+    print(f"✅ 5 calls finished in {elapsed:.2f}s")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_delegated_methods_use_thread():
+    """Test that sync-only operations run off the event loop."""
+    print("\n=== Test 4: delegated methods ===")
+
+    sync_client, client = _make_clients(_branches_handler())
+    loop_thread = threading.get_ident()
+    seen = {}
+
+    def fake_get_issue(issue_number, owner=None, repo=None):
+        seen["thread"] = threading.get_ident()
+        return {"number": issue_number}
+
+    with patch.object(sync_client, "get_issue", fake_get_issue):
+        issue = asyncio.run(client.get_issue(5, owner="o", repo="r"))
+
+    assert issue == {"number": 5}
+    assert seen["thread"] != loop_thread
+    assert client.default_owner == "test-org"
+
+    print("✅ get_issue ran in a worker thread")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_tools_are_async():
+    """Test that tools await the client and run concurrently."""
+    print("\n=== Test 5: async tools ===")
+
+    from fastmcp import Client, FastMCP
+
+    from mcp_server.tools import github_tools
+
+    sync_client, async_client = _make_clients(_branches_handler(delay=0.2))
+    mcp = FastMCP("test")
+    github_tools.create_github_tools(mcp)
+
+    async def run():
+        async with Client(mcp) as mcp_client:
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(
+                    mcp_client.call_tool("list_branches", {"repo": f"repo-{i}"})
+                    for i in range(4)
+                )
+            )
+            return results, time.perf_counter() - start
+
+    with (
+        patch.object(github_tools, "_get_client", return_value=sync_client),
+        patch.object(github_tools, "_async_client_cache", (sync_client, async_client)),
+    ):
+        results, elapsed = asyncio.run(run())
+
+    assert len(results) == 4
+    assert elapsed < 0.6, f"4 x 0.2s tool calls took {elapsed:.2f}s"
+
+    print(f"✅ 4 tool calls finished in {elapsed:.2f}s")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_rotated_token_closes_clients():
+    """Test that replaced clients stay open for their callers, then close."""
+    print("\n=== Test 6: Token rotation closes old clients ===")
+
+    from mcp_server.tools import github_tools
+
+    tokens = iter(["ghp_first", "ghp_second"])
+
+    async def run():
+        first = await github_tools._get_async_client()
+        second = await github_tools._get_async_client()
+        assert first is not second
+        assert github_tools._async_client_cache[1] is second
+
+        # A call still holding the old client can keep using it
+        sync_http, async_http = first.sync_client._http, first._http
+        assert not sync_http.is_closed and not async_http.is_closed
+
+        del first
+        gc.collect()
+        await asyncio.sleep(0.05)  # let the scheduled aclose run
+        assert sync_http.is_closed, "Old sync client left open"
+        assert async_http.is_closed, "Old async client left open"
+        return second
+
+    with (
+        patch.object(
+            github_tools, "get_github_pat", side_effect=lambda: (next(tokens), "env")
+        ),
+        patch.object(github_tools, "get_github_pat_username", return_value="alice"),
+        patch.object(github_tools, "get_http_cache", return_value=None),
+        patch.object(github_tools, "_client_cache", None),
+        patch.object(github_tools, "_async_client_cache", None),
+    ):
+        second = asyncio.run(run())
+
+    assert not second.sync_client._http.is_closed
+    second.sync_client.close()
+
+    print("✅ Old clients served their callers, closed once dropped")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_concurrent_cold_start():
+    """Test that racing _get_client calls share one open client."""
+    print("\n=== Test 7: concurrent cold start ===")
+
+    from mcp_server.tools import github_tools
+
+    real_client = github_tools.GitHubClient
+    built = []
+
+    def slow_client(**kwargs):
+        time.sleep(0.05)
+        client = real_client(**kwargs)
+        built.append(client)
+        return client
+
+    results = []
+    with (
+        patch.object(github_tools, "get_github_pat", return_value=("ghp_x", "env")),
+        patch.object(github_tools, "get_github_pat_username", return_value="alice"),
+        patch.object(github_tools, "get_http_cache", return_value=None),
+        patch.object(github_tools, "GitHubClient", side_effect=slow_client),
+        patch.object(github_tools, "_client_cache", None),
+    ):
+        threads = [
+            threading.Thread(target=lambda: results.append(github_tools._get_client()))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert len(built) == 1, f"{len(built)} clients built"
+    assert all(client is built[0] for client in results)
+    assert not built[0]._http.is_closed
+    built[0].close()
+
+    print("✅ 4 racing calls got the same open client")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Async GitHub Client Tests")
+    print("=" * 60)
+
+    tests = [
+        test_native_async_listing,
+        test_fetch_prs_batch,
+        test_concurrent_calls_overlap,
+        test_delegated_methods_use_thread,
+        test_tools_are_async,
+        test_rotated_token_closes_clients,
+        test_concurrent_cold_start,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
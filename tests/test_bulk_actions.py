@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Test concurrent bulk actions in manage_issues and manage_prs.
+
+Tests:
+1. Closing 40 issues runs BULK_CONCURRENCY at a time, not serially
+2. Results keep input order and failures don't abort the batch
+3. Each PyGithub request is claimed from the core budget once, and waits
+   for a spent budget to reset
+4. An argument error cancels entries that haven't started
+
+Usage:
+    uv run python tests/test_bulk_actions.py
+"""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+from github import GithubException
+
+
+def _make_clients():
+    from mcp_server.api_clients.async_github_client import AsyncGitHubClient
+    from mcp_server.api_clients.github_client import GitHubClient
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError(f"Unexpected request: {request.url}")
+
+    transport = httpx.MockTransport(handler)
+    client = GitHubClient(
+        token="fake-token",
+        default_owner="test-org",
+        default_repo="test-repo",
+        installation_id=123,
+        transport=transport,
+    )
+    return client, AsyncGitHubClient.from_client(client, transport=transport)
+
+
+async def _call_tool(sync_client, async_client, name: str, arguments: dict) -> dict:
+    from fastmcp import Client, FastMCP
+
+    from mcp_server.tools import github_tools
+
+    mcp = FastMCP("test")
+    github_tools.create_github_tools(mcp)
+    with (
+        patch.object(github_tools, "_get_client", return_value=sync_client),
+        patch.object(github_tools, "_async_client_cache", (sync_client, async_client)),
+    ):
+        async with Client(mcp) as mcp_client:
+            result = await mcp_client.call_tool(name, arguments)
+    return json.loads(result.content[0].text)
+
+
+def test_bulk_close_is_concurrent():
+    """Test that 40 closes overlap, bounded by BULK_CONCURRENCY."""
+    print("\n=== Test 1: bulk close runs concurrently ===")
+
+    from mcp_server.tools.github_tools import BULK_CONCURRENCY
+
+    sync_client, async_client = _make_clients()
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+    stamps = []
+
+    def fake_close(issue_number, owner=None, repo=None):
+        with lock:
+            stamps.append(time.perf_counter())
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        time.sleep(0.05)
+        with lock:
+            in_flight["now"] -= 1
+            stamps.append(time.perf_counter())
+        return {"number": issue_number}
+
+    with patch.object(sync_client, "close_issue", fake_close):
+        data = asyncio.run(
+            _call_tool(
+                sync_client,
+                async_client,
+                "manage_issues",
+                {"action": "close", "issue_numbers": list(range(1, 41))},
+            )
+        )
+    elapsed = max(stamps) - min(stamps)
+
+    assert data["count"] == 40
+    assert all(r["status"] == "closed" for r in data["results"])
+    assert in_flight["peak"] == BULK_CONCURRENCY, in_flight
+    assert elapsed < 40 * 0.05 / 2, f"Took {elapsed:.2f}s, expected overlap"
+
+    print(f"✅ 40 closes in {elapsed:.2f}s, peak {in_flight['peak']} in flight")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_order_and_partial_failures():
+    """Test that one failing PR doesn't abort the rest."""
+    print("\n=== Test 2: ordered partial results ===")
+
+    sync_client, async_client = _make_clients()
+
+    def fake_add_labels(pr_number, labels, owner=None, repo=None):
+        # Finish in reverse order to check ordering
+        time.sleep(0.01 * (6 - pr_number))
+        if pr_number == 3:
+            raise GithubException(404, {"message": "Not Found"})
+        return {"labels": labels}
+
+    with patch.object(sync_client, "add_pr_labels", fake_add_labels):
+        data = asyncio.run(
+            _call_tool(
+                sync_client,
+                async_client,
+                "manage_prs",
+                {
+                    "action": "add_labels",
+                    "pr_numbers": [1, 2, 3, 4, 5],
+                    "labels": ["stale"],
+                },
+            )
+        )
+
+    results = data["results"]
+    assert [r["number"] for r in results] == [1, 2, 3, 4, 5]
+    assert results[2]["status"] == "error"
+    assert "GitHub API error (404): Not Found" in results[2]["error"]
+    assert [r["status"] for r in results if r["number"] != 3] == ["labels_added"] * 4
+
+    print("✅ 4 labelled, 1 error reported in place")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_bulk_respects_budget():
+    """Test that PyGithub requests draw from the limiter, once each."""
+    print("\n=== Test 3: bulk actions wait for budget ===")
+
+    sync_client, async_client = _make_clients()
+    limiter = async_client.rate_limiter
+    budget = limiter._budgets["core"]
+
+    def fake_reopen(number, owner=None, repo=None):
+        # get_issue + edit: PyGithub authenticates each request it sends
+        for _ in range(2):
+            sync_client.gh.requester.auth.authentication({})
+        return {}
+
+    with patch.object(sync_client, "reopen_issue", fake_reopen):
+        used = budget.used
+        data = asyncio.run(
+            _call_tool(
+                sync_client,
+                async_client,
+                "manage_issues",
+                {"action": "reopen", "issue_numbers": [1, 2, 3]},
+            )
+        )
+        assert budget.used - used == 6, f"Claimed {budget.used - used}, sent 6"
+
+        budget.remaining = 0
+        budget.reset_at = time.time() + 0.3
+        start = time.perf_counter()
+        data = asyncio.run(
+            _call_tool(
+                sync_client,
+                async_client,
+                "manage_issues",
+                {"action": "reopen", "issue_numbers": [7, 8]},
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+    assert [r["status"] for r in data["results"]] == ["reopened", "reopened"]
+    assert elapsed >= 0.25, f"Expected to wait for the reset, took {elapsed:.2f}s"
+
+    print(f"✅ One claim per request, waited {elapsed:.2f}s for the core budget")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_argument_error_cancels_rest():
+    """Test that a ValueError stops entries that haven't started yet."""
+    print("\n=== Test 4: argument errors cancel the batch ===")
+
+    from mcp_server.tools.github_tools import BULK_CONCURRENCY
+
+    sync_client, async_client = _make_clients()
+    started = []
+
+    def fake_close(issue_number, owner=None, repo=None):
+        started.append(issue_number)
+        if issue_number == 1:
+            raise ValueError("Repository owner and name must be specified")
+        time.sleep(0.05)
+        return {}
+
+    async def run():
+        try:
+            await _call_tool(
+                sync_client,
+                async_client,
+                "manage_issues",
+                {"action": "close", "issue_numbers": list(range(1, 21))},
+            )
+            raise AssertionError("Expected the tool to fail")
+        except Exception as e:
+            assert "must be specified" in str(e), e
+        # Nothing keeps going in the background
+        await asyncio.sleep(0.2)
+
+    with patch.object(sync_client, "close_issue", fake_close):
+        asyncio.run(run())
+
+    assert len(started) <= BULK_CONCURRENCY, f"{len(started)} closes started"
+
+    print(f"✅ Only {len(started)} of 20 closes started")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Bulk Action Tests")
+    print("=" * 60)
+
+    tests = [
+        test_bulk_close_is_concurrent,
+        test_order_and_partial_failures,
+        test_bulk_respects_budget,
+        test_argument_error_cancels_rest,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
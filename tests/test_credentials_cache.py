@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Test the API credential cache in CredentialStore.
+
+Tests:
+1. Repeated get_api_credentials calls within the TTL hit the network once
+2. Expired cache entries are refetched
+3. invalidate_api_credentials forces a refetch (e.g. after a 401)
+4. GitHub token expiry caps the cache lifetime
+5. Background refresh keeps returning cached credentials
+6. A PyGithub BadCredentialsException in a tool invalidates the cache
+
+Usage:
+    uv run python tests/test_credentials_cache.py
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from mcp_server.auth import credentials
+from mcp_server.auth.credentials import CredentialStore, StoredCredentials
+
+REAL_CLIENT = httpx.Client
+
+
+def _credentials_payload(token: str = "ghs_token", expires_at: str = None) -> dict:
+    github = {
+        "connected": True,
+        "token": token,
+        "username": "testuser",
+        "installation_id": 42,
+    }
+    if expires_at:
+        github["expires_at"] = expires_at
+    return {
+        "user": {"user_id": "u1", "email": "test@example.com"},
+        "github": github,
+        "slack": {"connected": True, "bot_token": "xoxb-test"},
+    }
+
+
+class _FakeAPI:
+    """Counts credential fetches and serves a configurable payload."""
+
+    def __init__(self, payload: dict):
+        self.payload = payload
+        self.calls = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        return httpx.Response(200, json=self.payload)
+
+    def client_factory(self, **kwargs):
+        return REAL_CLIENT(transport=httpx.MockTransport(self.handler), **kwargs)
+
+
+def _make_store() -> CredentialStore:
+    with patch.object(CredentialStore, "_load", lambda self: None):
+        store = CredentialStore(api_url="http://quickcall.test")
+    store._stored = StoredCredentials(device_token="qt_test", user_id="u1")
+    return store
+
+
+def test_cache_hit_within_ttl():
+    """Test that repeated calls within the TTL don't refetch."""
+    print("\n=== Test 1: cache hit within TTL ===")
+
+    api = _FakeAPI(_credentials_payload())
+    store = _make_store()
+
+    with patch.object(credentials.httpx, "Client", api.client_factory):
+        first = store.get_api_credentials()
+        second = store.get_api_credentials()
+        third = store.get_api_credentials()
+
+    assert first.github_token == "ghs_token"
+    assert first is second is third, "Cached credentials should be reused"
+    assert api.calls == 1, f"Expected 1 fetch, got {api.calls}"
+
+    print(f"✅ 3 calls, {api.calls} network fetch")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_expired_cache_refetches():
+    """Test that credentials past the TTL are fetched again."""
+    print("\n=== Test 2: expired cache refetches ===")
+
+    api = _FakeAPI(_credentials_payload())
+    store = _make_store()
+
+    with patch.object(credentials.httpx, "Client", api.client_factory):
+        store.get_api_credentials()
+        # Pretend the cache was filled long ago
+        store._api_creds_fetched_at -= store._api_creds_ttl + 1
+        store.get_api_credentials()
+
+    assert api.calls == 2, f"Expected 2 fetches, got {api.calls}"
+
+    print("✅ Expired credentials refetched")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_invalidate_forces_refetch():
+    """Test that invalidation (e.g. on 401) drops the cache."""
+    print("\n=== Test 3: invalidate forces refetch ===")
+
+    api = _FakeAPI(_credentials_payload(token="ghs_old"))
+    store = _make_store()
+
+    with patch.object(credentials.httpx, "Client", api.client_factory):
+        assert store.get_api_credentials().github_token == "ghs_old"
+
+        api.payload = _credentials_payload(token="ghs_new")
+        store.invalidate_api_credentials()
+        refreshed = store.get_api_credentials()
+
+    assert refreshed.github_token == "ghs_new", "Should pick up the new token"
+    assert api.calls == 2, f"Expected 2 fetches, got {api.calls}"
+
+    print("✅ Invalidated credentials refetched")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_token_expiry_caps_cache():
+    """Test that a nearly-expired GitHub token is not served from cache."""
+    print("\n=== Test 4: token expiry caps cache lifetime ===")
+
+    expires_at = (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat()
+    api = _FakeAPI(_credentials_payload(expires_at=expires_at))
+    store = _make_store()
+
+    with patch.object(credentials.httpx, "Client", api.client_factory):
+        store.get_api_credentials()
+        store.get_api_credentials()
+
+    assert api.calls == 2, "Token expiring within 60s should not be cached"
+
+    print("✅ Expiring token refetched")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_background_refresh_serves_cached():
+    """Test that late-window calls return cached creds and refresh in background."""
+    print("\n=== Test 5: background refresh ===")
+
+    api = _FakeAPI(_credentials_payload(token="ghs_old"))
+    store = _make_store()
+
+    with patch.object(credentials.httpx, "Client", api.client_factory):
+        cached = store.get_api_credentials()
+
+        # Move into the background refresh window (past soft, before hard deadline)
+        store._api_creds_fetched_at -= store._api_creds_ttl * 0.9
+        api.payload = _credentials_payload(token="ghs_new")
+
+        served = store.get_api_credentials()
+        assert served is cached, "Should serve cached creds while refreshing"
+
+        store._refresh_thread.join(timeout=5)
+
+    assert api.calls == 2, f"Expected background fetch, got {api.calls} calls"
+    assert store.get_api_credentials().github_token == "ghs_new"
+    assert time.monotonic() - store._api_creds_fetched_at < 5
+
+    print("✅ Cached creds served, refreshed in background")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_bad_credentials_invalidate():
+    """Test that tools invalidate credentials on PyGithub's 401."""
+    print("\n=== Test 6: BadCredentialsException invalidates ===")
+
+    from fastmcp import Client, FastMCP
+    from fastmcp.exceptions import ToolError
+    from github import BadCredentialsException
+
+    from mcp_server.tools import github_tools
+
+    class _RejectedClient:
+        async def list_repos(self, limit=20):
+            raise BadCredentialsException(401, {"message": "Bad credentials"})
+
+    async def get_client():
+        return _RejectedClient()
+
+    async def call():
+        mcp = FastMCP("test")
+        github_tools.create_github_tools(mcp)
+        async with Client(mcp) as client:
+            try:
+                await client.call_tool("list_repos", {})
+                raise AssertionError("Expected ToolError")
+            except ToolError as e:
+                assert "Bad credentials" in str(e)
+
+    store = MagicMock()
+    with (
+        patch.object(github_tools, "_get_async_client", get_client),
+        patch.object(github_tools, "get_credential_store", return_value=store),
+    ):
+        with patch.object(github_tools, "_using_pat_mode", False):
+            asyncio.run(call())
+        assert store.invalidate_api_credentials.call_count == 1
+
+        # A rejected PAT has no cached credentials to drop
+        with patch.object(github_tools, "_using_pat_mode", True):
+            asyncio.run(call())
+        assert store.invalidate_api_credentials.call_count == 1
+
+    print("✅ App token rejection invalidated the cache, PAT left alone")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Credential Cache Tests")
+    print("=" * 60)
+
+    tests = [
+        test_cache_hit_within_ttl,
+        test_expired_cache_refetches,
+        test_invalidate_forces_refetch,
+        test_token_expiry_caps_cache,
+        test_background_refresh_serves_cached,
+        test_bad_credentials_invalidate,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Test size-budgeted diff compaction.
+
+Tests:
+1. High-churn files and hunks are kept whole, the rest reported as elided
+2. Files that don't fit are listed with their stats
+3. Output size follows the budget, not the size of the diff
+4. One huge file (a lockfile) doesn't crowd out many small ones
+
+Usage:
+    uv run python tests/test_diff_compactor.py
+"""
+
+from typing import List
+
+from mcp_server.tools.diff_compactor import ELIDED_FILES_LISTED, compact_diff
+
+
+def _file_diff(path: str, hunks: List[int]) -> List[str]:
+    """Diff lines for one file with one hunk per entry of added lines."""
+    lines = [
+        f"diff --git a/{path} b/{path}",
+        "index 1111111..2222222 100644",
+        f"--- a/{path}",
+        f"+++ b/{path}",
+    ]
+    for i, added in enumerate(hunks):
+        start = i * 1000 + 1
+        lines.append(f"@@ -{start},3 +{start},{3 + added} @@ def f{i}():")
+        lines.append("     context")
+        lines.extend(f"+    {path} hunk {i} line {n}" for n in range(added))
+        lines.append("     context")
+    return lines
+
+
+def test_keeps_top_hunks_whole():
+    """Test that big hunks win and small ones are counted, never cut."""
+    print("\n=== Test 1: top hunks kept whole ===")
+
+    diff = _file_diff("a_small.py", [2]) + _file_diff("z_big.py", [3, 40, 5, 60])
+    result = compact_diff(diff, budget=6000)
+    patch = result["patch"]
+
+    # Ranked by churn: the big file comes first despite sorting after
+    assert patch.index("diff --git a/z_big.py") < patch.index("diff --git a/a_small.py")
+    assert "index 1111111" not in patch
+    for i, added in [(1, 40), (3, 60)]:
+        hunk_lines = [line for line in patch.split("\n") if f"hunk {i} line" in line]
+        assert len(hunk_lines) == added, f"Hunk {i} cut"
+    assert "a_small.py hunk 0 line 1" in patch
+    assert result["files_shown"] == 2
+    assert len(patch) <= 6000
+
+    # Tighter budget: the top hunk stays whole, one that no longer fits goes
+    result = compact_diff(diff, budget=3500)
+    assert "z_big.py hunk 3 line 59" in result["patch"]
+    assert "z_big.py hunk 1" not in result["patch"]
+    assert "... (1 more hunks elided, 40 changed lines)" in result["patch"]
+    assert result["elided"]["hunks"] == 1
+    assert len(result["patch"]) <= 3500
+
+    print("✅ Highest-churn hunks kept whole, elided hunks counted")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_elided_files_listed():
+    """Test that files past the budget are listed, not silently dropped."""
+    print("\n=== Test 2: elided files ===")
+
+    diff = []
+    for i in range(50):
+        diff += _file_diff(f"pkg/mod{i:02d}.py", [i + 1])
+    result = compact_diff(diff, budget=4000)
+
+    elided = result["elided"]
+    assert result["files_changed"] == 50
+    assert result["files_shown"] + elided["files"] == 50
+    assert elided["files"] > 0
+    # Highest churn shown, the rest listed from the most changed down
+    assert "pkg/mod49.py" in result["patch"]
+    assert "pkg/mod00.py" not in result["patch"]
+    listed = [f["additions"] for f in elided["file_list"]]
+    assert listed == sorted(listed, reverse=True)
+    assert len(listed) == min(elided["files"], ELIDED_FILES_LISTED)
+    assert elided["lines"] >= sum(range(1, elided["files"] + 1))
+
+    print(f"✅ {result['files_shown']} files shown, {elided['files']} listed as elided")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_size_follows_budget():
+    """Test that a 100x bigger diff doesn't make the output bigger."""
+    print("\n=== Test 3: size follows the budget ===")
+
+    sizes = {}
+    for files in [5, 500]:
+        diff = []
+        for i in range(files):
+            diff += _file_diff(f"src/f{i}.py", [30, 10, 80])
+        for budget in [5000, 20000]:
+            result = compact_diff(iter(diff), budget=budget)
+            assert len(result["patch"]) <= budget
+            sizes[(files, budget)] = len(result["patch"])
+
+    assert sizes[(500, 20000)] > 2 * sizes[(500, 5000)]
+    assert sizes[(500, 20000)] > 0.8 * 20000
+
+    print(f"✅ Output sizes by (files, budget): {sizes}")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_skewed_churn():
+    """Test that a 4000-line lockfile leaves room for 20 small files."""
+    print("\n=== Test 4: skewed churn ===")
+
+    diff = _file_diff("package-lock.json", [4000])
+    for i in range(20):
+        diff += _file_diff(f"src/mod{i:02d}.py", [5 + i % 4, 3])
+    result = compact_diff(diff, budget=20000)
+    patch = result["patch"]
+
+    assert result["files_shown"] == 21
+    assert result["elided"]["files"] == 0
+    for i in range(20):
+        added = 5 + i % 4
+        assert f"src/mod{i:02d}.py hunk 0 line {added - 1}" in patch
+        assert f"src/mod{i:02d}.py hunk 1 line 2" in patch
+    # The lockfile gets what the small files leave, cut inside its hunk
+    assert "package-lock.json hunk 0 line 0" in patch
+    assert "more changed lines in this hunk" in patch
+    assert len(patch) <= 20000
+
+    print("✅ All 20 small files shown whole next to the lockfile")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Diff Compactor Tests")
+    print("=" * 60)
+
+    tests = [
+        test_keeps_top_hunks_whole,
+        test_elided_files_listed,
+        test_size_follows_budget,
+        test_skewed_churn,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Test the local git tools against throwaway repositories.
+
+Tests:
+1. git log -z parsing survives '|' and newlines, and attaches numstat
+2. get_local_contributions reads history in a single git log pass
+3. Output budgets stop reading and kill git
+4. get_updates compacts the patch to its budget, stats stay complete
+5. Repeat queries are answered from the history index
+6. The index only returns commits reachable from HEAD
+7. Multi-repo updates discover checkouts and collect them concurrently
+8. Active repositories share one patch budget; checkouts are deduped
+
+Usage:
+    uv run python tests/test_git_tools.py
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from mcp_server.tools import git_index, git_tools
+
+
+def _git(repo: Path, *args: str, date: str = None) -> None:
+    env = None
+    if date:
+        env = {**os.environ, "GIT_AUTHOR_DATE": date, "GIT_COMMITTER_DATE": date}
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, env=env)
+
+
+def _make_repo(root: Path) -> Path:
+    """A repo whose author and messages contain the old '|' separator."""
+    repo = root / "repo"
+    repo.mkdir(parents=True)
+    _git(repo, "init", "-q")
+    _git(repo, "config", "user.name", "Ada | Lovelace")
+    _git(repo, "config", "user.email", "ada@example.com")
+
+    (repo / "engine.py").write_text("a\nb\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "feat: add engine | v1", "-m", "Line one\nLine two")
+
+    (repo / "engine.py").write_text("a\nc\nd\n")
+    (repo / "blob.bin").write_bytes(b"\x00\x01")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "fix: engine (#42)")
+
+    _git(repo, "mv", "engine.py", "core.py")
+    _git(repo, "commit", "-qm", "chore: rename")
+    return repo
+
+
+async def _call(tool: str, arguments: dict, index_dir: Path = None) -> dict:
+    """Call a git tool, keeping its history index out of the home directory."""
+    from fastmcp import Client, FastMCP
+
+    mcp = FastMCP("test")
+    git_tools.create_git_tools(mcp)
+    with tempfile.TemporaryDirectory() as tmp:
+        with (
+            patch.object(git_index, "GIT_INDEX_DIR", index_dir or Path(tmp)),
+            patch.dict(git_index._indexes, clear=True),
+        ):
+            async with Client(mcp) as client:
+                result = await client.call_tool(tool, arguments)
+    return json.loads(result.content[0].text)
+
+
+def _count_logs():
+    """Patch Popen to record the arguments of every git log it starts."""
+    real_popen = subprocess.Popen
+    calls = []
+
+    def popen(args, **kwargs):
+        if "log" in args:
+            calls.append(args)
+        return real_popen(args, **kwargs)
+
+    return patch.object(git_tools.subprocess, "Popen", side_effect=popen), calls
+
+
+def test_log_z_parsing():
+    """Test NUL-delimited parsing of names, subjects, bodies and stats."""
+    print("\n=== Test 1: git log -z parsing ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _make_repo(Path(tmp))
+        commits = list(git_tools._iter_log_z([], str(repo)))
+
+    assert [c["subject"] for c in commits] == [
+        "chore: rename",
+        "fix: engine (#42)",
+        "feat: add engine | v1",
+    ]
+    assert all(c["author"] == "Ada | Lovelace" for c in commits)
+    assert commits[2]["body"].strip() == "Line one\nLine two"
+    assert commits[2]["files"] == ["engine.py"]
+    assert (commits[2]["additions"], commits[2]["deletions"]) == (2, 0)
+    # Binary files count as touched with no line stats
+    assert sorted(commits[1]["files"]) == ["blob.bin", "engine.py"]
+    assert (commits[1]["additions"], commits[1]["deletions"]) == (2, 1)
+    # Renames report the new path
+    assert commits[0]["files"] == ["core.py"]
+
+    print("✅ 3 commits parsed with '|' in author and subject")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_contributions_single_pass():
+    """Test that get_local_contributions runs git log once."""
+    print("\n=== Test 2: contributions in a single pass ===")
+
+    real_popen = subprocess.Popen
+    real_run = subprocess.run
+    log_calls = []
+
+    def popen(args, **kwargs):
+        if "log" in args:
+            log_calls.append(args)
+        return real_popen(args, **kwargs)
+
+    def run(args, **kwargs):
+        if "log" in args:
+            log_calls.append(args)
+        return real_run(args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _make_repo(Path(tmp))
+        with (
+            patch.object(git_tools.subprocess, "Popen", side_effect=popen),
+            patch.object(git_tools.subprocess, "run", side_effect=run),
+        ):
+            data = asyncio.run(
+                _call("get_local_contributions", {"path": str(repo), "days": 30})
+            )
+
+    assert len(log_calls) == 1, log_calls
+    assert data["summary"]["total_commits"] == 3
+    assert data["summary"]["total_additions"] == 4
+    assert data["summary"]["total_deletions"] == 1
+    assert data["summary"]["files_touched"] == 3
+    assert data["summary"]["unique_prs"] == 1
+    fix = data["commits"][1]
+    assert fix["pr_number"] == 42
+    assert (fix["additions"], fix["deletions"], fix["files_changed"]) == (2, 1, 2)
+
+    print("✅ 1 git log call, per-commit stats attached")
+    print("✅ Test passed!\n")
+    return True
+
+
+def _big_change(repo: Path, lines: int = 200_000) -> None:
+    """Commit a change whose diff is several MB."""
+    (repo / "big.txt").write_text("".join(f"line {i}\n" for i in range(lines)))
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "feat: big file")
+
+
+def test_budget_kills_git():
+    """Test that reading stops at max_bytes and git doesn't run to the end."""
+    print("\n=== Test 3: output budget kills git ===")
+
+    real_popen = subprocess.Popen
+    procs = []
+
+    def popen(args, **kwargs):
+        proc = real_popen(args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _make_repo(Path(tmp))
+        _big_change(repo)
+        with patch.object(git_tools.subprocess, "Popen", side_effect=popen):
+            output, truncated = git_tools._read_git(
+                ["log", "-p"], str(repo), max_bytes=10_000
+            )
+            lines = list(git_tools._iter_git_lines(["log", "-p"], str(repo)))
+
+    assert truncated
+    assert len(output.encode()) <= 10_000
+    assert output.endswith("line 9") or not output.endswith("\n")
+    assert procs[0].returncode < 0, "git was killed, not run to completion"
+    assert len(lines) > 200_000, "Unbudgeted reads still see everything"
+
+    print(f"✅ Stopped at {len(output)} bytes, git killed")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_updates_patch_budget():
+    """Test that get_updates compacts the patch to DIFF_MAX_BYTES."""
+    print("\n=== Test 4: get_updates patch budget ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp)
+        _git(repo, "init", "-q")
+        _git(repo, "config", "user.name", "Ada")
+        _git(repo, "config", "user.email", "ada@example.com")
+        # Root commit out of range: the diff is taken against its tree
+        (repo / "README").write_text("old\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-qm", "docs: readme", date="2020-01-01T00:00:00")
+        _big_change(repo)
+        data = asyncio.run(_call("get_updates", {"path": str(repo), "days": 30}))
+
+    patch_text = data["diff"]["patch"]
+    # One huge hunk: cut at a line, with the rest counted
+    assert patch_text.startswith("diff --git a/big.txt b/big.txt")
+    assert patch_text.endswith("more changed lines in this hunk)")
+    assert len(patch_text) <= git_tools.DIFF_MAX_BYTES
+    assert data["diff"]["elided"]["files"] == 0
+    assert data["diff"]["additions"] == 200_000
+    assert data["commit_count"] == 1
+
+    print(f"✅ Patch compacted to {len(patch_text)} chars, stats complete")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_repeat_queries_use_index():
+    """Test that an unchanged HEAD needs no git log and new commits are added."""
+    print("\n=== Test 5: repeat queries use the index ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _make_repo(Path(tmp))
+        index_dir = Path(tmp) / "index"
+        args = {"path": str(repo), "days": 30}
+
+        async def run():
+            first = await _call("get_local_contributions", args, index_dir)
+            popen, calls = _count_logs()
+            with popen:
+                second = await _call("get_local_contributions", args, index_dir)
+                updates = await _call("get_updates", args, index_dir)
+                assert calls == [], calls
+
+                (repo / "core.py").write_text("a\nc\nd\ne\n")
+                _git(repo, "commit", "-qam", "feat: more (#43)")
+                third = await _call("get_local_contributions", args, index_dir)
+            return first, second, updates, third, calls
+
+        first, second, updates, third, calls = asyncio.run(run())
+
+    assert second["commits"] == first["commits"]
+    assert [c["message"] for c in updates["commits"]] == [
+        "chore: rename",
+        "fix: engine (#42)",
+        "feat: add engine | v1",
+    ]
+    assert len(calls) == 1 and any(a.startswith("^") for a in calls[0])
+    assert third["summary"]["total_commits"] == 4
+    assert third["commits"][0]["pr_number"] == 43
+    assert third["summary"]["unique_prs"] == 2
+
+    print("✅ Unchanged HEAD: 0 git log calls; new commit: 1 incremental scan")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_index_follows_head():
+    """Test branch switches and windows reaching past the index."""
+    print("\n=== Test 6: index follows HEAD ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = _make_repo(Path(tmp))
+        index_dir = Path(tmp) / "index"
+        args = {"path": str(repo), "days": 30}
+        base = subprocess.run(
+            ["git", "branch", "--show-current"],
+            cwd=repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+        async def run():
+            _git(repo, "checkout", "-qb", "topic")
+            (repo / "topic.py").write_text("x\n")
+            _git(repo, "add", ".")
+            _git(repo, "commit", "-qm", "feat: topic work")
+            on_topic = await _call("get_updates", args, index_dir)
+
+            _git(repo, "checkout", "-q", base)
+            on_base = await _call("get_updates", args, index_dir)
+
+            popen, calls = _count_logs()
+            with popen:
+                wider = await _call("get_updates", {**args, "days": 60}, index_dir)
+            return on_topic, on_base, wider, calls
+
+        on_topic, on_base, wider, calls = asyncio.run(run())
+
+    assert on_topic["commits"][0]["message"] == "feat: topic work"
+    assert "feat: topic work" not in [c["message"] for c in on_base["commits"]]
+    assert on_base["commit_count"] == 3
+    assert wider["commit_count"] == 3
+    assert len(calls) == 1, "Wider window rescans once"
+
+    print("✅ Other branch's commits hidden, wider window rescanned")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_multi_repo_discovery():
+    """Test repo discovery under a parent directory and concurrent collection."""
+    print("\n=== Test 7: multi-repo discovery ===")
+
+    real_collect = git_tools._collect_updates
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def collect(*args):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        time.sleep(0.2)
+        try:
+            return real_collect(*args)
+        finally:
+            with lock:
+                state["in_flight"] -= 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _make_repo(root / "api")
+        _make_repo(root / "clients")
+        _make_repo(root / "archive" / "2019")  # Too deep
+        idle = root / "idle"
+        idle.mkdir()
+        _git(idle, "init", "-q")
+        _git(idle, "config", "user.name", "Ada")
+        _git(idle, "config", "user.email", "ada@example.com")
+        _git(
+            idle,
+            "commit",
+            "-q",
+            "--allow-empty",
+            "-m",
+            "init",
+            date="2020-01-01T00:00:00",
+        )
+        (root / "notes").mkdir()
+        _make_repo(root / ".cache")
+        _make_repo(root / "api" / "repo" / "vendor")  # Inside a repo
+
+        found = git_tools._discover_repos(str(root))
+        with patch.object(git_tools, "_collect_updates", side_effect=collect):
+            data = asyncio.run(
+                _call("get_multi_repo_updates", {"parent_dir": str(root), "days": 30})
+            )
+
+    assert [Path(p).relative_to(root).as_posix() for p in found] == [
+        "idle",
+        "api/repo",
+        "clients/repo",
+    ]
+    assert data["summary"]["repositories"] == 3
+    assert data["summary"]["active_repositories"] == 2
+    assert data["summary"]["commits"] == 6
+    assert len(data["inactive"]) == 1
+    assert state["peak"] == 3, state
+
+    print(f"✅ 3 repos found, collected with {state['peak']} in flight")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_multi_repo_budget():
+    """Test the shared patch budget, dedup and per-repo errors."""
+    print("\n=== Test 8: multi-repo budget ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = []
+        for name in ["one", "two", "idle"]:
+            repo = root / name
+            repo.mkdir()
+            _git(repo, "init", "-q")
+            _git(repo, "config", "user.name", "Ada")
+            _git(repo, "config", "user.email", "ada@example.com")
+            (repo / "README").write_text("old\n")
+            _git(repo, "add", ".")
+            _git(repo, "commit", "-qm", "docs: readme", date="2020-01-01T00:00:00")
+            if name != "idle":
+                _big_change(repo, lines=20_000)
+            paths.append(str(repo))
+        (root / "one" / "docs").mkdir()
+
+        data = asyncio.run(
+            _call(
+                "get_multi_repo_updates",
+                {
+                    "paths": paths + [paths[0] + "/", paths[0] + "/docs", str(root)],
+                    "days": 30,
+                },
+            )
+        )
+
+    patches = [repo["diff"]["patch"] for repo in data["repositories"]]
+    assert len(patches) == 2, "Duplicate path collected once"
+    assert data["summary"]["repositories"] == 4
+    assert sum(len(p) for p in patches) <= git_tools.MULTI_REPO_PATCH_BUDGET
+    # Split over the 2 active repos, not the 4 collected
+    share = git_tools.MULTI_REPO_PATCH_BUDGET // 4 * 2 // 3
+    assert all(len(p) > share for p in patches), [len(p) for p in patches]
+    assert all(p.endswith("more changed lines in this hunk)") for p in patches)
+    assert all(repo["diff"]["additions"] == 20_000 for repo in data["repositories"])
+    assert "Not a git repository" in data["errors"][str(root)]
+
+    print(f"✅ {sum(len(p) for p in patches)} patch chars across 2 repos")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Git Tools Tests")
+    print("=" * 60)
+
+    tests = [
+        test_log_z_parsing,
+        test_contributions_single_pass,
+        test_budget_kills_git,
+        test_updates_patch_budget,
+        test_repeat_queries_use_index,
+        test_index_follows_head,
+        test_multi_repo_discovery,
+        test_multi_repo_budget,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
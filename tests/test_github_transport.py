@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test the shared pooled HTTP transport used by GitHubClient.
+
+Tests:
+1. Raw REST/GraphQL calls reuse one long-lived httpx.Client
+2. Auth and API version headers are set once on the shared client
+3. close() releases the pooled connections
+
+Usage:
+    uv run python tests/test_github_transport.py
+"""
+
+import json
+
+import httpx
+
+
+def _make_client(handler):
+    """Create a GitHubClient whose HTTP calls go to a mock transport."""
+    from mcp_server.api_clients.github_client import GitHubClient
+
+    return GitHubClient(
+        token="fake-token",
+        default_owner="test-org",
+        default_repo="test-repo",
+        installation_id=123,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_calls_share_pooled_client():
+    """Test that chained GraphQL/REST calls go through the same client."""
+    print("\n=== Test 1: calls share pooled client ===")
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/graphql":
+            return httpx.Response(
+                200, json={"data": {"repository": {"issue": {"id": "I_1"}}}}
+            )
+        if request.url.path.endswith("/sub_issues"):
+            return httpx.Response(200, json=[])
+        return httpx.Response(200, json={"repositories": []})
+
+    client = _make_client(handler)
+    http_client = client._http
+
+    node_id = client.get_issue_node_id(1)
+    client.list_sub_issues(1)
+    client.list_repos(limit=5)
+    assert client.health_check() is True
+
+    assert node_id == "I_1", "GraphQL response should be parsed"
+    assert client._http is http_client, "Client should not be recreated per call"
+    assert len(seen) == 4, f"Expected 4 requests, got {len(seen)}"
+    assert seen[0].url == "https://api.github.com/graphql"
+    assert json.loads(seen[0].content)["variables"]["number"] == 1
+
+    print(f"✅ {len(seen)} requests served by one pooled client")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_shared_headers():
+    """Test that auth headers are applied by the shared client."""
+    print("\n=== Test 2: shared headers ===")
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"repositories": []})
+
+    client = _make_client(handler)
+    client.list_repos(limit=1)
+
+    headers = seen[0].headers
+    assert headers["Authorization"] == "Bearer fake-token"
+    assert headers["Accept"] == "application/vnd.github+json"
+    assert headers["X-GitHub-Api-Version"] == "2022-11-28"
+
+    print("✅ Authorization/Accept/API version headers present")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_close_releases_pool():
+    """Test that close() closes the pooled client."""
+    print("\n=== Test 3: close releases pool ===")
+
+    client = _make_client(lambda request: httpx.Response(200, json={}))
+    client.close()
+
+    assert client._http.is_closed, "Pooled client should be closed"
+
+    print("✅ Pooled client closed")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("GitHub Transport Tests")
+    print("=" * 60)
+
+    tests = [
+        test_calls_share_pooled_client,
+        test_shared_headers,
+        test_close_releases_pool,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
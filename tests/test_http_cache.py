@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Test the on-disk HTTP response cache.
+
+Tests:
+1. ETag responses are revalidated and served from cache on 304
+2. Cache entries are scoped to the Authorization header
+3. TTL rules serve responses without a network round-trip (Slack)
+4. Eviction trims entries by age and total size
+5. Repeated GitHubClient.list_branches calls revalidate instead of refetching
+6. Slack errors sent as 200 {"ok": false} are not cached
+7. A rotated GitHub App token keeps the installation's cache; a PAT doesn't
+
+Usage:
+    uv run python tests/test_http_cache.py
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from mcp_server.api_clients.http_cache import CachingTransport, HTTPCache
+
+
+def _make_cache(**kwargs) -> HTTPCache:
+    path = Path(tempfile.mkdtemp()) / "http_cache.db"
+    return HTTPCache(path=path, **kwargs)
+
+
+class _ETagServer:
+    """Serves a JSON body with an ETag and answers If-None-Match with 304."""
+
+    def __init__(self, payload: dict, etag: str = '"v1"'):
+        self.payload = payload
+        self.etag = etag
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(
+                304, headers={"ETag": self.etag, "X-RateLimit-Remaining": "4999"}
+            )
+        return httpx.Response(200, headers={"ETag": self.etag}, json=self.payload)
+
+
+def _client(server, cache, token="token-a", ttl_rules=None) -> httpx.Client:
+    transport = CachingTransport(
+        httpx.MockTransport(server.handler), cache, ttl_rules=ttl_rules
+    )
+    return httpx.Client(
+        base_url="https://api.example.com",
+        headers={"Authorization": f"Bearer {token}"},
+        transport=transport,
+    )
+
+
+def test_etag_revalidation():
+    """Test that a 304 is turned into the cached 200 response."""
+    print("\n=== Test 1: ETag revalidation ===")
+
+    server = _ETagServer({"items": [1, 2, 3]})
+    client = _client(server, _make_cache())
+
+    first = client.get("/repos/o/r/branches")
+    second = client.get("/repos/o/r/branches")
+
+    assert first.json() == second.json() == {"items": [1, 2, 3]}
+    assert second.status_code == 200
+    assert second.extensions.get("from_cache") is True
+    assert "If-None-Match" not in server.requests[0].headers
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+    assert second.headers["X-RateLimit-Remaining"] == "4999"
+
+    server.etag = '"v2"'
+    server.payload = {"items": [4]}
+    assert client.get("/repos/o/r/branches").json() == {"items": [4]}
+
+    print("✅ 304 served from cache, changed ETag refetched")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_identity_scoping():
+    """Test that different tokens don't share entries."""
+    print("\n=== Test 2: identity scoping ===")
+
+    cache = _make_cache()
+    server = _ETagServer({"private": True})
+
+    _client(server, cache, token="token-a").get("/user/repos")
+    _client(server, cache, token="token-b").get("/user/repos")
+
+    assert "If-None-Match" not in server.requests[1].headers, (
+        "Second token must not revalidate the first token's entry"
+    )
+
+    print("✅ Entries keyed by Authorization header")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_ttl_rules():
+    """Test that TTL endpoints skip the network while fresh."""
+    print("\n=== Test 3: TTL rules ===")
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"ok": True, "channels": []})
+
+    cache = _make_cache()
+    transport = CachingTransport(
+        httpx.MockTransport(handler), cache, {"/conversations.list": 300.0}
+    )
+    client = httpx.Client(transport=transport)
+
+    client.get("https://slack.com/api/conversations.list")
+    cached = client.get("https://slack.com/api/conversations.list")
+    client.get("https://slack.com/api/conversations.history")
+    client.get("https://slack.com/api/conversations.history")
+
+    assert cached.json()["ok"] is True
+    paths = [request.url.path for request in calls]
+    assert paths.count("/api/conversations.list") == 1
+    assert paths.count("/api/conversations.history") == 2, "No rule, no caching"
+
+    print("✅ TTL endpoint cached, other endpoints passed through")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_eviction():
+    """Test that old entries and overflow are evicted."""
+    print("\n=== Test 4: eviction ===")
+
+    cache = _make_cache(max_bytes=2500, max_age=60)
+    payload = {"data": "x" * 1000}
+    server = _ETagServer(payload)
+    client = _client(server, cache)
+
+    for i in range(4):
+        client.get(f"/items/{i}")
+        time.sleep(0.01)
+
+    # Entry 0 is most recently used, entry 3 is too old
+    client.get("/items/0")
+    cache._conn.execute(
+        "UPDATE responses SET stored_at = stored_at - 120 WHERE url LIKE '%/items/3'"
+    )
+    cache.evict()
+
+    urls = {row[0] for row in cache._conn.execute("SELECT url FROM responses")}
+    assert not any(url.endswith("/items/3") for url in urls), "Expired entry kept"
+    assert any(url.endswith("/items/0") for url in urls), "Recently used evicted"
+    assert len(urls) == 2, f"Expected 2 entries under budget, got {len(urls)}"
+
+    print(f"✅ {len(urls)} entries left after age + size eviction")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_github_client_uses_cache():
+    """Test that GitHubClient REST listings revalidate through the cache."""
+    print("\n=== Test 5: GitHubClient with cache ===")
+
+    from mcp_server.api_clients.github_client import GitHubClient
+
+    server = _ETagServer(
+        [{"name": "main", "commit": {"sha": "abc"}, "protected": True}]
+    )
+    client = GitHubClient(
+        token="fake-token",
+        default_owner="test-org",
+        default_repo="test-repo",
+        installation_id=123,
+        transport=httpx.MockTransport(server.handler),
+        http_cache=_make_cache(),
+    )
+
+    first = client.list_branches()
+    second = client.list_branches()
+
+    assert first == second == [{"name": "main", "sha": "abc", "protected": True}]
+    assert len(server.requests) == 2
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+    print("✅ Second list_branches answered by 304")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_slack_errors_not_cached():
+    """Test that a transient Slack error isn't replayed for the TTL."""
+    print("\n=== Test 6: Slack errors not cached ===")
+
+    from mcp_server.api_clients.slack_client import SlackAPIError, SlackClient
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(200, json={"ok": False, "error": "internal_error"})
+        return httpx.Response(
+            200,
+            json={
+                "ok": True,
+                "channels": [{"id": "C1", "name": "general", "is_member": True}],
+                "response_metadata": {"next_cursor": ""},
+            },
+        )
+
+    cache = _make_cache()
+
+    def make_client() -> SlackClient:
+        return SlackClient(
+            bot_token="xoxb-test",
+            transport=httpx.MockTransport(handler),
+            http_cache=cache,
+        )
+
+    try:
+        make_client().list_channels()
+        raise AssertionError("Expected SlackAPIError")
+    except SlackAPIError as e:
+        assert "internal_error" in str(e)
+
+    # A fresh client shares the cache but not the in-memory directory
+    channels = make_client().list_channels()
+    assert [c.name for c in channels] == ["general"]
+    assert len(calls) == 2, "Error response was served from the cache"
+
+    # The successful listing is cached as before
+    make_client().list_channels()
+    assert len(calls) == 2
+
+    print("✅ Error refetched, successful listing cached")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_rotated_app_token_keeps_cache():
+    """Test that entries are keyed by installation, not installation token."""
+    print("\n=== Test 7: rotated App token keeps cache ===")
+
+    from mcp_server.api_clients.github_client import GitHubClient
+
+    server = _ETagServer(
+        [{"name": "main", "commit": {"sha": "abc"}, "protected": True}]
+    )
+    cache = _make_cache()
+
+    def client(token, installation_id):
+        return GitHubClient(
+            token=token,
+            default_owner="test-org",
+            default_repo="test-repo",
+            installation_id=installation_id,
+            transport=httpx.MockTransport(server.handler),
+            http_cache=cache,
+        )
+
+    client("ghs_first", 123).list_branches()
+    client("ghs_second", 123).list_branches()
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+    # Another installation, or a PAT, never sees those entries
+    client("ghs_third", 456).list_branches()
+    client("ghp_pat", None).list_branches()
+    assert "If-None-Match" not in server.requests[2].headers
+    assert "If-None-Match" not in server.requests[3].headers
+
+    print("✅ New installation token revalidated the old entry")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("HTTP Cache Tests")
+    print("=" * 60)
+
+    tests = [
+        test_etag_revalidation,
+        test_identity_scoping,
+        test_ttl_rules,
+        test_eviction,
+        test_github_client_uses_cache,
+        test_slack_errors_not_cached,
+        test_rotated_app_token_keeps_cache,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Test the GraphQL-backed pull request listing and batch fetch in GitHubClient.
+
+Tests:
+1. Summary listing is served by a single GraphQL request
+2. Full listing maps GraphQL fields onto the PullRequest model
+3. Limits above 100 page through the connection with cursors
+4. backend='rest' keeps the PyGithub path available
+5. fetch_prs_batch packs 100 PRs across repos into 2 aliased queries
+6. Missing PRs are reported per-PR, other failures fall back to REST
+
+Usage:
+    uv run python tests/test_pr_graphql.py
+"""
+
+import json
+import re
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+
+def _make_client(handler):
+    """Create a GitHubClient whose HTTP calls go to a mock transport."""
+    from mcp_server.api_clients.github_client import GitHubClient
+
+    return GitHubClient(
+        token="fake-token",
+        default_owner="test-org",
+        default_repo="test-repo",
+        installation_id=123,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def _pr_node(number: int, **overrides) -> dict:
+    node = {
+        "number": number,
+        "title": f"PR {number}",
+        "state": "OPEN",
+        "author": {"login": "alice"},
+        "createdAt": "2024-01-01T00:00:00Z",
+        "mergedAt": None,
+        "url": f"https://github.com/test-org/test-repo/pull/{number}",
+        "body": "",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "headRefName": f"feature-{number}",
+        "baseRefName": "main",
+        "additions": 10,
+        "deletions": 2,
+        "changedFiles": 3,
+        "commits": {"totalCount": 4},
+        "isDraft": False,
+        "mergeable": "UNKNOWN",
+        "labels": {"nodes": []},
+        "reviewRequests": {"nodes": []},
+    }
+    node.update(overrides)
+    return node
+
+
+def _page(nodes: list, has_next: bool = False, cursor: str = None) -> dict:
+    return {
+        "data": {
+            "repository": {
+                "pullRequests": {
+                    "pageInfo": {"hasNextPage": has_next, "endCursor": cursor},
+                    "nodes": nodes,
+                }
+            }
+        }
+    }
+
+
+def test_summary_single_request():
+    """Test that listing 50 PRs costs one request."""
+    print("\n=== Test 1: summary listing in one request ===")
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(json.loads(request.content))
+        return httpx.Response(200, json=_page([_pr_node(n) for n in range(1, 51)]))
+
+    client = _make_client(handler)
+    prs = client.list_prs(state="closed", limit=50, backend="graphql")
+
+    assert len(seen) == 1, f"Expected 1 request, got {len(seen)}"
+    variables = seen[0]["variables"]
+    assert variables["states"] == ["CLOSED", "MERGED"]
+    assert variables["first"] == 50
+    assert "additions" not in seen[0]["query"], "Summary should not fetch stats"
+    assert len(prs) == 50
+    assert prs[0].author == "alice"
+    assert prs[0].state == "open"
+
+    print(f"✅ {len(prs)} PRs in {len(seen)} request")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_full_field_mapping():
+    """Test that GraphQL nodes convert to the same shape as REST PRs."""
+    print("\n=== Test 2: full field mapping ===")
+
+    node = _pr_node(
+        7,
+        state="MERGED",
+        author=None,
+        mergedAt="2024-01-03T00:00:00Z",
+        mergeable="CONFLICTING",
+        isDraft=True,
+        labels={"nodes": [{"name": "bug"}]},
+        reviewRequests={
+            "nodes": [
+                {"requestedReviewer": {"login": "bob"}},
+                {"requestedReviewer": {}},  # team reviewer
+            ]
+        },
+    )
+
+    client = _make_client(lambda request: httpx.Response(200, json=_page([node])))
+    pr = client.list_prs(state="all", limit=5, detail_level="full")[0]
+
+    assert pr.state == "closed", "MERGED should map to REST 'closed'"
+    assert pr.author == "unknown", "Deleted users should map to 'unknown'"
+    assert pr.body is None
+    assert pr.mergeable is False
+    assert pr.draft is True
+    assert pr.commits == 4
+    assert pr.head_branch == "feature-7"
+    assert pr.labels == ["bug"]
+    assert pr.reviewers == ["bob"]
+    assert pr.merged_at is not None
+
+    print("✅ state/mergeable/labels/reviewers mapped")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_pagination_over_100():
+    """Test that limits above 100 follow endCursor."""
+    print("\n=== Test 3: pagination over 100 ===")
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        seen.append(variables)
+        if variables["after"] is None:
+            nodes = [_pr_node(n) for n in range(1, 101)]
+            return httpx.Response(200, json=_page(nodes, True, "cursor-1"))
+        nodes = [_pr_node(n) for n in range(101, 101 + variables["first"])]
+        return httpx.Response(200, json=_page(nodes, True, "cursor-2"))
+
+    client = _make_client(handler)
+    prs = client.list_prs(limit=150, backend="graphql")
+
+    assert len(prs) == 150
+    assert len(seen) == 2, f"Expected 2 requests, got {len(seen)}"
+    assert seen[1]["after"] == "cursor-1"
+    assert seen[1]["first"] == 50, "Second page should only ask for the rest"
+
+    print(f"✅ 150 PRs in {len(seen)} requests")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_rest_backend():
+    """Test that backend='rest' still uses PyGithub."""
+    print("\n=== Test 4: rest backend ===")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("GraphQL should not be called for backend='rest'")
+
+    client = _make_client(handler)
+
+    pr = MagicMock()
+    pr.number = 1
+    pr.title = "REST PR"
+    pr.state = "open"
+    pr.user.login = "alice"
+    pr.created_at = "2024-01-01T00:00:00Z"
+    pr.merged_at = None
+    pr.html_url = "https://github.com/test-org/test-repo/pull/1"
+
+    gh_repo = MagicMock()
+    gh_repo.get_pulls.return_value = [pr]
+    client._repo_cache["test-org/test-repo"] = gh_repo
+
+    prs = client.list_prs(limit=5, backend="rest")
+
+    assert [p.title for p in prs] == ["REST PR"]
+    gh_repo.get_pulls.assert_called_once()
+
+    print("✅ PyGithub path still selectable")
+    print("✅ Test passed!\n")
+    return True
+
+
+def _batch_response(request: httpx.Request, missing=(), broken=()) -> httpx.Response:
+    """Answer an aliased PR batch query from its variables."""
+    body = json.loads(request.content)
+    variables = body["variables"]
+    aliases = re.findall(r"(pr\d+): repository", body["query"])
+    data = {}
+    errors = []
+    for alias in aliases:
+        i = alias[2:]
+        number = variables[f"n{i}"]
+        if number in missing:
+            data[alias] = {"pullRequest": None}
+            errors.append(
+                {"type": "NOT_FOUND", "path": [alias, "pullRequest"], "message": "x"}
+            )
+        elif number in broken:
+            data[alias] = None
+            errors.append({"type": "FORBIDDEN", "path": [alias], "message": "y"})
+        else:
+            data[alias] = {"pullRequest": _pr_node(number, state="MERGED")}
+    payload = {"data": data}
+    if errors:
+        payload["errors"] = errors
+    return httpx.Response(200, json=payload)
+
+
+def test_batch_fetch_request_count():
+    """Test that 100 PRs across repos are fetched in 2 requests, in order."""
+    print("\n=== Test 5: batched fetch request count ===")
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return _batch_response(request)
+
+    client = _make_client(handler)
+    refs = [
+        {"owner": "test-org", "repo": f"repo-{n % 3}", "number": n}
+        for n in range(100, 0, -1)
+    ]
+    prs, errors = client.fetch_prs_batch(refs)
+
+    assert len(seen) == 2, f"Expected 2 requests, got {len(seen)}"
+    assert errors == []
+    assert [pr["number"] for pr in prs] == [ref["number"] for ref in refs]
+    assert prs[0]["repo"] == "repo-1" and prs[0]["owner"] == "test-org"
+    assert prs[0]["additions"] == 10 and prs[0]["state"] == "closed"
+
+    print(f"✅ 100 PRs in {len(seen)} requests, input order kept")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_batch_fetch_errors_and_fallback():
+    """Test per-PR error reporting and REST fallback."""
+    print("\n=== Test 6: batched fetch errors and fallback ===")
+
+    from mcp_server.api_clients.github_client import PullRequest
+
+    client = _make_client(
+        lambda request: _batch_response(request, missing={2}, broken={3})
+    )
+    refs = [{"owner": "test-org", "repo": "test-repo", "number": n} for n in (1, 2, 3)]
+
+    rest_pr = PullRequest(
+        number=3,
+        title="From REST",
+        state="open",
+        author="alice",
+        created_at="2024-01-01T00:00:00Z",
+        html_url="https://github.com/test-org/test-repo/pull/3",
+        head_branch="feature",
+        base_branch="main",
+    )
+    with patch.object(client, "get_pr", return_value=rest_pr) as get_pr:
+        prs, errors = client.fetch_prs_batch(refs)
+
+    get_pr.assert_called_once_with(3, owner="test-org", repo="test-repo")
+    assert [pr["number"] for pr in prs] == [1, 3]
+    assert prs[1]["title"] == "From REST"
+    assert errors == [
+        {
+            "owner": "test-org",
+            "repo": "test-repo",
+            "number": 2,
+            "error": "PR not found",
+        }
+    ]
+    assert client.fetch_prs_parallel(refs[:1])[0]["number"] == 1
+
+    print("✅ Missing PR reported, failed PR fetched over REST")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("GraphQL PR Listing Tests")
+    print("=" * 60)
+
+    tests = [
+        test_summary_single_request,
+        test_full_field_mapping,
+        test_pagination_over_100,
+        test_rest_backend,
+        test_batch_fetch_request_count,
+        test_batch_fetch_errors_and_fallback,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
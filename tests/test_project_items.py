@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Test Projects V2 item lookups and metadata caching in GitHubClient.
+
+Tests:
+1. Item lookups ask the issue for its project items instead of scanning the board
+2. Repeat lookups are answered from the index without requests
+3. add/remove keep the index current
+4. Items deleted outside the client are dropped from the index
+5. Project IDs and field definitions are resolved once per batch of updates
+6. Cached field definitions are refetched when an option is missing
+7. Bulk field updates pack 50 cards into aliased documents
+8. Bulk updates report per-issue, per-field errors
+
+Usage:
+    uv run python tests/test_project_items.py
+"""
+
+import json
+
+import httpx
+from github import GithubException
+
+
+class _ProjectServer:
+    """Minimal GraphQL backend for one project ('PVT_1', number 1)."""
+
+    def __init__(self, items=None):
+        # issue number -> project item ID
+        self.items = dict(items or {})
+        self.status_options = ["Todo", "Done"]
+        self.calls = []
+        self._next_item = 100
+
+    def _kind(self, query: str) -> str:
+        if "u0:" in query:
+            return "batch_update"
+        if "i0:" in query:
+            return "batch_items"
+        for kind in (
+            "addProjectV2ItemById",
+            "deleteProjectV2Item",
+            "updateProjectV2ItemFieldValue",
+            "projectItems",
+            "projectV2(number",
+            "fields(first",
+            "issue(number",
+        ):
+            if kind in query:
+                return kind
+        raise AssertionError(f"Unexpected query: {query}")
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        variables = body.get("variables") or {}
+        kind = self._kind(body["query"])
+        self.calls.append(kind)
+
+        if kind == "batch_update":
+            return self._batch_update(variables)
+        if kind == "batch_items":
+            data = {}
+            for key, number in variables.items():
+                if key.startswith("n"):
+                    data[f"i{key[1:]}"] = self._issue_items(number)
+            return httpx.Response(200, json={"data": data})
+
+        if kind == "projectV2(number":
+            data = {"organization": {"projectV2": {"id": "PVT_1"}}}
+        elif kind == "issue(number":
+            data = {"repository": {"issue": {"id": f"I_{variables['number']}"}}}
+        elif kind == "projectItems":
+            data = {"repository": self._issue_items(variables["number"])}
+        elif kind == "fields(first":
+            data = {
+                "node": {
+                    "fields": {
+                        "nodes": [
+                            {
+                                "id": "PVTF_status",
+                                "name": "Status",
+                                "dataType": "SINGLE_SELECT",
+                                "options": [
+                                    {"id": f"opt_{name.lower()}", "name": name}
+                                    for name in self.status_options
+                                ],
+                            },
+                            {"id": "PVTF_notes", "name": "Notes", "dataType": "TEXT"},
+                            {"id": "PVTF_size", "name": "Size", "dataType": "NUMBER"},
+                        ]
+                    }
+                }
+            }
+        elif kind == "addProjectV2ItemById":
+            number = int(variables["contentId"][2:])
+            self._next_item += 1
+            self.items[number] = f"PVTI_{self._next_item}"
+            data = {"addProjectV2ItemById": {"item": {"id": self.items[number]}}}
+        elif kind == "deleteProjectV2Item":
+            number = next(n for n, i in self.items.items() if i == variables["itemId"])
+            del self.items[number]
+            data = {"deleteProjectV2Item": {"deletedItemId": variables["itemId"]}}
+        else:
+            if variables["itemId"] not in self.items.values():
+                return httpx.Response(
+                    200,
+                    json={
+                        "data": None,
+                        "errors": [
+                            {
+                                "type": "NOT_FOUND",
+                                "message": "Could not resolve to a node",
+                            }
+                        ],
+                    },
+                )
+            data = {
+                "updateProjectV2ItemFieldValue": {
+                    "projectV2Item": {"id": variables["itemId"]}
+                }
+            }
+        return httpx.Response(200, json={"data": data})
+
+    def _issue_items(self, number: int) -> dict:
+        nodes = [{"id": "PVTI_other", "project": {"id": "PVT_2"}}]
+        if number in self.items:
+            nodes.append({"id": self.items[number], "project": {"id": "PVT_1"}})
+        return {
+            "issue": {
+                "id": f"I_{number}",
+                "projectItems": {
+                    "nodes": nodes,
+                    "pageInfo": {"hasNextPage": False, "endCursor": None},
+                },
+            }
+        }
+
+    def _batch_update(self, variables: dict) -> httpx.Response:
+        data, errors = {}, []
+        for key, item_id in variables.items():
+            if not key.startswith("i"):
+                continue
+            alias = f"u{key[1:]}"
+            if item_id in self.items.values():
+                data[alias] = {"projectV2Item": {"id": item_id}}
+            else:
+                data[alias] = None
+                errors.append(
+                    {
+                        "type": "NOT_FOUND",
+                        "path": [alias],
+                        "message": f"Could not resolve item {item_id}",
+                    }
+                )
+        return httpx.Response(200, json={"data": data, "errors": errors})
+
+
+def _make_client(server: _ProjectServer):
+    from mcp_server.api_clients.github_client import GitHubClient
+
+    return GitHubClient(
+        token="fake-token",
+        default_owner="test-org",
+        default_repo="test-repo",
+        installation_id=123,
+        transport=httpx.MockTransport(server.handler),
+    )
+
+
+def test_lookup_uses_issue_project_items():
+    """Test that finding an item costs one request however big the board is."""
+    print("\n=== Test 1: lookup via issue.projectItems ===")
+
+    server = _ProjectServer({42: "PVTI_42"})
+    client = _make_client(server)
+
+    item_id = client.get_project_item_id(42, project="1")
+
+    assert item_id == "PVTI_42"
+    assert server.calls.count("projectItems") == 1
+    assert "items(first" not in str(server.calls), "Should not scan the board"
+    assert client.get_project_item_id(7, project="1") is None
+
+    print(f"✅ Found {item_id} with calls {server.calls}")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_repeat_lookups_hit_index():
+    """Test that the index answers repeat lookups."""
+    print("\n=== Test 2: repeat lookups hit the index ===")
+
+    server = _ProjectServer({42: "PVTI_42"})
+    client = _make_client(server)
+
+    client.get_project_item_id(42, project="1")
+    server.calls.clear()
+    item_id = client.get_project_item_id(42, project="1")
+
+    assert item_id == "PVTI_42"
+    assert "projectItems" not in server.calls, f"Unexpected lookup: {server.calls}"
+    assert client._issue_node_ids[("test-org", "test-repo", 42)] == "I_42"
+    assert client._project_items["PVT_2"]["I_42"] == "PVTI_other", (
+        "Items in other projects are indexed from the same response"
+    )
+
+    print("✅ Second lookup served from the index")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_add_remove_update_index():
+    """Test that add and remove maintain the index."""
+    print("\n=== Test 3: add/remove keep the index current ===")
+
+    server = _ProjectServer()
+    client = _make_client(server)
+
+    added = client.add_issue_to_project(5, project="1")
+    assert client._project_items["PVT_1"]["I_5"] == added["project_item_id"]
+
+    server.calls.clear()
+    client.update_project_item_field(5, project="1", field_name="Status", value="Done")
+    assert "projectItems" not in server.calls, "Update should use the indexed item"
+
+    removed = client.remove_issue_from_project(5, project="1")
+    assert removed["deleted_item_id"] == added["project_item_id"]
+    assert "I_5" not in client._project_items["PVT_1"]
+
+    print(f"✅ Indexed {added['project_item_id']} on add, dropped on remove")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_stale_item_invalidated():
+    """Test recovery when an item was removed in the GitHub UI."""
+    print("\n=== Test 4: stale items are invalidated ===")
+
+    server = _ProjectServer({42: "PVTI_42"})
+    client = _make_client(server)
+    client.get_project_item_id(42, project="1")
+
+    # Someone removes the card in the web UI
+    del server.items[42]
+
+    try:
+        client.update_project_item_field(
+            42, project="1", field_name="Notes", value="hi"
+        )
+        raise AssertionError("Expected GithubException for deleted item")
+    except GithubException:
+        pass
+
+    assert "PVT_1" not in client._project_items
+    assert client.get_project_item_id(42, project="1") is None
+
+    print("✅ Failed update dropped the stale entry")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_metadata_resolved_once():
+    """Test that 3 fields x 20 issues don't re-resolve project metadata."""
+    print("\n=== Test 5: metadata memoized across updates ===")
+
+    server = _ProjectServer({n: f"PVTI_{n}" for n in range(1, 21)})
+    client = _make_client(server)
+
+    for number in range(1, 21):
+        for field_name, value in (("Status", "Done"), ("Notes", "x"), ("Size", "3")):
+            client.update_project_item_field(
+                number, project="1", field_name=field_name, value=value
+            )
+
+    assert server.calls.count("projectV2(number") == 1, server.calls
+    assert server.calls.count("fields(first") == 1
+    assert server.calls.count("updateProjectV2ItemFieldValue") == 60
+
+    print(f"✅ 60 updates, {len(server.calls) - 60} metadata/item lookups")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_metadata_refresh_on_miss():
+    """Test that a new option is picked up without waiting for the TTL."""
+    print("\n=== Test 6: refetch fields on a missing option ===")
+
+    server = _ProjectServer({1: "PVTI_1"})
+    client = _make_client(server)
+    client.update_project_item_field(1, project="1", field_name="Status", value="Todo")
+
+    server.status_options.append("Blocked")
+    result = client.update_project_item_field(
+        1, project="1", field_name="Status", value="Blocked"
+    )
+    assert result["success"] is True
+    assert server.calls.count("fields(first") == 2
+
+    try:
+        client.update_project_item_field(
+            1, project="1", field_name="Status", value="Nope"
+        )
+        raise AssertionError("Expected GithubException for unknown option")
+    except GithubException as e:
+        assert "Available options" in e.data["message"]
+
+    uncached = _make_client(server)
+    uncached.project_metadata_ttl = 0
+    server.calls.clear()
+    uncached.get_project_fields("1")
+    uncached.get_project_fields("1")
+    assert server.calls.count("fields(first") == 2, "TTL 0 disables memoization"
+
+    print("✅ Stale field definitions refetched once")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_bulk_update_batches():
+    """Test that 50 cards x 2 fields take a handful of requests."""
+    print("\n=== Test 7: bulk field updates ===")
+
+    server = _ProjectServer({n: f"PVTI_{n}" for n in range(1, 51)})
+    client = _make_client(server)
+
+    results = client.update_project_item_fields(
+        list(range(1, 51)), project="1", fields={"Status": "Done", "Notes": "moved"}
+    )
+
+    assert [r["number"] for r in results] == list(range(1, 51))
+    assert all(r["status"] == "success" for r in results)
+    assert results[0]["fields_updated"] == [
+        {"field": "Status", "value": "Done"},
+        {"field": "Notes", "value": "moved"},
+    ]
+    assert server.calls.count("batch_items") == 1
+    assert server.calls.count("batch_update") == 2, "100 updates in chunks of 50"
+    assert len(server.calls) == 5, server.calls
+
+    print(f"✅ 100 field updates in {len(server.calls)} requests")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_bulk_update_partial_failures():
+    """Test that failures are reported per issue and field."""
+    print("\n=== Test 8: bulk update errors ===")
+
+    server = _ProjectServer({1: "PVTI_1", 2: "PVTI_2"})
+    client = _make_client(server)
+    client.get_project_item_id(2, project="1")
+    # Card 2 is deleted in the web UI after we indexed it
+    del server.items[2]
+
+    results = client.update_project_item_fields(
+        [1, 2, 3], project="1", fields={"Status": "Done", "Color": "Red"}
+    )
+    by_number = {r["number"]: r for r in results}
+
+    assert by_number[1]["fields_updated"] == [{"field": "Status", "value": "Done"}]
+    assert by_number[1]["errors"][0]["field"] == "Color"
+    assert "Could not resolve" in by_number[2]["errors"][-1]["error"]
+    assert "not found in project" in by_number[3]["errors"][-1]["error"]
+    assert all(r["status"] == "partial" for r in results)
+    assert "PVT_1" not in client._project_items, "Failed update drops the index"
+
+    print("✅ Per-field errors reported, other updates applied")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Project Item and Metadata Cache Tests")
+    print("=" * 60)
+
+    tests = [
+        test_lookup_uses_issue_project_items,
+        test_repeat_lookups_hit_index,
+        test_add_remove_update_index,
+        test_stale_item_invalidated,
+        test_metadata_resolved_once,
+        test_metadata_refresh_on_miss,
+        test_bulk_update_batches,
+        test_bulk_update_partial_failures,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Test project discovery in the github://projects resource.
+
+Tests:
+1. Orgs are queried concurrently, user projects first, failures skipped
+2. Repeated reads within the TTL are served from cache per identity
+3. Stale listings are served instantly and refreshed in the background
+4. Listings are keyed by installation, not by the rotating token
+
+Usage:
+    uv run python tests/test_project_resource.py
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+
+class _FakeClient:
+    """Async client stand-in counting discovery calls."""
+
+    def __init__(
+        self,
+        orgs,
+        delay: float = 0.1,
+        username: str = "alice",
+        token: str = "tok-a",
+        installation_id=None,
+    ):
+        self.sync_client = SimpleNamespace(token=token, installation_id=installation_id)
+        self.username = username
+        self.orgs = orgs
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self.version = 1
+        self.stamps = []
+
+    async def get_authenticated_user(self):
+        return self.username
+
+    async def list_repos(self, limit=20):
+        repos = [SimpleNamespace(owner=self.username)]
+        for i, org in enumerate(self.orgs):
+            # Earlier orgs own more repos
+            repos += [SimpleNamespace(owner=org)] * (len(self.orgs) - i)
+        return repos
+
+    async def list_projects_with_fields(self, owner=None, is_org=True, limit=20):
+        self.calls.append(owner)
+        self.stamps.append(time.perf_counter())
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+            self.stamps.append(time.perf_counter())
+        if owner == "broken-org":
+            raise RuntimeError("SSO not authorized")
+        return [
+            {
+                "number": 1,
+                "title": f"{owner} board v{self.version}",
+                "url": f"https://github.com/{owner}/projects/1",
+                "closed": False,
+                "fields": [],
+            }
+        ]
+
+
+async def _read(client) -> str:
+    from fastmcp import Client, FastMCP
+
+    from mcp_server.resources.github_resources import create_github_resources
+
+    mcp = FastMCP("test")
+    create_github_resources(mcp)
+    async with Client(mcp) as mcp_client:
+        contents = await mcp_client.read_resource("github://projects")
+    return contents[0].text
+
+
+def _patched(client):
+    from mcp_server.resources import github_resources
+    from mcp_server.tools import github_tools
+
+    async def get_async_client():
+        return client
+
+    github_resources.invalidate_projects_cache()
+    return (
+        patch.object(github_resources, "get_github_pat", return_value=("tok", "env")),
+        patch.object(
+            github_resources, "get_credential_store", return_value=MagicMock()
+        ),
+        patch.object(github_tools, "_get_async_client", get_async_client),
+    )
+
+
+def test_concurrent_org_fanout():
+    """Test that org projects are fetched in parallel."""
+    print("\n=== Test 1: concurrent org fan-out ===")
+
+    orgs = [f"org-{i}" for i in range(6)] + ["broken-org"]
+    client = _FakeClient(orgs, delay=0.2)
+    pat, store, get_client = _patched(client)
+
+    with pat, store, get_client:
+        text = asyncio.run(_read(client))
+    elapsed = max(client.stamps) - min(client.stamps)
+
+    titles = [line for line in text.splitlines() if line.startswith("- #")]
+    assert titles[0] == "- #1: alice board v1 (open)"
+    assert [t.split(": ")[1].split(" ")[0] for t in titles[1:]] == orgs[:-1]
+    assert client.peak == len(orgs)
+    assert elapsed < 0.8, f"8 x 0.2s owner lookups took {elapsed:.2f}s"
+
+    print(f"✅ {len(client.calls)} owners in {elapsed:.2f}s, broken org skipped")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_cached_per_identity():
+    """Test that reads within the TTL don't refetch, per user."""
+    print("\n=== Test 2: cached per identity ===")
+
+    from mcp_server.tools import github_tools
+
+    client = _FakeClient(["org-a"], delay=0)
+    pat, store, get_client = _patched(client)
+
+    with pat, store, get_client:
+        asyncio.run(_read(client))
+        asyncio.run(_read(client))
+        assert len(client.calls) == 2, client.calls
+
+        # A different identity gets its own listing
+        other = _FakeClient(["org-b"], delay=0, username="bob")
+
+        async def get_other():
+            return other
+
+        with patch.object(github_tools, "_get_async_client", get_other):
+            text = asyncio.run(_read(other))
+        assert "bob board" in text and "alice board" not in text
+
+    print("✅ Second read served from cache, other user fetched separately")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_stale_while_revalidate():
+    """Test that a stale listing returns instantly and refreshes behind it."""
+    print("\n=== Test 3: stale-while-revalidate ===")
+
+    from mcp_server.resources import github_resources
+
+    client = _FakeClient(["org-a"], delay=0.3)
+    pat, store, get_client = _patched(client)
+
+    async def run():
+        await _read(client)
+        # Age the entry past the TTL
+        key = ("PAT", "alice", "")
+        fetched_at, projects = github_resources._projects_cache[key]
+        github_resources._projects_cache[key] = (
+            fetched_at - github_resources.PROJECTS_CACHE_TTL - 60,
+            projects,
+        )
+        client.version = 2
+
+        start = time.perf_counter()
+        stale_text = await _read(client)
+        elapsed = time.perf_counter() - start
+
+        await github_resources._projects_refresh[key]
+        fresh_text = await _read(client)
+        return stale_text, elapsed, fresh_text
+
+    with pat, store, get_client:
+        stale_text, elapsed, fresh_text = asyncio.run(run())
+
+    assert "(Cached 6 min ago, refreshing)" in stale_text
+    assert "alice board v1" in stale_text
+    assert elapsed < 0.2, f"Stale read waited {elapsed:.2f}s"
+    assert "alice board v2" in fresh_text and "Cached" not in fresh_text
+
+    print(f"✅ Stale read in {elapsed:.3f}s, refreshed listing served next")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_keyed_by_installation():
+    """Test that a rotated App token reuses the listing, a new installation doesn't."""
+    print("\n=== Test 4: listings keyed by installation ===")
+
+    from mcp_server.resources import github_resources
+    from mcp_server.tools import github_tools
+
+    client = _FakeClient(["org-a"], delay=0, installation_id=1)
+    pat, store, get_client = _patched(client)
+
+    def read_with(other):
+        async def get_other():
+            return other
+
+        with patch.object(github_tools, "_get_async_client", get_other):
+            return asyncio.run(_read(other))
+
+    with pat, store, get_client:
+        assert "alice board v1" in asyncio.run(_read(client))
+
+        # Hourly token rotation on the same installation
+        rotated = _FakeClient([], delay=0, token="tok-b", installation_id=1)
+        assert "alice board v1" in read_with(rotated)
+        assert rotated.calls == []
+
+        # Another installation for the same user (e.g. without org access)
+        other = _FakeClient([], delay=0, token="tok-c", installation_id=2)
+        other.version = 2
+        text = read_with(other)
+
+    assert "alice board v2" in text and "org-a" not in text
+    assert other.calls == ["alice"]
+    assert set(github_resources._projects_cache) == {
+        ("PAT", "alice", "1"),
+        ("PAT", "alice", "2"),
+    }
+
+    print("✅ Rotated token served from cache, new installation fetched its own")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Project Resource Tests")
+    print("=" * 60)
+
+    tests = [
+        test_concurrent_org_fanout,
+        test_cached_per_identity,
+        test_stale_while_revalidate,
+        test_keyed_by_installation,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
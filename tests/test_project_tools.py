@@ -268,6 +268,8 @@ def test_with_mock_github_client():
         client.default_owner = "test-org"
         client.default_repo = "test-repo"
         client._repo_cache = {}
+        client._project_items = {}
+        client._issue_node_ids = {}
 
         # Mock _graphql_request
         def mock_graphql(query, variables=None):
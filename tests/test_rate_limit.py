@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Test the GitHub rate-limit scheduler.
+
+Tests:
+1. Budgets are tracked per resource from X-RateLimit-* headers
+2. 429/secondary-limit 403s are retried honoring Retry-After
+3. Permission 403s are returned without retrying
+4. Spent budgets wait for a near reset and fail fast on a far one
+5. get_rate_limits syncs budgets from GET /rate_limit
+6. Sync and async transports share one concurrency limit
+
+Usage:
+    uv run python tests/test_rate_limit.py
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+from github import GithubException
+
+from mcp_server.api_clients import rate_limit
+from mcp_server.api_clients.rate_limit import (
+    AsyncRateLimitTransport,
+    RateLimiter,
+    RateLimitTransport,
+)
+
+
+def _rate_headers(resource: str, remaining: int, limit: int = 5000, reset=None):
+    return {
+        "X-RateLimit-Resource": resource,
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Used": str(limit - remaining),
+        "X-RateLimit-Reset": str(int(reset or time.time() + 3600)),
+    }
+
+
+def _client(handler, limiter: RateLimiter) -> httpx.Client:
+    return httpx.Client(
+        base_url="https://api.github.com",
+        transport=RateLimitTransport(httpx.MockTransport(handler), limiter),
+    )
+
+
+def test_budgets_from_headers():
+    """Test that core/search/graphql budgets are tracked separately."""
+    print("\n=== Test 1: budgets from headers ===")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/graphql":
+            return httpx.Response(200, headers=_rate_headers("graphql", 4990), json={})
+        if request.url.path.startswith("/search/"):
+            return httpx.Response(
+                200, headers=_rate_headers("search", 27, limit=30), json={}
+            )
+        return httpx.Response(200, headers=_rate_headers("core", 4321), json={})
+
+    limiter = RateLimiter()
+    client = _client(handler, limiter)
+    client.get("/repos/o/r")
+    client.get("/search/issues", params={"q": "is:pr"})
+    client.post("/graphql", json={"query": "{ viewer { login } }"})
+
+    budgets = limiter.snapshot()
+    assert budgets["core"]["remaining"] == 4321
+    assert budgets["search"]["remaining"] == 27
+    assert budgets["search"]["limit"] == 30
+    assert budgets["graphql"]["remaining"] == 4990
+
+    print("✅ core/search/graphql tracked independently")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_retries_honor_retry_after():
+    """Test that 429 and secondary-limit 403 are retried after Retry-After."""
+    print("\n=== Test 2: retries honor Retry-After ===")
+
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(
+            403, json={"message": "You have exceeded a secondary rate limit"}
+        ),
+        httpx.Response(200, json={"ok": True}),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    with patch.object(rate_limit.time, "sleep") as sleep:
+        response = _client(handler, RateLimiter()).get("/repos/o/r/pulls")
+
+    assert response.status_code == 200
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert delays == [7.0, 4.0], f"Unexpected backoff delays: {delays}"
+
+    print(f"✅ Retried after {delays}s")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_permission_403_not_retried():
+    """Test that a plain 403 is passed straight through."""
+    print("\n=== Test 3: permission 403 not retried ===")
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(403, json={"message": "Resource not accessible"})
+
+    with patch.object(rate_limit.time, "sleep") as sleep:
+        response = _client(handler, RateLimiter()).get("/repos/o/r/collaborators")
+
+    assert response.status_code == 403
+    assert len(calls) == 1
+    sleep.assert_not_called()
+
+    print("✅ 403 returned without retry")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_spent_budget_waits_or_fails():
+    """Test throttling when a budget is spent."""
+    print("\n=== Test 4: spent budget waits or fails ===")
+
+    limiter = RateLimiter(max_wait=60)
+    soon = time.time() + 10
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers=_rate_headers("search", 0, limit=30, reset=soon), json={}
+        )
+
+    client = _client(handler, limiter)
+    client.get("/search/issues")  # learns the search budget is spent
+
+    slept = []
+
+    def fake_sleep(seconds):
+        slept.append(seconds)
+        # Pretend the window reset while we slept
+        limiter._budgets["search"].remaining = 30
+
+    with patch.object(rate_limit.time, "sleep", fake_sleep):
+        client.get("/search/issues")
+    assert slept and 0 < slept[0] <= 10, f"Expected wait until reset, got {slept}"
+
+    limiter._budgets["core"].remaining = 0
+    limiter._budgets["core"].reset_at = time.time() + 3600
+    try:
+        client.get("/repos/o/r")
+        raise AssertionError("Expected GithubException for exhausted core budget")
+    except GithubException as e:
+        assert e.status == 403
+        assert "core rate limit exhausted" in e.data["message"]
+
+    print(f"✅ Waited {slept[0]:.1f}s for search reset, failed fast on core")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_get_rate_limits():
+    """Test that GitHubClient.get_rate_limits reports synced budgets."""
+    print("\n=== Test 5: get_rate_limits ===")
+
+    from mcp_server.api_clients.github_client import GitHubClient
+
+    reset = int(time.time()) + 1800
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/rate_limit"
+        return httpx.Response(
+            200,
+            json={
+                "resources": {
+                    "core": {
+                        "limit": 5000,
+                        "remaining": 4000,
+                        "reset": reset,
+                        "used": 1000,
+                    },
+                    "search": {
+                        "limit": 30,
+                        "remaining": 12,
+                        "reset": reset,
+                        "used": 18,
+                    },
+                    "graphql": {
+                        "limit": 5000,
+                        "remaining": 4999,
+                        "reset": reset,
+                        "used": 1,
+                    },
+                }
+            },
+        )
+
+    client = GitHubClient(
+        token="fake-token",
+        installation_id=123,
+        transport=httpx.MockTransport(handler),
+    )
+    budgets = client.get_rate_limits()
+
+    assert budgets["core"]["remaining"] == 4000, "/rate_limit itself is free"
+    assert budgets["search"]["remaining"] == 12
+    assert budgets["graphql"]["used"] == 1
+
+    print("✅ Budgets synced from /rate_limit")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_shared_concurrency_limit():
+    """Test that sync and async requests draw from the same slots."""
+    print("\n=== Test 6: shared concurrency limit ===")
+
+    lock = threading.Lock()
+    state = {"in_flight": 0, "peak": 0}
+
+    def enter():
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+
+    def leave():
+        with lock:
+            state["in_flight"] -= 1
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        enter()
+        time.sleep(0.1)
+        leave()
+        return httpx.Response(200, json={})
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        enter()
+        await asyncio.sleep(0.1)
+        leave()
+        return httpx.Response(200, json={})
+
+    limiter = RateLimiter(max_concurrent=2)
+    sync_client = _client(handler, limiter)
+
+    async def run():
+        async with httpx.AsyncClient(
+            base_url="https://api.github.com",
+            transport=AsyncRateLimitTransport(
+                httpx.MockTransport(async_handler), limiter
+            ),
+        ) as client:
+            await asyncio.gather(*(client.get(f"/repos/o/r{i}") for i in range(3)))
+
+    threads = [
+        threading.Thread(target=sync_client.get, args=(f"/repos/o/s{i}",))
+        for i in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    asyncio.run(run())
+    for thread in threads:
+        thread.join()
+
+    assert state["peak"] == 2, state
+    assert limiter._in_flight == 0
+
+    print(f"✅ 6 sync/async requests, at most {state['peak']} in flight")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Rate Limit Tests")
+    print("=" * 60)
+
+    tests = [
+        test_budgets_from_headers,
+        test_retries_honor_retry_after,
+        test_permission_403_not_retried,
+        test_spent_budget_waits_or_fails,
+        test_get_rate_limits,
+        test_shared_concurrency_limit,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test Search API pagination for merged PRs in GitHubClient.
+
+Tests:
+1. Pages are followed through Link headers
+2. Date windows over the 1000-result cap are split, newest first
+3. search_merged_prs stops fetching once the limit is reached
+
+Usage:
+    uv run python tests/test_search_pagination.py
+"""
+
+import re
+from datetime import date
+
+import httpx
+
+
+def _make_client(handler):
+    """Create a GitHubClient whose HTTP calls go to a mock transport."""
+    from mcp_server.api_clients.github_client import GitHubClient
+
+    return GitHubClient(
+        token="fake-token",
+        installation_id=123,
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def _item(number: int) -> dict:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "body": None,
+        "html_url": f"https://github.com/org/repo/pull/{number}",
+        "repository_url": "https://api.github.com/repos/org/repo",
+        "user": {"login": "alice"},
+        "labels": [{"name": "feature"}],
+        "pull_request": {"merged_at": "2024-01-01T00:00:00Z"},
+    }
+
+
+def _paged_handler(total: int, seen: list):
+    """Serve `total` items, 100 per page, linking pages with Link headers."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        page = int(request.url.params.get("page", "1"))
+        start = (page - 1) * 100 + 1
+        end = min(start + 100, total + 1)
+        headers = {}
+        if end <= total:
+            next_url = request.url.copy_set_param("page", str(page + 1))
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return httpx.Response(
+            200,
+            headers=headers,
+            json={
+                "total_count": total,
+                "items": [_item(n) for n in range(start, end)],
+            },
+        )
+
+    return handler
+
+
+def test_follows_link_headers():
+    """Test that all pages are fetched, not just the first 100 results."""
+    print("\n=== Test 1: follows Link headers ===")
+
+    seen = []
+    client = _make_client(_paged_handler(250, seen))
+    prs = client.search_merged_prs(
+        author="alice", since_date="2024-01-01", limit=None, detail_level="full"
+    )
+
+    assert len(prs) == 250, f"Expected 250 PRs, got {len(prs)}"
+    assert len(seen) == 3, f"Expected 3 pages, got {len(seen)}"
+    query = seen[0].url.params["q"]
+    assert "author:alice" in query
+    assert re.search(r"merged:2024-01-01\.\.\d{4}-\d{2}-\d{2}", query)
+    assert prs[0]["labels"] == ["feature"] and prs[0]["body"] == ""
+    assert prs[0]["owner"] == "org" and prs[0]["repo"] == "repo"
+
+    print(f"✅ {len(prs)} PRs across {len(seen)} pages")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_splits_windows_over_cap():
+    """Test that ranges matching >1000 PRs are split into sub-windows."""
+    print("\n=== Test 2: splits windows over the cap ===")
+
+    windows = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start, end = re.search(
+            r"merged:(\S+)\.\.(\S+)", request.url.params["q"]
+        ).groups()
+        days = (date.fromisoformat(end) - date.fromisoformat(start)).days + 1
+        windows.append((start, end))
+        # 300 merged PRs per day: only windows of 3 days or less fit the cap
+        total = days * 300
+        base = date.fromisoformat(start).toordinal() * 1000
+        items = [] if total > 1000 else [_item(base + n) for n in range(total)]
+        return httpx.Response(200, json={"total_count": total, "items": items})
+
+    client = _make_client(handler)
+    prs = list(client.iter_merged_prs(since_date="2024-01-01", until_date="2024-01-08"))
+
+    assert len(prs) == 8 * 300, f"Expected 2400 PRs, got {len(prs)}"
+    sub_windows = windows[1:]
+    assert ("2024-01-05", "2024-01-08") in sub_windows
+    assert sub_windows.index(("2024-01-05", "2024-01-08")) < sub_windows.index(
+        ("2024-01-01", "2024-01-04")
+    ), "Newer windows should be searched first"
+
+    print(f"✅ {len(prs)} PRs from {len(windows)} window queries")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_limit_stops_streaming():
+    """Test that a small limit only fetches the pages it needs."""
+    print("\n=== Test 3: limit stops streaming ===")
+
+    seen = []
+    client = _make_client(_paged_handler(500, seen))
+    prs = client.search_merged_prs(since_date="2024-01-01", limit=150)
+
+    assert len(prs) == 150
+    assert len(seen) == 2, f"Expected 2 pages, got {len(seen)}"
+    assert "body" not in prs[0], "Summary results should skip body"
+
+    print(f"✅ limit=150 fetched {len(seen)} of 5 pages")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Search Pagination Tests")
+    print("=" * 60)
+
+    tests = [
+        test_follows_link_headers,
+        test_splits_windows_over_cap,
+        test_limit_stops_streaming,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test the precomputed Slack channel resolution index.
+
+Tests:
+1. Exact names win, then unique prefixes, then fuzzy matches
+2. Repeated resolutions reuse one index and memoized fuzzy results
+3. The index is rebuilt when the channel cache refreshes
+
+Usage:
+    uv run python tests/test_slack_channel_index.py
+"""
+
+from unittest.mock import patch
+
+import httpx
+
+from mcp_server.api_clients import slack_channel_index
+from mcp_server.api_clients.slack_client import SlackClient
+
+CHANNELS = [
+    {"id": "C1", "name": "engineering"},
+    {"id": "C2", "name": "eng-ops"},
+    {"id": "C3", "name": "launch-2025"},
+    {"id": "C4", "name": "dev-no-sleep"},
+    {"id": "C5", "name": "eng"},
+]
+
+
+def _client(channels):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"ok": True, "channels": list(channels)})
+
+    return SlackClient(
+        bot_token="xoxb-test", transport=httpx.MockTransport(handler)
+    ), calls
+
+
+def test_resolution_order():
+    """Test exact > unique prefix > fuzzy."""
+    print("\n=== Test 1: resolution order ===")
+
+    client, _ = _client(CHANNELS)
+
+    assert client.resolve_channel("#eng") == "C5", "Exact beats prefix"
+    assert client.resolve_channel("ENGINEERING") == "C1"
+    assert client.resolve_channel("launch") == "C3", "Unique prefix"
+    assert client.resolve_channel("eng-o") == "C2"
+    assert client.resolve_channel("sleep no dev") == "C4", "Fuzzy"
+    try:
+        client.resolve_channel("marketing")
+        raise AssertionError("Expected ValueError for unknown channel")
+    except ValueError as e:
+        assert "not found" in str(e)
+
+    print("✅ Exact, prefix and fuzzy matches resolved in order")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_index_reused():
+    """Test that resolution doesn't rebuild or rescan per call."""
+    print("\n=== Test 2: index reused ===")
+
+    channels = CHANNELS + [
+        {"id": f"C{i}", "name": f"team-{i}"} for i in range(10, 3000)
+    ]
+    client, _ = _client(channels)
+
+    real_extract = slack_channel_index.process.extractOne
+    with (
+        patch.object(
+            slack_channel_index.ChannelIndex,
+            "__init__",
+            autospec=True,
+            side_effect=slack_channel_index.ChannelIndex.__init__,
+        ) as build,
+        patch.object(
+            slack_channel_index.process, "extractOne", side_effect=real_extract
+        ) as extract,
+    ):
+        for _ in range(200):
+            assert client.resolve_channel("team-2999") == "C2999"
+            assert client.resolve_channel("sleep no dev") == "C4"
+
+    assert build.call_count == 1, build.call_count
+    assert extract.call_count == 1, extract.call_count
+
+    print("✅ 400 resolutions, 1 index build, 1 fuzzy scan")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_index_rebuilt_on_refresh():
+    """Test that a refreshed channel list gets a new index."""
+    print("\n=== Test 3: index rebuilt on refresh ===")
+
+    channels = list(CHANNELS)
+    client, calls = _client(channels)
+    assert client.resolve_channel("launch") == "C3"
+    first = client._channel_index
+
+    channels.append({"id": "C6", "name": "launch-2026"})
+    client._channel_cache_at -= client.channel_cache_ttl
+
+    assert client.resolve_channel("launch-2026") == "C6"
+    assert client._channel_index is not first
+    # "launch" is no longer a unique prefix
+    assert client._channel_index.prefix("launch") is None
+    assert len(calls) == 2
+
+    print("✅ New index after the channel cache expired")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Slack Channel Index Tests")
+    print("=" * 60)
+
+    tests = [
+        test_resolution_order,
+        test_index_reused,
+        test_index_rebuilt_on_refresh,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Test SlackClient transport, pagination and rate limiting.
+
+Tests:
+1. list_channels follows cursors past the first 200 channels
+2. History and user listings stop paginating once the limit is reached
+3. 429 responses are retried after Retry-After
+4. Tier limits hold calls back before Slack rejects them
+5. Sync and async calls reuse one pooled client
+6. A rotated bot token closes the replaced client's pools and store
+7. A call the tier budget would hold back past max_wait fails fast
+
+Usage:
+    uv run python tests/test_slack_client.py
+"""
+
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+
+from mcp_server.api_clients import slack_rate_limit
+from mcp_server.api_clients.slack_client import SlackAPIError, SlackClient
+from mcp_server.api_clients.slack_rate_limit import SlackRateLimiter
+
+
+class _FakeClock:
+    """Stands in for time.monotonic/time.sleep so waits are instant."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _paged(items, key, request: httpx.Request) -> httpx.Response:
+    """Serve items in pages using an offset cursor."""
+    start = int(request.url.params.get("cursor") or 0)
+    size = int(request.url.params["limit"])
+    page = items[start : start + size]
+    next_cursor = str(start + size) if start + size < len(items) else ""
+    return httpx.Response(
+        200,
+        json={
+            "ok": True,
+            key: page,
+            "response_metadata": {"next_cursor": next_cursor},
+        },
+    )
+
+
+def test_channels_paginate_past_200():
+    """Test that channels beyond the first page can be resolved."""
+    print("\n=== Test 1: channels paginate past 200 ===")
+
+    channels = [{"id": f"C{i:04d}", "name": f"channel-{i}"} for i in range(450)]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return _paged(channels, "channels", request)
+
+    client = SlackClient(bot_token="xoxb-test", transport=httpx.MockTransport(handler))
+    listed = client.list_channels(limit=1000)
+
+    assert len(listed) == 450
+    assert len(requests) == 3
+    assert [r.url.params.get("cursor") for r in requests] == [None, "200", "400"]
+    assert client.resolve_channel("#channel-420") == "C0420"
+
+    print(f"✅ {len(listed)} channels over {len(requests)} pages")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_pagination_stops_at_limit():
+    """Test that history/users don't fetch pages past the limit."""
+    print("\n=== Test 2: pagination stops at limit ===")
+
+    messages = [{"ts": f"{1700000000 + i}.0", "text": f"m{i}"} for i in range(500)]
+    members = [
+        {"id": f"U{i}", "name": f"user{i}", "is_bot": i % 2 == 1} for i in range(600)
+    ]
+    calls = {"conversations.history": 0, "users.list": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        calls[method] += 1
+        if method == "conversations.history":
+            return _paged(messages, "messages", request)
+        return _paged(members, "members", request)
+
+    client = SlackClient(bot_token="xoxb-test", transport=httpx.MockTransport(handler))
+    client._user_cache = {}
+    client._user_cache_at = time.time()
+
+    history = client.get_channel_messages("C123", limit=250)
+    assert len(history) == 250
+    assert calls["conversations.history"] == 2
+
+    # Half the members are bots, so 250 humans take two pages
+    users = client.list_users(limit=250)
+    assert len(users) == 250
+    assert not any(u.is_bot for u in users)
+    assert calls["users.list"] == 3
+
+    print(f"✅ {len(history)} messages and {len(users)} users, no extra pages")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_retry_after_honored():
+    """Test that a 429 waits for Retry-After and retries."""
+    print("\n=== Test 3: Retry-After honored ===")
+
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "3"}),
+        httpx.Response(200, json={"ok": True, "team": "Acme"}),
+        httpx.Response(429, headers={"Retry-After": "120"}),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return responses.pop(0)
+
+    clock = _FakeClock()
+    client = SlackClient(bot_token="xoxb-test", transport=httpx.MockTransport(handler))
+
+    with patch.object(slack_rate_limit, "time", clock):
+        status = client.health_check()
+        assert status["connected"] and status["team"] == "Acme"
+        assert clock.slept == [3.0]
+
+        # A Retry-After beyond max_wait is surfaced instead of blocking
+        try:
+            client._request_sync("POST", "auth.test")
+            raise AssertionError("Expected SlackAPIError for long Retry-After")
+        except SlackAPIError as e:
+            assert "ratelimited" in str(e)
+
+    print(f"✅ Retried after {clock.slept}s, long Retry-After surfaced")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_tier_limits_throttle():
+    """Test that a method's per-minute tier budget paces calls."""
+    print("\n=== Test 4: tier limits throttle ===")
+
+    clock = _FakeClock()
+    limiter = SlackRateLimiter()
+    assert limiter.limit_for("conversations.list") == 20
+    assert limiter.limit_for("users.info") == 100
+    assert limiter.limit_for("chat.postMessage") == 60
+
+    with patch.object(slack_rate_limit, "time", clock):
+        waits = [limiter.reserve("conversations.list") for _ in range(21)]
+        assert waits[:20] == [0.0] * 20
+        assert waits[20] == 60.0
+        # Other methods have their own budget
+        assert limiter.reserve("conversations.history") == 0.0
+
+        clock.now += 60
+        assert limiter.reserve("conversations.list") == 0.0
+
+    print("✅ 21st conversations.list call waits for the window")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_pooled_client_reused():
+    """Test that calls share one pooled client instead of opening new ones."""
+    print("\n=== Test 5: pooled client reused ===")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ok": True, "channel": "C1", "ts": "1.0"})
+
+    transport = httpx.MockTransport(handler)
+    client = SlackClient(
+        bot_token="xoxb-test", transport=transport, async_transport=transport
+    )
+
+    with patch.object(httpx, "Client", side_effect=AssertionError("new client")):
+        client.send_message("hi", channel="C1")
+        client.send_message("again", channel="C1")
+
+    async def run():
+        await client.send_message_async("hi", channel="C1")
+        first = client._async_http[1]
+        await client.send_message_async("again", channel="C1")
+        assert client._async_http[1] is first
+        await client.aclose()
+
+    asyncio.run(run())
+    client.close()
+
+    print("✅ Sync and async calls reused their pools")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_rotated_token_closes_client():
+    """Test that slack_tools closes the client a new token replaces."""
+    print("\n=== Test 6: token rotation closes old client ===")
+
+    from mcp_server.tools import slack_tools
+
+    creds = SimpleNamespace(slack_connected=True, slack_bot_token="xoxb-first")
+    store = SimpleNamespace(
+        is_authenticated=lambda: True,
+        get_api_credentials=lambda: creds,
+        invalidate_api_credentials=lambda: None,
+    )
+
+    async def run(tmp: str):
+        with (
+            patch.object(slack_tools, "get_credential_store", return_value=store),
+            patch.object(slack_tools, "get_http_cache", return_value=None),
+            patch.object(slack_tools, "SLACK_DIRECTORY_DIR", Path(tmp)),
+            patch.object(slack_tools, "_client_cache", None),
+        ):
+            first = slack_tools._get_client()
+            async_http = first._get_async_http()
+            assert slack_tools._get_client() is first
+
+            creds.slack_bot_token = "xoxb-second"
+            second = slack_tools._get_client()
+            await asyncio.sleep(0.05)  # let the scheduled aclose run
+
+            assert second is not first
+            assert first._http.is_closed, "Old sync pool left open"
+            assert async_http.is_closed, "Old async pool left open"
+            try:
+                first.message_store.mark("C1")
+                raise AssertionError("Old message store left open")
+            except Exception as e:
+                assert "closed" in str(e)
+            second.close()
+            second.message_store.close()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(tmp))
+
+    print("✅ Old client's pools and message store closed")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_budget_wait_capped():
+    """Test that an exhausted budget fails a call instead of blocking it."""
+    print("\n=== Test 7: budget wait capped ===")
+
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"ok": True, "members": []})
+
+    clock = _FakeClock()
+    limiter = SlackRateLimiter(max_wait=30.0)
+    client = SlackClient(
+        bot_token="xoxb-test",
+        transport=httpx.MockTransport(handler),
+        rate_limiter=limiter,
+    )
+
+    with patch.object(slack_rate_limit, "time", clock):
+        for _ in range(20):
+            limiter.reserve("users.list")
+        try:
+            client.list_users()
+            raise AssertionError("Expected SlackAPIError")
+        except SlackAPIError as e:
+            assert e.error == "ratelimited"
+
+    assert clock.slept == [] and calls == []
+
+    print("✅ Call over budget failed as ratelimited without waiting 60s")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Slack Client Tests")
+    print("=" * 60)
+
+    tests = [
+        test_channels_paginate_past_200,
+        test_pagination_stops_at_limit,
+        test_retry_after_honored,
+        test_tier_limits_throttle,
+        test_pooled_client_reused,
+        test_rotated_token_closes_client,
+        test_budget_wait_capped,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
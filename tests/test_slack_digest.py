@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Test the multi-channel Slack digest.
+
+Tests:
+1. Channels are fetched concurrently with one user directory lookup
+2. The digest stays within its size budget and reports what was left out
+3. Unknown channels are reported; no channels means every member channel
+4. Only channels with messages share the size budget
+
+Usage:
+    uv run python tests/test_slack_digest.py
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+
+from mcp_server.api_clients.slack_client import SlackClient
+
+
+class _Workspace:
+    """Fake workspace with N channels of short messages."""
+
+    def __init__(self, channels: int, messages: int = 3, text: str = "hello"):
+        self.channels = [
+            {"id": f"C{i}", "name": f"team-{i}", "is_member": i % 2 == 0}
+            for i in range(channels)
+        ]
+        self.messages = [
+            {"ts": f"{1700000000 + i}.0", "user": f"U{i % 2}", "text": text}
+            for i in range(messages)
+        ][::-1]
+        self.messages[0].update(
+            reply_count=1, thread_ts=self.messages[0]["ts"], latest_reply="9.0"
+        )
+        # Channel IDs with no recent messages
+        self.quiet = set()
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def sync_handler(self, request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        self.calls.append(method)
+        if method == "conversations.list":
+            body = {"channels": self.channels}
+        elif method == "users.list":
+            body = {
+                "members": [
+                    {"id": "U0", "name": "alice", "profile": {}},
+                    {"id": "U1", "name": "bob", "profile": {}},
+                ]
+            }
+        else:
+            raise AssertionError(f"Unexpected sync call: {method}")
+        return httpx.Response(200, json={"ok": True, **body})
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        channel = request.url.params["channel"]
+        self.calls.append(f"{method}:{channel}")
+        if method == "conversations.replies":
+            ts = request.url.params["ts"]
+            messages = [
+                {"ts": ts, "user": "U0", "text": "parent"},
+                {"ts": "9.0", "user": "U1", "text": "reply"},
+            ]
+            return httpx.Response(200, json={"ok": True, "messages": messages})
+
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            self.in_flight -= 1
+        messages = [] if channel in self.quiet else self.messages
+        return httpx.Response(200, json={"ok": True, "messages": messages})
+
+    def client(self) -> SlackClient:
+        return SlackClient(
+            bot_token="xoxb-test",
+            transport=httpx.MockTransport(self.sync_handler),
+            async_transport=httpx.MockTransport(self.async_handler),
+        )
+
+
+async def _digest(client: SlackClient, **arguments) -> dict:
+    from fastmcp import Client, FastMCP
+
+    from mcp_server.tools import slack_tools
+
+    mcp = FastMCP("test")
+    slack_tools.create_slack_tools(mcp)
+    with patch.object(slack_tools, "_get_client", return_value=client):
+        async with Client(mcp) as mcp_client:
+            result = await mcp_client.call_tool("read_slack_digest", arguments)
+    return json.loads(result.content[0].text)
+
+
+def test_channels_fetched_concurrently():
+    """Test that 10 channels overlap and share one users.list."""
+    print("\n=== Test 1: channels fetched concurrently ===")
+
+    from mcp_server.api_clients.slack_client import CHANNEL_FETCH_CONCURRENCY
+
+    workspace = _Workspace(channels=10)
+    names = [f"#team-{i}" for i in range(10)]
+    data = asyncio.run(_digest(workspace.client(), channels=names))
+
+    assert data["channels_read"] == 10
+    assert data["total_messages"] == 30
+    assert [entry["channel"] for entry in data["channels"]] == names
+    newest = data["channels"][0]["messages"][0]
+    assert newest["user"] == "alice"
+    assert newest["replies"] == [{"user": "bob", "text": "reply"}]
+    assert workspace.calls.count("users.list") == 1
+    assert workspace.calls.count("conversations.list") == 1
+    assert workspace.peak == CHANNEL_FETCH_CONCURRENCY, workspace.peak
+
+    print(f"✅ 10 channels, peak {workspace.peak} in flight, 1 users.list")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_digest_size_bounded():
+    """Test clipping, per-channel budgets and omitted counts."""
+    print("\n=== Test 2: digest size bounded ===")
+
+    from mcp_server.tools.slack_tools import DIGEST_MAX_CHARS, DIGEST_TEXT_MAX
+
+    workspace = _Workspace(channels=4, messages=100, text="x" * 2000)
+    data = asyncio.run(
+        _digest(
+            workspace.client(),
+            channels=["team-0", "team-1", "team-2", "team-3"],
+            include_threads=False,
+        )
+    )
+
+    text = sum(
+        len(msg["text"]) for entry in data["channels"] for msg in entry["messages"]
+    )
+    assert text <= DIGEST_MAX_CHARS, text
+    for entry in data["channels"]:
+        assert all(len(m["text"]) == DIGEST_TEXT_MAX + 1 for m in entry["messages"])
+        assert entry["count"] + entry["omitted"] == 100
+        assert entry["omitted"] > 0
+    assert not any(c.startswith("conversations.replies") for c in workspace.calls)
+
+    print(f"✅ {text} chars of text, omitted messages reported per channel")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_unknown_and_default_channels():
+    """Test error reporting and the member-channel default."""
+    print("\n=== Test 3: unknown and default channels ===")
+
+    workspace = _Workspace(channels=4)
+    client = workspace.client()
+
+    async def run():
+        picked = await _digest(client, channels=["team-1", "marketing-zzz"])
+        default = await _digest(client)
+        return picked, default
+
+    picked, default = asyncio.run(run())
+
+    assert picked["channels_read"] == 1
+    assert "not found" in picked["errors"]["marketing-zzz"]
+    assert [entry["channel"] for entry in default["channels"]] == [
+        "#team-0",
+        "#team-2",
+    ]
+
+    print("✅ Unknown channel reported, default read member channels only")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_budget_split_over_active_channels():
+    """Test that quiet and unknown channels don't shrink the others' share."""
+    print("\n=== Test 4: budget split over active channels ===")
+
+    from mcp_server.tools.slack_tools import DIGEST_MAX_CHARS, DIGEST_TEXT_MAX
+
+    workspace = _Workspace(channels=4, messages=100, text="x" * 2000)
+    workspace.quiet = {"C1", "C2"}
+    data = asyncio.run(
+        _digest(
+            workspace.client(),
+            channels=["team-0", "team-1", "team-2", "team-3", "marketing-zzz"],
+            include_threads=False,
+        )
+    )
+
+    assert data["channels_read"] == 4
+    assert [entry["channel"] for entry in data["channels"]] == ["team-0", "team-3"]
+    share = DIGEST_MAX_CHARS // 2 // (DIGEST_TEXT_MAX + 1)
+    assert [entry["count"] for entry in data["channels"]] == [share, share]
+
+    print(f"✅ 2 active channels of 5 requested, {share} messages each")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Slack Digest Tests")
+    print("=" * 60)
+
+    tests = [
+        test_channels_fetched_concurrently,
+        test_digest_size_bounded,
+        test_unknown_and_default_channels,
+        test_budget_split_over_active_channels,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
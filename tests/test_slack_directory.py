@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Test SlackClient channel/user directory caching.
+
+Tests:
+1. The channel list expires after its TTL; forced refreshes skip the HTTP cache
+2. An unknown channel name refreshes the list once before fuzzy matching
+3. Unknown user IDs are looked up with users.info, not users.list
+4. The directory is persisted so a new client starts warm
+5. Failed users.info lookups (other than unknown IDs) aren't remembered
+6. Cold starts read a bounded directory; expired names refresh per ID
+
+Usage:
+    uv run python tests/test_slack_directory.py
+"""
+
+import tempfile
+from pathlib import Path
+
+import httpx
+
+from mcp_server.api_clients.http_cache import HTTPCache
+from mcp_server.api_clients.slack_client import SlackAPIError, SlackClient
+
+
+class _Workspace:
+    """Fake Slack workspace whose channels and users can change."""
+
+    def __init__(self):
+        self.channels = [{"id": "C1", "name": "general"}]
+        self.members = [{"id": "U1", "name": "alice", "profile": {}}]
+        self.new_members = {}
+        # user ID -> users.info error code, e.g. "missing_scope"
+        self.info_errors = {}
+        self.messages = []
+        self.calls = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        self.calls.append(method)
+        if method == "conversations.list":
+            body = {"channels": self.channels}
+        elif method == "users.list":
+            body = {"members": self.members}
+        elif method == "users.info":
+            user_id = request.url.params["user"]
+            if user_id in self.info_errors:
+                return httpx.Response(
+                    200, json={"ok": False, "error": self.info_errors[user_id]}
+                )
+            if user_id not in self.new_members:
+                return httpx.Response(
+                    200, json={"ok": False, "error": "user_not_found"}
+                )
+            body = {"user": self.new_members[user_id]}
+        elif method == "conversations.history":
+            body = {"messages": self.messages}
+        else:
+            raise AssertionError(f"Unexpected call: {method}")
+        return httpx.Response(200, json={"ok": True, **body})
+
+    def client(self, **kwargs) -> SlackClient:
+        return SlackClient(
+            bot_token="xoxb-test",
+            transport=httpx.MockTransport(self.handler),
+            **kwargs,
+        )
+
+
+def test_channel_list_expires():
+    """Test TTL expiry, and that use_cache=False bypasses the HTTP cache."""
+    print("\n=== Test 1: channel list expires ===")
+
+    workspace = _Workspace()
+    client = workspace.client()
+    client.list_channels()
+    workspace.channels.append({"id": "C2", "name": "random"})
+    assert len(client.list_channels()) == 1, "Served from memory within TTL"
+
+    client._channel_cache_at -= client.channel_cache_ttl
+    assert [ch.name for ch in client.list_channels()] == ["general", "random"]
+    assert workspace.calls == ["conversations.list", "conversations.list"]
+
+    workspace = _Workspace()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = HTTPCache(path=Path(tmp) / "cache.db")
+        client = workspace.client(http_cache=cache)
+        client.list_channels()
+        workspace.channels.append({"id": "C2", "name": "random"})
+        client._channel_cache = None
+        assert len(client.list_channels()) == 1, "Served from HTTP cache"
+        names = [ch.name for ch in client.list_channels(use_cache=False)]
+        cache.close()
+
+    assert names == ["general", "random"]
+    assert workspace.calls == ["conversations.list", "conversations.list"]
+
+    print("✅ Refetched after TTL, forced refresh skipped the HTTP cache")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_unknown_channel_refreshes():
+    """Test that a channel created after caching can be resolved."""
+    print("\n=== Test 2: unknown channel refreshes list ===")
+
+    workspace = _Workspace()
+    client = workspace.client()
+    client.list_channels()
+    client._channel_cache_at -= 120
+
+    workspace.channels.append({"id": "C9", "name": "launch-2025"})
+    assert client.resolve_channel("#launch-2025") == "C9"
+    assert workspace.calls.count("conversations.list") == 2
+
+    # Just refreshed: a second miss falls through to fuzzy matching only
+    try:
+        client.resolve_channel("nonexistent-zzz")
+        raise AssertionError("Expected ValueError for unknown channel")
+    except ValueError:
+        pass
+    assert workspace.calls.count("conversations.list") == 2
+
+    print("✅ New channel found with one refresh, repeat misses don't refetch")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_unknown_user_uses_users_info():
+    """Test that new user IDs are resolved individually."""
+    print("\n=== Test 3: unknown users via users.info ===")
+
+    workspace = _Workspace()
+    workspace.messages = [
+        {"ts": "3.0", "user": "U2", "text": "hi, I'm new"},
+        {"ts": "2.0", "user": "U404", "text": "deleted user"},
+        {"ts": "1.0", "user": "U1", "text": "welcome"},
+    ]
+    workspace.new_members["U2"] = {
+        "id": "U2",
+        "name": "bob",
+        "profile": {"display_name": "Bobby"},
+    }
+    client = workspace.client()
+    client._get_user_map()  # Directory cached before U2 joined
+
+    messages = client.get_channel_messages("C1")
+    assert [m.user_name for m in messages] == ["Bobby", "U404", "alice"]
+    assert workspace.calls.count("users.list") == 1
+    assert workspace.calls.count("users.info") == 2
+
+    # Both IDs are remembered
+    client.get_channel_messages("C1")
+    assert workspace.calls.count("users.info") == 2
+
+    print("✅ 2 users.info lookups, no directory refetch")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_directory_persisted():
+    """Test that a new client loads the saved directory instead of fetching."""
+    print("\n=== Test 4: directory persisted ===")
+
+    workspace = _Workspace()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "slack" / "directory.json"
+        first = workspace.client(directory_path=path)
+        first.list_channels()
+        first._get_user_map()
+        assert path.exists()
+        assert path.stat().st_mode & 0o777 == 0o600
+
+        workspace.calls.clear()
+        second = workspace.client(directory_path=path)
+        assert second.resolve_channel("general") == "C1"
+        assert second._get_user_map() == {"U1": "alice"}
+        assert workspace.calls == []
+
+        # Expired entries on disk are refetched
+        third = workspace.client(directory_path=path, channel_cache_ttl=0)
+        third.list_channels()
+        assert workspace.calls == ["conversations.list"]
+
+    print("✅ Cold start served from disk, expired entries refetched")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_failed_lookup_not_cached():
+    """Test that a transient users.info error isn't saved as the name."""
+    print("\n=== Test 5: failed lookups not cached ===")
+
+    workspace = _Workspace()
+    workspace.messages = [{"ts": "1.0", "user": "U3", "text": "hello"}]
+    workspace.new_members["U3"] = {
+        "id": "U3",
+        "name": "carol",
+        "profile": {"display_name": "Carol"},
+    }
+    workspace.info_errors["U3"] = "internal_error"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "directory.json"
+        client = workspace.client(directory_path=path)
+
+        messages = client.get_channel_messages("C1")
+        assert messages[0].user_name == "U3", "Falls back to the ID for now"
+        assert "U3" not in client._get_user_map()
+        assert "U3" not in path.read_text(), "Raw ID saved as display name"
+
+        del workspace.info_errors["U3"]
+        messages = client.get_channel_messages("C1")
+        assert messages[0].user_name == "Carol"
+
+    try:
+        workspace.info_errors["U9"] = "missing_scope"
+        workspace.client().get_user("U9")
+        raise AssertionError("Expected SlackAPIError")
+    except SlackAPIError as e:
+        assert e.error == "missing_scope"
+    assert workspace.client().get_user("U404") is None
+
+    print("✅ Failed lookup retried next call, resolved once Slack recovered")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_directory_bounded_and_refreshed_per_id():
+    """Test that reads never scan the whole workspace with users.list."""
+    print("\n=== Test 6: bounded directory, per-ID refresh ===")
+
+    from mcp_server.api_clients.slack_client import USER_DIRECTORY_LIMIT
+
+    workspace = _Workspace()
+    workspace.members = [
+        {"id": f"U{i}", "name": f"user{i}", "profile": {}} for i in range(1, 2000)
+    ]
+    workspace.messages = [{"ts": "1.0", "user": "U1", "text": "hello"}]
+    client = workspace.client()
+
+    assert client.get_channel_messages("C1")[0].user_name == "user1"
+    assert len(client._user_cache) == USER_DIRECTORY_LIMIT
+    assert workspace.calls.count("users.list") == 1
+
+    # Past the TTL: the old directory is served, U1 alone is looked up
+    client._user_cache_at -= client.user_cache_ttl
+    workspace.new_members["U1"] = {"id": "U1", "name": "alice", "profile": {}}
+    workspace.calls.clear()
+    assert client.get_channel_messages("C1")[0].user_name == "alice"
+    assert workspace.calls == ["conversations.history", "users.info"]
+
+    workspace.calls.clear()
+    client.get_channel_messages("C1")
+    assert workspace.calls == ["conversations.history"], "U1 checked again"
+    assert client._user_cache["U2"] == "user2", "Expired entries still served"
+
+    print("✅ One bounded users.list, then users.info for expired IDs only")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Slack Directory Cache Tests")
+    print("=" * 60)
+
+    tests = [
+        test_channel_list_expires,
+        test_unknown_channel_refreshes,
+        test_unknown_user_uses_users_info,
+        test_directory_persisted,
+        test_failed_lookup_not_cached,
+        test_directory_bounded_and_refreshed_per_id,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
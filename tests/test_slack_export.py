@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Test the streaming Slack history export.
+
+Tests:
+1. Every page of the date range is streamed to a JSONL file
+2. The export index points at each day's messages
+3. read_slack_export serves slices from the file without API calls
+
+Usage:
+    uv run python tests/test_slack_export.py
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import httpx
+
+from mcp_server.api_clients.slack_client import SlackClient
+
+# 2025-03-01 00:00 UTC
+DAY_START = datetime(2025, 3, 1, tzinfo=timezone.utc).timestamp()
+
+
+class _History:
+    """Fake channel with 3 days of history, 300 messages per day."""
+
+    def __init__(self):
+        self.messages = [
+            {
+                "ts": f"{DAY_START + day * 86400 + i * 60 + 30:.6f}",
+                "user": f"U{i % 3}",
+                "text": f"day {day} message {i}",
+                **({"reply_count": 4, "thread_ts": "x"} if i == 10 else {}),
+            }
+            for day in range(3)
+            for i in range(300)
+        ][::-1]
+        self.messages.insert(5, {"ts": "0.1", "subtype": "channel_join"})
+        self.calls = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        self.calls.append(method)
+        if method == "conversations.list":
+            body = {"channels": [{"id": "C1", "name": "eng"}]}
+        elif method == "users.list":
+            body = {
+                "members": [
+                    {"id": f"U{i}", "name": name, "profile": {}}
+                    for i, name in enumerate(["alice", "bob", "carol"])
+                ]
+            }
+        elif method == "conversations.history":
+            params = request.url.params
+            assert params["channel"] == "C1"
+            oldest = float(params.get("oldest", 0))
+            latest = float(params.get("latest", "inf"))
+            matching = [
+                m
+                for m in self.messages
+                if m.get("subtype") or oldest < float(m["ts"]) < latest
+            ]
+            start = int(params.get("cursor") or 0)
+            size = int(params["limit"])
+            more = start + size < len(matching)
+            body = {
+                "messages": matching[start : start + size],
+                "response_metadata": {"next_cursor": str(start + size) if more else ""},
+            }
+        else:
+            raise AssertionError(f"Unexpected call: {method}")
+        return httpx.Response(200, json={"ok": True, **body})
+
+    def client(self) -> SlackClient:
+        return SlackClient(
+            bot_token="xoxb-test", transport=httpx.MockTransport(self.handler)
+        )
+
+
+async def _call(client: SlackClient, tool: str, arguments: dict) -> dict:
+    from fastmcp import Client, FastMCP
+
+    from mcp_server.tools import slack_tools
+
+    mcp = FastMCP("test")
+    slack_tools.create_slack_tools(mcp)
+    with patch.object(slack_tools, "_get_client", return_value=client):
+        async with Client(mcp) as mcp_client:
+            result = await mcp_client.call_tool(tool, arguments)
+    return json.loads(result.content[0].text)
+
+
+def _export(history: _History, **arguments) -> dict:
+    return asyncio.run(
+        _call(
+            history.client(),
+            "export_slack_history",
+            {"channel": "#eng", **arguments},
+        )
+    )
+
+
+def test_export_streams_all_pages():
+    """Test that the export covers the whole range, not the first page."""
+    print("\n=== Test 1: export streams all pages ===")
+
+    history = _History()
+    data = _export(history, start_date="2025-03-01", end_date="2025-03-03")
+    try:
+        assert data["count"] == 900, data["count"]
+        assert history.calls.count("conversations.history") == 5
+        with open(data["file_path"]) as f:
+            lines = [json.loads(line) for line in f]
+        assert len(lines) == 900
+        assert lines[0]["text"] == "day 2 message 299", "Newest first"
+        assert lines[-1]["user"] == "alice"
+        assert "messages" not in data, "Messages stay in the file"
+    finally:
+        os.unlink(data["file_path"])
+
+    print(f"✅ {data['count']} messages over 5 pages written to file")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_index_offsets():
+    """Test per-day offsets, user counts and thread summary."""
+    print("\n=== Test 2: index offsets ===")
+
+    history = _History()
+    data = _export(history, start_date="2025-03-02", end_date="2025-03-03")
+    try:
+        index = data["index"]
+        assert index["days"] == [
+            {"date": "2025-03-03", "offset": 0, "count": 300},
+            {"date": "2025-03-02", "offset": 300, "count": 300},
+        ]
+        assert index["top_users"] == {"alice": 200, "bob": 200, "carol": 200}
+        assert [t["reply_count"] for t in index["top_threads"]] == [4, 4]
+
+        with open(data["file_path"]) as f:
+            lines = f.readlines()
+        first_of_day = json.loads(lines[index["days"][1]["offset"]])
+        assert first_of_day["time"].startswith("2025-03-02")
+    finally:
+        os.unlink(data["file_path"])
+
+    print("✅ Day offsets land on each day's first line")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_read_slices_without_api():
+    """Test that read_slack_export only touches the file."""
+    print("\n=== Test 3: slices read from file ===")
+
+    history = _History()
+    data = _export(history, start_date="2025-03-01", end_date="2025-03-03")
+    history.calls.clear()
+
+    async def run():
+        client = history.client()
+        page = await _call(
+            client,
+            "read_slack_export",
+            {"file_path": data["file_path"], "offset": 300, "count": 5},
+        )
+        capped = await _call(
+            client,
+            "read_slack_export",
+            {"file_path": data["file_path"], "offset": 0, "count": 10_000},
+        )
+        return page, capped
+
+    try:
+        page, capped = asyncio.run(run())
+    finally:
+        os.unlink(data["file_path"])
+
+    assert page["count"] == 5
+    assert page["messages"][0]["text"] == "day 1 message 299"
+    assert capped["count"] == 200
+    assert history.calls == []
+
+    print("✅ Slices served from file, count capped at 200")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Slack History Export Tests")
+    print("=" * 60)
+
+    tests = [
+        test_export_streams_all_pages,
+        test_index_offsets,
+        test_read_slices_without_api,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Test the local Slack message store.
+
+Tests:
+1. Channel reads see a stored parent's new replies (history isn't stored)
+2. Deletions inside the refresh window are dropped; gaps reset the store
+3. Repeat thread reads only fetch replies past the high-water mark
+4. Least recently read scopes are evicted past max_bytes
+5. Marks older than max_age refetch the whole thread
+6. Concurrent thread fetches read through the same store
+
+Usage:
+    uv run python tests/test_slack_message_store.py
+"""
+
+import asyncio
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from mcp_server.api_clients.slack_client import SlackClient
+from mcp_server.api_clients.slack_message_store import SlackMessageStore
+
+NOW = time.time()
+
+
+def _ts(minutes_ago: float) -> str:
+    return f"{NOW - minutes_ago * 60:.6f}"
+
+
+class _Channel:
+    """Fake channel C1 whose history and thread can change between reads."""
+
+    def __init__(self, messages: int):
+        # Newest first, one message every 10 minutes
+        self.history = [
+            {"ts": _ts(i * 10), "user": "U1", "text": f"m{i}"} for i in range(messages)
+        ]
+        self.thread_ts = self.history[-1]["ts"]
+        self.replies = [{"ts": self.thread_ts, "user": "U1", "text": "parent"}] + [
+            {"ts": _ts(100 - i), "user": "U1", "text": f"r{i}"} for i in range(3)
+        ]
+        self.requests = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        params = request.url.params
+        if method == "users.list":
+            return httpx.Response(
+                200, json={"ok": True, "members": [{"id": "U1", "name": "alice"}]}
+            )
+
+        self.requests.append((method, params.get("oldest")))
+        oldest = float(params.get("oldest") or 0)
+        if method == "conversations.history":
+            items = [m for m in self.history if float(m["ts"]) > oldest]
+        elif method == "conversations.replies":
+            # Slack returns the parent even when it's older than `oldest`
+            items = [self.replies[0]] + [
+                m for m in self.replies[1:] if float(m["ts"]) > oldest
+            ]
+        else:
+            raise AssertionError(f"Unexpected call: {method}")
+
+        start = int(params.get("cursor") or 0)
+        size = int(params["limit"])
+        more = start + size < len(items)
+        return httpx.Response(
+            200,
+            json={
+                "ok": True,
+                "messages": items[start : start + size],
+                "response_metadata": {"next_cursor": str(start + size) if more else ""},
+            },
+        )
+
+    def client(self, store: SlackMessageStore) -> SlackClient:
+        return SlackClient(
+            bot_token="xoxb-test",
+            transport=httpx.MockTransport(self.handler),
+            async_transport=httpx.MockTransport(self.handler),
+            message_store=store,
+        )
+
+
+def test_parent_gains_replies():
+    """Test that a parent posted before the refresh window shows new replies."""
+    print("\n=== Test 1: stored parent gains replies ===")
+
+    channel = _Channel(messages=20)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SlackMessageStore(Path(tmp) / "messages.db")
+        client = channel.client(store)
+
+        first = client.get_channel_messages("C1", oldest=_ts(24 * 60), limit=100)
+        parent = first[12]  # Posted 2 hours ago
+        assert parent.reply_count is None or parent.reply_count == 0
+
+        channel.history[12].update(
+            thread_ts=parent.ts, reply_count=3, latest_reply=_ts(-1)
+        )
+        channel.history[15]["text"] = "edited"
+        second = client.get_channel_messages("C1", oldest=_ts(24 * 60), limit=100)
+
+        assert second[12].reply_count == 3
+        assert second[12].latest_reply == channel.history[12]["latest_reply"]
+        assert second[15].text == "edited"
+        assert store.mark("C1") is None, "History stored"
+        store.close()
+
+    print("✅ Reply count and edits of old messages seen on the next read")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_deletions_and_gaps():
+    """Test that the store tracks deletions and never serves across a gap."""
+    print("\n=== Test 2: deletions and gaps ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SlackMessageStore(Path(tmp) / "messages.db")
+        batch = [{"ts": f"{i}.0", "text": f"m{i}"} for i in range(10, 21)]
+        store.save("S", batch, 5.0, complete=True)
+        assert store.mark("S") == (5.0, 20.0)
+
+        # Refetch of 15.. without 17: it was deleted
+        refetch = [m for m in batch if 15 <= float(m["ts"]) and m["ts"] != "17.0"]
+        store.save("S", refetch, 14.0, complete=True)
+        texts = [m["text"] for m in store.messages("S", newest_first=False)]
+        assert "m17" not in texts and len(texts) == 10
+
+        # A truncated fetch only covers down to its oldest message
+        store.save("S", [{"ts": "30.0"}, {"ts": "25.0"}], 0.0, complete=False)
+        assert store.mark("S") == (25.0, 30.0), "Gap served from the store"
+        assert len(store.messages("S")) == 2
+        store.close()
+
+    print("✅ Deleted message dropped, truncated fetch didn't leave a gap")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_thread_incremental():
+    """Test that a second thread read asks only for new replies."""
+    print("\n=== Test 3: incremental threads ===")
+
+    channel = _Channel(messages=20)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SlackMessageStore(Path(tmp) / "messages.db")
+        client = channel.client(store)
+
+        first = client.get_thread_replies("C1", channel.thread_ts, limit=50)
+        assert [m.text for m in first] == ["parent", "r0", "r1", "r2"]
+
+        channel.replies.append({"ts": _ts(-1), "user": "U1", "text": "r3"})
+        channel.requests.clear()
+        second = client.get_thread_replies("C1", channel.thread_ts, limit=50)
+
+        assert [m.text for m in second] == ["parent", "r0", "r1", "r2", "r3"]
+        assert channel.requests[0][1] is not None, "Fetched with oldest"
+
+        # Threads longer than the limit aren't stored
+        capped = client.get_thread_replies("C1", channel.thread_ts, limit=3)
+        assert [m.text for m in capped] == ["parent", "r0", "r1"]
+        assert store.mark(f"C1/{channel.thread_ts}") is None
+        store.close()
+
+    print("✅ Only new replies fetched, parent kept, long threads not stored")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_eviction():
+    """Test that eviction drops whole scopes, least recently read first."""
+    print("\n=== Test 4: size eviction ===")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SlackMessageStore(Path(tmp) / "messages.db", max_bytes=5000)
+        batch = [{"ts": f"{i}.0", "text": "x" * 100} for i in range(1, 21)]
+        for scope in ["C1", "C2", "C3"]:
+            store.save(scope, batch, 0.0, complete=True)
+            time.sleep(0.01)
+        store.messages("C1")  # C1 read most recently
+
+        store.evict()
+        assert store.mark("C2") is None and store.mark("C3") is None
+        assert len(store.messages("C1")) == 20
+        store.close()
+
+    print("✅ Least recently read scopes evicted whole")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_mark_max_age():
+    """Test that an old mark refetches the thread and catches old edits."""
+    print("\n=== Test 5: mark max age ===")
+
+    channel = _Channel(messages=20)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "messages.db"
+        # A database from before marks expired is started over
+        conn = sqlite3.connect(str(path))
+        conn.execute(
+            "CREATE TABLE marks (scope TEXT PRIMARY KEY, covered_from REAL, "
+            "high_water REAL, accessed_at REAL)"
+        )
+        conn.execute("INSERT INTO marks VALUES ('C1/1.0', 0, 2, 3)")
+        conn.commit()
+        conn.close()
+
+        store = SlackMessageStore(path)
+        assert store.mark("C1/1.0") is None
+        client = channel.client(store)
+        client.get_thread_replies("C1", channel.thread_ts, limit=50)
+        channel.replies.append({"ts": _ts(-1), "user": "U1", "text": "r3"})
+        client.get_thread_replies("C1", channel.thread_ts, limit=50)
+
+        # Edited long before the refresh window
+        channel.replies[1]["text"] = "r0 edited"
+        texts = [m.text for m in client.get_thread_replies("C1", channel.thread_ts)]
+        assert texts[1] == "r0", "Expected the stored copy within max_age"
+
+        store.max_age = 0.0
+        channel.requests.clear()
+        texts = [m.text for m in client.get_thread_replies("C1", channel.thread_ts)]
+        assert texts == ["parent", "r0 edited", "r1", "r2", "r3"]
+        assert channel.requests == [("conversations.replies", None)]
+
+        # The full fetch refreshed the mark
+        store.max_age = 3600.0
+        channel.requests.clear()
+        client.get_thread_replies("C1", channel.thread_ts)
+        assert channel.requests[0][1] is not None, "Fetched with oldest"
+        store.close()
+
+    print("✅ Expired mark refetched the thread whole, then reads were incremental")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_async_threads_use_store():
+    """Test that fetch_thread_replies reads stored threads incrementally."""
+    print("\n=== Test 6: async thread fetches use the store ===")
+
+    channel = _Channel(messages=20)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SlackMessageStore(Path(tmp) / "messages.db")
+        client = channel.client(store)
+
+        # Stored by a sync read; no latest_reply, so the reply cache is skipped
+        client.get_thread_replies("C1", channel.thread_ts, limit=50)
+        channel.replies.append({"ts": _ts(-1), "user": "U1", "text": "r3"})
+        channel.requests.clear()
+
+        async def run():
+            results = await client.fetch_thread_replies(
+                "C1", [(channel.thread_ts, None)], limit=50
+            )
+            await client.aclose()
+            return results[channel.thread_ts]
+
+        replies = asyncio.run(run())
+        assert [m.text for m in replies] == ["parent", "r0", "r1", "r2", "r3"]
+        assert channel.requests[0][1] is not None, "Fetched with oldest"
+        assert store.mark(f"C1/{channel.thread_ts}")[1] == float(_ts(-1))
+        store.close()
+
+    print("✅ Async fetch asked only for new replies and updated the store")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Slack Message Store Tests")
+    print("=" * 60)
+
+    tests = [
+        test_parent_gains_replies,
+        test_deletions_and_gaps,
+        test_thread_incremental,
+        test_eviction,
+        test_mark_max_age,
+        test_async_threads_use_store,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Test concurrent thread fetching in read_slack_messages.
+
+Tests:
+1. Threads are fetched concurrently and the channel is resolved once
+2. Re-reading a channel only refetches threads with new replies
+3. A failing thread doesn't fail the whole read
+
+Usage:
+    uv run python tests/test_slack_threads.py
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+
+from mcp_server.api_clients.slack_client import SlackClient
+
+
+class _Channel:
+    """Fake #eng channel with a configurable set of threads."""
+
+    def __init__(self, threads: int, delay: float = 0.05):
+        self.delay = delay
+        self.latest = {f"{100 + i}.0": f"{200 + i}.0" for i in range(threads)}
+        self.broken = set()
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+
+    def history(self):
+        return [
+            {
+                "ts": ts,
+                "user": "U1",
+                "text": f"thread {ts}",
+                "reply_count": 1,
+                "latest_reply": latest,
+            }
+            for ts, latest in self.latest.items()
+        ] + [{"ts": "99.0", "user": "U1", "text": "no thread"}]
+
+    def sync_handler(self, request: httpx.Request) -> httpx.Response:
+        method = request.url.path.rsplit("/", 1)[-1]
+        self.calls.append(method)
+        if method == "conversations.list":
+            body = {"channels": [{"id": "C1", "name": "eng"}]}
+        elif method == "users.list":
+            body = {"members": [{"id": "U1", "name": "alice", "profile": {}}]}
+        elif method == "conversations.history":
+            assert request.url.params["channel"] == "C1"
+            body = {"messages": self.history()}
+        else:
+            raise AssertionError(f"Unexpected sync call: {method}")
+        return httpx.Response(200, json={"ok": True, **body})
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path.endswith("/conversations.replies")
+        assert request.url.params["channel"] == "C1"
+        thread_ts = request.url.params["ts"]
+        self.calls.append(f"replies:{thread_ts}")
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if thread_ts in self.broken:
+            return httpx.Response(200, json={"ok": False, "error": "thread_not_found"})
+        messages = [
+            {"ts": thread_ts, "user": "U1", "text": "parent"},
+            {"ts": self.latest[thread_ts], "user": "U1", "text": "reply"},
+        ]
+        return httpx.Response(200, json={"ok": True, "messages": messages})
+
+    def client(self) -> SlackClient:
+        return SlackClient(
+            bot_token="xoxb-test",
+            transport=httpx.MockTransport(self.sync_handler),
+            async_transport=httpx.MockTransport(self.async_handler),
+        )
+
+
+async def _read(client: SlackClient, **arguments) -> dict:
+    from fastmcp import Client, FastMCP
+
+    from mcp_server.tools import slack_tools
+
+    mcp = FastMCP("test")
+    slack_tools.create_slack_tools(mcp)
+    with patch.object(slack_tools, "_get_client", return_value=client):
+        async with Client(mcp) as mcp_client:
+            result = await mcp_client.call_tool(
+                "read_slack_messages", {"channel": "#eng", **arguments}
+            )
+    return json.loads(result.content[0].text)
+
+
+def test_threads_fetched_concurrently():
+    """Test that 20 threads overlap and the channel is resolved once."""
+    print("\n=== Test 1: threads fetched concurrently ===")
+
+    from mcp_server.api_clients.slack_client import THREAD_FETCH_CONCURRENCY
+
+    channel = _Channel(threads=20)
+    data = asyncio.run(_read(channel.client()))
+
+    assert data["count"] == 21
+    threaded = [m for m in data["messages"] if m["has_thread"]]
+    assert all(m["replies"][0]["text"] == "reply" for m in threaded)
+    assert "replies" not in data["messages"][-1]
+    assert channel.calls.count("conversations.list") == 1
+    assert channel.peak == THREAD_FETCH_CONCURRENCY, channel.peak
+
+    print(f"✅ 20 threads, peak {channel.peak} in flight, channel resolved once")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_unchanged_threads_reused():
+    """Test that only threads with a new latest_reply are refetched."""
+    print("\n=== Test 2: unchanged threads reused ===")
+
+    channel = _Channel(threads=5, delay=0)
+    client = channel.client()
+
+    async def run():
+        await _read(client)
+        channel.calls.clear()
+        channel.latest["102.0"] = "300.0"  # New reply in one thread
+        return await _read(client)
+
+    data = asyncio.run(run())
+
+    assert [c for c in channel.calls if c.startswith("replies:")] == ["replies:102.0"]
+    updated = next(m for m in data["messages"] if m["ts"] == "102.0")
+    assert updated["replies"][0]["ts"] == "300.0"
+
+    print("✅ 1 of 5 threads refetched")
+    print("✅ Test passed!\n")
+    return True
+
+
+def test_failed_thread_isolated():
+    """Test that one failing thread leaves the others intact."""
+    print("\n=== Test 3: failed thread isolated ===")
+
+    channel = _Channel(threads=3, delay=0)
+    channel.broken.add("101.0")
+    data = asyncio.run(_read(channel.client()))
+
+    replies = {m["ts"]: m.get("replies") for m in data["messages"]}
+    assert replies["101.0"] == []
+    assert len(replies["100.0"]) == 1 and len(replies["102.0"]) == 1
+
+    print("✅ Broken thread returned no replies, others intact")
+    print("✅ Test passed!\n")
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Slack Thread Fetching Tests")
+    print("=" * 60)
+
+    tests = [
+        test_threads_fetched_concurrently,
+        test_unchanged_threads_reused,
+        test_failed_thread_isolated,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            if test():
+                passed += 1
+            else:
+                failed += 1
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            import traceback
+
+            traceback.print_exc()
+            failed += 1
+
+    print("=" * 60)
+    print(f"Results: {passed} passed, {failed} failed")
+    print("=" * 60)